@@ -1,4 +1,5 @@
 import base64
+import logging
 import os
 from datetime import datetime, timezone
 from pathlib import Path
@@ -8,6 +9,8 @@ from bubus import BaseEvent
 from pydantic import Field, field_validator
 from uuid_extensions import uuid7str
 
+logger = logging.getLogger(__name__)
+
 MAX_STRING_LENGTH = 100000  # 100K chars ~ 25k tokens should be enough
 MAX_URL_LENGTH = 100000
 MAX_TASK_LENGTH = 100000
@@ -154,16 +157,16 @@ class CreateAgentStepEvent(BaseEvent):
 
 		# Capture screenshot as base64 data URL if available
 		screenshot_url = None
-		if browser_state_summary.screenshot:
-			screenshot_url = f'data:image/png;base64,{browser_state_summary.screenshot}'
-			import logging
-
-			logger = logging.getLogger(__name__)
+		if getattr(browser_state_summary, 'screenshot_unchanged', False):
+			# The page looks the same as in the previous step, whose event already carried this image
+			logger.debug('📸 Screenshot unchanged since the previous step, not included in CreateAgentStepEvent')
+		elif browser_state_summary.screenshot:
+			screenshot_image = getattr(browser_state_summary, 'screenshot_image', None)
+			screenshot_url = (
+				screenshot_image.data_url if screenshot_image else f'data:image/png;base64,{browser_state_summary.screenshot}'
+			)
 			logger.debug(f'📸 Including screenshot in CreateAgentStepEvent, length: {len(browser_state_summary.screenshot)}')
 		else:
-			import logging
-
-			logger = logging.getLogger(__name__)
 			logger.debug('📸 No screenshot in browser_state_summary for CreateAgentStepEvent')
 
 		return cls(
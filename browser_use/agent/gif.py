@@ -5,11 +5,14 @@ import io
 import logging
 import os
 import platform
+from collections.abc import Iterator
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from browser_use.agent.views import AgentHistoryList
+from browser_use.agent.views import AgentHistory, AgentHistoryList
 from browser_use.browser.views import PLACEHOLDER_4PX_SCREENSHOT
 from browser_use.config import CONFIG
+from browser_use.screenshots.service import content_hash
 
 if TYPE_CHECKING:
 	from PIL import Image, ImageFont
@@ -54,29 +57,33 @@ def create_history_gif(
 
 	from PIL import Image, ImageFont
 
-	images = []
-
 	# if history is empty, we can't create a gif
 	if not history.history:
 		logger.warning('No history to create GIF from')
 		return
 
-	# Get all screenshots from history (including None placeholders)
-	screenshots = history.screenshots(return_none_if_not_screenshot=True)
+	placeholder_screenshot = base64.b64decode(PLACEHOLDER_4PX_SCREENSHOT)
+	placeholder_blob = content_hash(placeholder_screenshot)
 
-	if not screenshots:
-		logger.warning('No screenshots found in history')
-		return
+	def is_placeholder(item: AgentHistory, screenshot: bytes) -> bool:
+		"""The 4px placeholder for about:blank pages, also once the store re-encoded it (storage_format), since
+		stored screenshots are named after the hash of the captured bytes"""
+		path = item.state.screenshot_path
+		return screenshot == placeholder_screenshot or (path is not None and Path(path).stem == placeholder_blob)
 
-	# Find the first non-placeholder screenshot
-	# A screenshot is considered a placeholder if:
-	# 1. It's the exact 4px placeholder for about:blank pages, OR
-	# 2. It comes from a new tab page (chrome://newtab/, about:blank, etc.)
+	# Screenshots are read from disk one at a time, only the first real one is kept for the task frame
+	found_screenshot = False
 	first_real_screenshot = None
-	for screenshot in screenshots:
-		if screenshot and screenshot != PLACEHOLDER_4PX_SCREENSHOT:
-			first_real_screenshot = screenshot
-			break
+	for item, screenshot in zip(history.history, history.iter_screenshot_bytes()):
+		if screenshot:
+			found_screenshot = True
+			if not is_placeholder(item, screenshot):
+				first_real_screenshot = screenshot
+				break
+
+	if not found_screenshot:
+		logger.warning('No screenshots found in history')
+		return
 
 	if not first_real_screenshot:
 		logger.warning('No valid screenshots found (all are placeholders or from new tab pages)')
@@ -136,18 +143,11 @@ def create_history_gif(
 		except Exception as e:
 			logger.warning(f'Could not load logo: {e}')
 
-	# Create task frame if requested
-	if show_task and task:
-		# Find the first non-placeholder screenshot for the task frame
-		first_real_screenshot = None
-		for item in history.history:
-			screenshot_b64 = item.state.get_screenshot()
-			if screenshot_b64 and screenshot_b64 != PLACEHOLDER_4PX_SCREENSHOT:
-				first_real_screenshot = screenshot_b64
-				break
-
-		if first_real_screenshot:
-			task_frame = _create_task_frame(
+	def frames() -> Iterator[Image.Image]:
+		"""GIF frames, built as the GIF is written, loading each screenshot from disk only when it is reached"""
+		# Create task frame if requested
+		if show_task and task:
+			yield _create_task_frame(
 				task,
 				first_real_screenshot,
 				title_font,  # type: ignore
@@ -155,51 +155,48 @@ def create_history_gif(
 				logo,
 				line_spacing,
 			)
-			images.append(task_frame)
-		else:
-			logger.warning('No real screenshots found for task frame, skipping task frame')
-
-	# Process each history item with its corresponding screenshot
-	for i, (item, screenshot) in enumerate(zip(history.history, screenshots), 1):
-		if not screenshot:
-			continue
-
-		# Skip placeholder screenshots from about:blank pages
-		# These are 4x4 white PNGs encoded as a specific base64 string
-		if screenshot == PLACEHOLDER_4PX_SCREENSHOT:
-			logger.debug(f'Skipping placeholder screenshot from about:blank page at step {i}')
-			continue
-
-		# Skip screenshots from new tab pages
-		from browser_use.utils import is_new_tab_page
-
-		if is_new_tab_page(item.state.url):
-			logger.debug(f'Skipping screenshot from new tab page ({item.state.url}) at step {i}')
-			continue
-
-		# Convert base64 screenshot to PIL Image
-		img_data = base64.b64decode(screenshot)
-		image = Image.open(io.BytesIO(img_data))
-
-		if show_goals and item.model_output:
-			image = _add_overlay_to_image(
-				image=image,
-				step_number=i,
-				goal_text=item.model_output.current_state.next_goal,
-				regular_font=regular_font,  # type: ignore
-				title_font=title_font,  # type: ignore
-				margin=margin,
-				logo=logo,
-			)
 
-		images.append(image)
+		# Process each history item with its corresponding screenshot
+		for i, (item, screenshot) in enumerate(zip(history.history, history.iter_screenshot_bytes()), 1):
+			if not screenshot:
+				continue
+
+			# Skip placeholder screenshots from about:blank pages
+			# These are 4x4 white PNGs, see PLACEHOLDER_4PX_SCREENSHOT
+			if is_placeholder(item, screenshot):
+				logger.debug(f'Skipping placeholder screenshot from about:blank page at step {i}')
+				continue
+
+			# Skip screenshots from new tab pages
+			from browser_use.utils import is_new_tab_page
+
+			if is_new_tab_page(item.state.url):
+				logger.debug(f'Skipping screenshot from new tab page ({item.state.url}) at step {i}')
+				continue
 
-	if images:
-		# Save the GIF
-		images[0].save(
+			image = Image.open(io.BytesIO(screenshot))
+
+			if show_goals and item.model_output:
+				image = _add_overlay_to_image(
+					image=image,
+					step_number=i,
+					goal_text=item.model_output.current_state.next_goal,
+					regular_font=regular_font,  # type: ignore
+					title_font=title_font,  # type: ignore
+					margin=margin,
+					logo=logo,
+				)
+
+			yield image
+
+	frame_iterator = frames()
+	first_frame = next(frame_iterator, None)
+	if first_frame is not None:
+		# Save the GIF, append_images consumes the remaining frames one at a time
+		first_frame.save(
 			output_path,
 			save_all=True,
-			append_images=images[1:],
+			append_images=frame_iterator,
 			duration=duration,
 			loop=0,
 			optimize=False,
@@ -211,7 +208,7 @@ def create_history_gif(
 
 def _create_task_frame(
 	task: str,
-	first_screenshot: str,
+	first_screenshot: bytes,
 	title_font: ImageFont.FreeTypeFont,
 	regular_font: ImageFont.FreeTypeFont,
 	logo: Image.Image | None = None,
@@ -220,8 +217,7 @@ def _create_task_frame(
 	"""Create initial frame showing the task."""
 	from PIL import Image, ImageDraw, ImageFont
 
-	img_data = base64.b64decode(first_screenshot)
-	template = Image.open(io.BytesIO(img_data))
+	template = Image.open(io.BytesIO(first_screenshot))
 	image = Image.new('RGB', template.size, (0, 0, 0))
 	draw = ImageDraw.Draw(image)
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import math
 from typing import Literal
 
 from browser_use.agent.message_manager.views import (
@@ -14,12 +15,14 @@ from browser_use.agent.views import (
 	MessageManagerState,
 )
 from browser_use.browser.views import BrowserStateSummary
+from browser_use.dom.serializer.delta import DOMDeltaTracker
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.llm.messages import (
 	BaseMessage,
 	ContentPartImageParam,
 	ContentPartTextParam,
 	SystemMessage,
+	UserMessage,
 )
 from browser_use.observability import observe_debug
 from browser_use.utils import match_url_with_domain_pattern, time_execution_sync
@@ -111,6 +114,10 @@ class MessageManager:
 		include_recent_events: bool = False,
 		sample_images: list[ContentPartTextParam | ContentPartImageParam] | None = None,
 		llm_screenshot_size: tuple[int, int] | None = None,
+		omit_unchanged_screenshots: bool = False,
+		dom_token_budget: int | None = None,
+		dom_state_format: Literal['full', 'delta'] = 'full',
+		dom_keyframe_interval: int = 10,
 	):
 		self.task = task
 		self.state = state
@@ -124,6 +131,9 @@ class MessageManager:
 		self.include_recent_events = include_recent_events
 		self.sample_images = sample_images
 		self.llm_screenshot_size = llm_screenshot_size
+		self.omit_unchanged_screenshots = omit_unchanged_screenshots
+		self.dom_token_budget = dom_token_budget
+		self.dom_delta_tracker = DOMDeltaTracker(keyframe_interval=dom_keyframe_interval) if dom_state_format == 'delta' else None
 
 		assert max_history_items is None or max_history_items > 5, 'max_history_items must be None or greater than 5'
 
@@ -139,23 +149,31 @@ class MessageManager:
 	@property
 	def agent_history_description(self) -> str:
 		"""Build agent history description from list of items, respecting max_history_items limit"""
+		return '\n'.join(self._agent_history_entries())
+
+	def _agent_history_entries(self) -> list[str]:
+		"""Rendered history items in prompt order, respecting max_history_items limit"""
 		if self.max_history_items is None:
 			# Include all items
-			return '\n'.join(item.to_string() for item in self.state.agent_history_items)
+			return [item.to_string() for item in self.state.agent_history_items]
 
 		total_items = len(self.state.agent_history_items)
 
 		# If we have fewer items than the limit, just return all items
 		if total_items <= self.max_history_items:
-			return '\n'.join(item.to_string() for item in self.state.agent_history_items)
+			return [item.to_string() for item in self.state.agent_history_items]
 
 		# We have more items than the limit, so we need to omit some
-		omitted_count = total_items - self.max_history_items
-
-		# Show first item + omitted message + most recent (max_history_items - 1) items
+		# Show first item + omitted message + most recent items
 		# The omitted message doesn't count against the limit, only real history items do
 		recent_items_count = self.max_history_items - 1  # -1 for first item
 
+		# Omit whole blocks of steps at a time instead of one step per step. The rendered history, which leads the
+		# state message, then stays the same for several steps, so provider prompt caches keep matching it.
+		omit_block = max(1, recent_items_count // 2)
+		omitted_count = math.ceil((total_items - self.max_history_items) / omit_block) * omit_block
+		recent_items_count = total_items - 1 - omitted_count
+
 		items_to_include = [
 			self.state.agent_history_items[0].to_string(),  # Keep first item (initialization)
 			f'<sys>[... {omitted_count} previous steps omitted...]</sys>',
@@ -163,7 +181,7 @@ class MessageManager:
 		# Add most recent items
 		items_to_include.extend([item.to_string() for item in self.state.agent_history_items[-recent_items_count:]])
 
-		return '\n'.join(items_to_include)
+		return items_to_include
 
 	def add_new_task(self, new_task: str) -> None:
 		new_task = '<follow_up_user_request> ' + new_task.strip() + ' </follow_up_user_request>'
@@ -340,18 +358,28 @@ class MessageManager:
 			include_screenshot = include_screenshot_requested
 		# else: use_vision is False, never include screenshot (include_screenshot stays False)
 
+		# A screenshot identical to the previous step's adds no information, unless an action asked for it
+		omitted_unchanged_screenshot = False
 		if include_screenshot and browser_state_summary.screenshot:
-			screenshots.append(browser_state_summary.screenshot)
+			if (
+				self.omit_unchanged_screenshots
+				and browser_state_summary.screenshot_unchanged
+				and not include_screenshot_requested
+			):
+				omitted_unchanged_screenshot = True
+			else:
+				screenshots.append(browser_state_summary.screenshot_image or browser_state_summary.screenshot)
 
 		# Use vision in the user message if screenshots are included
 		effective_use_vision = len(screenshots) > 0
 
 		# Create single state message with all content
 		assert browser_state_summary
+		agent_history_entries = self._agent_history_entries()
 		state_message = AgentMessagePrompt(
 			browser_state_summary=browser_state_summary,
 			file_system=self.file_system,
-			agent_history_description=self.agent_history_description,
+			agent_history_description='\n'.join(agent_history_entries),
 			read_state_description=self.state.read_state_description,
 			task=self.task,
 			include_attributes=self.include_attributes,
@@ -365,14 +393,49 @@ class MessageManager:
 			sample_images=self.sample_images,
 			read_state_images=self.state.read_state_images,
 			llm_screenshot_size=self.llm_screenshot_size,
+			dom_token_budget=self.dom_token_budget,
+			dom_delta_tracker=self.dom_delta_tracker,
 			unavailable_skills_info=unavailable_skills_info,
+			omitted_unchanged_screenshot=omitted_unchanged_screenshot,
 		).get_user_message(effective_use_vision)
 
 		# Store state message text for history
 		self.last_state_message_text = state_message.text
 
-		# Set the state message with caching enabled
-		self._set_message_with_type(state_message, 'state')
+		# Set the state message with a cache breakpoint after the agent history
+		self._set_message_with_type(self._split_cacheable_history(state_message, agent_history_entries), 'state')
+
+	@staticmethod
+	def _split_cacheable_history(state_message: UserMessage, agent_history_entries: list[str]) -> UserMessage:
+		"""Move the agent history at the start of the state message into one content part per history item.
+
+		The system prompt and the history only ever grow at the end between steps, so they form the prompt prefix
+		that stays byte-identical. Implicit prefix caches (OpenAI, Gemini, DeepSeek) match it as is. For providers
+		with explicit breakpoints the last history part is marked as one, and since every earlier item keeps its own
+		part, the next step's prompt contains this step's breakpoint at a part boundary and reads it from the cache.
+		A page snapshot leading the history (delta DOM state format) becomes its own part in front of it. The rest
+		of the state message changes every step and is not cached.
+		"""
+		first_part = state_message.content if isinstance(state_message.content, str) else state_message.content[0]
+		text = first_part if isinstance(first_part, str) else first_part.text if first_part.type == 'text' else ''
+
+		history_parts = [f'{entry}\n' for entry in agent_history_entries]
+		if history_parts:
+			history_parts[0] = '<agent_history>\n' + history_parts[0]
+		leading = text[: max(text.find('<agent_history>\n'), 0)]
+		prefix = leading + ''.join(history_parts)
+		if not history_parts or not text.startswith(prefix):
+			# History was normalised while rendering (e.g. stripped newlines), leave the message as it is
+			return state_message
+
+		content: list[ContentPartTextParam | ContentPartImageParam] = [ContentPartTextParam(text=part) for part in history_parts]
+		content[-1].cache = True
+		if leading:
+			content.insert(0, ContentPartTextParam(text=leading))
+		content.append(ContentPartTextParam(text=text[len(prefix) :]))
+		if isinstance(state_message.content, list):
+			content.extend(state_message.content[1:])
+		return UserMessage(content=content, cache=False)
 
 	def _log_history_lines(self) -> str:
 		"""Generate a formatted log string of message history for debugging / printing to terminal"""
@@ -9,7 +9,8 @@ from browser_use.utils import is_new_tab_page, sanitize_surrogates
 
 if TYPE_CHECKING:
 	from browser_use.agent.views import AgentStepInfo
-	from browser_use.browser.views import BrowserStateSummary
+	from browser_use.browser.views import BrowserStateSummary, Screenshot
+	from browser_use.dom.serializer.delta import DOMDeltaTracker
 	from browser_use.filesystem.file_system import FileSystem
 
 
@@ -96,15 +97,18 @@ class AgentMessagePrompt:
 		step_info: Optional['AgentStepInfo'] = None,
 		page_filtered_actions: str | None = None,
 		max_clickable_elements_length: int = 40000,
+		dom_token_budget: int | None = None,
+		dom_delta_tracker: 'DOMDeltaTracker | None' = None,
 		sensitive_data: str | None = None,
 		available_file_paths: list[str] | None = None,
-		screenshots: list[str] | None = None,
+		screenshots: list['str | Screenshot'] | None = None,
 		vision_detail_level: Literal['auto', 'low', 'high'] = 'auto',
 		include_recent_events: bool = False,
 		sample_images: list[ContentPartTextParam | ContentPartImageParam] | None = None,
 		read_state_images: list[dict] | None = None,
 		llm_screenshot_size: tuple[int, int] | None = None,
 		unavailable_skills_info: str | None = None,
+		omitted_unchanged_screenshot: bool = False,
 	):
 		self.browser_state: 'BrowserStateSummary' = browser_state_summary
 		self.file_system: 'FileSystem | None' = file_system
@@ -115,6 +119,9 @@ class AgentMessagePrompt:
 		self.step_info = step_info
 		self.page_filtered_actions: str | None = page_filtered_actions
 		self.max_clickable_elements_length: int = max_clickable_elements_length
+		self.dom_token_budget: int | None = dom_token_budget
+		self.dom_delta_tracker = dom_delta_tracker
+		self.page_snapshot: str | None = None  # keyframe the elements are described against, set in delta mode
 		self.sensitive_data: str | None = sensitive_data
 		self.available_file_paths: list[str] | None = available_file_paths
 		self.screenshots = screenshots or []
@@ -124,6 +131,7 @@ class AgentMessagePrompt:
 		self.read_state_images = read_state_images or []
 		self.unavailable_skills_info: str | None = unavailable_skills_info
 		self.llm_screenshot_size = llm_screenshot_size
+		self.omitted_unchanged_screenshot = omitted_unchanged_screenshot
 		assert self.browser_state
 
 	def _extract_page_statistics(self) -> dict[str, int]:
@@ -213,13 +221,37 @@ class AgentMessagePrompt:
 		stats_text += f', {page_stats["total_elements"]} total elements'
 		stats_text += '</page_stats>\n'
 
-		elements_text = self.browser_state.dom_state.llm_representation(include_attributes=self.include_attributes)
-
-		if len(elements_text) > self.max_clickable_elements_length:
-			elements_text = elements_text[: self.max_clickable_elements_length]
-			truncated_text = f' (truncated to {self.max_clickable_elements_length} characters)'
+		if self.dom_token_budget is not None:
+			# Leave out the least relevant lines instead of cutting off the end of the page
+			pi = self.browser_state.page_info
+			elements_text, omitted_lines = self.browser_state.dom_state.budgeted_llm_representation(
+				self.dom_token_budget,
+				include_attributes=self.include_attributes,
+				viewport=(pi.scroll_y, pi.viewport_height) if pi else None,
+			)
+			truncated_text = f' ({omitted_lines} less relevant lines left out, marked with ...)' if omitted_lines else ''
 		else:
-			truncated_text = ''
+			elements_text = self.browser_state.dom_state.llm_representation(include_attributes=self.include_attributes)
+			if len(elements_text) > self.max_clickable_elements_length:
+				elements_text = elements_text[: self.max_clickable_elements_length]
+				truncated_text = f' (truncated to {self.max_clickable_elements_length} characters)'
+			else:
+				truncated_text = ''
+
+		if self.dom_delta_tracker is not None:
+			delta = self.dom_delta_tracker.update(
+				self.browser_state.url,
+				self.browser_state.dom_state.llm_representation_lines(include_attributes=self.include_attributes),
+				elements_text,
+			)
+			self.page_snapshot = delta.keyframe.text
+			if delta.changes is None:
+				elements_text = 'The <page_snapshot> above shows the current page.'
+			else:
+				elements_text = (
+					'Changes since the <page_snapshot> above (+ added, ~ changed, - removed), '
+					'elements not listed are unchanged:\n' + (delta.changes or 'No changes')
+				)
 
 		has_content_above = False
 		has_content_below = False
@@ -293,11 +325,16 @@ class AgentMessagePrompt:
 				closed_popups_text += f'  - {popup_msg}\n'
 			closed_popups_text += '\n'
 
+		# Tell the model why there is no screenshot this step
+		unchanged_screenshot_text = ''
+		if self.omitted_unchanged_screenshot:
+			unchanged_screenshot_text = 'Screenshot omitted: the page looks the same as in the previous step.\n'
+
 		browser_state = f"""{stats_text}{current_tab_text}
 Available tabs:
 {tabs_text}
 {page_info_text}
-{recent_events_text}{closed_popups_text}{pdf_message}Interactive elements{truncated_text}:
+{recent_events_text}{closed_popups_text}{unchanged_screenshot_text}{pdf_message}Interactive elements{truncated_text}:
 {elements_text}
 """
 		return browser_state
@@ -335,33 +372,40 @@ Available tabs:
 			agent_state += f'<available_file_paths>{available_file_paths_text}\nUse with absolute paths</available_file_paths>\n'
 		return agent_state
 
-	def _resize_screenshot(self, screenshot_b64: str) -> str:
-		"""Resize screenshot to llm_screenshot_size if configured."""
+	def _resize_screenshot(self, screenshot: 'str | Screenshot') -> 'Screenshot':
+		"""Resize screenshot to llm_screenshot_size if configured.
+
+		Screenshots captured for this agent are usually already at that size (the browser renders them downscaled),
+		in which case only the image header is read and nothing is re-encoded.
+		"""
+		from browser_use.browser.views import Screenshot
+
+		if not isinstance(screenshot, Screenshot):
+			screenshot = Screenshot(screenshot)
 		if not self.llm_screenshot_size:
-			return screenshot_b64
+			return screenshot
 
 		try:
-			import base64
 			import logging
 			from io import BytesIO
 
 			from PIL import Image
 
-			img = Image.open(BytesIO(base64.b64decode(screenshot_b64)))
-			if img.size == self.llm_screenshot_size:
-				return screenshot_b64
+			if screenshot.size == self.llm_screenshot_size:
+				return screenshot
 
 			logging.getLogger(__name__).info(
-				f'🔄 Resizing screenshot from {img.size[0]}x{img.size[1]} to {self.llm_screenshot_size[0]}x{self.llm_screenshot_size[1]} for LLM'
+				f'🔄 Resizing screenshot from {screenshot.size[0]}x{screenshot.size[1]} to {self.llm_screenshot_size[0]}x{self.llm_screenshot_size[1]} for LLM'
 			)
 
+			img = Image.open(BytesIO(screenshot.data))
 			img_resized = img.resize(self.llm_screenshot_size, Image.Resampling.LANCZOS)
 			buffer = BytesIO()
-			img_resized.save(buffer, format='PNG')
-			return base64.b64encode(buffer.getvalue()).decode('utf-8')
+			img_resized.save(buffer, format=screenshot.format.upper())
+			return Screenshot(data=buffer.getvalue(), format=screenshot.format, size=self.llm_screenshot_size)
 		except Exception as e:
 			logging.getLogger(__name__).warning(f'Failed to resize screenshot: {e}, using original')
-			return screenshot_b64
+			return screenshot
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='get_user_message')
 	def get_user_message(self, use_vision: bool = True) -> UserMessage:
@@ -376,13 +420,18 @@ Available tabs:
 			use_vision = False
 
 		# Build complete state description
-		state_description = (
+		browser_state_description = self._get_browser_state_description().strip('\n')
+		state_description = ''
+		if self.page_snapshot is not None:
+			# Changes only every few steps, so it leads the message to stay part of the cacheable prompt prefix
+			state_description += '<page_snapshot>\n' + self.page_snapshot.strip('\n') + '\n</page_snapshot>\n\n'
+		state_description += (
 			'<agent_history>\n'
 			+ (self.agent_history_description.strip('\n') if self.agent_history_description else '')
 			+ '\n</agent_history>\n\n'
 		)
 		state_description += '<agent_state>\n' + self._get_agent_state_description().strip('\n') + '\n</agent_state>\n'
-		state_description += '<browser_state>\n' + self._get_browser_state_description().strip('\n') + '\n</browser_state>\n'
+		state_description += '<browser_state>\n' + browser_state_description + '\n</browser_state>\n'
 		# Only add read_state if it has content
 		read_state_description = self.read_state_description.strip('\n').strip() if self.read_state_description else ''
 		if read_state_description:
@@ -428,8 +477,8 @@ Available tabs:
 				content_parts.append(
 					ContentPartImageParam(
 						image_url=ImageURL(
-							url=f'data:image/png;base64,{processed_screenshot}',
-							media_type='image/png',
+							url=processed_screenshot.data_url,
+							media_type=processed_screenshot.mime_type,
 							detail=self.vision_detail_level,
 						),
 					)
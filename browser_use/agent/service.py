@@ -28,6 +28,8 @@ from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage, ContentPartImageParam, ContentPartTextParam, UserMessage
 from browser_use.tokens.service import TokenCost
+from browser_use.tokens.views import PromptCacheUsage
+from browser_use.tracing.service import Tracer, trace_span
 
 load_dotenv()
 
@@ -44,6 +46,7 @@ from browser_use.agent.message_manager.service import (
 	MessageManager,
 )
 from browser_use.agent.prompts import SystemPrompt
+from browser_use.agent.streaming import ActionStream, iterate_actions
 from browser_use.agent.views import (
 	ActionResult,
 	AgentError,
@@ -59,10 +62,11 @@ from browser_use.agent.views import (
 	JudgementResult,
 	StepMetadata,
 )
+from browser_use.browser.prefetch import SpeculativePrefetcher
 from browser_use.browser.session import DEFAULT_BROWSER_PROFILE
-from browser_use.browser.views import BrowserStateSummary
+from browser_use.browser.views import BrowserStateSummary, Screenshot
 from browser_use.config import CONFIG
-from browser_use.dom.views import DOMInteractedElement, MatchLevel
+from browser_use.dom.views import DOMInteractedElement, MatchLevel, hash_selector_map
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.observability import observe, observe_debug
 from browser_use.telemetry.service import ProductTelemetry
@@ -166,6 +170,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		override_system_message: str | None = None,
 		extend_system_message: str | None = None,
 		generate_gif: bool | str = False,
+		trace_latency: bool | str = False,
 		available_file_paths: list[str] | None = None,
 		include_attributes: list[str] | None = None,
 		max_actions_per_step: int = 3,
@@ -186,6 +191,17 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		display_files_in_done_text: bool = True,
 		include_tool_call_examples: bool = False,
 		vision_detail_level: Literal['auto', 'low', 'high'] = 'auto',
+		deduplicate_screenshots: bool = True,
+		omit_unchanged_screenshots: bool = False,
+		screenshot_storage_format: Literal['webp', 'avif'] | None = None,
+		screenshot_storage_quality: int = 80,
+		screenshot_retention_max_age: float | None = None,
+		screenshot_retention_max_bytes: int | None = None,
+		stream_actions: bool = False,
+		speculative_prefetch: bool = False,
+		dom_token_budget: int | None = None,
+		dom_state_format: Literal['full', 'delta'] = 'full',
+		dom_keyframe_interval: int = 10,
 		llm_timeout: int | None = None,
 		step_timeout: int = 120,
 		directly_open_url: bool = True,
@@ -361,12 +377,24 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self.settings = AgentSettings(
 			use_vision=use_vision,
 			vision_detail_level=vision_detail_level,
+			deduplicate_screenshots=deduplicate_screenshots,
+			omit_unchanged_screenshots=omit_unchanged_screenshots,
+			screenshot_storage_format=screenshot_storage_format,
+			screenshot_storage_quality=screenshot_storage_quality,
+			screenshot_retention_max_age=screenshot_retention_max_age,
+			screenshot_retention_max_bytes=screenshot_retention_max_bytes,
+			stream_actions=stream_actions,
+			speculative_prefetch=speculative_prefetch,
+			dom_token_budget=dom_token_budget,
+			dom_state_format=dom_state_format,
+			dom_keyframe_interval=dom_keyframe_interval,
 			save_conversation_path=save_conversation_path,
 			save_conversation_path_encoding=save_conversation_path_encoding,
 			max_failures=max_failures,
 			override_system_message=override_system_message,
 			extend_system_message=extend_system_message,
 			generate_gif=generate_gif,
+			trace_latency=trace_latency,
 			include_attributes=include_attributes,
 			max_actions_per_step=max_actions_per_step,
 			use_thinking=use_thinking,
@@ -387,10 +415,31 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self.token_cost_service.register_llm(llm)
 		self.token_cost_service.register_llm(page_extraction_llm)
 		self.token_cost_service.register_llm(judge_llm)
+		self._step_usage_start = 0  # usage_history index at the start of the current step
 
 		# Initialize state
 		self.state = injected_agent_state or AgentState()
 
+		# Latency tracing (None when disabled)
+		self.tracer: Tracer | None = Tracer() if trace_latency else None
+
+		# Last stored screenshot and its path, to reuse when the next step's page looks the same
+		self._last_screenshot: Screenshot | None = None
+		self._last_screenshot_path: str | None = None
+
+		# Results of actions already executed while the LLM response was streaming (stream_actions=True)
+		self._streamed_results: list[ActionResult] | None = None
+		# Results of the streamed actions executed so far, kept as the step's results when the LLM call then fails
+		self._dispatched_results: list[ActionResult] = []
+
+		# Tab the last DOM delta keyframe was taken on (dom_state_format='delta')
+		self._dom_delta_target_id: str | None = None
+
+		# CDP results fetched while waiting for the LLM (None when disabled)
+		self.prefetcher: SpeculativePrefetcher | None = (
+			SpeculativePrefetcher(self.browser_session) if speculative_prefetch else None
+		)
+
 		# Initialize history
 		self.history = AgentHistoryList(history=[], usage=None)
 
@@ -479,6 +528,10 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			include_recent_events=self.include_recent_events,
 			sample_images=self.sample_images,
 			llm_screenshot_size=llm_screenshot_size,
+			omit_unchanged_screenshots=self.settings.omit_unchanged_screenshots,
+			dom_token_budget=self.settings.dom_token_budget,
+			dom_state_format=self.settings.dom_state_format,
+			dom_keyframe_interval=self.settings.dom_keyframe_interval,
 		)
 
 		if self.sensitive_data:
@@ -686,7 +739,13 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		try:
 			from browser_use.screenshots.service import ScreenshotService
 
-			self.screenshot_service = ScreenshotService(self.agent_directory)
+			self.screenshot_service = ScreenshotService(
+				self.agent_directory,
+				storage_format=self.settings.screenshot_storage_format,
+				storage_quality=self.settings.screenshot_storage_quality,
+				max_age=self.settings.screenshot_retention_max_age,
+				max_total_bytes=self.settings.screenshot_retention_max_bytes,
+			)
 			self.logger.debug(f'📸 Screenshot service initialized in: {self.agent_directory}/screenshots')
 		except Exception as e:
 			self.logger.error(f'📸 Failed to initialize screenshot service: {e}.')
@@ -983,26 +1042,37 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		# Initialize timing first, before any exceptions can occur
 
 		self.step_start_time = time.time()
+		self._step_usage_start = len(self.token_cost_service.usage_history)
 
 		browser_state_summary = None
 
-		try:
-			# Phase 1: Prepare context and timing
-			browser_state_summary = await self._prepare_context(step_info)
+		tracer = self.tracer
+		with trace_span(tracer, 'step', 'agent', step=self.state.n_steps):
+			try:
+				# Phase 1: Prepare context and timing
+				with trace_span(tracer, 'prepare_context', 'agent'):
+					browser_state_summary = await self._prepare_context(step_info)
 
-			# Phase 2: Get model output and execute actions
-			await self._get_next_action(browser_state_summary)
-			await self._execute_actions()
+				# Phase 2: Get model output and execute actions
+				with trace_span(tracer, 'get_next_action', 'agent'):
+					await self._get_next_action(browser_state_summary)
+				with trace_span(tracer, 'execute_actions', 'agent'):
+					await self._execute_actions()
 
-			# Phase 3: Post-processing
-			await self._post_process()
+				# Phase 3: Post-processing
+				with trace_span(tracer, 'post_process', 'agent'):
+					await self._post_process()
 
-		except Exception as e:
-			# Handle ALL exceptions in one place
-			await self._handle_step_error(e)
+			except Exception as e:
+				# Handle ALL exceptions in one place
+				await self._handle_step_error(e)
 
-		finally:
-			await self._finalize(browser_state_summary)
+			finally:
+				await self._finalize(browser_state_summary)
+
+		if tracer is not None and self.browser_session is not None:
+			# bubus only keeps recent events, so handler timings are collected after every step
+			tracer.record_event_bus(self.browser_session.event_bus)
 
 	async def _prepare_context(self, step_info: AgentStepInfo | None = None) -> BrowserStateSummary:
 		"""Prepare the context for the step: browser state, action models, page actions"""
@@ -1019,6 +1089,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		)
 		if browser_state_summary.screenshot:
 			self.logger.debug(f'📸 Got browser state WITH screenshot, length: {len(browser_state_summary.screenshot)}')
+			if self.settings.deduplicate_screenshots:
+				await self._mark_unchanged_screenshot(browser_state_summary)
 		else:
 			self.logger.debug('📸 Got browser state WITHOUT screenshot')
 
@@ -1043,17 +1115,20 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		if self.skill_service is not None:
 			unavailable_skills_info = await self._get_unavailable_skills_info()
 
-		self._message_manager.create_state_messages(
-			browser_state_summary=browser_state_summary,
-			model_output=self.state.last_model_output,
-			result=self.state.last_result,
-			step_info=step_info,
-			use_vision=self.settings.use_vision,
-			page_filtered_actions=page_filtered_actions if page_filtered_actions else None,
-			sensitive_data=self.sensitive_data,
-			available_file_paths=self.available_file_paths,  # Always pass current available_file_paths
-			unavailable_skills_info=unavailable_skills_info,
-		)
+		self._reset_dom_delta_on_tab_switch()
+
+		with trace_span(self.tracer, 'create_state_messages', 'prompt'):
+			self._message_manager.create_state_messages(
+				browser_state_summary=browser_state_summary,
+				model_output=self.state.last_model_output,
+				result=self.state.last_result,
+				step_info=step_info,
+				use_vision=self.settings.use_vision,
+				page_filtered_actions=page_filtered_actions if page_filtered_actions else None,
+				sensitive_data=self.sensitive_data,
+				available_file_paths=self.available_file_paths,  # Always pass current available_file_paths
+				unavailable_skills_info=unavailable_skills_info,
+			)
 
 		await self._force_done_after_last_step(step_info)
 		await self._force_done_after_failure()
@@ -1067,10 +1142,21 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			f'🤖 Step {self.state.n_steps}: Calling LLM with {len(input_messages)} messages (model: {self.llm.model})...'
 		)
 
+		# A step callback gets to see the model output before any of its actions run, so it turns early dispatch off
+		stream_actions = self.settings.stream_actions and self.register_new_step_callback is None
+		action_stream = ActionStream(self.ActionModel, self.settings.max_actions_per_step) if stream_actions else None
+		self._dispatched_results = []
+		# Use the time the browser would sit idle waiting for the model to prepare for the next action
+		prefetch_task = asyncio.create_task(self.prefetcher.run()) if self.prefetcher is not None else None
 		try:
-			model_output = await asyncio.wait_for(
-				self._get_model_output_with_retry(input_messages), timeout=self.settings.llm_timeout
-			)
+			with trace_span(self.tracer, 'invoke', 'llm', model=self.llm.model, messages=len(input_messages)):
+				llm_call = asyncio.wait_for(
+					self._get_model_output_with_retry(input_messages, action_stream), timeout=self.settings.llm_timeout
+				)
+				if action_stream is None:
+					model_output = await llm_call
+				else:
+					model_output = await self._invoke_with_early_dispatch(llm_call, action_stream)
 		except TimeoutError:
 
 			@observe(name='_llm_call_timed_out_with_input')
@@ -1083,6 +1169,11 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			raise TimeoutError(
 				f'LLM call timed out after {self.settings.llm_timeout} seconds. Keep your thinking and output short.'
 			)
+		finally:
+			if prefetch_task is not None:
+				# Whatever was not fetched yet comes too late to help
+				prefetch_task.cancel()
+				await asyncio.gather(prefetch_task, return_exceptions=True)
 
 		self.state.last_model_output = model_output
 
@@ -1095,12 +1186,41 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		# check again if Ctrl+C was pressed before we commit the output to history
 		await self._check_stop_or_pause()
 
+	async def _invoke_with_early_dispatch(self, llm_call: Awaitable[AgentOutput], action_stream: ActionStream) -> AgentOutput:
+		"""Execute actions as the LLM streams them, while the LLM call is still running"""
+
+		def close_stream(task: asyncio.Task[AgentOutput]) -> None:
+			failed = task.cancelled() or task.exception() is not None
+			action_stream.close(None if failed else task.result().action)
+
+		llm_task = asyncio.create_task(llm_call)
+		llm_task.add_done_callback(close_stream)
+		try:
+			self._streamed_results = await self.multi_act(action_stream)
+			model_output = await llm_task
+		except BaseException:
+			llm_task.cancel()
+			self._streamed_results = None
+			if self._dispatched_results:
+				# They did run, so history and the next prompt must show them next to the error
+				self.logger.warning(
+					f'⚠️ {len(self._dispatched_results)} streamed actions were already executed when the step failed'
+				)
+				self.state.last_result = list(self._dispatched_results)
+			raise
+		self._dispatched_results = []
+		return model_output
+
 	async def _execute_actions(self) -> None:
 		"""Execute the actions from model output"""
 		if self.state.last_model_output is None:
 			raise ValueError('No model output to execute actions from')
 
-		result = await self.multi_act(self.state.last_model_output.action)
+		if self._streamed_results is not None:
+			# Already executed while the response was streaming
+			result, self._streamed_results = self._streamed_results, None
+		else:
+			result = await self.multi_act(self.state.last_model_output.action)
 		self.state.last_result = result
 
 	async def _post_process(self) -> None:
@@ -1163,9 +1283,21 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			self.logger.log(log_level, f'{prefix}{error_msg}')
 
 		await self._demo_mode_log(f'Step error: {error_msg}', 'error', {'step': self.state.n_steps})
-		self.state.last_result = [ActionResult(error=error_msg)]
+		self.state.last_result = [*self._dispatched_results, ActionResult(error=error_msg)]
+		self._dispatched_results = []
 		return None
 
+	def _step_prompt_cache_usage(self) -> PromptCacheUsage | None:
+		"""Prompt cache hits of the LLM calls made during the current step"""
+		usage = self.token_cost_service.get_prompt_cache_usage(since_entry=self._step_usage_start)
+		if not usage.prompt_tokens:
+			return None
+		self.logger.debug(
+			f'💾 Prompt cache: {usage.prompt_cached_tokens}/{usage.prompt_tokens} tokens read ({usage.cache_hit_rate:.0%}), '
+			f'{usage.prompt_cache_creation_tokens} written'
+		)
+		return usage
+
 	async def _finalize(self, browser_state_summary: BrowserStateSummary | None) -> None:
 		"""Finalize the step with history, logging, and events"""
 		step_end_time = time.time()
@@ -1186,6 +1318,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				step_start_time=self.step_start_time,
 				step_end_time=step_end_time,
 				step_interval=step_interval,
+				prompt_cache=self._step_prompt_cache_usage(),
 			)
 
 			# Use _make_history_item like main branch
@@ -1320,9 +1453,11 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				judge_log += f'   {judgement.reasoning}\n'
 				self.logger.info(judge_log)
 
-	async def _get_model_output_with_retry(self, input_messages: list[BaseMessage]) -> AgentOutput:
+	async def _get_model_output_with_retry(
+		self, input_messages: list[BaseMessage], action_stream: ActionStream | None = None
+	) -> AgentOutput:
 		"""Get model output with retry logic for empty actions"""
-		model_output = await self.get_model_output(input_messages)
+		model_output = await self.get_model_output(input_messages, action_stream)
 		self.logger.debug(
 			f'✅ Step {self.state.n_steps}: Got LLM response with {len(model_output.action) if model_output.action else 0} actions'
 		)
@@ -1339,7 +1474,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			)
 
 			retry_messages = input_messages + [clarification_message]
-			model_output = await self.get_model_output(retry_messages)
+			model_output = await self.get_model_output(retry_messages, action_stream)
 
 			if not model_output.action or all(action.model_dump() == {} for action in model_output.action):
 				self.logger.warning('Model still returned empty after retry. Inserting safe noop action.')
@@ -1388,6 +1523,31 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				self.settings.save_conversation_path_encoding,
 			)
 
+	def _reset_dom_delta_on_tab_switch(self) -> None:
+		"""Start a new DOM keyframe when the agent moved to another tab, which can show the same URL as the previous one"""
+		dom_delta_tracker = self._message_manager.dom_delta_tracker
+		target_id = self.browser_session.agent_focus_target_id
+		if dom_delta_tracker is not None and target_id != self._dom_delta_target_id:
+			dom_delta_tracker.reset()
+			self._dom_delta_target_id = target_id
+
+	async def _mark_unchanged_screenshot(self, browser_state_summary: BrowserStateSummary) -> None:
+		"""Flag the screenshot when it has the same pixels as the last stored one, so it is reused instead of stored again"""
+		screenshot = browser_state_summary.screenshot_image
+		if screenshot is None or self._last_screenshot is None:
+			return
+		try:
+			with trace_span(self.tracer, 'compare_screenshot', 'agent'):
+				# decoding the new image to hash its pixels is the only real work, keep it off the event loop
+				browser_state_summary.screenshot_unchanged = await asyncio.to_thread(
+					screenshot.is_visually_identical, self._last_screenshot
+				)
+		except Exception as e:
+			self.logger.debug(f'📸 Could not compare screenshot with the previous step: {type(e).__name__}: {e}')
+			return
+		if browser_state_summary.screenshot_unchanged:
+			self.logger.debug(f'📸 Step {self.state.n_steps}: screenshot identical to the previous step')
+
 	async def _make_history_item(
 		self,
 		model_output: AgentOutput | None,
@@ -1405,12 +1565,23 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 		# Store screenshot and get path
 		screenshot_path = None
-		if browser_state_summary.screenshot:
+		if (
+			browser_state_summary.screenshot_unchanged
+			and self._last_screenshot_path
+			and await self.screenshot_service.reuse_screenshot(self._last_screenshot_path)
+		):
+			screenshot_path = self._last_screenshot_path
+			self.logger.debug(f'📸 Screenshot unchanged for step {self.state.n_steps}, reusing {screenshot_path}')
+		elif browser_state_summary.screenshot:
 			self.logger.debug(
 				f'📸 Storing screenshot for step {self.state.n_steps}, screenshot length: {len(browser_state_summary.screenshot)}'
 			)
-			screenshot_path = await self.screenshot_service.store_screenshot(browser_state_summary.screenshot, self.state.n_steps)
+			screenshot_path = await self.screenshot_service.store_screenshot(
+				browser_state_summary.screenshot_image or browser_state_summary.screenshot, self.state.n_steps
+			)
 			self.logger.debug(f'📸 Screenshot stored at: {screenshot_path}')
+			self._last_screenshot = browser_state_summary.screenshot_image
+			self._last_screenshot_path = screenshot_path
 		else:
 			self.logger.debug(f'📸 No screenshot in browser_state_summary for step {self.state.n_steps}')
 
@@ -1595,14 +1766,25 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 	@time_execution_async('--get_next_action')
 	@observe_debug(ignore_input=True, ignore_output=True, name='get_model_output')
-	async def get_model_output(self, input_messages: list[BaseMessage]) -> AgentOutput:
-		"""Get next action from LLM based on current state"""
+	async def get_model_output(self, input_messages: list[BaseMessage], action_stream: ActionStream | None = None) -> AgentOutput:
+		"""Get next action from LLM based on current state
+
+		With an action_stream, models that support streaming report the response text as it arrives, so its
+		actions can be dispatched before the full output is parsed.
+		"""
 
 		urls_replaced = self._process_messsages_and_replace_long_urls_shorter_ones(input_messages)
 
 		# Build kwargs for ainvoke
 		# Note: ChatBrowserUse will automatically generate action descriptions from output_format schema
 		kwargs: dict = {'output_format': self.AgentOutput, 'session_id': self.session_id}
+		if action_stream is not None:
+			action_stream.start_attempt(
+				prepare=(lambda action: self._recursive_process_all_strings_inside_pydantic_model(action, urls_replaced))
+				if urls_replaced
+				else None
+			)
+			kwargs['on_text_delta'] = action_stream.feed
 
 		try:
 			response = await self.llm.ainvoke(input_messages, **kwargs)
@@ -1631,7 +1813,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				# No fallback available, re-raise the original error
 				raise
 			# Retry with the fallback LLM
-			return await self.get_model_output(input_messages)
+			return await self.get_model_output(input_messages, action_stream)
 
 	def _try_switch_to_fallback_llm(self, error: ModelRateLimitError | ModelProviderError) -> bool:
 		"""
@@ -2203,6 +2385,10 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 			# Log startup message on first step (only if we haven't already done steps)
 			self._log_first_step_startup()
+			if self.tracer is not None:
+				self.browser_session.set_tracer(self.tracer)
+			if self.prefetcher is not None:
+				self.browser_session.set_prefetcher(self.prefetcher)
 			# Start browser session and attach watchdogs
 			await self.browser_session.start()
 			if self._demo_mode_enabled:
@@ -2346,6 +2532,12 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 					output_event = await CreateAgentOutputFileEvent.from_agent_and_file(self, output_path)
 					self.eventbus.dispatch(output_event)
 
+			# Summarise and export the latency trace if tracing is enabled
+			if self.tracer is not None:
+				self._finish_trace()
+			if self.prefetcher is not None:
+				self._finish_prefetch()
+
 			# Log final messages to user based on outcome
 			self._log_final_outcome_messages()
 
@@ -2355,13 +2547,45 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 			await self.close()
 
+	def _finish_trace(self) -> None:
+		"""Store the latency summary on the history and export the Chrome trace if a path was given"""
+		assert self.tracer is not None
+		if self.browser_session is not None:
+			self.tracer.record_event_bus(self.browser_session.event_bus)
+			if self.browser_session.tracer is self.tracer:
+				self.browser_session.set_tracer(None)
+
+		self.history.trace_summary = self.tracer.summary()
+		self.logger.debug(f'⏱️ Latency summary:\n{self.history.trace_summary.table(limit=20)}')
+
+		if isinstance(self.settings.trace_latency, str):
+			output_path = self.tracer.export_chrome_trace(self.settings.trace_latency)
+			self.logger.info(f'⏱️ Saved latency trace to {output_path} (open in chrome://tracing or ui.perfetto.dev)')
+
+	def _finish_prefetch(self) -> None:
+		"""Store the speculation counters on the history and detach the prefetcher from the browser session"""
+		assert self.prefetcher is not None
+		self.prefetcher.invalidate()  # count whatever is still cached as wasted
+		if self.browser_session is not None and self.browser_session.prefetcher is self.prefetcher:
+			self.browser_session.set_prefetcher(None)
+		self.history.prefetch_stats = self.prefetcher.stats.model_copy()
+		self.logger.debug(f'🔮 Speculative prefetch: {self.history.prefetch_stats.summary()}')
+
 	@observe_debug(ignore_input=True, ignore_output=True)
 	@time_execution_async('--multi_act')
-	async def multi_act(self, actions: list[ActionModel]) -> list[ActionResult]:
-		"""Execute multiple actions"""
+	async def multi_act(self, actions: list[ActionModel] | ActionStream) -> list[ActionResult]:
+		"""Execute multiple actions
+
+		actions can be an ActionStream, whose actions are executed as the LLM produces them. The remaining streamed
+		actions are skipped once the page changes, since the model chose them for the page it was shown.
+		"""
 		results: list[ActionResult] = []
 		time_elapsed = 0
-		total_actions = len(actions)
+		action_stream = actions if isinstance(actions, ActionStream) else None
+		if action_stream is not None:
+			self._dispatched_results = results  # filled as actions run, in case the LLM call fails afterwards
+		total_actions = len(actions) if isinstance(actions, list) else None
+		start_page: tuple[str | None, str] | None = None
 
 		assert self.browser_session is not None, 'BrowserSession is not set up'
 		try:
@@ -2370,7 +2594,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				and self.browser_session._cached_browser_state_summary.dom_state is not None
 			):
 				cached_selector_map = dict(self.browser_session._cached_browser_state_summary.dom_state.selector_map)
-				cached_element_hashes = {e.parent_branch_hash() for e in cached_selector_map.values()}
+				cached_element_hashes = set(hash_selector_map(cached_selector_map, 'parent_branch').values())
 			else:
 				cached_selector_map = {}
 				cached_element_hashes = set()
@@ -2379,14 +2603,24 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			cached_selector_map = {}
 			cached_element_hashes = set()
 
-		for i, action in enumerate(actions):
+		i = -1
+		async for action in iterate_actions(actions):
+			i += 1
 			if i > 0:
 				# ONLY ALLOW TO CALL `done` IF IT IS A SINGLE ACTION
 				if action.model_dump(exclude_unset=True).get('done') is not None:
-					msg = f'Done action is allowed only as a single action - stopped after action {i} / {total_actions}.'
+					msg = f'Done action is allowed only as a single action - stopped after action {i} / {total_actions or i + 1}.'
 					self.logger.debug(msg)
 					break
 
+			if action_stream is not None:
+				current_page = (self.browser_session.agent_focus_target_id, await self.browser_session.get_current_page_url())
+				if start_page is None:
+					start_page = current_page
+				elif current_page != start_page:
+					self.logger.info(f'🔄 Page changed after action {i}, skipping the remaining streamed actions')
+					break
+
 			# wait between actions (only after first action)
 			if i > 0:
 				self.logger.debug(f'Waiting {self.browser_profile.wait_between_actions} seconds between actions')
@@ -2403,14 +2637,18 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 				time_start = time.time()
 
-				result = await self.tools.act(
-					action=action,
-					browser_session=self.browser_session,
-					file_system=self.file_system,
-					page_extraction_llm=self.settings.page_extraction_llm,
-					sensitive_data=self.sensitive_data,
-					available_file_paths=self.available_file_paths,
-				)
+				with trace_span(self.tracer, action_name, 'action', index=i):
+					result = await self.tools.act(
+						action=action,
+						browser_session=self.browser_session,
+						file_system=self.file_system,
+						page_extraction_llm=self.settings.page_extraction_llm,
+						sensitive_data=self.sensitive_data,
+						available_file_paths=self.available_file_paths,
+					)
+				if self.prefetcher is not None:
+					# Prefetched results describe the page before this action
+					self.prefetcher.invalidate()
 
 				time_end = time.time()
 				time_elapsed = time_end - time_start
@@ -2432,7 +2670,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 				results.append(result)
 
-				if results[-1].is_done or results[-1].error or i == total_actions - 1:
+				if results[-1].is_done or results[-1].error or i == (total_actions or 0) - 1:
 					break
 
 			except Exception as e:
@@ -2445,17 +2683,22 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				)
 				raise e
 
+		if action_stream is not None:
+			action_stream.stop()
 		return results
 
-	async def _log_action(self, action, action_name: str, action_num: int, total_actions: int) -> None:
+	async def _log_action(self, action, action_name: str, action_num: int, total_actions: int | None) -> None:
 		"""Log the action before execution with colored formatting"""
 		# Color definitions
 		blue = '\033[34m'  # Action name
 		magenta = '\033[35m'  # Parameter names
 		reset = '\033[0m'
 
-		# Format action number and name
-		if total_actions > 1:
+		# Format action number and name (the total is unknown while actions are still streaming)
+		if total_actions is None:
+			action_header = f'▶️  [{action_num}] {blue}{action_name}{reset}:'
+			plain_header = f'▶️  [{action_num}] {action_name}:'
+		elif total_actions > 1:
 			action_header = f'▶️  [{action_num}/{total_actions}] {blue}{action_name}{reset}:'
 			plain_header = f'▶️  [{action_num}/{total_actions}] {action_name}:'
 		else:
@@ -3141,8 +3384,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			)
 
 		# Level 1: EXACT hash match
-		for idx, elem in selector_map.items():
-			if elem.element_hash == historical_element.element_hash:
+		for idx, element_hash in hash_selector_map(selector_map).items():
+			if element_hash == historical_element.element_hash:
 				highlight_index = idx
 				match_level = MatchLevel.EXACT
 				break
@@ -3153,8 +3396,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		# Level 2: STABLE hash match (dynamic classes filtered)
 		# Use stored stable_hash (computed at save time from EnhancedDOMTreeNode - single source of truth)
 		if highlight_index is None and historical_element.stable_hash is not None:
-			for idx, elem in selector_map.items():
-				if elem.compute_stable_hash() == historical_element.stable_hash:
+			for idx, stable_hash in hash_selector_map(selector_map, 'stable').items():
+				if stable_hash == historical_element.stable_hash:
 					highlight_index = idx
 					match_level = MatchLevel.STABLE
 					self.logger.info('Element matched at STABLE level (dynamic classes filtered)')
@@ -3452,18 +3695,23 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 	async def _update_action_models_for_page(self, page_url: str) -> None:
 		"""Update action models with page-specific actions"""
-		# Create new action model with current page's filtered actions
-		self.ActionModel = self.tools.registry.create_action_model(page_url=page_url)
-		# Update output model with the new actions
-		if self.settings.flash_mode:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.ActionModel)
-		elif self.settings.use_thinking:
-			self.AgentOutput = AgentOutput.type_with_custom_actions(self.ActionModel)
-		else:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.ActionModel)
+		# The registry returns the same action model while the page's filtered actions stay the same,
+		# keep the output models (and the LLM schema cached for them) unless it changed or done was forced
+		action_model = self.tools.registry.create_action_model(page_url=page_url)
+		if action_model is not self.ActionModel or self.AgentOutput is self.DoneAgentOutput:
+			self.ActionModel = action_model
+			if self.settings.flash_mode:
+				self.AgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.ActionModel)
+			elif self.settings.use_thinking:
+				self.AgentOutput = AgentOutput.type_with_custom_actions(self.ActionModel)
+			else:
+				self.AgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.ActionModel)
 
 		# Update done action model too
-		self.DoneActionModel = self.tools.registry.create_action_model(include_actions=['done'], page_url=page_url)
+		done_action_model = self.tools.registry.create_action_model(include_actions=['done'], page_url=page_url)
+		if done_action_model is self.DoneActionModel:
+			return
+		self.DoneActionModel = done_action_model
 		if self.settings.flash_mode:
 			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.DoneActionModel)
 		elif self.settings.use_thinking:
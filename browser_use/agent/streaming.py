@@ -0,0 +1,201 @@
+"""
+Early action dispatch for streamed LLM responses.
+
+The LLM streams the raw JSON of an AgentOutput. IncrementalActionParser picks each finished element out of its
+top-level "action" list, and ActionStream hands them to the agent so the first action can run while the model
+is still writing the rest.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from pydantic import ValidationError
+
+from browser_use.tools.registry.views import ActionModel
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalActionParser:
+	"""Yields each complete element of the top-level "action" array of a JSON object received in chunks.
+
+	Only tracks string/escape state and nesting depth, so every character is looked at once no matter how the
+	text is split. Text around the object (e.g. markdown code fences) is ignored.
+	"""
+
+	def __init__(self, key: str = 'action'):
+		self.key = key
+		self._buffer: list[str] = []
+		self._depth = 0
+		self._in_string = False
+		self._escaped = False
+		self._string_start = -1
+		self._last_string: str | None = None
+		self._current_key: str | None = None
+		self._in_array = False
+		self._array_closed = False
+		self._element_start = -1
+		self._length = 0
+
+	def feed(self, text: str) -> list[dict[str, Any]]:
+		"""Consume the next chunk and return the array elements it completed"""
+		if self._array_closed:
+			return []
+
+		completed: list[dict[str, Any]] = []
+		for char in text:
+			position = self._length
+			self._length += 1
+			self._buffer.append(char)
+
+			if self._in_string:
+				if self._escaped:
+					self._escaped = False
+				elif char == '\\':
+					self._escaped = True
+				elif char == '"':
+					self._in_string = False
+					if self._depth == 1:
+						self._last_string = ''.join(self._buffer[self._string_start + 1 : position])
+				continue
+
+			if char == '"':
+				self._in_string = True
+				self._string_start = position
+			elif char == ':' and self._depth == 1:
+				self._current_key = self._last_string
+			elif char == ',' and self._depth == 1:
+				self._current_key = None
+			elif char in '{[':
+				if char == '[' and self._depth == 1 and self._current_key == self.key:
+					self._in_array = True
+				elif char == '{' and self._in_array and self._depth == 2:
+					self._element_start = position
+				self._depth += 1
+			elif char in '}]':
+				self._depth -= 1
+				if self._in_array and self._depth == 2 and char == '}' and self._element_start >= 0:
+					element = json.loads(''.join(self._buffer[self._element_start : position + 1]))
+					self._element_start = -1
+					if isinstance(element, dict):
+						completed.append(element)
+				elif self._in_array and self._depth == 1 and char == ']':
+					self._in_array = False
+					self._array_closed = True
+					break
+
+			# Outside strings and the current element nothing before this point is needed again
+			if self._element_start < 0 and not self._in_string and len(self._buffer) > 4096:
+				self._buffer = []
+				self._length = 0
+
+		return completed
+
+
+class ActionStream:
+	"""Actions parsed from a streaming LLM response, consumed by Agent.multi_act while the response is generated.
+
+	The LLM call reports text deltas through feed(). When it finishes, close() replaces whatever is still queued
+	with the rest of the final validated output. If that output disagrees with an action already dispatched,
+	dispatch stops, because executed actions cannot be taken back.
+	"""
+
+	def __init__(self, action_model: type[ActionModel], max_actions: int):
+		self.action_model = action_model
+		self.max_actions = max_actions
+		self.streamed: list[ActionModel] = []  # parsed from the response so far, in order
+		self.dispatched: list[ActionModel] = []  # handed to the agent for execution
+		self.stopped = False
+		self._queue: asyncio.Queue[ActionModel | None] = asyncio.Queue()
+		self._parser = IncrementalActionParser()
+		self._parsing = True
+		self._prepare: Callable[[ActionModel], None] | None = None
+		self._closed = False
+
+	def start_attempt(self, prepare: Callable[[ActionModel], None] | None = None) -> None:
+		"""Reset the parser for a new LLM request. prepare is applied to each action before it is queued."""
+		if self.streamed:
+			# A retried request cannot be lined up with actions from the previous one, let the final output decide
+			logger.debug('LLM request retried after streaming actions, waiting for the final output')
+			self._parsing = False
+		self._parser = IncrementalActionParser()
+		self._prepare = prepare
+
+	def feed(self, text: str) -> None:
+		"""Text delta callback passed to BaseChatModel.ainvoke(on_text_delta=...)"""
+		if not self._parsing or self.stopped or self._closed:
+			return
+		try:
+			elements = self._parser.feed(text)
+		except json.JSONDecodeError as e:
+			logger.debug(f'Could not parse streamed action, waiting for the final output: {e}')
+			self._parsing = False
+			return
+
+		for element in elements:
+			# done must see the complete output, so it only ever comes from the final response
+			if len(self.streamed) >= self.max_actions or 'done' in element:
+				self._parsing = False
+				return
+			try:
+				action = self.action_model.model_validate(element)
+			except ValidationError as e:
+				logger.debug(f'Streamed action failed validation, waiting for the final output: {e}')
+				self._parsing = False
+				return
+			if self._prepare is not None:
+				self._prepare(action)
+			self.streamed.append(action)
+			self._queue.put_nowait(action)
+
+	def close(self, final_actions: list[ActionModel] | None) -> None:
+		"""End the stream. final_actions is the validated output, or None if the LLM call failed."""
+		if self._closed:
+			return
+		self._closed = True
+
+		if final_actions is not None and not self.stopped:
+			# Queued actions can still be swapped for the final ones, only those already dispatched have to match
+			while not self._queue.empty():
+				self._queue.get_nowait()
+			dispatched = [action.model_dump(exclude_unset=True) for action in self.dispatched]
+			final = [action.model_dump(exclude_unset=True) for action in final_actions[: len(dispatched)]]
+			if dispatched != final:
+				logger.warning('⚠️ Final LLM output differs from the streamed actions, skipping the remaining actions')
+				self.stopped = True
+			else:
+				for action in final_actions[len(dispatched) : self.max_actions]:
+					self._queue.put_nowait(action)
+
+		self._queue.put_nowait(None)
+
+	def stop(self) -> None:
+		"""Stop dispatching, the remaining actions are skipped"""
+		self.stopped = True
+
+	def __aiter__(self) -> 'ActionStream':
+		return self
+
+	async def __anext__(self) -> ActionModel:
+		while True:
+			action = await self._queue.get()
+			if action is None:
+				self._queue.put_nowait(None)  # keep the stream closed for later readers
+				raise StopAsyncIteration
+			if self.stopped:
+				continue
+			self.dispatched.append(action)
+			return action
+
+
+async def iterate_actions(actions: list[ActionModel] | ActionStream) -> AsyncIterator[ActionModel]:
+	"""Iterate a list of actions and an ActionStream the same way"""
+	if isinstance(actions, ActionStream):
+		async for action in actions:
+			yield action
+	else:
+		for action in actions:
+			yield action
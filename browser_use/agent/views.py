@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import base64
 import json
 import logging
 import traceback
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Generic, Literal
@@ -12,6 +14,7 @@ from typing_extensions import TypeVar
 from uuid_extensions import uuid7str
 
 from browser_use.agent.message_manager.views import MessageManagerState
+from browser_use.browser.prefetch import PrefetchStats
 from browser_use.browser.views import BrowserStateHistory
 from browser_use.dom.views import DEFAULT_INCLUDE_ATTRIBUTES, DOMInteractedElement, DOMSelectorMap
 
@@ -23,8 +26,9 @@ from browser_use.dom.views import DEFAULT_INCLUDE_ATTRIBUTES, DOMInteractedEleme
 # from browser_use.dom.views import SelectorMap
 from browser_use.filesystem.file_system import FileSystemState
 from browser_use.llm.base import BaseChatModel
-from browser_use.tokens.views import UsageSummary
+from browser_use.tokens.views import PromptCacheUsage, UsageSummary
 from browser_use.tools.registry.views import ActionModel
+from browser_use.tracing.views import TraceSummary
 
 logger = logging.getLogger(__name__)
 
@@ -34,10 +38,21 @@ class AgentSettings(BaseModel):
 
 	use_vision: bool | Literal['auto'] = True
 	vision_detail_level: Literal['auto', 'low', 'high'] = 'auto'
+	deduplicate_screenshots: bool = True  # Reuse the previous step's stored screenshot when the page has the same pixels
+	omit_unchanged_screenshots: bool = False  # Also leave such screenshots out of the LLM prompt
+	screenshot_storage_format: Literal['webp', 'avif'] | None = (
+		None  # Re-encode stored screenshots, None keeps the captured format
+	)
+	screenshot_storage_quality: int = 80
+	screenshot_retention_max_age: float | None = None  # seconds
+	screenshot_retention_max_bytes: int | None = None
+	stream_actions: bool = False  # Execute actions while the LLM response is still streaming, off with a step callback
+	speculative_prefetch: bool = False  # Prefetch likely-needed CDP results while waiting for the LLM
 	save_conversation_path: str | Path | None = None
 	save_conversation_path_encoding: str | None = 'utf-8'
 	max_failures: int = 3
 	generate_gif: bool | str = False
+	trace_latency: bool | str = False  # True to collect a latency trace, or a path to also export it as Chrome trace JSON
 	override_system_message: str | None = None
 	extend_system_message: str | None = None
 	include_attributes: list[str] | None = DEFAULT_INCLUDE_ATTRIBUTES
@@ -47,6 +62,9 @@ class AgentSettings(BaseModel):
 	use_judge: bool = True
 	ground_truth: str | None = None  # Ground truth answer or criteria for judge validation
 	max_history_items: int | None = None
+	dom_token_budget: int | None = None  # Fit the page elements into this many tokens, dropping the least relevant lines
+	dom_state_format: Literal['full', 'delta'] = 'full'  # 'delta' sends changes against a periodic full page snapshot
+	dom_keyframe_interval: int = 10  # Steps between full page snapshots in the delta format
 
 	page_extraction_llm: BaseChatModel | None = None
 	calculate_cost: bool = False
@@ -169,6 +187,7 @@ class StepMetadata(BaseModel):
 	step_end_time: float
 	step_number: int
 	step_interval: float | None = None
+	prompt_cache: PromptCacheUsage | None = None  # prompt tokens of this step's LLM calls and how many were cache hits
 
 	@property
 	def duration_seconds(self) -> float:
@@ -403,6 +422,8 @@ class AgentHistoryList(BaseModel, Generic[AgentStructuredOutput]):
 
 	history: list[AgentHistory]
 	usage: UsageSummary | None = None
+	trace_summary: TraceSummary | None = None  # Per-run latency summary (Agent(trace_latency=...))
+	prefetch_stats: PrefetchStats | None = None  # Speculation hit rate and waste (Agent(speculative_prefetch=True))
 
 	_output_model_schema: type[AgentStructuredOutput] | None = None
 
@@ -583,24 +604,29 @@ class AgentHistoryList(BaseModel, Generic[AgentStructuredOutput]):
 			else:
 				return [h.state.screenshot_path for h in self.history[-n_last:] if h.state.screenshot_path is not None]
 
-	def screenshots(self, n_last: int | None = None, return_none_if_not_screenshot: bool = True) -> list[str | None]:
-		"""Get all screenshots from history as base64 strings"""
+	def iter_screenshot_bytes(
+		self, n_last: int | None = None, return_none_if_not_screenshot: bool = True
+	) -> Iterator[bytes | None]:
+		"""Yield screenshots from history as raw image bytes, reading each file from disk only when it is reached"""
 		if n_last == 0:
-			return []
+			return
 
 		history_items = self.history if n_last is None else self.history[-n_last:]
-		screenshots = []
-
 		for item in history_items:
-			screenshot_b64 = item.state.get_screenshot()
-			if screenshot_b64:
-				screenshots.append(screenshot_b64)
-			else:
-				if return_none_if_not_screenshot:
-					screenshots.append(None)
-				# If return_none_if_not_screenshot is False, we skip None values
+			screenshot = item.state.get_screenshot_bytes()
+			if screenshot:
+				yield screenshot
+			elif return_none_if_not_screenshot:
+				yield None
+
+	def iter_screenshots(self, n_last: int | None = None, return_none_if_not_screenshot: bool = True) -> Iterator[str | None]:
+		"""Yield screenshots from history as base64 strings, one at a time"""
+		for screenshot in self.iter_screenshot_bytes(n_last, return_none_if_not_screenshot):
+			yield base64.b64encode(screenshot).decode('utf-8') if screenshot else None
 
-		return screenshots
+	def screenshots(self, n_last: int | None = None, return_none_if_not_screenshot: bool = True) -> list[str | None]:
+		"""Get all screenshots from history as base64 strings"""
+		return list(self.iter_screenshots(n_last, return_none_if_not_screenshot))
 
 	def action_names(self) -> list[str]:
 		"""Get all action names from history"""
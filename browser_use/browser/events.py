@@ -9,7 +9,7 @@ from bubus.models import T_EventResultType
 from cdp_use.cdp.target import TargetID
 from pydantic import BaseModel, Field, field_validator
 
-from browser_use.browser.views import BrowserStateSummary
+from browser_use.browser.views import BrowserStateSummary, ScreenshotFormat
 from browser_use.dom.views import EnhancedDOMTreeNode
 
 
@@ -187,6 +187,11 @@ class ScreenshotEvent(BaseEvent[str]):
 
 	full_page: bool = False
 	clip: dict[str, float] | None = None  # {x, y, width, height}
+	format: ScreenshotFormat = 'png'
+	quality: int | None = None  # 0-100, JPEG and WebP only
+	# Let the browser render the viewport downscaled (Page.captureScreenshot clip.scale) as far as it can while still
+	# covering (width, height) pixels, instead of capturing at full device resolution and resizing afterwards
+	target_size: tuple[int, int] | None = None
 
 	event_timeout: float | None = Field(default_factory=lambda: _get_timeout('TIMEOUT_ScreenshotEvent', 15.0))  # seconds
 
@@ -0,0 +1,327 @@
+"""
+Pool of warm local browsers.
+
+Launching Chrome, finding a free debugging port and waiting for its CDP endpoint takes seconds for every
+BrowserSession.start(). BrowserPool launches browsers ahead of time, each with its own clean temporary profile, and
+hands out BrowserSessions connected to an idle one, so starting a session only opens a CDP connection. Released
+browsers are reset (tabs, cookies and site storage) and go back to the pool, or are shut down and replaced once they
+were used max_uses times or grew beyond max_memory_mb.
+"""
+
+import asyncio
+import logging
+import shutil
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+import httpx
+import psutil
+from cdp_use import CDPClient
+from pydantic import BaseModel
+
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import BrowserSession
+from browser_use.utils import create_task_with_error_handling
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPoolStats(BaseModel):
+	"""Counters of a BrowserPool"""
+
+	acquired: int = 0
+	hits: int = 0  # sessions handed a browser that was already running
+	misses: int = 0  # sessions that had to wait for a browser to launch
+	launches: int = 0
+	failed_launches: int = 0
+	recycled: int = 0  # browsers shut down after max_uses, max_memory_mb or a failed reset
+	launch_seconds: float = 0.0  # total time spent launching browsers
+	last_launch_seconds: float = 0.0
+
+	@property
+	def hit_rate(self) -> float:
+		"""Share of sessions that got a warm browser"""
+		return self.hits / self.acquired if self.acquired else 0.0
+
+	@property
+	def average_launch_seconds(self) -> float:
+		return self.launch_seconds / self.launches if self.launches else 0.0
+
+	def summary(self) -> str:
+		return (
+			f'{self.acquired} sessions, {self.hits} warm ({self.hit_rate:.0%}), {self.launches} launches '
+			f'(avg {self.average_launch_seconds:.2f}s), {self.failed_launches} failed, {self.recycled} recycled'
+		)
+
+
+@dataclass
+class PooledBrowser:
+	"""A browser process owned by a BrowserPool"""
+
+	process: psutil.Process
+	cdp_url: str
+	user_data_dir: Path
+	client: CDPClient | None = None
+	"""The pool's own CDP connection, used to see which sites were visited and to reset the browser"""
+	uses: int = 0
+	origins: set[str] = field(default_factory=set)
+	"""Origins opened since the last reset, their site storage is cleared on the next reset"""
+
+
+class BrowserPool:
+	"""Keeps local browsers launched ahead of time and hands out sessions connected to them.
+
+	```python
+	pool = BrowserPool(size=4, browser_profile=BrowserProfile(headless=True))
+	await pool.start()
+
+	async with pool.session() as browser_session:
+	    await Agent(task=task, llm=llm, browser_session=browser_session).run()
+
+	print(pool.stats.summary())
+	await pool.close()
+	```
+
+	Every handed out session is a new BrowserSession with its own event bus, watchdogs and caches. It does not own the
+	browser process: stopping or killing it only disconnects, the browser goes back to the pool on release(). The pool
+	keeps size idle browsers ready, launching replacements in the background as sessions take them.
+	"""
+
+	def __init__(
+		self,
+		size: int = 2,
+		browser_profile: BrowserProfile | None = None,
+		max_uses: int = 20,
+		max_memory_mb: float | None = None,
+	):
+		"""
+		Args:
+			size: Number of idle browsers to keep ready
+			browser_profile: Launch settings of the browsers, a temporary user_data_dir is used for each of them
+			max_uses: Sessions a browser serves before it is replaced by a fresh one
+			max_memory_mb: Replace a browser on release when its processes use more memory than this
+		"""
+		browser_profile = browser_profile or BrowserProfile()
+		if browser_profile.cdp_url or browser_profile.use_cloud or browser_profile.cloud_browser_params:
+			raise ValueError('BrowserPool launches local browsers, it cannot pool a browser given by cdp_url or a cloud browser')
+		if size < 0 or max_uses < 1:
+			raise ValueError('BrowserPool needs size >= 0 and max_uses >= 1')
+
+		self.size = size
+		self.browser_profile = browser_profile
+		self.max_uses = max_uses
+		self.max_memory_mb = max_memory_mb
+		self.stats = BrowserPoolStats()
+
+		self._idle: asyncio.Queue[PooledBrowser | BaseException] = asyncio.Queue()
+		self._launches: set[asyncio.Task] = set()
+		self._waiting = 0
+		self._leased: dict[str, PooledBrowser] = {}
+		self._closed = False
+
+	async def start(self, wait: bool = True) -> None:
+		"""Launch the idle browsers, waiting until they are ready unless wait is False"""
+		self._replenish()
+		if wait and self._launches:
+			await asyncio.gather(*self._launches, return_exceptions=True)
+
+	async def acquire(self) -> BrowserSession:
+		"""Get a session connected to an idle browser, launching one if none is ready"""
+		if self._closed:
+			raise RuntimeError('BrowserPool is closed')
+
+		self.stats.acquired += 1
+		if self._idle.empty():
+			self.stats.misses += 1
+		else:
+			self.stats.hits += 1
+
+		self._waiting += 1
+		self._replenish()
+		try:
+			browser = await self._idle.get()
+		finally:
+			self._waiting -= 1
+		if isinstance(browser, BaseException):
+			self._replenish()
+			raise browser
+
+		browser.uses += 1
+		browser_session = BrowserSession(
+			browser_profile=self.browser_profile,
+			cdp_url=browser.cdp_url,
+			is_local=True,
+			user_data_dir=browser.user_data_dir,
+			keep_alive=False,
+		)
+		self._leased[browser_session.id] = browser
+		self._replenish()
+		return browser_session
+
+	async def release(self, browser_session: BrowserSession) -> None:
+		"""Give a session's browser back: reset it for the next session or replace it when it is used up"""
+		browser = self._leased.pop(browser_session.id, None)
+		if browser is None:
+			raise ValueError(f'BrowserSession {browser_session.id} was not acquired from this pool')
+
+		if browser_session._cdp_client_root is not None:
+			await browser_session.kill()  # only disconnects, the browser process belongs to the pool
+
+		if self._closed:
+			await self._shutdown(browser)
+			return
+		if browser.uses >= self.max_uses or (self.max_memory_mb is not None and self._memory_mb(browser) > self.max_memory_mb):
+			self._recycle(browser)
+			return
+		try:
+			await self._reset(browser)
+		except Exception as e:
+			logger.warning(f'🏊 Failed to reset pooled browser, replacing it: {type(e).__name__}: {e}')
+			self._recycle(browser)
+			return
+		self._idle.put_nowait(browser)
+
+	@asynccontextmanager
+	async def session(self) -> AsyncIterator[BrowserSession]:
+		"""acquire() a session and release() it when the block exits"""
+		browser_session = await self.acquire()
+		try:
+			yield browser_session
+		finally:
+			await self.release(browser_session)
+
+	async def close(self) -> None:
+		"""Shut down all idle browsers, and leased ones as they are released"""
+		self._closed = True
+		# Launches in flight shut their browser down themselves once they see the pool closed
+		await asyncio.gather(*self._launches, return_exceptions=True)
+		while not self._idle.empty():
+			browser = self._idle.get_nowait()
+			if isinstance(browser, PooledBrowser):
+				await self._shutdown(browser)
+		logger.debug(f'🏊 Browser pool closed: {self.stats.summary()}')
+
+	async def __aenter__(self) -> 'BrowserPool':
+		await self.start()
+		return self
+
+	async def __aexit__(self, *args: Any) -> None:
+		await self.close()
+
+	def _replenish(self) -> None:
+		"""Start launches until idle and launching browsers cover size plus the sessions waiting for one"""
+		if self._closed:
+			return
+		missing = self.size + self._waiting - self._idle.qsize() - len(self._launches)
+		for _ in range(missing):
+			task = create_task_with_error_handling(self._launch_into_pool(), name='browser_pool_launch', logger_instance=logger)
+			self._launches.add(task)
+			task.add_done_callback(self._launches.discard)
+
+	async def _launch_into_pool(self) -> None:
+		started = time.perf_counter()
+		try:
+			browser = await self._launch()
+		except Exception as e:
+			self.stats.failed_launches += 1
+			logger.warning(f'🏊 Failed to launch pooled browser: {type(e).__name__}: {e}')
+			if self._waiting:
+				self._idle.put_nowait(e)  # fail a waiting acquire() instead of leaving it hanging
+			return
+
+		elapsed = time.perf_counter() - started
+		self.stats.launches += 1
+		self.stats.launch_seconds += elapsed
+		self.stats.last_launch_seconds = elapsed
+		if self._closed:
+			await self._shutdown(browser)
+			return
+		self._idle.put_nowait(browser)
+
+	async def _launch(self) -> PooledBrowser:
+		"""Launch a browser with a fresh temporary profile and connect the pool's CDP client to it"""
+		from browser_use.browser.watchdogs.local_browser_watchdog import LocalBrowserWatchdog
+
+		# user_data_dir=None makes the profile create a new temporary directory
+		profile = BrowserProfile(**{**self.browser_profile.model_dump(exclude_unset=True), 'user_data_dir': None})
+		launcher_session = BrowserSession(browser_profile=profile)
+		launcher = LocalBrowserWatchdog(event_bus=launcher_session.event_bus, browser_session=launcher_session)
+		process, cdp_url = await launcher._launch_browser()
+		browser = PooledBrowser(
+			process=process, cdp_url=cdp_url, user_data_dir=Path(str(launcher_session.browser_profile.user_data_dir))
+		)
+		try:
+			browser.client = await self._connect(browser)
+		except BaseException:
+			await self._shutdown(browser)
+			raise
+		return browser
+
+	async def _connect(self, browser: PooledBrowser) -> CDPClient:
+		"""Connect to the browser and record the origin of every page opened in it"""
+		async with httpx.AsyncClient() as http:
+			version_info = await http.get(f'{browser.cdp_url.rstrip("/")}/json/version')
+		client = CDPClient(version_info.json()['webSocketDebuggerUrl'])
+		await client.start()
+
+		def on_target(event, session_id=None):
+			url = urlparse(event['targetInfo'].get('url', ''))
+			if url.scheme in ('http', 'https'):
+				browser.origins.add(f'{url.scheme}://{url.netloc}')
+
+		client.register.Target.targetCreated(on_target)
+		client.register.Target.targetInfoChanged(on_target)
+		await client.send.Target.setDiscoverTargets(params={'discover': True})
+		return client
+
+	async def _reset(self, browser: PooledBrowser) -> None:
+		"""Leave one blank tab and clear cookies and the storage of every visited site"""
+		assert browser.client is not None
+		client = browser.client
+		targets = (await client.send.Target.getTargets())['targetInfos']
+		await client.send.Target.createTarget(params={'url': 'about:blank'})
+		for target in targets:
+			if target['type'] == 'page':
+				await client.send.Target.closeTarget(params={'targetId': target['targetId']})
+
+		await client.send.Storage.clearCookies()
+		for origin in sorted(browser.origins):
+			await client.send.Storage.clearDataForOrigin(params={'origin': origin, 'storageTypes': 'all'})
+		browser.origins.clear()
+
+	def _recycle(self, browser: PooledBrowser) -> None:
+		"""Shut a used up browser down in the background and launch its replacement"""
+		self.stats.recycled += 1
+		create_task_with_error_handling(self._shutdown(browser), name='browser_pool_shutdown', logger_instance=logger)
+		self._replenish()
+
+	async def _shutdown(self, browser: PooledBrowser) -> None:
+		from browser_use.browser.watchdogs.local_browser_watchdog import LocalBrowserWatchdog
+
+		if browser.client is not None:
+			try:
+				await browser.client.stop()
+			except Exception as e:
+				logger.debug(f'Error closing pooled browser CDP connection: {e}')
+		await LocalBrowserWatchdog._cleanup_process(browser.process)
+		shutil.rmtree(browser.user_data_dir, ignore_errors=True)
+
+	@staticmethod
+	def _memory_mb(browser: PooledBrowser) -> float:
+		"""Resident memory of the browser and all its renderer, GPU and utility processes"""
+		try:
+			processes = [browser.process, *browser.process.children(recursive=True)]
+		except psutil.Error:
+			return 0.0
+		rss = 0
+		for process in processes:
+			try:
+				rss += process.memory_info().rss
+			except psutil.Error:
+				pass
+		return rss / (1024 * 1024)
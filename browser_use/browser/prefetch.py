@@ -0,0 +1,266 @@
+"""
+Speculative CDP prefetching while the agent waits for the LLM.
+
+Between sending the prompt and receiving the model output the browser is idle. SpeculativePrefetcher uses that
+time to fetch what the next action most likely needs: layout metrics of every open tab, content quads and remote
+object ids of the visible interactive elements, and the clean markdown the extract action works on. Action code
+takes results out with the take_* methods and falls back to its own CDP calls on a miss.
+
+Prefetched results describe the page as it was when they were fetched, so the agent invalidates the prefetcher
+after every action and the browser session invalidates it whenever a new DOM state is cached.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pydantic import BaseModel
+
+from browser_use.utils import create_task_with_error_handling
+
+if TYPE_CHECKING:
+	from browser_use.browser.session import BrowserSession
+	from browser_use.dom.views import EnhancedDOMTreeNode
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class PrefetchStats(BaseModel):
+	"""Speculation counters for a run (Agent(speculative_prefetch=True))"""
+
+	rounds: int = 0
+	cdp_calls: int = 0  # CDP commands sent speculatively
+	hits: int = 0  # prefetched CDP results used by an action
+	wasted_cdp_calls: int = 0  # failed, cancelled, outdated or never used
+	markdown_prefetches: int = 0
+	markdown_hits: int = 0
+
+	@property
+	def hit_rate(self) -> float:
+		"""Share of speculative CDP calls whose result was used"""
+		return self.hits / self.cdp_calls if self.cdp_calls else 0.0
+
+	def summary(self) -> str:
+		return (
+			f'{self.rounds} rounds, {self.cdp_calls} CDP calls, {self.hits} hits ({self.hit_rate:.0%}), '
+			f'{self.wasted_cdp_calls} wasted, markdown {self.markdown_hits}/{self.markdown_prefetches} used'
+		)
+
+
+class SpeculativePrefetcher:
+	"""Fetches likely-needed CDP results during LLM latency and hands them to the actions that need them.
+
+	Every cached result is counted either as a hit when an action takes it, or as wasted when it is invalidated
+	unused. Calls that fail, are cancelled when the LLM responds, or return after an invalidation are wasted too.
+	"""
+
+	def __init__(self, browser_session: 'BrowserSession', max_elements: int = 10, prefetch_markdown: bool = True):
+		self.browser_session = browser_session
+		self.max_elements = max_elements
+		self.prefetch_markdown = prefetch_markdown
+		self.stats = PrefetchStats()
+
+		self._generation = 0
+		self._layout_metrics: dict[str, Any] = {}
+		"""session_id -> Page.getLayoutMetrics result"""
+		self._quads: dict[tuple[str, int], list[list[float]]] = {}
+		"""(session_id, backend_node_id) -> DOM.getContentQuads quads, only kept when inside the viewport"""
+		self._object_ids: dict[tuple[str, int], str] = {}
+		"""(session_id, backend_node_id) -> DOM.resolveNode objectId"""
+		self._object_group_clients: dict[tuple[str, int], Any] = {}
+		"""(session_id, generation) -> CDP client holding the remote objects resolved for that generation"""
+		self._markdown: dict[bool, tuple[str, str, dict[str, Any]]] = {}
+		"""extract_links -> (url, content, content stats) from extract_clean_markdown"""
+
+	async def run(self) -> None:
+		"""Run one round of speculation for the current page. Meant to be cancelled once the LLM responds."""
+		generation = self._generation
+		self.stats.rounds += 1
+		await self._warm_tabs(generation)
+		await asyncio.gather(*(self._prefetch_element(node, generation) for node in self._likely_targets()))
+		if self.prefetch_markdown:
+			await self._prefetch_markdown(generation)
+
+	def invalidate(self) -> None:
+		"""Drop all prefetched results, the page may have changed. Calls still in flight are discarded."""
+		unused = len(self._layout_metrics) + len(self._quads) + len(self._object_ids)
+		if unused:
+			self.stats.wasted_cdp_calls += unused
+			logger.debug(f'🔮 Dropped {unused} unused prefetched CDP results')
+		self._layout_metrics.clear()
+		self._quads.clear()
+		self._object_ids.clear()
+		self._markdown.clear()
+		# Remote objects stay alive in the page until released, whether an action used them or not
+		for (session_id, generation), cdp_client in self._object_group_clients.items():
+			self._release_object_group(cdp_client, session_id, generation)
+		self._object_group_clients.clear()
+		self._generation += 1
+
+	# region - consumers
+
+	def take_layout_metrics(self, session_id: str) -> Any | None:
+		return self._take(self._layout_metrics, session_id)
+
+	def take_quads(self, session_id: str, backend_node_id: int) -> list[list[float]] | None:
+		return self._take(self._quads, (session_id, backend_node_id))
+
+	def take_object_id(self, session_id: str, backend_node_id: int) -> str | None:
+		return self._take(self._object_ids, (session_id, backend_node_id))
+
+	def take_markdown(self, url: str, extract_links: bool) -> tuple[str, dict[str, Any]] | None:
+		"""Clean markdown of the page at url, as returned by extract_clean_markdown"""
+		cached = self._markdown.pop(extract_links, None)
+		if cached is None or cached[0] != url:
+			return None
+		self.stats.markdown_hits += 1
+		_, content, content_stats = cached
+		return content, dict(content_stats)
+
+	def _take(self, cache: dict[Any, T], key: Any) -> T | None:
+		result = cache.pop(key, None)
+		if result is not None:
+			self.stats.hits += 1
+		return result
+
+	# endregion
+
+	# region - speculation
+
+	async def _send(self, generation: int, command: Awaitable[T]) -> T | None:
+		"""Await a speculative CDP command, returning None when its result cannot be used"""
+		self.stats.cdp_calls += 1
+		try:
+			result = await command
+		except asyncio.CancelledError:
+			self.stats.wasted_cdp_calls += 1
+			raise
+		except Exception as e:
+			self.stats.wasted_cdp_calls += 1
+			logger.debug(f'🔮 Speculative CDP call failed: {type(e).__name__}: {e}')
+			return None
+		if generation != self._generation:
+			# The page changed while the call was in flight
+			self.stats.wasted_cdp_calls += 1
+			return None
+		return result
+
+	async def _warm_tabs(self, generation: int) -> None:
+		"""Attach to every open tab and fetch its layout metrics, used first by clicks and scrolls"""
+
+		async def warm(target_id: str) -> None:
+			try:
+				cdp_session = await self.browser_session.get_or_create_cdp_session(target_id, focus=False)
+			except Exception as e:
+				logger.debug(f'🔮 Could not warm CDP session for tab {target_id[-4:]}: {e}')
+				return
+			metrics = await self._send(
+				generation, cdp_session.cdp_client.send.Page.getLayoutMetrics(session_id=cdp_session.session_id)
+			)
+			if metrics is not None:
+				self._layout_metrics[cdp_session.session_id] = metrics
+
+		await asyncio.gather(*(warm(target.target_id) for target in self.browser_session.get_page_targets()))
+
+	def _likely_targets(self) -> list['EnhancedDOMTreeNode']:
+		"""Visible interactive elements on screen, in the order the LLM sees them"""
+		state = self.browser_session._cached_browser_state_summary
+		page_info = state.page_info if state is not None else None
+		targets = []
+		for node in self.browser_session._cached_selector_map.values():
+			if not node.is_visible:
+				continue
+			position = node.absolute_position
+			if page_info is not None and position is not None:
+				# Elements outside the viewport get scrolled first, which moves them away from their prefetched quads
+				if (
+					position.y + position.height < page_info.scroll_y
+					or position.y > page_info.scroll_y + page_info.viewport_height
+				):
+					continue
+			targets.append(node)
+			if len(targets) >= self.max_elements:
+				break
+		return targets
+
+	async def _prefetch_element(self, node: 'EnhancedDOMTreeNode', generation: int) -> None:
+		try:
+			cdp_session = await self.browser_session.cdp_client_for_node(node)
+		except Exception as e:
+			logger.debug(f'🔮 No CDP session for element {node.backend_node_id}: {e}')
+			return
+		session_id = cdp_session.session_id
+		params = {'backendNodeId': node.backend_node_id}
+		self._object_group_clients[(session_id, generation)] = cdp_session.cdp_client
+		quads_result, object_result = await asyncio.gather(
+			self._send(generation, cdp_session.cdp_client.send.DOM.getContentQuads(params=params, session_id=session_id)),
+			self._send(
+				generation,
+				cdp_session.cdp_client.send.DOM.resolveNode(
+					params={**params, 'objectGroup': self._object_group(generation)}, session_id=session_id
+				),
+			),
+		)
+		if generation != self._generation:
+			# Resolved after invalidate() released the group, release it again so the object doesn't leak
+			self._release_object_group(cdp_session.cdp_client, session_id, generation)
+			return
+		key = (session_id, node.backend_node_id)
+
+		if quads_result is not None:
+			quads = quads_result.get('quads') or []
+			if quads and self._in_viewport(session_id, quads):
+				self._quads[key] = quads
+			else:
+				self.stats.wasted_cdp_calls += 1
+
+		if object_result is not None:
+			object_id = object_result.get('object', {}).get('objectId')
+			if object_id:
+				self._object_ids[key] = object_id
+			else:
+				self.stats.wasted_cdp_calls += 1
+
+	@staticmethod
+	def _object_group(generation: int) -> str:
+		return f'browser_use_prefetch_{generation}'
+
+	def _release_object_group(self, cdp_client: Any, session_id: str, generation: int) -> None:
+		"""Release the remote objects resolved for generation in the background, the tab may be gone already"""
+
+		async def release() -> None:
+			try:
+				await cdp_client.send.Runtime.releaseObjectGroup(
+					params={'objectGroup': self._object_group(generation)}, session_id=session_id
+				)
+			except Exception as e:
+				logger.debug(f'🔮 Could not release prefetched objects: {type(e).__name__}: {e}')
+
+		create_task_with_error_handling(release(), name='prefetch_release_objects', logger_instance=logger)
+
+	def _in_viewport(self, session_id: str, quads: list[list[float]]) -> bool:
+		"""Whether scrollIntoViewIfNeeded would leave the element where it is"""
+		metrics = self._layout_metrics.get(session_id)
+		if metrics is None:
+			return False
+		width = metrics['layoutViewport']['clientWidth']
+		height = metrics['layoutViewport']['clientHeight']
+		return all(0 <= quad[i] <= width and 0 <= quad[i + 1] <= height for quad in quads for i in range(0, len(quad) - 1, 2))
+
+	async def _prefetch_markdown(self, generation: int) -> None:
+		from browser_use.dom.markdown_extractor import extract_clean_markdown
+
+		try:
+			url = await self.browser_session.get_current_page_url()
+			content, content_stats = await extract_clean_markdown(browser_session=self.browser_session)
+		except Exception as e:
+			logger.debug(f'🔮 Could not prefetch page markdown: {type(e).__name__}: {e}')
+			return
+		if generation == self._generation:
+			self._markdown[False] = (url, content, content_stats)
+			self.stats.markdown_prefetches += 1
+
+	# endregion
@@ -651,6 +651,26 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 		default=True, description='Only show element IDs in highlights if llm_representation is less than 10 characters.'
 	)
 	paint_order_filtering: bool = Field(default=True, description='Enable paint order filtering. Slightly experimental.')
+	incremental_dom_snapshots: bool = Field(
+		default=False,
+		description='Patch the cached DOM document from CDP DOM mutation events between steps instead of refetching the whole document and accessibility tree every step. Experimental.',
+	)
+	incremental_dom_max_dirty_nodes: int = Field(
+		ge=0,
+		default=500,
+		description='Maximum number of changed DOM nodes between two steps before incremental DOM snapshots fall back to a full rebuild.',
+	)
+	ax_tree_mode: Literal['full', 'auto'] = Field(
+		default='full',
+		description="Accessibility tree fetching for the agent's DOM state: 'full' fetches the whole AX tree of every frame, 'auto' only fetches AX data the DOM serializer needs (interactive candidates). Experimental.",
+	)
+	screenshot_format: Literal['png', 'jpeg', 'webp'] = Field(
+		default='png',
+		description="Image format the browser encodes agent screenshots in. 'jpeg' and 'webp' are much smaller and faster to capture than 'png', at some loss of detail.",
+	)
+	screenshot_quality: int | None = Field(
+		default=None, ge=0, le=100, description='Compression quality (0-100) for jpeg and webp screenshots.'
+	)
 	interaction_highlight_color: str = Field(
 		default='rgb(255, 127, 39)',
 		description='Color to use for highlighting elements during interactions (CSS color string).',
@@ -45,11 +45,13 @@ from browser_use.browser.profile import BrowserProfile, ProxySettings
 from browser_use.browser.views import BrowserStateSummary, TabInfo
 from browser_use.dom.views import DOMRect, EnhancedDOMTreeNode, TargetInfo
 from browser_use.observability import observe_debug
+from browser_use.tracing.service import Tracer, trace_cdp_client
 from browser_use.utils import _log_pretty_url, create_task_with_error_handling, is_new_tab_page
 
 if TYPE_CHECKING:
 	from browser_use.actor.page import Page
 	from browser_use.browser.demo_mode import DemoMode
+	from browser_use.browser.prefetch import SpeculativePrefetcher
 
 DEFAULT_BROWSER_PROFILE = BrowserProfile()
 
@@ -89,6 +91,7 @@ class CDPSession(BaseModel):
 	# Lifecycle monitoring (populated by SessionManager)
 	_lifecycle_events: Any = PrivateAttr(default=None)
 	_lifecycle_lock: Any = PrivateAttr(default=None)
+	_network_idle: Any = PrivateAttr(default=None)  # asyncio.Event, set on main-frame networkIdle, cleared on init
 
 
 class BrowserSession(BaseModel):
@@ -151,6 +154,8 @@ class BrowserSession(BaseModel):
 		highlight_elements: bool | None = None,
 		dom_highlight_elements: bool | None = None,
 		paint_order_filtering: bool | None = None,
+		incremental_dom_snapshots: bool | None = None,
+		ax_tree_mode: Literal['full', 'auto'] | None = None,
 		max_iframes: int | None = None,
 		max_iframe_depth: int | None = None,
 	) -> None: ...
@@ -184,6 +189,8 @@ class BrowserSession(BaseModel):
 		highlight_elements: bool | None = None,
 		dom_highlight_elements: bool | None = None,
 		paint_order_filtering: bool | None = None,
+		incremental_dom_snapshots: bool | None = None,
+		ax_tree_mode: Literal['full', 'auto'] | None = None,
 		max_iframes: int | None = None,
 		max_iframe_depth: int | None = None,
 		# All other local params
@@ -291,6 +298,8 @@ class BrowserSession(BaseModel):
 		highlight_elements: bool | None = None,
 		dom_highlight_elements: bool | None = None,
 		paint_order_filtering: bool | None = None,
+		incremental_dom_snapshots: bool | None = None,
+		ax_tree_mode: Literal['full', 'auto'] | None = None,
 		# Iframe processing limits
 		max_iframes: int | None = None,
 		max_iframe_depth: int | None = None,
@@ -423,6 +432,15 @@ class BrowserSession(BaseModel):
 	_cached_selector_map: dict[int, EnhancedDOMTreeNode] = PrivateAttr(default_factory=dict)
 	_downloaded_files: list[str] = PrivateAttr(default_factory=list)  # Track files downloaded during this session
 	_closed_popup_messages: list[str] = PrivateAttr(default_factory=list)  # Store messages from auto-closed JavaScript dialogs
+	_tracer: Tracer | None = PrivateAttr(
+		default=None
+	)  # Latency tracer of the agent driving this session (Agent(trace_latency=...))
+	_prefetcher: 'SpeculativePrefetcher | None' = PrivateAttr(
+		default=None
+	)  # Speculative CDP results of the agent driving this session (Agent(speculative_prefetch=True))
+	_tab_scope: set[TargetID] | None = PrivateAttr(
+		default=None
+	)  # Tabs a tab session works on (see new_tab_session()), None to work on every tab of the browser
 
 	# Watchdogs
 	_crash_watchdog: Any | None = PrivateAttr(default=None)
@@ -502,7 +520,9 @@ class BrowserSession(BaseModel):
 		self._downloaded_files.clear()
 
 		self.agent_focus_target_id = None
-		if self.is_local:
+		if self._tab_scope is not None:
+			self._tab_scope.clear()  # a restarted tab session opens a new tab
+		elif self.is_local:
 			self.browser_profile.cdp_url = None
 
 		self._crash_watchdog = None
@@ -994,6 +1014,8 @@ class BrowserSession(BaseModel):
 		# Clear cached browser state
 		self._cached_browser_state_summary = None
 		self._cached_selector_map.clear()
+		if self._prefetcher is not None:
+			self._prefetcher.invalidate()
 		self.logger.debug('🔄 Cached browser state cleared')
 
 		# Update agent focus if a specific target_id is provided (only for page/tab targets)
@@ -1046,6 +1068,13 @@ class BrowserSession(BaseModel):
 				except Exception as e:
 					self.logger.debug(f'Failed to cleanup cloud browser session: {e}')
 
+			# A tab session closes its own tabs, the browser keeps running for the session it was created from
+			for target_id in list(self._tab_scope or ()):
+				try:
+					await self._cdp_close_page(target_id)
+				except Exception as e:
+					self.logger.debug(f'Failed to close tab {target_id[-4:]} of tab session: {e}')
+
 			# Clear CDP session cache before stopping
 			self.logger.info(
 				f'📢 on_BrowserStopEvent - Calling reset() (force={event.force}, keep_alive={self.browser_profile.keep_alive})'
@@ -1053,7 +1082,7 @@ class BrowserSession(BaseModel):
 			await self.reset()
 
 			# Reset state
-			if self.is_local:
+			if self.is_local and self._tab_scope is None:
 				self.browser_profile.cdp_url = None
 
 			# Notify stop and wait for all handlers to complete
@@ -1070,6 +1099,57 @@ class BrowserSession(BaseModel):
 				)
 			)
 
+	@property
+	def tracer(self) -> Tracer | None:
+		"""Latency tracer of the agent currently driving this session, None when tracing is disabled."""
+		return self._tracer
+
+	def set_tracer(self, tracer: Tracer | None) -> None:
+		"""Attach (or detach with None) a latency tracer; CDP commands and browser state requests are recorded on it."""
+		self._tracer = tracer
+
+	@property
+	def prefetcher(self) -> 'SpeculativePrefetcher | None':
+		"""Speculative CDP results fetched while the agent waits for the LLM, None when prefetching is disabled."""
+		return self._prefetcher
+
+	def set_prefetcher(self, prefetcher: 'SpeculativePrefetcher | None') -> None:
+		"""Attach (or detach with None) a prefetcher; element geometry lookups and actions consult it first."""
+		self._prefetcher = prefetcher
+
+	def new_tab_session(self) -> Self:
+		"""Create a session that works in its own tab of this session's browser, to run agents in parallel in one browser.
+
+		The tab session connects to the same browser process over its own CDP connection, with its own event bus,
+		watchdogs, agent focus and DOM caches. It opens a new tab when started and only sees that tab and the tabs and
+		popups opened from it, so agents on different tab sessions don't see or switch to each other's tabs:
+
+		```python
+		await browser_session.start()
+		agents = [Agent(task=task, llm=llm, browser_session=browser_session.new_tab_session()) for task in tasks]
+		await asyncio.gather(*(agent.run() for agent in agents))
+		```
+
+		Cookies and storage are shared with the browser. Stopping a tab session closes its tabs and keeps the browser
+		running, only this session (or kill()) shuts it down.
+		"""
+		if not self.cdp_url:
+			raise RuntimeError('Start the browser session before creating tab sessions from it')
+
+		tab_profile = self.browser_profile.model_copy(
+			update={
+				'keep_alive': False,  # an agent closes its tab when it is done
+				'use_cloud': False,  # the cloud browser belongs to this session
+				'cloud_browser_params': None,
+				'storage_state': None,  # loaded and saved by this session
+				'user_data_dir': None,
+			}
+		)
+		tab_session = type(self)(browser_profile=tab_profile, cdp_url=self.cdp_url, is_local=self.is_local)
+		tab_session.llm_screenshot_size = self.llm_screenshot_size
+		tab_session._tab_scope = set()
+		return tab_session
+
 	# region - ========== CDP-based replacements for browser_context operations ==========
 	@property
 	def cdp_client(self) -> CDPClient:
@@ -1537,6 +1617,7 @@ class BrowserSession(BaseModel):
 				additional_headers=headers,
 				max_ws_frame_size=200 * 1024 * 1024,  # Use 200MB limit to handle pages with very large DOMs
 			)
+			trace_cdp_client(self._cdp_client_root, get_tracer=lambda: self._tracer)
 			assert self._cdp_client_root is not None
 			await self._cdp_client_root.start()
 
@@ -1580,10 +1661,9 @@ class BrowserSession(BaseModel):
 					except Exception as e:
 						self.logger.warning(f'Failed to redirect {target_url}: {e}')
 
-			# Ensure we have at least one page
+			# Ensure we have at least one page (a tab session always starts without one and opens its own)
 			if not page_targets_from_manager:
-				new_target = await self._cdp_client_root.send.Target.createTarget(params={'url': 'about:blank'})
-				target_id = new_target['targetId']
+				target_id = await self._cdp_create_new_page('about:blank')
 				self.logger.debug(f'📄 Created new blank page: {target_id}')
 			else:
 				target_id = page_targets_from_manager[0].target_id
@@ -1944,6 +2024,8 @@ class BrowserSession(BaseModel):
 			selector_map: The new selector map from DOM serialization
 		"""
 		self._cached_selector_map = selector_map
+		if self._prefetcher is not None:
+			self._prefetcher.invalidate()
 
 	# Alias for backwards compatibility
 	async def get_element_by_index(self, index: int) -> EnhancedDOMTreeNode | None:
@@ -2231,18 +2313,23 @@ class BrowserSession(BaseModel):
 		session_id = cdp_session.session_id
 		quads = []
 
+		# Method 0: Quads fetched speculatively while the agent was waiting for the LLM
+		if self._prefetcher is not None:
+			quads = self._prefetcher.take_quads(session_id, backend_node_id) or []
+
 		# Method 1: Try DOM.getContentQuads first (best for inline elements and complex layouts)
-		try:
-			content_quads_result = await cdp_session.cdp_client.send.DOM.getContentQuads(
-				params={'backendNodeId': backend_node_id}, session_id=session_id
-			)
-			if 'quads' in content_quads_result and content_quads_result['quads']:
-				quads = content_quads_result['quads']
-				self.logger.debug(f'Got {len(quads)} quads from DOM.getContentQuads')
-			else:
-				self.logger.debug(f'No quads found from DOM.getContentQuads {content_quads_result}')
-		except Exception as e:
-			self.logger.debug(f'DOM.getContentQuads failed: {e}')
+		if not quads:
+			try:
+				content_quads_result = await cdp_session.cdp_client.send.DOM.getContentQuads(
+					params={'backendNodeId': backend_node_id}, session_id=session_id
+				)
+				if 'quads' in content_quads_result and content_quads_result['quads']:
+					quads = content_quads_result['quads']
+					self.logger.debug(f'Got {len(quads)} quads from DOM.getContentQuads')
+				else:
+					self.logger.debug(f'No quads found from DOM.getContentQuads {content_quads_result}')
+			except Exception as e:
+				self.logger.debug(f'DOM.getContentQuads failed: {e}')
 
 		# Method 2: Fall back to DOM.getBoxModel
 		if not quads:
@@ -2827,6 +2914,9 @@ class BrowserSession(BaseModel):
 		# Build TargetInfo dicts from SessionManager owned data (crystal clear ownership)
 		result = []
 		for target_id, target in self.session_manager.get_all_targets().items():
+			if target.target_type in ('page', 'tab') and not self.session_manager.is_in_scope(target_id):
+				continue
+
 			# Create TargetInfo dict
 			target_info: TargetInfo = {
 				'targetId': target.target_id,
@@ -2865,6 +2955,8 @@ class BrowserSession(BaseModel):
 			result = await self.cdp_client.send.Target.createTarget(
 				params={'url': url, 'newWindow': new_window, 'background': background}
 			)
+		if self._tab_scope is not None and self.session_manager:
+			await self.session_manager.adopt_target(result['targetId'])
 		return result['targetId']
 
 	async def _cdp_close_page(self, target_id: TargetID) -> None:
@@ -3437,7 +3529,7 @@ class BrowserSession(BaseModel):
 			path: Optional file path to save screenshot
 			full_page: Capture entire scrollable page beyond viewport
 			format: Image format ('png', 'jpeg', 'webp')
-			quality: Quality 0-100 for JPEG format
+			quality: Quality 0-100 for JPEG and WebP formats
 			clip: Region to capture {'x': int, 'y': int, 'width': int, 'height': int}
 
 		Returns:
@@ -3455,7 +3547,7 @@ class BrowserSession(BaseModel):
 			'captureBeyondViewport': full_page,
 		}
 
-		if quality is not None and format == 'jpeg':
+		if quality is not None and format != 'png':
 			params['quality'] = quality
 
 		if clip:
@@ -155,10 +155,37 @@ class SessionManager:
 		"""
 		page_targets = []
 		for target in self._targets.values():
-			if target.target_type in ('page', 'tab'):
+			if target.target_type in ('page', 'tab') and self.is_in_scope(target.target_id):
 				page_targets.append(target)
 		return page_targets
 
+	def is_in_scope(self, target_id: TargetID) -> bool:
+		"""Whether a page belongs to this session: always, unless it is a tab session (BrowserSession.new_tab_session()).
+
+		A tab session shares the browser with other sessions and only works on the tabs it opened itself and the popups
+		opened from them. Pages of other sessions stay tracked, so they can be adopted, but are not monitored.
+		"""
+		tab_scope = self.browser_session._tab_scope
+		return tab_scope is None or target_id in tab_scope
+
+	async def adopt_target(self, target_id: TargetID) -> None:
+		"""Add a page this tab session opened to its scope, enabling monitoring if it attached before it was adopted."""
+		tab_scope = self.browser_session._tab_scope
+		if tab_scope is None or target_id in tab_scope:
+			return
+		tab_scope.add(target_id)
+
+		cdp_session = self._get_session_for_target(target_id)
+		if cdp_session is None or cdp_session._lifecycle_events is not None:
+			return  # not attached yet, _handle_target_attached() sees it in scope
+		try:
+			await cdp_session.cdp_client.send.Target.setAutoAttach(
+				params={'autoAttach': True, 'waitForDebuggerOnStart': False, 'flatten': True}, session_id=cdp_session.session_id
+			)
+		except Exception as e:
+			self.logger.debug(f'[SessionManager] Auto-attach failed for adopted target {target_id[:8]}...: {e}')
+		await self._enable_page_monitoring(cdp_session)
+
 	async def validate_session(self, target_id: TargetID) -> bool:
 		"""Check if a target still has active sessions.
 
@@ -390,16 +417,25 @@ class SessionManager:
 			)
 			return
 
+		# Tab sessions adopt popups opened from their own tabs, other sessions' pages are tracked without monitoring
+		is_page = target_type in ('page', 'tab')
+		if is_page and not self.is_in_scope(target_id):
+			opener_id = target_info.get('openerId')
+			if opener_id and self.is_in_scope(opener_id):
+				assert self.browser_session._tab_scope is not None
+				self.browser_session._tab_scope.add(target_id)
+
 		# Enable auto-attach for this session's children (do this FIRST, outside lock)
-		try:
-			await self.browser_session._cdp_client_root.send.Target.setAutoAttach(
-				params={'autoAttach': True, 'waitForDebuggerOnStart': False, 'flatten': True}, session_id=session_id
-			)
-		except Exception as e:
-			error_str = str(e)
-			# Expected for short-lived targets (workers, temp iframes) that detach before this executes
-			if '-32001' not in error_str and 'Session with given id not found' not in error_str:
-				self.logger.debug(f'[SessionManager] Auto-attach failed for {target_type}: {e}')
+		if not is_page or self.is_in_scope(target_id):
+			try:
+				await self.browser_session._cdp_client_root.send.Target.setAutoAttach(
+					params={'autoAttach': True, 'waitForDebuggerOnStart': False, 'flatten': True}, session_id=session_id
+				)
+			except Exception as e:
+				error_str = str(e)
+				# Expected for short-lived targets (workers, temp iframes) that detach before this executes
+				if '-32001' not in error_str and 'Session with given id not found' not in error_str:
+					self.logger.debug(f'[SessionManager] Auto-attach failed for {target_type}: {e}')
 
 		async with self._lock:
 			# Track this session for the target
@@ -446,8 +482,8 @@ class SessionManager:
 			f'(total sessions: {len(self._sessions)})'
 		)
 
-		# Enable lifecycle events and network monitoring for page targets
-		if target_type in ('page', 'tab'):
+		# Enable lifecycle events and network monitoring for page targets (checked again: adopt_target() may have run meanwhile)
+		if is_page and self.is_in_scope(target_id):
 			await self._enable_page_monitoring(cdp_session)
 
 		# Resume execution if waiting for debugger
@@ -562,6 +598,12 @@ class SessionManager:
 
 		# Dispatch TabClosedEvent only for page/tab targets that are fully removed (not iframes/workers or partial detaches)
 		if target_fully_removed:
+			tab_scope = self.browser_session._tab_scope
+			if tab_scope is not None and target_type in ('page', 'tab'):
+				if target_id not in tab_scope:
+					return  # another session's tab
+				tab_scope.discard(target_id)
+
 			if target_type in ('page', 'tab'):
 				from browser_use.browser.events import TabClosedEvent
 
@@ -758,6 +800,10 @@ class SessionManager:
 			target_id = target['targetId']
 			target_type = target.get('type', 'unknown')
 
+			# A tab session only attaches to its own pages, their iframes are attached through the page's auto-attach
+			if self.browser_session._tab_scope is not None and target_id not in self.browser_session._tab_scope:
+				continue
+
 			try:
 				# Just attach - event handler does everything
 				await cdp_client.send.Target.attachToTarget(params={'targetId': target_id, 'flatten': True})
@@ -853,6 +899,9 @@ class SessionManager:
 
 			cdp_session._lifecycle_events = deque(maxlen=50)  # Keep last 50 events
 			cdp_session._lifecycle_lock = asyncio.Lock()
+			# Network idle signal for state requests; unknown until the first main-frame lifecycle event arrives
+			cdp_session._network_idle = asyncio.Event()
+			cdp_session._network_idle.set()
 
 			# Register ONE handler per session that stores events
 			def on_lifecycle_event(event, session_id=None):
@@ -879,6 +928,13 @@ class SessionManager:
 						# Only log errors, not every event
 						self.logger.error(f'[SessionManager] Failed to store lifecycle event: {e}')
 
+					# Track network idleness of the main frame (its frame id is the target id)
+					if event.get('frameId', cdp_session.target_id) == cdp_session.target_id:
+						if event_name == 'init':
+							cdp_session._network_idle.clear()
+						elif event_name == 'networkIdle':
+							cdp_session._network_idle.set()
+
 			# Register the handler ONCE (this is the only place we register)
 			cdp_session.cdp_client.register.Page.lifecycleEvent(on_lifecycle_event)
 
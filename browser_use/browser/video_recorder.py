@@ -3,17 +3,15 @@
 import base64
 import logging
 import math
+import queue
 import subprocess
+import threading
 from pathlib import Path
-from typing import Optional
 
 from browser_use.browser.profile import ViewportSize
 
 try:
-	import imageio.v2 as iio  # type: ignore[import-not-found]
 	import imageio_ffmpeg  # type: ignore[import-not-found]
-	import numpy as np  # type: ignore[import-not-found]
-	from imageio.core.format import Format  # type: ignore[import-not-found]
 
 	IMAGEIO_AVAILABLE = True
 except ImportError:
@@ -31,14 +29,15 @@ def _get_padded_size(size: ViewportSize, macro_block_size: int = 16) -> Viewport
 
 class VideoRecorderService:
 	"""
-	Handles the video encoding process for a browser session using imageio.
+	Handles the video encoding process for a browser session using a single ffmpeg process.
 
-	This service captures individual frames from the CDP screencast, decodes them,
-	and appends them to a video file using a pip-installable ffmpeg backend.
-	It automatically resizes frames to match the target video dimensions.
+	This service streams the PNG frames of the CDP screencast into one long-lived ffmpeg
+	process (from the pip-installable imageio-ffmpeg package) that decodes, resizes, pads
+	and encodes them. add_frame() only queues the frame, a worker thread feeds the encoder.
+	When the encoder falls behind and the queue is full, the oldest queued frame is dropped.
 	"""
 
-	def __init__(self, output_path: Path, size: ViewportSize, framerate: int):
+	def __init__(self, output_path: Path, size: ViewportSize, framerate: int, max_queued_frames: int = 60):
 		"""
 		Initializes the video recorder.
 
@@ -46,17 +45,22 @@ class VideoRecorderService:
 		    output_path: The full path where the video will be saved.
 		    size: A ViewportSize object specifying the width and height of the video.
 		    framerate: The desired framerate for the output video.
+		    max_queued_frames: Frames waiting for the encoder before the oldest ones are dropped.
 		"""
 		self.output_path = output_path
 		self.size = size
 		self.framerate = framerate
-		self._writer: Optional['Format.Writer'] = None
-		self._is_active = False
 		self.padded_size = _get_padded_size(self.size)
+		self.frames_written = 0
+		self.frames_dropped = 0
+		self._queue: queue.Queue[str | None] = queue.Queue(maxsize=max_queued_frames)
+		self._encoder: subprocess.Popen | None = None
+		self._worker: threading.Thread | None = None
+		self._is_active = False
 
 	def start(self) -> None:
 		"""
-		Prepares and starts the video writer.
+		Starts the ffmpeg encoder and the worker thread feeding it.
 
 		If the required optional dependencies are not installed, this method will
 		log an error and do nothing.
@@ -69,94 +73,117 @@ class VideoRecorderService:
 
 		try:
 			self.output_path.parent.mkdir(parents=True, exist_ok=True)
-			# The macro_block_size is set to None because we handle padding ourselves
-			self._writer = iio.get_writer(
-				str(self.output_path),
-				fps=self.framerate,
-				codec='libx264',
-				quality=8,  # A good balance of quality and file size (1-10 scale)
-				pixelformat='yuv420p',  # Ensures compatibility with most players
-				macro_block_size=None,
-			)
-			self._is_active = True
-			logger.debug(f'Video recorder started. Output will be saved to {self.output_path}')
+			self._encoder = self._open_encoder()
 		except Exception as e:
-			logger.error(f'Failed to initialize video writer: {e}')
-			self._is_active = False
+			logger.error(f'Failed to initialize video encoder: {e}')
+			return
+
+		self._is_active = True
+		self._worker = threading.Thread(target=self._encode_frames, args=(self._encoder,), name='video_recorder', daemon=True)
+		self._worker.start()
+		logger.debug(f'Video recorder started. Output will be saved to {self.output_path}')
+
+	def _open_encoder(self) -> subprocess.Popen:
+		"""Launches ffmpeg reading PNG frames from stdin and writing the video to output_path."""
+		# Build a filter chain for ffmpeg:
+		# 1. scale: Resizes the frame to the user-specified dimensions.
+		# 2. pad: Adds black bars to meet codec's macro-block requirements,
+		#    centering the original content.
+		vf_chain = (
+			f'scale={self.size["width"]}:{self.size["height"]},'
+			f'pad={self.padded_size["width"]}:{self.padded_size["height"]}:(ow-iw)/2:(oh-ih)/2:color=black'
+		)
+		command = [
+			imageio_ffmpeg.get_ffmpeg_exe(),
+			'-hide_banner',
+			'-loglevel',
+			'error',
+			'-y',
+			'-f',
+			'image2pipe',  # Input format from a pipe
+			'-framerate',
+			str(self.framerate),
+			'-c:v',
+			'png',  # Specify input codec is PNG
+			'-i',
+			'-',  # Input from stdin
+			'-vf',
+			vf_chain,  # Video filter for resizing and padding
+			'-c:v',
+			'libx264',
+			'-crf',
+			'10',  # Same as imageio's quality=8, a good balance of quality and file size
+			'-pix_fmt',
+			'yuv420p',  # Ensures compatibility with most players
+			str(self.output_path),
+		]
+		return subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
 
 	def add_frame(self, frame_data_b64: str) -> None:
 		"""
-		Decodes a base64-encoded PNG frame, resizes it, pads it to be codec-compatible,
-		and appends it to the video.
+		Queues a base64-encoded PNG frame for the encoder without blocking.
+
+		If the encoder is behind and the queue is full, the oldest queued frame is dropped
+		so the video keeps up with the page.
 
 		Args:
 		    frame_data_b64: A base64-encoded string of the PNG frame data.
 		"""
-		if not self._is_active or not self._writer:
+		if not self._is_active:
 			return
 
 		try:
-			frame_bytes = base64.b64decode(frame_data_b64)
-
-			# Build a filter chain for ffmpeg:
-			# 1. scale: Resizes the frame to the user-specified dimensions.
-			# 2. pad: Adds black bars to meet codec's macro-block requirements,
-			#    centering the original content.
-			vf_chain = (
-				f'scale={self.size["width"]}:{self.size["height"]},'
-				f'pad={self.padded_size["width"]}:{self.padded_size["height"]}:(ow-iw)/2:(oh-ih)/2:color=black'
-			)
-
-			output_pix_fmt = 'rgb24'
-			command = [
-				imageio_ffmpeg.get_ffmpeg_exe(),
-				'-f',
-				'image2pipe',  # Input format from a pipe
-				'-c:v',
-				'png',  # Specify input codec is PNG
-				'-i',
-				'-',  # Input from stdin
-				'-vf',
-				vf_chain,  # Video filter for resizing and padding
-				'-f',
-				'rawvideo',  # Output format is raw video
-				'-pix_fmt',
-				output_pix_fmt,  # Output pixel format
-				'-',  # Output to stdout
-			]
-
-			# Execute ffmpeg as a subprocess
-			proc = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-			out, err = proc.communicate(input=frame_bytes)
-
-			if proc.returncode != 0:
-				err_msg = err.decode(errors='ignore').strip()
-				if 'deprecated pixel format used' not in err_msg.lower():
-					raise OSError(f'ffmpeg error during resizing/padding: {err_msg}')
-				else:
-					logger.debug(f'ffmpeg warning during resizing/padding: {err_msg}')
-
-			# Convert the raw output bytes to a numpy array with the padded dimensions
-			img_array = np.frombuffer(out, dtype=np.uint8).reshape((self.padded_size['height'], self.padded_size['width'], 3))
-
-			self._writer.append_data(img_array)
-		except Exception as e:
-			logger.warning(f'Could not process and add video frame: {e}')
+			self._queue.put_nowait(frame_data_b64)
+		except queue.Full:
+			try:
+				self._queue.get_nowait()
+				self.frames_dropped += 1
+			except queue.Empty:
+				pass
+			self._queue.put_nowait(frame_data_b64)
+
+	def _encode_frames(self, encoder: subprocess.Popen) -> None:
+		"""Worker thread: writes queued frames to the encoder until stop_and_save() queues None."""
+		assert encoder.stdin is not None
+		while True:
+			frame_data_b64 = self._queue.get()
+			if frame_data_b64 is None:
+				return
+			if not self._is_active:
+				continue  # encoder failed, keep draining until stopped
+			try:
+				encoder.stdin.write(base64.b64decode(frame_data_b64))
+				self.frames_written += 1
+			except Exception as e:
+				logger.warning(f'Video encoder stopped accepting frames: {e}')
+				self._is_active = False
 
 	def stop_and_save(self) -> None:
 		"""
-		Finalizes the video file by closing the writer.
+		Writes the remaining queued frames and finalizes the video file.
 
-		This method should be called when the recording session is complete.
+		This method blocks until ffmpeg exits and should be called when the recording
+		session is complete, preferably from a thread rather than the event loop.
 		"""
-		if not self._is_active or not self._writer:
+		if self._encoder is None or self._worker is None:
 			return
 
+		encoder, worker = self._encoder, self._worker
+		self._encoder = self._worker = None
+		self._queue.put(None)
+		worker.join()
+		self._is_active = False
+
 		try:
-			self._writer.close()
-			logger.info(f'📹 Video recording saved successfully to: {self.output_path}')
+			assert encoder.stdin is not None and encoder.stderr is not None
+			try:
+				encoder.stdin.close()
+			except OSError:
+				pass
+			err = encoder.stderr.read()
+			if encoder.wait() != 0:
+				raise OSError(f'ffmpeg exited with code {encoder.returncode}: {err.decode(errors="ignore").strip()}')
+			dropped = f', {self.frames_dropped} dropped while the encoder was behind' if self.frames_dropped else ''
+			logger.info(f'📹 Video recording saved successfully to: {self.output_path} ({self.frames_written} frames{dropped})')
 		except Exception as e:
 			logger.error(f'Failed to finalize and save video: {e}')
-		finally:
-			self._is_active = False
-			self._writer = None
@@ -1,5 +1,9 @@
+import base64
+import hashlib
 from dataclasses import dataclass, field
-from typing import Any
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Literal
 
 from bubus import BaseEvent
 from cdp_use.cdp.target import TargetID
@@ -12,6 +16,95 @@ PLACEHOLDER_4PX_SCREENSHOT = (
 	'iVBORw0KGgoAAAANSUhEUgAAAAQAAAAECAIAAAAmkwkpAAAAFElEQVR4nGP8//8/AwwwMSAB3BwAlm4DBfIlvvkAAAAASUVORK5CYII='
 )
 
+ScreenshotFormat = Literal['png', 'jpeg', 'webp']
+SCREENSHOT_MIME_TYPES: dict[ScreenshotFormat, Literal['image/png', 'image/jpeg', 'image/webp']] = {
+	'png': 'image/png',
+	'jpeg': 'image/jpeg',
+	'webp': 'image/webp',
+}
+
+
+class Screenshot:
+	"""A captured image shared by every consumer of a browser state (LLM prompt, disk, GIF, cloud events).
+
+	CDP returns screenshots base64-encoded, so that form is kept exactly as received and the raw bytes are only
+	decoded on first access (e.g. when writing to disk). Screenshots created from raw bytes encode lazily instead.
+	"""
+
+	def __init__(
+		self,
+		base64_data: str | None = None,
+		*,
+		data: bytes | None = None,
+		format: ScreenshotFormat = 'png',
+		size: tuple[int, int] | None = None,
+	):
+		if base64_data is None and data is None:
+			raise ValueError('Screenshot needs either base64_data or data')
+		self._base64 = base64_data
+		self._data = data
+		self.format: ScreenshotFormat = format
+		self._size = size
+		self._fingerprint: bytes | None = None
+
+	@property
+	def base64(self) -> str:
+		if self._base64 is None:
+			assert self._data is not None
+			self._base64 = base64.b64encode(self._data).decode('ascii')
+		return self._base64
+
+	@property
+	def data(self) -> bytes:
+		if self._data is None:
+			assert self._base64 is not None
+			self._data = base64.b64decode(self._base64)
+		return self._data
+
+	@property
+	def size(self) -> tuple[int, int]:
+		"""(width, height) in pixels, read from the image header when it wasn't known at capture time"""
+		if self._size is None:
+			from PIL import Image
+
+			with Image.open(BytesIO(self.data)) as image:  # only parses the header, pixels are not decoded
+				self._size = image.size
+		return self._size
+
+	@property
+	def fingerprint(self) -> bytes:
+		"""SHA-256 of the decoded RGB pixels, so the same image encoded differently still matches, computed once"""
+		if self._fingerprint is None:
+			from PIL import Image
+
+			with Image.open(BytesIO(self.data)) as image:
+				self._size = image.size
+				self._fingerprint = hashlib.sha256(image.convert('RGB').tobytes()).digest()
+		return self._fingerprint
+
+	def is_visually_identical(self, other: 'Screenshot') -> bool:
+		"""Whether other has exactly the same pixels, any change at all (even a single character) counts as different"""
+		if other is self or other.base64 == self.base64:
+			return True
+		if other.size != self.size:
+			return False
+		return self.fingerprint == other.fingerprint
+
+	@property
+	def mime_type(self) -> Literal['image/png', 'image/jpeg', 'image/webp']:
+		return SCREENSHOT_MIME_TYPES[self.format]
+
+	@property
+	def file_extension(self) -> str:
+		return 'jpg' if self.format == 'jpeg' else self.format
+
+	@property
+	def data_url(self) -> str:
+		return f'data:{self.mime_type};base64,{self.base64}'
+
+	def __repr__(self) -> str:
+		return f'Screenshot(format={self.format!r}, size={self._size}, base64_length={len(self.base64)})'
+
 
 # Pydantic
 class TabInfo(BaseModel):
@@ -108,6 +201,17 @@ class BrowserStateSummary:
 	pending_network_requests: list[NetworkRequest] = field(default_factory=list)  # Currently loading network requests
 	pagination_buttons: list[PaginationButton] = field(default_factory=list)  # Detected pagination buttons
 	closed_popup_messages: list[str] = field(default_factory=list)  # Messages from auto-closed JavaScript dialogs
+	timing_info: dict[str, float] = field(default_factory=dict, repr=False)  # Per-phase latency of the state request (ms)
+	# The captured image with its format and size; screenshot above is always its base64 form
+	screenshot_image: Screenshot | None = field(default=None, repr=False)
+	# Set by the agent when the screenshot is visually identical to the previous step's
+	screenshot_unchanged: bool = False
+
+	def __post_init__(self) -> None:
+		if self.screenshot_image is not None:
+			self.screenshot = self.screenshot_image.base64
+		elif self.screenshot:
+			self.screenshot_image = Screenshot(self.screenshot)
 
 
 @dataclass
@@ -122,20 +226,22 @@ class BrowserStateHistory:
 
 	def get_screenshot(self) -> str | None:
 		"""Load screenshot from disk and return as base64 string"""
-		if not self.screenshot_path:
+		screenshot_data = self.get_screenshot_bytes()
+		if screenshot_data is None:
 			return None
+		return base64.b64encode(screenshot_data).decode('utf-8')
 
-		import base64
-		from pathlib import Path
+	def get_screenshot_bytes(self) -> bytes | None:
+		"""Load the raw screenshot file from disk"""
+		if not self.screenshot_path:
+			return None
 
 		path_obj = Path(self.screenshot_path)
 		if not path_obj.exists():
 			return None
 
 		try:
-			with open(path_obj, 'rb') as f:
-				screenshot_data = f.read()
-			return base64.b64encode(screenshot_data).decode('utf-8')
+			return path_obj.read_bytes()
 		except Exception:
 			return None
 
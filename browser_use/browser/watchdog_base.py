@@ -1,8 +1,10 @@
 """Base watchdog class for browser monitoring components."""
 
 import inspect
+import logging
 import time
 from collections.abc import Iterable
+from functools import cache
 from typing import Any, ClassVar
 
 from bubus import BaseEvent, EventBus
@@ -10,6 +12,37 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from browser_use.browser.session import BrowserSession
 
+# BrowserSession loggers are named browser_use.<session> and never configured individually
+_SESSION_LOGGERS = logging.getLogger('browser_use')
+
+
+@cache
+def get_event_classes() -> dict[str, type[BaseEvent[Any]]]:
+	"""All event classes defined in browser_use.browser.events, keyed by class name"""
+	from browser_use.browser import events
+
+	event_classes: dict[str, type[BaseEvent[Any]]] = {}
+	for name in dir(events):
+		obj = getattr(events, name)
+		if inspect.isclass(obj) and issubclass(obj, BaseEvent) and obj is not BaseEvent:
+			event_classes[name] = obj
+	return event_classes
+
+
+@cache
+def get_event_handler_methods(cls: type) -> tuple[tuple[type[BaseEvent[Any]], str], ...]:
+	"""(event class, method name) for every on_EventName handler defined on cls.
+
+	Computed once per class, so attaching a watchdog doesn't rescan the events module and every attribute of the
+	instance, and a watchdog without handlers registers nothing on the event bus.
+	"""
+	event_classes = get_event_classes()
+	return tuple(
+		(event_classes[method_name[3:]], method_name)
+		for method_name in dir(cls)
+		if method_name.startswith('on_') and method_name[3:] in event_classes and callable(getattr(cls, method_name))
+	)
+
 
 class BaseWatchdog(BaseModel):
 	"""Base class for all browser watchdogs.
@@ -72,36 +105,41 @@ class BaseWatchdog(BaseModel):
 		# Get the watchdog instance if this is a bound method
 		watchdog_instance = getattr(handler, '__self__', None)
 		watchdog_class_name = watchdog_instance.__class__.__name__ if watchdog_instance else 'Unknown'
+		handler_label = f'{watchdog_class_name}.{handler.__name__}'
 
 		# Create a wrapper function with unique name to avoid duplicate handler warnings
 		# Capture handler by value to avoid closure issues
 		def make_unique_handler(actual_handler):
 			async def unique_handler(event):
-				# just for debug logging, not used for anything else
-				parent_event = event_bus.event_history.get(event.event_parent_id) if event.event_parent_id else None
-				grandparent_event = (
-					event_bus.event_history.get(parent_event.event_parent_id)
-					if parent_event and parent_event.event_parent_id
-					else None
-				)
-				parent = (
-					f'↲  triggered by on_{parent_event.event_type}#{parent_event.event_id[-4:]}'
-					if parent_event
-					else '👈 by Agent'
-				)
-				grandparent = (
-					(
-						f'↲  under {grandparent_event.event_type}#{grandparent_event.event_id[-4:]}'
-						if grandparent_event
+				# the session logger is rebuilt on every access, only resolve it when something will be logged
+				logger = browser_session.logger if _SESSION_LOGGERS.isEnabledFor(logging.DEBUG) else None
+				watchdog_and_handler_str = ''
+				parent = grandparent = ''
+				if logger:
+					watchdog_and_handler_str = f'[{handler_label}(#{event.event_id[-4:]})]'.ljust(54)
+					# just for debug logging, not used for anything else
+					parent_event = event_bus.event_history.get(event.event_parent_id) if event.event_parent_id else None
+					grandparent_event = (
+						event_bus.event_history.get(parent_event.event_parent_id)
+						if parent_event and parent_event.event_parent_id
+						else None
+					)
+					parent = (
+						f'↲  triggered by on_{parent_event.event_type}#{parent_event.event_id[-4:]}'
+						if parent_event
 						else '👈 by Agent'
 					)
-					if parent_event
-					else ''
-				)
-				event_str = f'#{event.event_id[-4:]}'
+					grandparent = (
+						(
+							f'↲  under {grandparent_event.event_type}#{grandparent_event.event_id[-4:]}'
+							if grandparent_event
+							else '👈 by Agent'
+						)
+						if parent_event
+						else ''
+					)
+					logger.debug(f'🚌 {watchdog_and_handler_str} ⏳ Starting...       {parent} {grandparent}')
 				time_start = time.time()
-				watchdog_and_handler_str = f'[{watchdog_class_name}.{actual_handler.__name__}({event_str})]'.ljust(54)
-				browser_session.logger.debug(f'🚌 {watchdog_and_handler_str} ⏳ Starting...       {parent} {grandparent}')
 
 				try:
 					# **EXECUTE THE EVENT HANDLER FUNCTION**
@@ -111,23 +149,23 @@ class BaseWatchdog(BaseModel):
 						raise result
 
 					# just for debug logging, not used for anything else
-					time_end = time.time()
-					time_elapsed = time_end - time_start
-					result_summary = '' if result is None else f' ➡️ <{type(result).__name__}>'
-					parents_summary = f' {parent}'.replace('↲  triggered by ', '⤴  returned to  ').replace(
-						'👈 by Agent', '👉 returned to  Agent'
-					)
-					browser_session.logger.debug(
-						f'🚌 {watchdog_and_handler_str} Succeeded ({time_elapsed:.2f}s){result_summary}{parents_summary}'
-					)
+					if logger:
+						time_elapsed = time.time() - time_start
+						result_summary = '' if result is None else f' ➡️ <{type(result).__name__}>'
+						parents_summary = f' {parent}'.replace('↲  triggered by ', '⤴  returned to  ').replace(
+							'👈 by Agent', '👉 returned to  Agent'
+						)
+						logger.debug(
+							f'🚌 {watchdog_and_handler_str} Succeeded ({time_elapsed:.2f}s){result_summary}{parents_summary}'
+						)
 					return result
 				except Exception as e:
 					time_end = time.time()
 					time_elapsed = time_end - time_start
 					original_error = e
-					browser_session.logger.error(
-						f'🚌 {watchdog_and_handler_str} ❌ Failed ({time_elapsed:.2f}s): {type(e).__name__}: {e}'
-					)
+					logger = logger or browser_session.logger
+					watchdog_and_handler_str = f'[{handler_label}(#{event.event_id[-4:]})]'.ljust(54)
+					logger.error(f'🚌 {watchdog_and_handler_str} ❌ Failed ({time_elapsed:.2f}s): {type(e).__name__}: {e}')
 
 					# attempt to repair potentially crashed CDP session
 					try:
@@ -135,7 +173,7 @@ class BaseWatchdog(BaseModel):
 							# With event-driven sessions, Chrome will send detach/attach events
 							# SessionManager handles pool cleanup automatically
 							target_id_to_restore = browser_session.agent_focus_target_id
-							browser_session.logger.debug(
+							logger.debug(
 								f'🚌 {watchdog_and_handler_str} ⚠️ Session error detected, waiting for CDP events to sync (target: {target_id_to_restore})'
 							)
 
@@ -147,12 +185,12 @@ class BaseWatchdog(BaseModel):
 							await browser_session.get_or_create_cdp_session(target_id=None, focus=True)
 					except Exception as sub_error:
 						if 'ConnectionClosedError' in str(type(sub_error)) or 'ConnectionError' in str(type(sub_error)):
-							browser_session.logger.error(
+							logger.error(
 								f'🚌 {watchdog_and_handler_str} ❌ Browser closed or CDP Connection disconnected by remote. {type(sub_error).__name__}: {sub_error}\n'
 							)
 							raise
 						else:
-							browser_session.logger.error(
+							logger.error(
 								f'🚌 {watchdog_and_handler_str} ❌ CDP connected but failed to re-create CDP session after error "{type(original_error).__name__}: {original_error}" in {actual_handler.__name__}({event.event_type}#{event.event_id[-4:]}): due to {type(sub_error).__name__}: {sub_error}\n'
 							)
 
@@ -162,7 +200,7 @@ class BaseWatchdog(BaseModel):
 			return unique_handler
 
 		unique_handler = make_unique_handler(handler)
-		unique_handler.__name__ = f'{watchdog_class_name}.{handler.__name__}'
+		unique_handler.__name__ = handler_label
 
 		# Check if this handler is already registered - throw error if duplicate
 		existing_handlers = event_bus.handlers.get(event_class.__name__, [])
@@ -186,36 +224,19 @@ class BaseWatchdog(BaseModel):
 		# Register event handlers automatically based on method names
 		assert self.browser_session is not None, 'Root CDP client not initialized - browser may not be connected yet'
 
-		from browser_use.browser import events
-
-		event_classes = {}
-		for name in dir(events):
-			obj = getattr(events, name)
-			if inspect.isclass(obj) and issubclass(obj, BaseEvent) and obj is not BaseEvent:
-				event_classes[name] = obj
-
-		# Find all handler methods (on_EventName)
+		# Find all handler methods (on_EventName), precomputed once per watchdog class
 		registered_events = set()
-		for method_name in dir(self):
-			if method_name.startswith('on_') and callable(getattr(self, method_name)):
-				# Extract event name from method name (on_EventName -> EventName)
-				event_name = method_name[3:]  # Remove 'on_' prefix
-
-				if event_name in event_classes:
-					event_class = event_classes[event_name]
-
-					# ASSERTION: If LISTENS_TO is defined, enforce it
-					if self.LISTENS_TO:
-						assert event_class in self.LISTENS_TO, (
-							f'[{self.__class__.__name__}] Handler {method_name} listens to {event_name} '
-							f'but {event_name} is not declared in LISTENS_TO: {[e.__name__ for e in self.LISTENS_TO]}'
-						)
-
-					handler = getattr(self, method_name)
+		for event_class, method_name in get_event_handler_methods(type(self)):
+			# ASSERTION: If LISTENS_TO is defined, enforce it
+			if self.LISTENS_TO:
+				assert event_class in self.LISTENS_TO, (
+					f'[{self.__class__.__name__}] Handler {method_name} listens to {event_class.__name__} '
+					f'but {event_class.__name__} is not declared in LISTENS_TO: {[e.__name__ for e in self.LISTENS_TO]}'
+				)
 
-					# Use the static helper to attach the handler
-					self.attach_handler_to_session(self.browser_session, event_class, handler)
-					registered_events.add(event_class)
+			# Use the static helper to attach the handler
+			self.attach_handler_to_session(self.browser_session, event_class, getattr(self, method_name))
+			registered_events.add(event_class)
 
 		# ASSERTION: If LISTENS_TO is defined, ensure all declared events have handlers
 		if self.LISTENS_TO:
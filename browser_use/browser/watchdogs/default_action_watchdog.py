@@ -509,7 +509,10 @@ class DefaultActionWatchdog(BaseWatchdog):
 			backend_node_id = element_node.backend_node_id
 
 			# Get viewport dimensions for visibility checks
-			layout_metrics = await cdp_session.cdp_client.send.Page.getLayoutMetrics(session_id=session_id)
+			prefetcher = self.browser_session.prefetcher
+			layout_metrics = prefetcher.take_layout_metrics(session_id) if prefetcher else None
+			if layout_metrics is None:
+				layout_metrics = await cdp_session.cdp_client.send.Page.getLayoutMetrics(session_id=session_id)
 			viewport_width = layout_metrics['layoutViewport']['clientWidth']
 			viewport_height = layout_metrics['layoutViewport']['clientHeight']
 
@@ -1484,14 +1487,17 @@ class DefaultActionWatchdog(BaseWatchdog):
 					self.logger.debug(f'Failed to scroll element {element_node} into view before typing: {type(e).__name__}: {e}')
 
 			# Get object ID for the element
-			result = await cdp_client.send.DOM.resolveNode(
-				params={'backendNodeId': backend_node_id},
-				session_id=cdp_session.session_id,
-			)
-			assert 'object' in result and 'objectId' in result['object'], (
-				'Failed to find DOM element based on backendNodeId, maybe page content changed?'
-			)
-			object_id = result['object']['objectId']
+			prefetcher = self.browser_session.prefetcher
+			object_id = prefetcher.take_object_id(cdp_session.session_id, backend_node_id) if prefetcher else None
+			if object_id is None:
+				result = await cdp_client.send.DOM.resolveNode(
+					params={'backendNodeId': backend_node_id},
+					session_id=cdp_session.session_id,
+				)
+				assert 'object' in result and 'objectId' in result['object'], (
+					'Failed to find DOM element based on backendNodeId, maybe page content changed?'
+				)
+				object_id = result['object']['objectId']
 
 			# Get current coordinates using unified method
 			coords = await self.browser_session.get_element_coordinates(backend_node_id, cdp_session)
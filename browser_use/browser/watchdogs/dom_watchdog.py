@@ -2,7 +2,8 @@
 
 import asyncio
 import time
-from typing import TYPE_CHECKING
+from collections.abc import Awaitable
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from browser_use.browser.events import (
 	BrowserErrorEvent,
@@ -11,16 +12,20 @@ from browser_use.browser.events import (
 	TabCreatedEvent,
 )
 from browser_use.browser.watchdog_base import BaseWatchdog
+from browser_use.dom.mutation_tracker import DOMMutationTracker
 from browser_use.dom.service import DomService
 from browser_use.dom.views import (
 	EnhancedDOMTreeNode,
 	SerializedDOMState,
 )
 from browser_use.observability import observe_debug
+from browser_use.tracing.service import trace_span
 from browser_use.utils import create_task_with_error_handling, time_execution_async
 
 if TYPE_CHECKING:
-	from browser_use.browser.views import BrowserStateSummary, NetworkRequest, PageInfo, PaginationButton
+	from browser_use.browser.views import BrowserStateSummary, NetworkRequest, PageInfo, PaginationButton, Screenshot
+
+T = TypeVar('T')
 
 
 class DOMWatchdog(BaseWatchdog):
@@ -42,6 +47,13 @@ class DOMWatchdog(BaseWatchdog):
 	# Internal DOM service
 	_dom_service: DomService | None = None
 
+	# Incremental DOM snapshots (BrowserProfile.incremental_dom_snapshots)
+	_dom_mutation_tracker: DOMMutationTracker | None = None
+	_dom_mutation_cdp_client: Any = None
+
+	# Upper bound on waiting for networkIdle before building the browser state
+	NETWORK_IDLE_TIMEOUT: ClassVar[float] = 0.3
+
 	# Network tracking - maps request_id to (url, start_time, method, resource_type)
 	_pending_requests: dict[str, tuple[str, float, str, str | None]] = {}
 
@@ -243,17 +255,22 @@ class DOMWatchdog(BaseWatchdog):
 		"""Handle browser state request by coordinating DOM building and screenshot capture.
 
 		This is the main entry point for getting the complete browser state.
+		Independent CDP calls run concurrently: tabs and pending requests are issued while waiting for
+		network idle, then DOM, screenshot, title and page info are issued together.
 
 		Args:
 			event: The browser state request event with options
 
 		Returns:
-			Complete BrowserStateSummary with DOM, screenshot, and target info
+			Complete BrowserStateSummary with DOM, screenshot, target info and per-phase timing
 		"""
 		from browser_use.browser.views import BrowserStateSummary, PageInfo
 
+		request_start = time.perf_counter()
+		timing_info: dict[str, float] = {}
+
 		self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: STARTING browser state request')
-		page_url = await self.browser_session.get_current_page_url()
+		page_url = await self._timed(timing_info, 'page_url_ms', self.browser_session.get_current_page_url())
 		self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got page URL: {page_url}')
 
 		# Get focused session for logging (validation already done by get_current_page_url)
@@ -263,42 +280,15 @@ class DOMWatchdog(BaseWatchdog):
 		# check if we should skip DOM tree build for pointless pages
 		not_a_meaningful_website = page_url.lower().split(':', 1)[0] not in ('http', 'https')
 
-		# Check for pending network requests BEFORE waiting (so we can see what's loading)
-		pending_requests_before_wait = []
-		if not not_a_meaningful_website:
-			try:
-				pending_requests_before_wait = await self._get_pending_network_requests()
-				if pending_requests_before_wait:
-					self.logger.debug(f'🔍 Found {len(pending_requests_before_wait)} pending requests before stability wait')
-			except Exception as e:
-				self.logger.debug(f'Failed to get pending requests before wait: {e}')
-		pending_requests = pending_requests_before_wait
-		# Wait for page stability using browser profile settings (main branch pattern)
-		if not not_a_meaningful_website:
-			self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ⏳ Waiting for page stability...')
-			try:
-				if pending_requests_before_wait:
-					# Reduced from 1s to 0.3s for faster DOM builds while still allowing critical resources to load
-					await asyncio.sleep(0.3)
-				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ Page stability complete')
-			except Exception as e:
-				self.logger.warning(
-					f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Network waiting failed: {e}, continuing anyway...'
-				)
-
-		# Get tabs info once at the beginning for all paths
+		# Tabs info doesn't depend on page stability, so it is fetched while we wait
 		self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting tabs info...')
-		tabs_info = await self.browser_session.get_tabs()
-		self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got {len(tabs_info)} tabs')
-		self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Tabs info: {tabs_info}')
-
-		# Get viewport / scroll position info, remember changing scroll position should invalidate selector_map cache because it only includes visible elements
-		# cdp_session = await self.browser_session.get_or_create_cdp_session(focus=True)
-		# scroll_info = await cdp_session.cdp_client.send.Runtime.evaluate(
-		# 	params={'expression': 'JSON.stringify({y: document.body.scrollTop, x: document.body.scrollLeft, width: document.documentElement.clientWidth, height: document.documentElement.clientHeight})'},
-		# 	session_id=cdp_session.session_id,
-		# )
-		# self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got scroll info: {scroll_info["result"]}')
+		tabs_task = create_task_with_error_handling(
+			self._timed(timing_info, 'tabs_ms', self.browser_session.get_tabs()),
+			name='get_tabs',
+			logger_instance=self.logger,
+		)
+		# Every task started below, cancelled on the way out if an error left it unawaited
+		started_tasks: list[asyncio.Task] = [tabs_task]
 
 		try:
 			# Fast path for empty pages
@@ -314,23 +304,13 @@ class DOMWatchdog(BaseWatchdog):
 
 				# Try to get page info from CDP, fall back to defaults if unavailable
 				try:
-					page_info = await self._get_page_info()
+					page_info = await self._timed(timing_info, 'page_info_ms', self._get_page_info())
 				except Exception as e:
 					self.logger.debug(f'Failed to get page info from CDP for empty page: {e}, using fallback')
-					# Use default viewport dimensions
-					viewport = self.browser_session.browser_profile.viewport or {'width': 1280, 'height': 720}
-					page_info = PageInfo(
-						viewport_width=viewport['width'],
-						viewport_height=viewport['height'],
-						page_width=viewport['width'],
-						page_height=viewport['height'],
-						scroll_x=0,
-						scroll_y=0,
-						pixels_above=0,
-						pixels_below=0,
-						pixels_left=0,
-						pixels_right=0,
-					)
+					page_info = self._get_fallback_page_info()
+
+				tabs_info = await tabs_task
+				timing_info['total_ms'] = (time.perf_counter() - request_start) * 1000
 
 				return BrowserStateSummary(
 					dom_state=content,
@@ -347,9 +327,28 @@ class DOMWatchdog(BaseWatchdog):
 					pending_network_requests=[],  # Empty page has no pending requests
 					pagination_buttons=[],  # Empty page has no pagination
 					closed_popup_messages=self.browser_session._closed_popup_messages.copy(),
+					timing_info=timing_info,
 				)
 
-			# Execute DOM building and screenshot capture in parallel
+			# Check for pending network requests while waiting for page stability (so we can see what's loading)
+			pending_requests_task = create_task_with_error_handling(
+				self._timed(timing_info, 'pending_requests_ms', self._get_pending_network_requests()),
+				name='get_pending_network_requests',
+				logger_instance=self.logger,
+				suppress_exceptions=True,
+			)
+			started_tasks.append(pending_requests_task)
+
+			# Wait for page stability, driven by the networkIdle lifecycle event instead of a fixed sleep
+			self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ⏳ Waiting for page stability...')
+			network_idle = await self._timed(
+				timing_info, 'network_idle_wait_ms', self._wait_for_network_idle(timeout=self.NETWORK_IDLE_TIMEOUT)
+			)
+			self.logger.debug(
+				f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ Page stability complete (network idle: {network_idle})'
+			)
+
+			# Execute DOM building, screenshot capture, title and page info in parallel
 			dom_task = None
 			screenshot_task = None
 
@@ -364,25 +363,41 @@ class DOMWatchdog(BaseWatchdog):
 				)
 
 				dom_task = create_task_with_error_handling(
-					self._build_dom_tree_without_highlights(previous_state),
+					self._timed(timing_info, 'dom_build_ms', self._build_dom_tree_without_highlights(previous_state)),
 					name='build_dom_tree',
 					logger_instance=self.logger,
 					suppress_exceptions=True,
 				)
+				started_tasks.append(dom_task)
 
 			# Start clean screenshot task if requested (without JS highlights)
 			if event.include_screenshot:
 				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: 📸 Starting clean screenshot task...')
 				screenshot_task = create_task_with_error_handling(
-					self._capture_clean_screenshot(),
+					self._timed(timing_info, 'screenshot_ms', self._capture_clean_screenshot()),
 					name='capture_screenshot',
 					logger_instance=self.logger,
 					suppress_exceptions=True,
 				)
+				started_tasks.append(screenshot_task)
+
+			title_task = create_task_with_error_handling(
+				self._timed(timing_info, 'title_ms', self._get_page_title()),
+				name='get_page_title',
+				logger_instance=self.logger,
+				suppress_exceptions=True,
+			)
+			page_info_task = create_task_with_error_handling(
+				self._timed(timing_info, 'page_info_ms', self._get_page_info_with_fallback()),
+				name='get_page_info',
+				logger_instance=self.logger,
+				suppress_exceptions=True,
+			)
+			started_tasks += [title_task, page_info_task]
 
 			# Wait for both tasks to complete
 			content = None
-			screenshot_b64 = None
+			screenshot = None
 
 			if dom_task:
 				try:
@@ -396,17 +411,17 @@ class DOMWatchdog(BaseWatchdog):
 
 			if screenshot_task:
 				try:
-					screenshot_b64 = await screenshot_task
+					screenshot = await screenshot_task
 					self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ Clean screenshot captured')
 				except Exception as e:
 					self.logger.warning(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Clean screenshot failed: {e}')
-					screenshot_b64 = None
+					screenshot = None
 
 			# Add browser-side highlights for user visibility
 			if content and content.selector_map and self.browser_session.browser_profile.dom_highlight_elements:
 				try:
 					self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: 🎨 Adding browser-side highlights...')
-					await self.browser_session.add_highlights(content.selector_map)
+					await self._timed(timing_info, 'highlights_ms', self.browser_session.add_highlights(content.selector_map))
 					self.logger.debug(
 						f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ Added browser highlights for {len(content.selector_map)} elements'
 					)
@@ -417,40 +432,16 @@ class DOMWatchdog(BaseWatchdog):
 			if not content:
 				content = SerializedDOMState(_root=None, selector_map={})
 
-			# Tabs info already fetched at the beginning
-
-			# Get target title safely
-			try:
-				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting page title...')
-				title = await asyncio.wait_for(self.browser_session.get_current_page_title(), timeout=1.0)
-				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got title: {title}')
-			except Exception as e:
-				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get title: {e}')
-				title = 'Page'
-
-			# Get comprehensive page info from CDP with timeout
-			try:
-				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting page info from CDP...')
-				page_info = await asyncio.wait_for(self._get_page_info(), timeout=1.0)
-				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got page info from CDP: {page_info}')
-			except Exception as e:
-				self.logger.debug(
-					f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get page info from CDP: {e}, using fallback'
-				)
-				# Fallback to default viewport dimensions
-				viewport = self.browser_session.browser_profile.viewport or {'width': 1280, 'height': 720}
-				page_info = PageInfo(
-					viewport_width=viewport['width'],
-					viewport_height=viewport['height'],
-					page_width=viewport['width'],
-					page_height=viewport['height'],
-					scroll_x=0,
-					scroll_y=0,
-					pixels_above=0,
-					pixels_below=0,
-					pixels_left=0,
-					pixels_right=0,
-				)
+			tabs_info = await tabs_task
+			self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got {len(tabs_info)} tabs')
+			self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Tabs info: {tabs_info}')
+
+			# Title and page info fall back to defaults on their own
+			title = await title_task
+			page_info = await page_info_task
+			pending_requests = await pending_requests_task
+			if pending_requests:
+				self.logger.debug(f'🔍 Found {len(pending_requests)} pending requests during stability wait')
 
 			# Check for PDF viewer
 			is_pdf_viewer = page_url.endswith('.pdf') or '/pdf/' in page_url
@@ -461,21 +452,27 @@ class DOMWatchdog(BaseWatchdog):
 				pagination_buttons_data = self._detect_pagination_buttons(content.selector_map)
 
 			# Build and cache the browser state summary
-			if screenshot_b64:
+			if screenshot:
 				self.logger.debug(
-					f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: 📸 Creating BrowserStateSummary with screenshot, length: {len(screenshot_b64)}'
+					f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: 📸 Creating BrowserStateSummary with screenshot, length: {len(screenshot.base64)}'
 				)
 			else:
 				self.logger.debug(
 					'🔍 DOMWatchdog.on_BrowserStateRequestEvent: 📸 Creating BrowserStateSummary WITHOUT screenshot'
 				)
 
+			timing_info['total_ms'] = (time.perf_counter() - request_start) * 1000
+			self.logger.debug(
+				'⏱️ Browser state request: '
+				+ ', '.join(f'{key.removesuffix("_ms")}={value:.0f}ms' for key, value in timing_info.items())
+			)
+
 			browser_state = BrowserStateSummary(
 				dom_state=content,
 				url=page_url,
 				title=title,
 				tabs=tabs_info,
-				screenshot=screenshot_b64,
+				screenshot_image=screenshot,
 				page_info=page_info,
 				pixels_above=0,
 				pixels_below=0,
@@ -485,6 +482,7 @@ class DOMWatchdog(BaseWatchdog):
 				pending_network_requests=pending_requests,
 				pagination_buttons=pagination_buttons_data,
 				closed_popup_messages=self.browser_session._closed_popup_messages.copy(),
+				timing_info=timing_info,
 			)
 
 			# Cache the state
@@ -529,7 +527,121 @@ class DOMWatchdog(BaseWatchdog):
 				closed_popup_messages=self.browser_session._closed_popup_messages.copy()
 				if hasattr(self, 'browser_session') and self.browser_session is not None
 				else [],
+				timing_info=timing_info,
 			)
+		finally:
+			for task in started_tasks:
+				if not task.done():
+					task.cancel()
+
+	async def _timed(self, timing_info: dict[str, float], key: str, awaitable: Awaitable[T]) -> T:
+		"""Await `awaitable` and record its duration in `timing_info[key]` (ms) and on the session tracer, even if it fails."""
+		start = time.perf_counter()
+		try:
+			with trace_span(self.browser_session.tracer, key.removesuffix('_ms'), 'browser_state'):
+				return await awaitable
+		finally:
+			timing_info[key] = (time.perf_counter() - start) * 1000
+
+	async def _wait_for_network_idle(self, timeout: float) -> bool:
+		"""Wait until the focused page reports networkIdle, for at most `timeout` seconds.
+
+		Uses the lifecycle signal SessionManager keeps per page session, so pages that are already idle
+		don't wait at all.
+
+		Returns:
+			True if the page was network idle within the timeout
+		"""
+		try:
+			cdp_session = await self.browser_session.get_or_create_cdp_session(focus=True)
+		except Exception as e:
+			self.logger.debug(f'Failed to get CDP session for network idle wait: {e}')
+			return False
+
+		network_idle = cdp_session._network_idle
+		if network_idle is None or network_idle.is_set():
+			# Lifecycle monitoring is not enabled for this target, or the page is already idle
+			return True
+
+		try:
+			await asyncio.wait_for(network_idle.wait(), timeout=timeout)
+			return True
+		except TimeoutError:
+			return False
+
+	async def _get_page_title(self) -> str:
+		"""Get the current page title, falling back to 'Page' if it isn't available within 1s."""
+		try:
+			self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting page title...')
+			title = await asyncio.wait_for(self.browser_session.get_current_page_title(), timeout=1.0)
+			self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got title: {title}')
+			return title
+		except Exception as e:
+			self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get title: {e}')
+			return 'Page'
+
+	async def _get_page_info_with_fallback(self) -> 'PageInfo':
+		"""Get page info from CDP, falling back to the configured viewport if it isn't available within 1s."""
+		try:
+			self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting page info from CDP...')
+			page_info = await asyncio.wait_for(self._get_page_info(), timeout=1.0)
+			self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got page info from CDP: {page_info}')
+			return page_info
+		except Exception as e:
+			self.logger.debug(
+				f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get page info from CDP: {e}, using fallback'
+			)
+			return self._get_fallback_page_info()
+
+	def _get_fallback_page_info(self) -> 'PageInfo':
+		"""Page info from the configured viewport, for when CDP can't provide it."""
+		from browser_use.browser.views import PageInfo
+
+		viewport = self.browser_session.browser_profile.viewport or {'width': 1280, 'height': 720}
+		return PageInfo(
+			viewport_width=viewport['width'],
+			viewport_height=viewport['height'],
+			page_width=viewport['width'],
+			page_height=viewport['height'],
+			scroll_x=0,
+			scroll_y=0,
+			pixels_above=0,
+			pixels_below=0,
+			pixels_left=0,
+			pixels_right=0,
+		)
+
+	def _setup_dom_mutation_tracking(self) -> DOMMutationTracker | None:
+		"""Create the DOM mutation tracker and route CDP DOM events to it (incremental DOM snapshots only).
+
+		CDP clients keep a single handler per event method, so the handlers are (re-)registered whenever the
+		root CDP client changes, e.g. after a reconnect.
+		"""
+		profile = self.browser_session.browser_profile
+		if not profile.incremental_dom_snapshots:
+			return None
+
+		if self._dom_mutation_tracker is None:
+			self._dom_mutation_tracker = DOMMutationTracker(max_dirty_nodes=profile.incremental_dom_max_dirty_nodes)
+
+		cdp_client = self.browser_session.cdp_client
+		if self._dom_mutation_cdp_client is not cdp_client:
+			tracker = self._dom_mutation_tracker
+			tracker.invalidate('CDP client changed')
+			cdp_client.register.DOM.documentUpdated(tracker.on_document_updated)
+			cdp_client.register.DOM.setChildNodes(tracker.on_set_child_nodes)
+			cdp_client.register.DOM.childNodeInserted(tracker.on_child_node_inserted)
+			cdp_client.register.DOM.childNodeRemoved(tracker.on_child_node_removed)
+			cdp_client.register.DOM.childNodeCountUpdated(tracker.on_child_node_count_updated)
+			cdp_client.register.DOM.attributeModified(tracker.on_attribute_modified)
+			cdp_client.register.DOM.attributeRemoved(tracker.on_attribute_removed)
+			cdp_client.register.DOM.characterDataModified(tracker.on_character_data_modified)
+			cdp_client.register.DOM.scrollableFlagUpdated(tracker.on_scrollable_flag_updated)
+			cdp_client.register.DOM.shadowRootPushed(tracker.on_shadow_root_pushed)
+			cdp_client.register.DOM.shadowRootPopped(tracker.on_shadow_root_popped)
+			self._dom_mutation_cdp_client = cdp_client
+
+		return self._dom_mutation_tracker
 
 	@time_execution_async('build_dom_tree_without_highlights')
 	@observe_debug(ignore_input=True, ignore_output=True, name='build_dom_tree_without_highlights')
@@ -547,7 +659,9 @@ class DOMWatchdog(BaseWatchdog):
 					paint_order_filtering=self.browser_session.browser_profile.paint_order_filtering,
 					max_iframes=self.browser_session.browser_profile.max_iframes,
 					max_iframe_depth=self.browser_session.browser_profile.max_iframe_depth,
+					ax_tree_mode=self.browser_session.browser_profile.ax_tree_mode,
 				)
+			self._dom_service.mutation_tracker = self._setup_dom_mutation_tracking()
 
 			# Get serialized DOM tree using the service
 			self.logger.debug('🔍 DOMWatchdog._build_dom_tree_without_highlights: Calling DomService.get_serialized_dom_tree...')
@@ -575,6 +689,9 @@ class DOMWatchdog(BaseWatchdog):
 					timing_lines.append(f'  │  ├─ iframe_scroll_detection: {iframe_scroll_ms:.2f}ms')
 				if cdp_parallel_ms > 0.01:
 					timing_lines.append(f'  │  ├─ cdp_parallel_calls: {cdp_parallel_ms:.2f}ms')
+				ax_tree_full_ms = timing_info.get('ax_tree_full_ms', 0)
+				if ax_tree_full_ms > 0.01:
+					timing_lines.append(f'  │  │  └─ ax_tree (full): {ax_tree_full_ms:.2f}ms')
 				if snapshot_proc_ms > 0.01:
 					timing_lines.append(f'  │  └─ snapshot_processing: {snapshot_proc_ms:.2f}ms')
 
@@ -593,6 +710,12 @@ class DOMWatchdog(BaseWatchdog):
 			if construct_tree_ms > 0.01:
 				timing_lines.append(f'  ├─ construct_enhanced_tree: {construct_tree_ms:.2f}ms')
 
+			# ax_tree (interactive candidates only)
+			ax_tree_interactive_ms = timing_info.get('ax_tree_interactive_ms', 0)
+			if ax_tree_interactive_ms > 0.01:
+				candidate_count = int(timing_info.get('ax_tree_candidate_nodes', 0))
+				timing_lines.append(f'  ├─ ax_tree (interactive, {candidate_count} nodes): {ax_tree_interactive_ms:.2f}ms')
+
 			# serialize_accessible_elements breakdown
 			serialize_total_ms = timing_info.get('serialize_accessible_elements_total_ms', 0)
 			if serialize_total_ms > 0.01:
@@ -674,8 +797,14 @@ class DOMWatchdog(BaseWatchdog):
 
 	@time_execution_async('capture_clean_screenshot')
 	@observe_debug(ignore_input=True, ignore_output=True, name='capture_clean_screenshot')
-	async def _capture_clean_screenshot(self) -> str:
-		"""Capture a clean screenshot without JavaScript highlights."""
+	async def _capture_clean_screenshot(self) -> 'Screenshot':
+		"""Capture a clean screenshot without JavaScript highlights.
+
+		The screenshot is requested in the profile's screenshot format and, when the agent resizes screenshots for the
+		LLM (llm_screenshot_size), already downscaled by the browser towards that size.
+		"""
+		from browser_use.browser.views import Screenshot
+
 		try:
 			self.logger.debug('🔍 DOMWatchdog._capture_clean_screenshot: Capturing clean screenshot...')
 
@@ -686,7 +815,15 @@ class DOMWatchdog(BaseWatchdog):
 			handler_names = [getattr(h, '__name__', str(h)) for h in handlers]
 			self.logger.debug(f'📸 ScreenshotEvent handlers registered: {len(handlers)} - {handler_names}')
 
-			screenshot_event = self.event_bus.dispatch(ScreenshotEvent(full_page=False))
+			profile = self.browser_session.browser_profile
+			screenshot_event = self.event_bus.dispatch(
+				ScreenshotEvent(
+					full_page=False,
+					format=profile.screenshot_format,
+					quality=profile.screenshot_quality,
+					target_size=self.browser_session.llm_screenshot_size,
+				)
+			)
 			self.logger.debug('📸 Dispatched ScreenshotEvent, waiting for event to complete...')
 
 			# Wait for the event itself to complete (this waits for all handlers)
@@ -697,7 +834,7 @@ class DOMWatchdog(BaseWatchdog):
 			if screenshot_b64 is None:
 				raise RuntimeError('Screenshot handler returned None')
 			self.logger.debug('🔍 DOMWatchdog._capture_clean_screenshot: ✅ Clean screenshot captured successfully')
-			return str(screenshot_b64)
+			return Screenshot(str(screenshot_b64), format=profile.screenshot_format)
 
 		except TimeoutError:
 			self.logger.warning('📸 Clean screenshot timed out after 6 seconds - no handler registered or slow page?')
@@ -834,6 +971,8 @@ class DOMWatchdog(BaseWatchdog):
 		self.selector_map = None
 		self.current_dom_state = None
 		self.enhanced_dom_tree = None
+		if self._dom_mutation_tracker:
+			self._dom_mutation_tracker.invalidate('cache cleared')
 		# Keep the DOM service instance to reuse its CDP client connection
 
 	def is_file_input(self, element: EnhancedDOMTreeNode) -> bool:
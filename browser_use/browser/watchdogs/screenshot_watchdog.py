@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from bubus import BaseEvent
-from cdp_use.cdp.page import CaptureScreenshotParameters
+from cdp_use.cdp.page import CaptureScreenshotParameters, Viewport
 
 from browser_use.browser.events import ScreenshotEvent
 from browser_use.browser.views import BrowserError
@@ -11,7 +11,7 @@ from browser_use.browser.watchdog_base import BaseWatchdog
 from browser_use.observability import observe_debug
 
 if TYPE_CHECKING:
-	pass
+	from browser_use.browser.session import CDPSession
 
 
 class ScreenshotWatchdog(BaseWatchdog):
@@ -31,7 +31,7 @@ class ScreenshotWatchdog(BaseWatchdog):
 			event: ScreenshotEvent with optional full_page and clip parameters
 
 		Returns:
-			Dict with 'screenshot' key containing base64-encoded screenshot or None
+			Base64-encoded screenshot in event.format
 		"""
 		self.logger.debug('[ScreenshotWatchdog] Handler START - on_ScreenshotEvent called')
 		try:
@@ -52,8 +52,14 @@ class ScreenshotWatchdog(BaseWatchdog):
 
 			cdp_session = await self.browser_session.get_or_create_cdp_session(target_id, focus=True)
 
-			# Prepare screenshot parameters
-			params = CaptureScreenshotParameters(format='png', captureBeyondViewport=False)
+			# Prepare screenshot parameters, in the format the consumer needs so nothing has to re-encode it later
+			params = CaptureScreenshotParameters(format=event.format, captureBeyondViewport=False)
+			if event.quality is not None and event.format != 'png':
+				params['quality'] = event.quality
+			if event.target_size:
+				clip = await self._get_downscaled_viewport_clip(cdp_session, event.target_size)
+				if clip:
+					params['clip'] = clip
 
 			# Take screenshot using CDP
 			self.logger.debug(f'[ScreenshotWatchdog] Taking screenshot with params: {params}')
@@ -74,3 +80,29 @@ class ScreenshotWatchdog(BaseWatchdog):
 				await self.browser_session.remove_highlights()
 			except Exception:
 				pass
+
+	async def _get_downscaled_viewport_clip(self, cdp_session: 'CDPSession', target_size: tuple[int, int]) -> Viewport | None:
+		"""Clip covering the visible viewport, scaled so the image still covers target_size pixels.
+
+		Returns None when the viewport already renders at or below the target size (never upscales).
+		"""
+		metrics = await cdp_session.cdp_client.send.Page.getLayoutMetrics(session_id=cdp_session.session_id)
+		css_viewport = metrics.get('cssVisualViewport', {})
+		css_width = css_viewport.get('clientWidth', 0)
+		css_height = css_viewport.get('clientHeight', 0)
+		if css_width <= 0 or css_height <= 0:
+			return None
+
+		# The captured image is clip size * scale * device pixel ratio
+		device_pixel_ratio = metrics.get('visualViewport', {}).get('clientWidth', css_width) / css_width
+		scale = max(target_size[0] / (css_width * device_pixel_ratio), target_size[1] / (css_height * device_pixel_ratio))
+		if scale >= 1:
+			return None
+
+		return Viewport(
+			x=css_viewport.get('pageX', 0),
+			y=css_viewport.get('pageY', 0),
+			width=css_width,
+			height=css_height,
+			scale=scale,
+		)
@@ -0,0 +1,139 @@
+"""Per-execution stdout capture for code cells, safe with many CodeAgents on one event loop."""
+
+import builtins
+import io
+import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TextIO
+
+_capture_buffer: ContextVar[io.StringIO | None] = ContextVar('code_cell_output', default=None)
+_lock = threading.Lock()
+_active_captures = 0
+
+
+class _ContextStream:
+	"""Stands in for sys.stdout or sys.stderr while cells run, writing to the capturing cell of the current context.
+
+	Catches what modules the cell calls print to the real streams (pprint, traceback, pandas, ...). Writes outside a
+	capture (other agents' logs, the host program) go to the stream it replaced.
+	"""
+
+	def __init__(self, stream: TextIO):
+		self.stream = stream
+
+	def _target(self) -> Any:
+		return _capture_buffer.get() or self.stream
+
+	def write(self, s: str) -> int:
+		return self._target().write(s)
+
+	def writelines(self, lines: Any) -> None:
+		self._target().writelines(lines)
+
+	def flush(self) -> None:
+		self._target().flush()
+
+	def __getattr__(self, name: str) -> Any:
+		# encoding, fileno(), isatty(), ... of the replaced stream
+		return getattr(self.stream, name)
+
+
+class _CellStdout:
+	"""What code cells see as sys.stdout, writing to the capture of the cell running in the current context.
+
+	Unlike the process-wide _ContextStream, this can't be undone by anything that swaps and restores sys.stdout
+	while a cell runs (test runners, logging handlers). Writes outside a capture go to whatever sys.stdout is now.
+	"""
+
+	def _target(self) -> Any:
+		return _capture_buffer.get() or sys.stdout
+
+	def write(self, s: str) -> int:
+		return self._target().write(s)
+
+	def writelines(self, lines: Any) -> None:
+		self._target().writelines(lines)
+
+	def flush(self) -> None:
+		self._target().flush()
+
+	def __getattr__(self, name: str) -> Any:
+		# encoding, fileno(), isatty(), ... of the real stdout
+		return getattr(sys.stdout, name)
+
+
+class _CellSys:
+	"""The sys module as code cells see it, with stdout routed to the running cell's capture"""
+
+	stdout = _CellStdout()
+
+	def __getattr__(self, name: str) -> Any:
+		return getattr(sys, name)
+
+
+_cell_sys = _CellSys()
+
+
+def cell_print(*args: Any, file: Any = None, **kwargs: Any) -> None:
+	"""print() for code cells and the helpers they call, printing to the running cell's capture by default"""
+	builtins.print(*args, file=_cell_sys.stdout if file is None else file, **kwargs)
+
+
+def _cell_import(name: str, globals: Any = None, locals: Any = None, fromlist: Any = (), level: int = 0) -> Any:
+	module = builtins.__import__(name, globals, locals, fromlist, level)
+	return _cell_sys if module is sys else module
+
+
+_CELL_BUILTINS = {**vars(builtins), 'print': cell_print, '__import__': _cell_import}
+
+
+def install_output_capture(namespace: dict[str, Any]) -> None:
+	"""Make code executed in namespace print through capture_output(), including sys.stdout and `import sys`"""
+	namespace['__builtins__'] = _CELL_BUILTINS
+	if namespace.get('sys') is sys:
+		namespace['sys'] = _cell_sys
+
+
+def _install_streams() -> None:
+	global _active_captures
+	with _lock:
+		if not isinstance(sys.stdout, _ContextStream):
+			sys.stdout = _ContextStream(sys.stdout)  # type: ignore[assignment]
+		if not isinstance(sys.stderr, _ContextStream):
+			sys.stderr = _ContextStream(sys.stderr)  # type: ignore[assignment]
+		_active_captures += 1
+
+
+def _uninstall_streams() -> None:
+	global _active_captures
+	with _lock:
+		_active_captures -= 1
+		# Put the real streams back once no cell is running, unless someone replaced them in the meantime
+		if not _active_captures:
+			if isinstance(sys.stdout, _ContextStream):
+				sys.stdout = sys.stdout.stream
+			if isinstance(sys.stderr, _ContextStream):
+				sys.stderr = sys.stderr.stream
+
+
+@contextmanager
+def capture_output() -> Iterator[io.StringIO]:
+	"""Capture what the current task (and tasks and threads it starts) prints, until the block exits.
+
+	While any capture is active, sys.stdout and sys.stderr route writes of the capturing context to its buffer, so
+	output of everything a cell calls is caught. Code executed in a namespace prepared with install_output_capture()
+	and helpers using cell_print() are caught even when something else replaces sys.stdout meanwhile. Unlike swapping
+	sys.stdout for a StringIO, concurrent captures don't see each other's output and nothing printed elsewhere in the
+	process ends up in the buffer.
+	"""
+	_install_streams()
+	buffer = io.StringIO()
+	token = _capture_buffer.set(buffer)
+	try:
+		yield buffer
+	finally:
+		_capture_buffer.reset(token)
+		_uninstall_streams()
@@ -16,6 +16,7 @@ from typing import Any
 import requests
 
 from browser_use.browser import BrowserSession
+from browser_use.code_use.capture import cell_print
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.llm.base import BaseChatModel
 from browser_use.tools.service import CodeAgentTools, Tools
@@ -415,14 +416,14 @@ def create_namespace(
 					result_preview += f'  {key}: {value_str}...\n'
 				if len(sample_result) > 10:
 					result_preview += f'  ... {len(sample_result) - 10} more keys'
-				print(result_preview)
+				cell_print(result_preview)
 
 			elif isinstance(result, list):
 				if len(result) == 0:
-					print('type=list, len=0')
+					cell_print('type=list, len=0')
 				else:
 					result_preview = str(result)[:100]
-					print(f'type=list, len={len(result)}, preview={result_preview}...')
+					cell_print(f'type=list, len={len(result)}, preview={result_preview}...')
 			elif isinstance(result, dict):
 				result_preview = f'type=dict, len={len(result)}, sample keys:\n'
 				for key, value in list(result.items())[:10]:
@@ -430,10 +431,10 @@ def create_namespace(
 					result_preview += f'  {key}: {value_str}...\n'
 				if len(result) > 10:
 					result_preview += f'  ... {len(result) - 10} more keys'
-				print(result_preview)
+				cell_print(result_preview)
 
 			else:
-				print(f'type={type(result).__name__}, value={repr(result)[:50]}')
+				cell_print(f'type={type(result).__name__}, value={repr(result)[:50]}')
 
 			return result
 		except Exception as e:
@@ -563,7 +564,7 @@ def create_namespace(
 								'You have multiple Python blocks in this response. Consider calling done() in a separate response '
 								'Now verify the last output and if it satisfies the task, call done(), else continue working.'
 							)
-							print(msg)
+							cell_print(msg)
 
 						# Get the current cell code from namespace (injected by service.py before execution)
 						current_code = namespace.get('_current_cell_code')
@@ -593,7 +594,7 @@ def create_namespace(
 									'Consider validating your output first, THEN call done() in a final step without if/else/elif blocks only if the task is truly complete.'
 								)
 								logger.error(msg)
-								print(msg)
+								cell_print(msg)
 								raise RuntimeError(msg)
 
 				# Build special context
@@ -33,9 +33,17 @@ from browser_use.tokens.views import UsageSummary
 from browser_use.tools.service import CodeAgentTools, Tools
 from browser_use.utils import get_browser_use_version
 
+from .capture import capture_output, install_output_capture
 from .formatting import format_browser_state_for_llm
 from .namespace import EvaluateError, create_namespace
-from .utils import detect_token_limit_issue, extract_code_blocks, extract_url_from_task, truncate_message_content
+from .utils import (
+	analyze_code_cell,
+	compile_code_cell,
+	detect_token_limit_issue,
+	extract_code_blocks,
+	extract_url_from_task,
+	truncate_message_content,
+)
 from .views import (
 	CellType,
 	CodeAgentHistory,
@@ -836,15 +844,11 @@ class CodeAgent:
 		browser_state = None
 
 		try:
-			# Capture output
-			import ast
-			import io
-			import sys
-
-			old_stdout = sys.stdout
-			sys.stdout = io.StringIO()
+			# Capture what this cell prints, without touching the output of other agents running concurrently
+			with capture_output() as captured:
+				# Route the cell's print() and sys.stdout to this capture (cells may replace sys or builtins)
+				install_output_capture(self.namespace)
 
-			try:
 				# Add asyncio to namespace if not already there
 				if 'asyncio' not in self.namespace:
 					self.namespace['asyncio'] = asyncio
@@ -856,12 +860,7 @@ class CodeAgent:
 
 				# Check if code contains await expressions - if so, wrap in async function
 				# This mimics how Jupyter/IPython handles top-level await
-				try:
-					tree = ast.parse(code, mode='exec')
-					has_await = any(isinstance(node, (ast.Await, ast.AsyncWith, ast.AsyncFor)) for node in ast.walk(tree))
-				except SyntaxError:
-					# If parse fails, let exec handle the error
-					has_await = False
+				has_await, assigned_names, user_global_names = analyze_code_cell(code)
 
 				if has_await:
 					# When code has await, we must wrap in async function
@@ -871,36 +870,15 @@ class CodeAgent:
 					# 3. Extract user's explicit global declarations and pre-define those vars
 					# 4. Return locals() so we can update namespace with new variables
 
-					# Find all variable names being assigned + user's explicit globals
-					try:
-						assigned_names = set()
-						user_global_names = set()
-
-						for node in ast.walk(tree):
-							if isinstance(node, ast.Assign):
-								for target in node.targets:
-									if isinstance(target, ast.Name):
-										assigned_names.add(target.id)
-							elif isinstance(node, ast.AugAssign) and isinstance(node.target, ast.Name):
-								assigned_names.add(node.target.id)
-							elif isinstance(node, (ast.AnnAssign, ast.NamedExpr)):
-								if hasattr(node, 'target') and isinstance(node.target, ast.Name):
-									assigned_names.add(node.target.id)
-							elif isinstance(node, ast.Global):
-								# Track user's explicit global declarations
-								user_global_names.update(node.names)
-
-						# Pre-define any user-declared globals that don't exist yet
-						# This prevents NameError when user writes "global foo" before "foo = ..."
-						for name in user_global_names:
-							if name not in self.namespace:
-								self.namespace[name] = None
-
-						# Filter to only existing namespace vars (like Jupyter does)
-						# Include both: assigned vars that exist + user's explicit globals
-						existing_vars = {name for name in (assigned_names | user_global_names) if name in self.namespace}
-					except Exception as e:
-						existing_vars = set()
+					# Pre-define any user-declared globals that don't exist yet
+					# This prevents NameError when user writes "global foo" before "foo = ..."
+					for name in user_global_names:
+						if name not in self.namespace:
+							self.namespace[name] = None
+
+					# Filter to only existing namespace vars (like Jupyter does)
+					# Include both: assigned vars that exist + user's explicit globals
+					existing_vars = {name for name in (assigned_names | user_global_names) if name in self.namespace}
 
 					# Build global declaration if needed
 					global_decl = ''
@@ -921,9 +899,8 @@ __code_exec_coro__ = __code_exec__()
 					# Store whether we added a global declaration (needed for error line mapping)
 					self.namespace['_has_global_decl'] = has_global_decl
 
-					# Compile and execute wrapper at module level
-					compiled_code = compile(wrapped_code, '<code>', 'exec')
-					exec(compiled_code, self.namespace, self.namespace)
+					# Compile (cached per wrapped source) and execute wrapper at module level
+					exec(compile_code_cell(wrapped_code), self.namespace, self.namespace)
 
 					# Get and await the coroutine, then update namespace with new/modified variables
 					coro = self.namespace.get('__code_exec_coro__')
@@ -943,24 +920,12 @@ __code_exec_coro__ = __code_exec__()
 				else:
 					# No await - execute directly at module level for natural variable scoping
 					# This means x = x + 10 will work without needing 'global x'
+					exec(compile_code_cell(code), self.namespace, self.namespace)
 
-					# Track variables before execution
-					vars_before = set(self.namespace.keys())
-
-					compiled_code = compile(code, '<code>', 'exec')
-					exec(compiled_code, self.namespace, self.namespace)
-
-					# Track newly created/modified variables (info shown in "Available" section)
-					vars_after = set(self.namespace.keys())
-					new_vars = vars_after - vars_before
-
-				# Get output
-				output_value = sys.stdout.getvalue()
-				if output_value:
-					output = output_value
-
-			finally:
-				sys.stdout = old_stdout
+			# Get output
+			output_value = captured.getvalue()
+			if output_value:
+				output = output_value
 
 			# Wait 2 seconds for page to stabilize after code execution
 			await asyncio.sleep(0.5)
@@ -1160,7 +1125,9 @@ __code_exec_coro__ = __code_exec__()
 			state = await self.browser_session.get_browser_state_summary(include_screenshot=True)
 			if state and state.screenshot:
 				# Store screenshot using screenshot service
-				screenshot_path = await self.screenshot_service.store_screenshot(state.screenshot, step_number)
+				screenshot_path = await self.screenshot_service.store_screenshot(
+					state.screenshot_image or state.screenshot, step_number
+				)
 				return str(screenshot_path) if screenshot_path else None
 		except Exception as e:
 			logger.warning(f'Failed to capture screenshot for step {step_number}: {e}')
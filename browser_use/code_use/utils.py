@@ -1,6 +1,9 @@
 """Utility functions for code-use agent."""
 
+import ast
+import functools
 import re
+from types import CodeType
 
 
 def truncate_message_content(content: str, max_length: int = 10000) -> str:
@@ -148,3 +151,41 @@ def extract_code_blocks(text: str) -> dict[str, str]:
 				blocks['python'] = combined
 
 	return blocks
+
+
+@functools.lru_cache(maxsize=256)
+def analyze_code_cell(code: str) -> tuple[bool, frozenset[str], frozenset[str]]:
+	"""
+	Parse a code cell once per source.
+
+	Returns: (has_await, assigned_names, user_global_names)
+	has_await is False for code that doesn't parse, so that exec() raises the SyntaxError.
+	"""
+	try:
+		tree = ast.parse(code, mode='exec')
+	except SyntaxError:
+		return False, frozenset(), frozenset()
+
+	has_await = any(isinstance(node, (ast.Await, ast.AsyncWith, ast.AsyncFor)) for node in ast.walk(tree))
+	assigned_names: set[str] = set()
+	user_global_names: set[str] = set()
+	for node in ast.walk(tree):
+		if isinstance(node, ast.Assign):
+			for target in node.targets:
+				if isinstance(target, ast.Name):
+					assigned_names.add(target.id)
+		elif isinstance(node, ast.AugAssign) and isinstance(node.target, ast.Name):
+			assigned_names.add(node.target.id)
+		elif isinstance(node, (ast.AnnAssign, ast.NamedExpr)):
+			if hasattr(node, 'target') and isinstance(node.target, ast.Name):
+				assigned_names.add(node.target.id)
+		elif isinstance(node, ast.Global):
+			# Track user's explicit global declarations
+			user_global_names.update(node.names)
+	return has_await, frozenset(assigned_names), frozenset(user_global_names)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_code_cell(source: str) -> CodeType:
+	"""Compile a code cell (or its async wrapper), cached per source."""
+	return compile(source, '<code>', 'exec')
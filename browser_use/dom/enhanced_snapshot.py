@@ -5,8 +5,12 @@ This module provides stateless functions for parsing Chrome DevTools Protocol (C
 to extract visibility, clickability, cursor styles, and other layout information.
 """
 
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+
 from cdp_use.cdp.domsnapshot.commands import CaptureSnapshotReturns
 from cdp_use.cdp.domsnapshot.types import (
+	DocumentSnapshot,
 	LayoutTreeSnapshot,
 	NodeTreeSnapshot,
 	RareBooleanData,
@@ -30,9 +34,11 @@ REQUIRED_COMPUTED_STYLES = [
 ]
 
 
-def _parse_rare_boolean_data(rare_data: RareBooleanData, index: int) -> bool | None:
-	"""Parse rare boolean data from snapshot - returns True if index is in the rare data."""
-	return index in rare_data['index']
+def _rare_boolean_index_set(rare_data: RareBooleanData | None) -> frozenset[int] | None:
+	"""Turn rare boolean data from the snapshot into a set, so membership checks are O(1) instead of a list scan."""
+	if rare_data is None:
+		return None
+	return frozenset(rare_data['index'])
 
 
 def _parse_computed_styles(strings: list[str], style_indices: list[int]) -> dict[str, str]:
@@ -44,132 +50,194 @@ def _parse_computed_styles(strings: list[str], style_indices: list[int]) -> dict
 	return styles
 
 
-def build_snapshot_lookup(
-	snapshot: CaptureSnapshotReturns,
-	device_pixel_ratio: float = 1.0,
-) -> dict[int, EnhancedSnapshotNode]:
-	"""Build a lookup table of backend node ID to enhanced snapshot data with everything calculated upfront."""
-	import logging
+def _rect_from_list(rect: list[float] | None, scale: float = 1.0) -> DOMRect | None:
+	if not rect or len(rect) < 4:
+		return None
+	return DOMRect(x=rect[0] / scale, y=rect[1] / scale, width=rect[2] / scale, height=rect[3] / scale)
 
-	logger = logging.getLogger('browser_use.dom.enhanced_snapshot')
-	snapshot_lookup: dict[int, EnhancedSnapshotNode] = {}
 
-	if not snapshot['documents']:
-		return snapshot_lookup
+@dataclass(slots=True)
+class _SnapshotDocumentColumns:
+	"""Per-document columns of a DOMSnapshot, referencing the CDP arrays directly (no per-node copies)."""
 
-	strings = snapshot['strings']
-	logger.debug(f'🔍 SNAPSHOT: Processing {len(snapshot["documents"])} documents with {len(strings)} strings')
+	clickable_indices: frozenset[int] | None
+	"""Snapshot node indices that are clickable, None if the snapshot has no isClickable data"""
+	layout_index_map: dict[int, int]
+	"""Snapshot node index -> FIRST layout tree index for that node"""
+	bounds: list[list[float]]
+	styles: list[list[int]]
+	paint_orders: list[int]
+	client_rects: list[list[float]]
+	scroll_rects: list[list[float]]
+	stacking_contexts_len: int
+	stacking_contexts_index: list[int]
 
-	for doc_idx, document in enumerate(snapshot['documents']):
+
+class SnapshotLookup(Mapping[int, EnhancedSnapshotNode]):
+	"""Backend node ID -> `EnhancedSnapshotNode` lookup backed by the columnar DOMSnapshot arrays.
+
+	Only the backend node ID index is built upfront (linear in the number of nodes). `EnhancedSnapshotNode` views are
+	materialised lazily on first access and memoized, and `computed_styles` dicts are interned per distinct style
+	tuple, so nodes sharing the same computed styles share one dict (treat them as read-only).
+	"""
+
+	__slots__ = ('_strings', '_documents', '_locations', '_views', '_style_cache', '_device_pixel_ratio')
+
+	def __init__(self, strings: list[str], device_pixel_ratio: float = 1.0):
+		self._strings = strings
+		self._documents: list[_SnapshotDocumentColumns] = []
+		self._locations: dict[int, tuple[int, int]] = {}
+		"""backend node id -> (document index, snapshot node index)"""
+		self._views: dict[int, EnhancedSnapshotNode] = {}
+		self._style_cache: dict[tuple[int, ...], dict[str, str]] = {}
+		self._device_pixel_ratio = device_pixel_ratio
+
+	def add_document(self, document: DocumentSnapshot) -> int:
+		"""Index one snapshot document, returns the number of backend nodes it contains."""
 		nodes: NodeTreeSnapshot = document['nodes']
 		layout: LayoutTreeSnapshot = document['layout']
 
-		# Build backend node id to snapshot index lookup
-		backend_node_to_snapshot_index = {}
-		if 'backendNodeId' in nodes:
-			for i, backend_node_id in enumerate(nodes['backendNodeId']):
-				backend_node_to_snapshot_index[backend_node_id] = i
-
-		# Log document info
-		doc_url = strings[document.get('documentURL', 0)] if document.get('documentURL', 0) < len(strings) else 'N/A'
-		logger.debug(
-			f'🔍 SNAPSHOT doc[{doc_idx}]: url={doc_url[:80]}... has {len(backend_node_to_snapshot_index)} nodes, '
-			f'layout has {len(layout.get("nodeIndex", []))} entries'
-		)
-
 		# PERFORMANCE: Pre-build layout index map to eliminate O(n²) double lookups
 		# Preserve original behavior: use FIRST occurrence for duplicates
-		layout_index_map = {}
+		layout_index_map: dict[int, int] = {}
 		if layout and 'nodeIndex' in layout:
 			for layout_idx, node_index in enumerate(layout['nodeIndex']):
 				if node_index not in layout_index_map:  # Only store first occurrence
 					layout_index_map[node_index] = layout_idx
 
-		# Build snapshot lookup for each backend node id
-		for backend_node_id, snapshot_index in backend_node_to_snapshot_index.items():
-			is_clickable = None
-			if 'isClickable' in nodes:
-				is_clickable = _parse_rare_boolean_data(nodes['isClickable'], snapshot_index)
-
-			# Find corresponding layout node
-			cursor_style = None
-			is_visible = None
-			bounding_box = None
-			computed_styles = {}
-
-			# Look for layout tree node that corresponds to this snapshot node
-			paint_order = None
-			client_rects = None
-			scroll_rects = None
-			stacking_contexts = None
-			if snapshot_index in layout_index_map:
-				layout_idx = layout_index_map[snapshot_index]
-				if layout_idx < len(layout.get('bounds', [])):
-					# Parse bounding box
-					bounds = layout['bounds'][layout_idx]
-					if len(bounds) >= 4:
-						# IMPORTANT: CDP coordinates are in device pixels, convert to CSS pixels
-						# by dividing by the device pixel ratio
-						raw_x, raw_y, raw_width, raw_height = bounds[0], bounds[1], bounds[2], bounds[3]
-
-						# Apply device pixel ratio scaling to convert device pixels to CSS pixels
-						bounding_box = DOMRect(
-							x=raw_x / device_pixel_ratio,
-							y=raw_y / device_pixel_ratio,
-							width=raw_width / device_pixel_ratio,
-							height=raw_height / device_pixel_ratio,
-						)
-
-					# Parse computed styles for this layout node
-					if layout_idx < len(layout.get('styles', [])):
-						style_indices = layout['styles'][layout_idx]
-						computed_styles = _parse_computed_styles(strings, style_indices)
-						cursor_style = computed_styles.get('cursor')
-
-					# Extract paint order if available
-					if layout_idx < len(layout.get('paintOrders', [])):
-						paint_order = layout.get('paintOrders', [])[layout_idx]
-
-					# Extract client rects if available
-					client_rects_data = layout.get('clientRects', [])
-					if layout_idx < len(client_rects_data):
-						client_rect_data = client_rects_data[layout_idx]
-						if client_rect_data and len(client_rect_data) >= 4:
-							client_rects = DOMRect(
-								x=client_rect_data[0],
-								y=client_rect_data[1],
-								width=client_rect_data[2],
-								height=client_rect_data[3],
-							)
-
-					# Extract scroll rects if available
-					scroll_rects_data = layout.get('scrollRects', [])
-					if layout_idx < len(scroll_rects_data):
-						scroll_rect_data = scroll_rects_data[layout_idx]
-						if scroll_rect_data and len(scroll_rect_data) >= 4:
-							scroll_rects = DOMRect(
-								x=scroll_rect_data[0],
-								y=scroll_rect_data[1],
-								width=scroll_rect_data[2],
-								height=scroll_rect_data[3],
-							)
-
-					# Extract stacking contexts if available
-					if layout_idx < len(layout.get('stackingContexts', [])):
-						stacking_contexts = layout.get('stackingContexts', {}).get('index', [])[layout_idx]
-
-			snapshot_lookup[backend_node_id] = EnhancedSnapshotNode(
-				is_clickable=is_clickable,
-				cursor_style=cursor_style,
-				bounds=bounding_box,
-				clientRects=client_rects,
-				scrollRects=scroll_rects,
-				computed_styles=computed_styles if computed_styles else None,
-				paint_order=paint_order,
-				stacking_contexts=stacking_contexts,
+		stacking_contexts = layout.get('stackingContexts') or {}
+		doc_idx = len(self._documents)
+		self._documents.append(
+			_SnapshotDocumentColumns(
+				clickable_indices=_rare_boolean_index_set(nodes.get('isClickable')),
+				layout_index_map=layout_index_map,
+				bounds=layout.get('bounds', []),
+				styles=layout.get('styles', []),
+				paint_orders=layout.get('paintOrders', []),
+				client_rects=layout.get('clientRects', []),
+				scroll_rects=layout.get('scrollRects', []),
+				stacking_contexts_len=len(stacking_contexts),
+				stacking_contexts_index=stacking_contexts.get('index', []),
+			)
+		)
+
+		backend_node_ids = nodes.get('backendNodeId', [])
+		for snapshot_index, backend_node_id in enumerate(backend_node_ids):
+			self._locations[backend_node_id] = (doc_idx, snapshot_index)
+		return len(set(backend_node_ids))
+
+	def _computed_styles(self, style_indices: list[int]) -> dict[str, str]:
+		key = tuple(style_indices)
+		styles = self._style_cache.get(key)
+		if styles is None:
+			styles = _parse_computed_styles(self._strings, style_indices)
+			self._style_cache[key] = styles
+		return styles
+
+	def _build_node(self, columns: _SnapshotDocumentColumns, snapshot_index: int) -> EnhancedSnapshotNode:
+		is_clickable = None
+		if columns.clickable_indices is not None:
+			is_clickable = snapshot_index in columns.clickable_indices
+
+		cursor_style = None
+		bounding_box = None
+		computed_styles: dict[str, str] = {}
+		paint_order = None
+		client_rects = None
+		scroll_rects = None
+		stacking_contexts = None
+
+		# Look for layout tree node that corresponds to this snapshot node
+		layout_idx = columns.layout_index_map.get(snapshot_index)
+		if layout_idx is not None and layout_idx < len(columns.bounds):
+			# IMPORTANT: CDP coordinates are in device pixels, convert to CSS pixels by dividing by the device pixel ratio
+			bounding_box = _rect_from_list(columns.bounds[layout_idx], self._device_pixel_ratio)
+
+			if layout_idx < len(columns.styles):
+				computed_styles = self._computed_styles(columns.styles[layout_idx])
+				cursor_style = computed_styles.get('cursor')
+
+			if layout_idx < len(columns.paint_orders):
+				paint_order = columns.paint_orders[layout_idx]
+
+			if layout_idx < len(columns.client_rects):
+				client_rects = _rect_from_list(columns.client_rects[layout_idx])
+
+			if layout_idx < len(columns.scroll_rects):
+				scroll_rects = _rect_from_list(columns.scroll_rects[layout_idx])
+
+			# NOTE: compares against the number of keys of the stackingContexts RareBooleanData (kept for compatibility)
+			if layout_idx < columns.stacking_contexts_len and layout_idx < len(columns.stacking_contexts_index):
+				stacking_contexts = columns.stacking_contexts_index[layout_idx]
+
+		return EnhancedSnapshotNode(
+			is_clickable=is_clickable,
+			cursor_style=cursor_style,
+			bounds=bounding_box,
+			clientRects=client_rects,
+			scrollRects=scroll_rects,
+			computed_styles=computed_styles if computed_styles else None,
+			paint_order=paint_order,
+			stacking_contexts=stacking_contexts,
+		)
+
+	def __getitem__(self, backend_node_id: int) -> EnhancedSnapshotNode:
+		view = self._views.get(backend_node_id)
+		if view is None:
+			doc_idx, snapshot_index = self._locations[backend_node_id]
+			view = self._build_node(self._documents[doc_idx], snapshot_index)
+			self._views[backend_node_id] = view
+		return view
+
+	def __contains__(self, backend_node_id: object) -> bool:
+		return backend_node_id in self._locations
+
+	def __iter__(self) -> Iterator[int]:
+		return iter(self._locations)
+
+	def __len__(self) -> int:
+		return len(self._locations)
+
+	def count_with_bounds(self) -> int:
+		"""Number of nodes that have a layout box, computed from the columns without materialising views."""
+		count = 0
+		for doc_idx, snapshot_index in self._locations.values():
+			columns = self._documents[doc_idx]
+			layout_idx = columns.layout_index_map.get(snapshot_index)
+			if layout_idx is not None and layout_idx < len(columns.bounds) and len(columns.bounds[layout_idx]) >= 4:
+				count += 1
+		return count
+
+
+def build_snapshot_lookup(
+	snapshot: CaptureSnapshotReturns,
+	device_pixel_ratio: float = 1.0,
+) -> SnapshotLookup:
+	"""Build a lookup table of backend node ID to enhanced snapshot data (per-node data is computed on first access)."""
+	import logging
+
+	logger = logging.getLogger('browser_use.dom.enhanced_snapshot')
+	strings = snapshot['strings']
+	snapshot_lookup = SnapshotLookup(strings, device_pixel_ratio)
+
+	if not snapshot['documents']:
+		return snapshot_lookup
+
+	logger.debug(f'🔍 SNAPSHOT: Processing {len(snapshot["documents"])} documents with {len(strings)} strings')
+
+	for doc_idx, document in enumerate(snapshot['documents']):
+		node_count = snapshot_lookup.add_document(document)
+
+		if logger.isEnabledFor(logging.DEBUG):
+			# Log document info
+			doc_url = strings[document.get('documentURL', 0)] if document.get('documentURL', 0) < len(strings) else 'N/A'
+			layout_entries = len(document['layout'].get('nodeIndex', []))
+			logger.debug(
+				f'🔍 SNAPSHOT doc[{doc_idx}]: url={doc_url[:80]}... has {node_count} nodes, layout has {layout_entries} entries'
 			)
 
-	# Count how many have bounds (are actually visible/laid out)
-	with_bounds = sum(1 for n in snapshot_lookup.values() if n.bounds)
-	logger.debug(f'🔍 SNAPSHOT: Built lookup with {len(snapshot_lookup)} total entries, {with_bounds} have bounds')
+	if logger.isEnabledFor(logging.DEBUG):
+		# Count how many have bounds (are actually visible/laid out)
+		with_bounds = snapshot_lookup.count_with_bounds()
+		logger.debug(f'🔍 SNAPSHOT: Built lookup with {len(snapshot_lookup)} total entries, {with_bounds} have bounds')
 	return snapshot_lookup
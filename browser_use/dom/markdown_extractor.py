@@ -50,7 +50,9 @@ async def extract_clean_markdown(
 	elif dom_service is not None and target_id is not None:
 		# DOM service path (page actor)
 		# Lazy fetch all_frames inside get_dom_tree if needed (for cross-origin iframes)
-		enhanced_dom_tree, _ = await dom_service.get_dom_tree(target_id=target_id, all_frames=None)
+		enhanced_dom_tree, _ = await dom_service.get_dom_tree(
+			target_id=target_id, all_frames=None, ax_tree_mode=HTMLSerializer.AX_TREE_MODE
+		)
 		current_url = None  # Not available via DOM service
 		method = 'dom_service'
 	else:
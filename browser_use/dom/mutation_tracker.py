@@ -0,0 +1,345 @@
+"""
+Incremental DOM tracking for browser-use DOM tree extraction.
+
+This module keeps the last `DOM.getDocument` result (and the AX nodes fetched alongside it) in sync with the
+`DOM.*` mutation events Chrome sends for nodes already known to the client. When only a handful of nodes changed
+between two steps, `DomService` can reuse the patched document instead of re-issuing `DOM.getDocument(depth=-1)`
+and can refresh accessibility data only for the dirty nodes instead of every frame.
+"""
+
+import logging
+from typing import Any
+
+from cdp_use.cdp.accessibility.types import AXNode
+from cdp_use.cdp.dom.commands import GetDocumentReturns
+from cdp_use.cdp.dom.types import Node
+from cdp_use.cdp.target.types import SessionID, TargetID
+
+from browser_use.dom.views import NodeType
+
+logger = logging.getLogger(__name__)
+
+
+class DOMMutationTracker:
+	"""Patches a cached CDP DOM document from DOM mutation events.
+
+	Lists inside the cached document are replaced rather than mutated, so a DOM build that is still walking the
+	previous version of the document is never affected by events arriving mid-build.
+
+	The tracker is bound to a single (target, CDP session) pair, because node ids are only valid for the session
+	that requested them. Anything the tracker cannot patch safely (unknown node ids, partially pushed subtrees,
+	`DOM.documentUpdated`, too many dirty nodes) invalidates the cache, which makes the next build fall back to a
+	full rebuild.
+	"""
+
+	def __init__(self, max_dirty_nodes: int = 500):
+		self.max_dirty_nodes = max_dirty_nodes
+
+		self.target_id: TargetID | None = None
+		self.session_id: SessionID | None = None
+		self.document: GetDocumentReturns | None = None
+		self.ax_nodes: dict[int, AXNode] = {}
+		"""backendDOMNodeId -> AX node, kept from the last full AX fetch and refreshed for dirty nodes"""
+
+		self.dirty_backend_node_ids: set[int] = set()
+		self.removed_backend_node_ids: set[int] = set()
+		self.invalidated_reason: str | None = 'no cached document'
+
+		self._nodes: dict[int, Node] = {}
+		"""nodeId -> raw CDP node dict (the same objects that live inside `self.document`)"""
+		self._parents: dict[int, int] = {}
+		"""nodeId -> parent nodeId (covers children, shadow roots and content documents)"""
+		self._rebuilding_session_id: SessionID | None = None
+		self._missed_mutations = False
+
+	# region - cache lifecycle
+
+	def begin_full_rebuild(self, session_id: SessionID) -> None:
+		"""Watch for mutations that arrive while a full DOM.getDocument is in flight (they cannot be patched in)."""
+		self._rebuilding_session_id = session_id
+		self._missed_mutations = False
+
+	def reset(
+		self,
+		target_id: TargetID,
+		session_id: SessionID,
+		document: GetDocumentReturns,
+		ax_nodes: list[AXNode],
+	) -> None:
+		"""Start tracking a freshly fetched document (called after every full rebuild)."""
+		self.target_id = target_id
+		self.session_id = session_id
+		self.document = document
+		self.ax_nodes = {ax_node['backendDOMNodeId']: ax_node for ax_node in ax_nodes if 'backendDOMNodeId' in ax_node}
+		self.dirty_backend_node_ids = set()
+		self.removed_backend_node_ids = set()
+		self.invalidated_reason = None
+		self._nodes = {}
+		self._parents = {}
+		self._index_subtree(document['root'], parent_id=None)
+		if self._missed_mutations and self._rebuilding_session_id == session_id:
+			# the document may already be stale, use it for this step but rebuild fully next time
+			self.invalidated_reason = 'mutations arrived during full rebuild'
+		self._rebuilding_session_id = None
+		self._missed_mutations = False
+
+	def invalidate(self, reason: str) -> None:
+		"""Drop the cached document so the next build does a full rebuild."""
+		if self.invalidated_reason is None:
+			logger.debug(f'🔄 DOM mutation cache invalidated: {reason}')
+		self.invalidated_reason = reason
+		self.document = None
+		self.ax_nodes = {}
+		self._nodes = {}
+		self._parents = {}
+		self.dirty_backend_node_ids = set()
+		self.removed_backend_node_ids = set()
+
+	@property
+	def dirty_count(self) -> int:
+		return len(self.dirty_backend_node_ids) + len(self.removed_backend_node_ids)
+
+	def can_reuse(self, target_id: TargetID, session_id: SessionID) -> bool:
+		"""Whether the cached document can be reused for this target/session instead of a full rebuild."""
+		if self.document is None or self.invalidated_reason is not None:
+			return False
+		if self.target_id != target_id or self.session_id != session_id:
+			return False
+		if self.dirty_count > self.max_dirty_nodes:
+			logger.debug(
+				f'🔄 DOM mutation cache has {self.dirty_count} dirty nodes (> {self.max_dirty_nodes}), doing full rebuild'
+			)
+			return False
+		return True
+
+	def consume_dirty_nodes(self) -> tuple[set[int], set[int]]:
+		"""Return (dirty, removed) backend node ids and start a new dirty window."""
+		dirty, removed = self.dirty_backend_node_ids, self.removed_backend_node_ids
+		self.dirty_backend_node_ids = set()
+		self.removed_backend_node_ids = set()
+		return dirty - removed, removed
+
+	def update_ax_nodes(self, ax_nodes: list[AXNode], removed_backend_node_ids: set[int]) -> None:
+		"""Merge freshly fetched AX nodes for dirty nodes into the cached AX lookup."""
+		for backend_node_id in removed_backend_node_ids:
+			self.ax_nodes.pop(backend_node_id, None)
+		for ax_node in ax_nodes:
+			if 'backendDOMNodeId' in ax_node:
+				self.ax_nodes[ax_node['backendDOMNodeId']] = ax_node
+
+	# endregion - cache lifecycle
+
+	# region - CDP DOM event handlers
+
+	def _is_tracked_session(self, session_id: str | None) -> bool:
+		if session_id is not None and session_id == self._rebuilding_session_id:
+			self._missed_mutations = True
+		return self.document is not None and session_id is not None and session_id == self.session_id
+
+	def on_document_updated(self, event: Any, session_id: str | None = None) -> None:
+		if self._is_tracked_session(session_id):
+			self.invalidate('document updated')
+
+	def on_set_child_nodes(self, event: Any, session_id: str | None = None) -> None:
+		if not self._is_tracked_session(session_id):
+			return
+		parent = self._nodes.get(event['parentId'])
+		if parent is None:
+			return self.invalidate(f'setChildNodes for unknown parent {event["parentId"]}')
+		for child in parent.get('children', []):
+			self._unindex_subtree(child)
+		parent['children'] = list(event['nodes'])
+		parent['childNodeCount'] = len(event['nodes'])
+		for child in parent['children']:
+			self._index_subtree(child, parent_id=parent['nodeId'], mark_dirty=True)
+
+	def on_child_node_inserted(self, event: Any, session_id: str | None = None) -> None:
+		if not self._is_tracked_session(session_id):
+			return
+		parent = self._nodes.get(event['parentNodeId'])
+		if parent is None:
+			return self.invalidate(f'node inserted under unknown parent {event["parentNodeId"]}')
+
+		node: Node = event['node']
+		if not self._is_subtree_complete(node):
+			# Chrome only pushes a shallow copy of large inserted subtrees, we would have to request the rest
+			return self.invalidate(f'partially pushed subtree inserted under {parent["nodeName"]}')
+
+		children = parent.get('children', [])
+		previous_node_id = event.get('previousNodeId', 0)
+		insert_at = 0
+		if previous_node_id:
+			for i, child in enumerate(children):
+				if child['nodeId'] == previous_node_id:
+					insert_at = i + 1
+					break
+			else:
+				return self.invalidate(f'node inserted after unknown sibling {previous_node_id}')
+
+		# copy-on-write: a DOM build may be iterating the old list while events keep arriving
+		parent['children'] = children[:insert_at] + [node] + children[insert_at:]
+		parent['childNodeCount'] = len(parent['children'])
+		self._index_subtree(node, parent_id=parent['nodeId'], mark_dirty=True)
+		self._mark_dirty(parent)
+
+	def on_child_node_removed(self, event: Any, session_id: str | None = None) -> None:
+		if not self._is_tracked_session(session_id):
+			return
+		parent = self._nodes.get(event['parentNodeId'])
+		node = self._nodes.get(event['nodeId'])
+		if parent is None or node is None:
+			return self.invalidate(f'unknown node {event["nodeId"]} removed')
+
+		parent['children'] = [child for child in parent.get('children', []) if child['nodeId'] != node['nodeId']]
+		parent['childNodeCount'] = len(parent['children'])
+		self._unindex_subtree(node)
+		self._mark_dirty(parent)
+
+	def on_child_node_count_updated(self, event: Any, session_id: str | None = None) -> None:
+		if not self._is_tracked_session(session_id):
+			return
+		node = self._nodes.get(event['nodeId'])
+		if node is None or event['childNodeCount'] != len(node.get('children', [])):
+			# children changed without being pushed to us, the cached subtree is stale
+			self.invalidate(f'child node count changed on node {event["nodeId"]}')
+
+	def on_attribute_modified(self, event: Any, session_id: str | None = None) -> None:
+		if not self._is_tracked_session(session_id):
+			return
+		node = self._nodes.get(event['nodeId'])
+		if node is None:
+			return self.invalidate(f'attribute modified on unknown node {event["nodeId"]}')
+
+		attributes = list(node.get('attributes', []))
+		for i in range(0, len(attributes), 2):
+			if attributes[i] == event['name']:
+				attributes[i + 1] = event['value']
+				break
+		else:
+			attributes.extend([event['name'], event['value']])
+		node['attributes'] = attributes
+		self._mark_dirty(node)
+
+	def on_attribute_removed(self, event: Any, session_id: str | None = None) -> None:
+		if not self._is_tracked_session(session_id):
+			return
+		node = self._nodes.get(event['nodeId'])
+		if node is None:
+			return self.invalidate(f'attribute removed on unknown node {event["nodeId"]}')
+
+		attributes = list(node.get('attributes', []))
+		for i in range(0, len(attributes), 2):
+			if attributes[i] == event['name']:
+				del attributes[i : i + 2]
+				break
+		node['attributes'] = attributes
+		self._mark_dirty(node)
+
+	def on_character_data_modified(self, event: Any, session_id: str | None = None) -> None:
+		if not self._is_tracked_session(session_id):
+			return
+		node = self._nodes.get(event['nodeId'])
+		if node is None:
+			return self.invalidate(f'character data modified on unknown node {event["nodeId"]}')
+
+		node['nodeValue'] = event['characterData']
+		self._mark_dirty(node)
+		# the accessible name of the containing element is usually computed from its text
+		parent = self._nodes.get(self._parents.get(node['nodeId'], 0))
+		if parent is not None:
+			self._mark_dirty(parent)
+
+	def on_scrollable_flag_updated(self, event: Any, session_id: str | None = None) -> None:
+		if not self._is_tracked_session(session_id):
+			return
+		node = self._nodes.get(event['nodeId'])
+		if node is not None:
+			node['isScrollable'] = event['isScrollable']  # type: ignore[typeddict-unknown-key]
+			self._mark_dirty(node)
+
+	def on_shadow_root_pushed(self, event: Any, session_id: str | None = None) -> None:
+		if not self._is_tracked_session(session_id):
+			return
+		host = self._nodes.get(event['hostId'])
+		root: Node = event['root']
+		if host is None or not self._is_subtree_complete(root):
+			return self.invalidate(f'shadow root pushed on host {event["hostId"]} could not be patched')
+
+		host['shadowRoots'] = host.get('shadowRoots', []) + [root]
+		self._index_subtree(root, parent_id=host['nodeId'], mark_dirty=True)
+		self._mark_dirty(host)
+
+	def on_shadow_root_popped(self, event: Any, session_id: str | None = None) -> None:
+		if not self._is_tracked_session(session_id):
+			return
+		host = self._nodes.get(event['hostId'])
+		root = self._nodes.get(event['rootId'])
+		if host is None or root is None:
+			return self.invalidate(f'unknown shadow root {event["rootId"]} popped')
+
+		host['shadowRoots'] = [r for r in host.get('shadowRoots', []) if r['nodeId'] != root['nodeId']]
+		self._unindex_subtree(root)
+		self._mark_dirty(host)
+
+	# endregion - CDP DOM event handlers
+
+	# region - helpers
+
+	def _mark_dirty(self, node: Node) -> None:
+		self.dirty_backend_node_ids.add(node['backendNodeId'])
+
+	@staticmethod
+	def _subtree_nodes(node: Node) -> list[Node]:
+		"""All nodes of a raw CDP subtree that the enhanced tree builder walks (children, shadow roots, content docs)."""
+		nodes: list[Node] = []
+		stack = [node]
+		while stack:
+			current = stack.pop()
+			nodes.append(current)
+			stack.extend(current.get('children', []))
+			stack.extend(current.get('shadowRoots', []))
+			content_document = current.get('contentDocument')
+			if content_document:
+				stack.append(content_document)
+		return nodes
+
+	@classmethod
+	def _is_subtree_complete(cls, node: Node) -> bool:
+		"""Check that every container in the pushed subtree came with all of its children."""
+		for current in cls._subtree_nodes(node):
+			if current['nodeType'] == NodeType.TEXT_NODE.value:
+				continue
+			if current.get('childNodeCount', 0) > len(current.get('children', [])):
+				return False
+		return True
+
+	def _index_subtree(self, node: Node, parent_id: int | None, mark_dirty: bool = False) -> None:
+		if parent_id is not None:
+			self._parents[node['nodeId']] = parent_id
+			node.setdefault('parentId', parent_id)
+		stack: list[Node] = [node]
+		while stack:
+			current = stack.pop()
+			self._nodes[current['nodeId']] = current
+			if mark_dirty:
+				self.dirty_backend_node_ids.add(current['backendNodeId'])
+				self.removed_backend_node_ids.discard(current['backendNodeId'])
+			nested = list(current.get('children', [])) + list(current.get('shadowRoots', []))
+			content_document = current.get('contentDocument')
+			if content_document:
+				nested.append(content_document)
+			for child in current.get('children', []):
+				# the enhanced tree builder links children to parents through parentId
+				child.setdefault('parentId', current['nodeId'])
+			for child in nested:
+				self._parents[child['nodeId']] = current['nodeId']
+				stack.append(child)
+
+	def _unindex_subtree(self, node: Node) -> None:
+		for current in self._subtree_nodes(node):
+			self._nodes.pop(current['nodeId'], None)
+			self._parents.pop(current['nodeId'], None)
+			self.dirty_backend_node_ids.discard(current['backendNodeId'])
+			self.removed_backend_node_ids.add(current['backendNodeId'])
+
+	# endregion - helpers
@@ -1,7 +1,52 @@
 from browser_use.dom.views import EnhancedDOMTreeNode, NodeType
 
+# Elements whose interactivity or rendered attributes can depend on AX data (focusable, form state, compound children)
+AX_CANDIDATE_TAGS = {
+	'a',
+	'area',
+	'audio',
+	'button',
+	'details',
+	'embed',
+	'frame',
+	'iframe',
+	'input',
+	'label',
+	'object',
+	'optgroup',
+	'option',
+	'select',
+	'summary',
+	'textarea',
+	'video',
+}
+AX_CANDIDATE_ATTRIBUTES = {'role', 'tabindex', 'contenteditable', 'draggable', 'disabled', 'hidden'}
+
 
 class ClickableElementDetector:
+	@staticmethod
+	def is_ax_candidate(node: EnhancedDOMTreeNode) -> bool:
+		"""Check if AX data may change how this node is serialized, used to fetch AX data on demand.
+
+		Must return True for every node `is_interactive` can accept, plus nodes whose AX properties are rendered
+		as attributes (form controls, ARIA state). Called before the AX data is attached.
+		"""
+		if node.node_type != NodeType.ELEMENT_NODE:
+			return False
+
+		if node.tag_name in AX_CANDIDATE_TAGS or node.is_scrollable:
+			return True
+
+		if node.snapshot_node and (node.snapshot_node.is_clickable or node.snapshot_node.cursor_style == 'pointer'):
+			return True
+
+		for attr_name in node.attributes:
+			if attr_name in AX_CANDIDATE_ATTRIBUTES or attr_name.startswith('aria-') or attr_name.startswith('on'):
+				return True
+
+		# Remaining DOM-only heuristics (search indicators, icon-sized elements)
+		return ClickableElementDetector.is_interactive(node)
+
 	@staticmethod
 	def is_interactive(node: EnhancedDOMTreeNode) -> bool:
 		"""Check if this node is clickable/interactive using enhanced scoring."""
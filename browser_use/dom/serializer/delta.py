@@ -0,0 +1,135 @@
+# @file purpose: Describes the serialized DOM as changes against a periodic full snapshot (keyframe)
+
+from dataclasses import dataclass, field
+
+from browser_use.dom.serializer.token_budget import OMITTED_MARKER
+from browser_use.dom.views import SimplifiedNode
+
+SerializedLines = list[tuple[SimplifiedNode, int, str]]
+
+
+@dataclass
+class DOMKeyframe:
+	"""Full serialized page that later steps are described against"""
+
+	url: str
+	text: str
+	elements: dict[int, str] = field(default_factory=dict)
+	"""backend_node_id -> element block (element line and its own text lines, without indentation and new marker)"""
+	texts: list[str] = field(default_factory=list)
+	"""Text lines that belong to no interactive element"""
+
+
+@dataclass
+class DOMDelta:
+	keyframe: DOMKeyframe
+	changes: str | None
+	"""None when this step sends a new keyframe, empty when nothing changed since the keyframe"""
+
+
+def _element_line(line: str) -> str:
+	line = line.strip()
+	return line[1:] if line.startswith('*') else line  # the new-element marker changes every step
+
+
+def _is_line_at(text: str, position: int, line: str) -> bool:
+	end = position + len(line)
+	return text.startswith(line, position) and (end == len(text) or text[end] == '\n')
+
+
+def _rendered_entries(entries: SerializedLines, text: str) -> SerializedLines:
+	"""The entries that text actually shows, in page order.
+
+	text is the full serialization with lines left out for the token budget (each run replaced by an omitted marker
+	line) or cut off at the end, so entries missing from it are skipped instead of being described as on the page.
+	"""
+	rendered: SerializedLines = []
+	position = 0
+	for entry in entries:
+		line = entry[2]
+		if _is_line_at(text, position, line):
+			rendered.append(entry)
+			position += len(line) + 1
+			continue
+		marker_end = text.find('\n', position)
+		if marker_end != -1 and text[position:marker_end].strip() == OMITTED_MARKER and _is_line_at(text, marker_end + 1, line):
+			rendered.append(entry)
+			position = marker_end + 1 + len(line) + 1
+	return rendered
+
+
+def _split_blocks(entries: SerializedLines) -> tuple[dict[int, str], list[str]]:
+	"""Group serialized lines into interactive element blocks and free text lines, both in page order"""
+	elements: dict[int, str] = {}
+	texts: list[str] = []
+	block_id: int | None = None
+	block_depth = 0
+	for node, depth, line in entries:
+		if block_id is not None and depth <= block_depth:
+			block_id = None
+		if node.is_interactive:
+			block_id, block_depth = node.original_node.backend_node_id, depth
+			elements[block_id] = _element_line(line)
+		elif block_id is not None:
+			elements[block_id] += '\n' + line.strip()
+		else:
+			texts.append(line.strip())
+	return elements, texts
+
+
+class DOMDeltaTracker:
+	"""Keeps the last keyframe of the page and describes each new serialization as changes against it.
+
+	Interactive elements keep their backend node id as index across steps, so changes are listed per element:
+	added (+), changed (~, with its new content) and removed (-), followed by added and removed page text. A new
+	keyframe is taken on the first step, after navigating to another URL, every keyframe_interval steps, and when
+	the changes would be longer than max_change_ratio of the full serialization.
+	"""
+
+	def __init__(self, keyframe_interval: int = 10, max_change_ratio: float = 0.5):
+		self.keyframe_interval = keyframe_interval
+		self.max_change_ratio = max_change_ratio
+		self.keyframe: DOMKeyframe | None = None
+		self._steps_since_keyframe = 0
+
+	def update(self, url: str, entries: SerializedLines, text: str) -> DOMDelta:
+		"""Compare the current serialization against the keyframe.
+
+		entries are the serialized lines of the current page, text is what a full state message would show for them.
+		Only the entries text shows are compared, so a keyframe never lists elements the model was not shown.
+		"""
+		elements, texts = _split_blocks(_rendered_entries(entries, text))
+		self._steps_since_keyframe += 1
+		if self.keyframe is not None and self.keyframe.url == url and self._steps_since_keyframe < self.keyframe_interval:
+			changes = self._describe_changes(self.keyframe, elements, texts)
+			if len(changes) <= self.max_change_ratio * len(text):
+				return DOMDelta(keyframe=self.keyframe, changes=changes)
+
+		self.keyframe = DOMKeyframe(url=url, text=text, elements=elements, texts=texts)
+		self._steps_since_keyframe = 0
+		return DOMDelta(keyframe=self.keyframe, changes=None)
+
+	def reset(self) -> None:
+		"""Send a full keyframe with the next update"""
+		self.keyframe = None
+
+	@staticmethod
+	def _describe_changes(keyframe: DOMKeyframe, elements: dict[int, str], texts: list[str]) -> str:
+		lines: list[str] = []
+		for backend_node_id, block in elements.items():
+			previous = keyframe.elements.get(backend_node_id)
+			if previous == block:
+				continue
+			first, *children = block.split('\n')
+			lines.append(f'{"+" if previous is None else "~"} {first}')
+			lines.extend(f'\t{child}' for child in children)
+		for backend_node_id, block in keyframe.elements.items():
+			if backend_node_id not in elements:
+				first = block.split('\n', 1)[0]
+				lines.append(f'- {first}')
+
+		previous_texts = set(keyframe.texts)
+		current_texts = set(texts)
+		lines.extend(f'+ {line}' for line in dict.fromkeys(texts) if line not in previous_texts)
+		lines.extend(f'- {line}' for line in dict.fromkeys(keyframe.texts) if line not in current_texts)
+		return '\n'.join(lines)
@@ -1,6 +1,6 @@
 # @file purpose: Serializes enhanced DOM trees to HTML format including shadow roots
 
-from browser_use.dom.views import EnhancedDOMTreeNode, NodeType
+from browser_use.dom.views import AXTreeMode, EnhancedDOMTreeNode, NodeType
 
 
 class HTMLSerializer:
@@ -16,6 +16,9 @@ class HTMLSerializer:
 	enhanced tree including shadow roots that are crucial for modern SPAs.
 	"""
 
+	AX_TREE_MODE: AXTreeMode = 'none'
+	"""The HTML output never reads accessibility data"""
+
 	def __init__(self, extract_links: bool = False):
 		"""Initialize the HTML serializer.
 
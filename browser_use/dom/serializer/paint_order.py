@@ -1,3 +1,4 @@
+import math
 from collections import defaultdict
 from dataclasses import dataclass
 
@@ -79,8 +80,11 @@ class RectUnionPure:
 		if not self._rects:
 			return False
 
+		return self._covered_by(r, self._rects)
+
+	def _covered_by(self, r: Rect, rects: list[Rect]) -> bool:
 		stack = [r]
-		for s in self._rects:
+		for s in rects:
 			new_stack = []
 			for piece in stack:
 				if s.contains(piece):
@@ -128,6 +132,161 @@ class RectUnionPure:
 		return True
 
 
+class RectUnionGrid(RectUnionPure):
+	"""
+	Same disjoint rectangle union as `RectUnionPure`, with the stored rectangles bucketed in a uniform grid.
+
+	`contains` and `add` only look at the rectangles sharing a grid cell with the query instead of every stored
+	rectangle, `contains` compares covered area instead of splitting, and `add` decomposes the uncovered part with a
+	sweep-line, which keeps grid-heavy pages (thousands of cards) sub-quadratic. The covered region is the same as
+	with `RectUnionPure`, the individual stored rectangles may differ.
+	"""
+
+	__slots__ = ('_cell_size', '_cells', '_large')
+
+	# Rectangles spanning more cells than this (page backgrounds, overlays) are kept out of the grid
+	MAX_CELLS_PER_RECT = 256
+	# Relative float tolerance when comparing covered area against the query area
+	AREA_TOLERANCE = 1e-9
+
+	def __init__(self, cell_size: float = 256.0):
+		super().__init__()
+		self._cell_size = cell_size
+		self._cells: dict[tuple[int, int], list[int]] = {}
+		self._large: list[int] = []
+
+	def _cell_range(self, r: Rect) -> tuple[int, int, int, int] | None:
+		"""Grid cells covered by r, None if r is too large (or not finite) to be bucketed."""
+		if not (math.isfinite(r.x1) and math.isfinite(r.y1) and math.isfinite(r.x2) and math.isfinite(r.y2)):
+			return None
+		size = self._cell_size
+		cx1, cy1, cx2, cy2 = math.floor(r.x1 / size), math.floor(r.y1 / size), math.floor(r.x2 / size), math.floor(r.y2 / size)
+		if (cx2 - cx1 + 1) * (cy2 - cy1 + 1) > self.MAX_CELLS_PER_RECT:
+			return None
+		return cx1, cy1, cx2, cy2
+
+	def _candidates(self, r: Rect) -> list[Rect]:
+		"""Stored rectangles that may intersect or contain r, in insertion order."""
+		cell_range = self._cell_range(r)
+		if cell_range is None:
+			return self._rects
+
+		cx1, cy1, cx2, cy2 = cell_range
+		indices = set(self._large)
+		cells = self._cells
+		for cx in range(cx1, cx2 + 1):
+			for cy in range(cy1, cy2 + 1):
+				bucket = cells.get((cx, cy))
+				if bucket:
+					indices.update(bucket)
+		rects = self._rects
+		return [rects[i] for i in sorted(indices)]
+
+	def _index(self, index: int) -> None:
+		cell_range = self._cell_range(self._rects[index])
+		if cell_range is None:
+			self._large.append(index)
+			return
+		cx1, cy1, cx2, cy2 = cell_range
+		for cx in range(cx1, cx2 + 1):
+			for cy in range(cy1, cy2 + 1):
+				self._cells.setdefault((cx, cy), []).append(index)
+
+	# -----------------------------------------------------------------
+	def contains(self, r: Rect) -> bool:
+		"""
+		True iff r is fully covered by the current union.
+		"""
+		if not self._rects:
+			return False
+
+		area = r.area()
+		if area <= 0:
+			# degenerate rectangles (lines, points) can't be measured by area, split them instead
+			return self._covered_by(r, self._candidates(r))
+
+		# Stored rectangles are disjoint, so r is covered iff their overlaps with r add up to its area
+		covered = 0.0
+		for s in self._candidates(r):
+			w = min(s.x2, r.x2) - max(s.x1, r.x1)
+			if w <= 0:
+				continue
+			h = min(s.y2, r.y2) - max(s.y1, r.y1)
+			if h <= 0:
+				continue
+			covered += w * h
+		return covered >= area * (1 - self.AREA_TOLERANCE)
+
+	# -----------------------------------------------------------------
+	def add(self, r: Rect) -> bool:
+		"""
+		Insert r unless it is already covered.
+		Returns True if the union grew.
+		"""
+		if self.contains(r):
+			return False
+
+		if r.area() <= 0:
+			pieces = [r]
+		else:
+			pieces = self._uncovered_pieces(r, self._candidates(r))
+
+		for piece in pieces:
+			self._rects.append(piece)
+			self._index(len(self._rects) - 1)
+		return True
+
+	def _uncovered_pieces(self, r: Rect, candidates: list[Rect]) -> list[Rect]:
+		"""Decompose r minus the candidates into disjoint rectangles with a sweep over vertical slabs.
+
+		Unlike repeatedly splitting r (which fragments a large rectangle against every stored one), this
+		yields at most one rectangle per uncovered y-gap, merged across neighbouring slabs.
+		"""
+		clipped = []
+		for s in candidates:
+			x1, x2 = max(s.x1, r.x1), min(s.x2, r.x2)
+			y1, y2 = max(s.y1, r.y1), min(s.y2, r.y2)
+			if x1 < x2 and y1 < y2:
+				clipped.append((x1, y1, x2, y2))
+		if not clipped:
+			return [r]
+
+		xs = sorted({r.x1, r.x2, *(c[0] for c in clipped), *(c[2] for c in clipped)})
+		by_start = sorted(clipped, key=lambda c: c[0])
+		active: list[tuple[float, float, float, float]] = []
+		next_start = 0
+
+		pieces: list[Rect] = []
+		open_pieces: dict[tuple[float, float], float] = {}  # (y1, y2) gap -> x where the piece started
+		for xa, xb in zip(xs, xs[1:]):
+			while next_start < len(by_start) and by_start[next_start][0] <= xa:
+				active.append(by_start[next_start])
+				next_start += 1
+			active = [c for c in active if c[2] > xa]
+
+			# uncovered y-gaps of this slab
+			gaps: list[tuple[float, float]] = []
+			y = r.y1
+			for _, y1, _, y2 in sorted(active, key=lambda c: c[1]):
+				if y1 > y:
+					gaps.append((y, y1))
+				y = max(y, y2)
+			if y < r.y2:
+				gaps.append((y, r.y2))
+
+			gap_set = set(gaps)
+			for gap, x_start in list(open_pieces.items()):
+				if gap not in gap_set:
+					pieces.append(Rect(x_start, gap[0], xa, gap[1]))
+					del open_pieces[gap]
+			for gap in gaps:
+				open_pieces.setdefault(gap, xa)
+
+		for gap, x_start in open_pieces.items():
+			pieces.append(Rect(x_start, gap[0], r.x2, gap[1]))
+		return pieces
+
+
 class PaintOrderRemover:
 	"""
 	Calculates which elements should be removed based on the paint order parameter.
@@ -158,7 +317,7 @@ class PaintOrderRemover:
 			if node.original_node.snapshot_node and node.original_node.snapshot_node.paint_order is not None:
 				grouped_by_paint_order[node.original_node.snapshot_node.paint_order].append(node)
 
-		rect_union = RectUnionPure()
+		rect_union = RectUnionGrid()
 
 		for paint_order, nodes in sorted(grouped_by_paint_order.items(), key=lambda x: -x[0]):
 			rects_to_add = []
@@ -6,6 +6,7 @@ from browser_use.dom.serializer.clickable_elements import ClickableElementDetect
 from browser_use.dom.serializer.paint_order import PaintOrderRemover
 from browser_use.dom.utils import cap_text_length
 from browser_use.dom.views import (
+	AXTreeMode,
 	DOMRect,
 	DOMSelectorMap,
 	EnhancedDOMTreeNode,
@@ -15,6 +16,13 @@ from browser_use.dom.views import (
 	SimplifiedNode,
 )
 
+try:
+	import numpy as np  # type: ignore
+
+	NUMPY_AVAILABLE = True
+except ImportError:
+	NUMPY_AVAILABLE = False
+
 DISABLED_ELEMENTS = {'style', 'script', 'head', 'meta', 'link', 'title'}
 
 # SVG child elements to skip (decorative only, no interaction value)
@@ -55,6 +63,11 @@ class DOMTreeSerializer:
 		# {'tag': 'span', 'role': 'link'},    # <span role="link">
 	]
 	DEFAULT_CONTAINMENT_THRESHOLD = 0.99  # 99% containment by default
+	# Below this many candidates per propagating ancestor, building NumPy arrays costs more than it saves
+	VECTORIZED_CONTAINMENT_MIN_BATCH = 16
+	# AX data is only read for nodes that can become interactive (see ClickableElementDetector.is_ax_candidate).
+	# DOMEvalSerializer and the code-use serializer render this serializer's output, so they need the same.
+	AX_TREE_MODE: AXTreeMode = 'interactive'
 
 	def __init__(
 		self,
@@ -69,6 +82,8 @@ class DOMTreeSerializer:
 		self._interactive_counter = 1
 		self._selector_map: DOMSelectorMap = {}
 		self._previous_cached_selector_map = previous_cached_state.selector_map if previous_cached_state else None
+		# Backend node ids of the previous selector map, built once on first use for new-element detection
+		self._previous_backend_node_ids: set[int] | None = None
 		# Add timing tracking
 		self.timing_info: dict[str, float] = {}
 		# Cache for clickable element detection to avoid redundant calls
@@ -76,6 +91,8 @@ class DOMTreeSerializer:
 		# Bounding box filtering configuration
 		self.enable_bbox_filtering = enable_bbox_filtering
 		self.containment_threshold = containment_threshold or self.DEFAULT_CONTAINMENT_THRESHOLD
+		# (tag, role) keys of PROPAGATING_ELEMENTS, None meaning "any"
+		self._propagating_patterns = {(pattern.get('tag'), pattern.get('role')) for pattern in self.PROPAGATING_ELEMENTS}
 		# Paint order filtering configuration
 		self.paint_order_filtering = paint_order_filtering
 		# Session ID for session-specific exclude attribute
@@ -171,6 +188,9 @@ class DOMTreeSerializer:
 		elif not node.ax_node or not node.ax_node.child_ids:
 			return
 
+		if node._compound_children is None:
+			node._compound_children = []
+
 		# Add compound component information based on element type
 		element_type = node.tag_name
 		input_type = node.attributes.get('type', '') if node.attributes else ''
@@ -696,8 +716,11 @@ class DOMTreeSerializer:
 					node.is_new = True
 				elif self._previous_cached_selector_map:
 					# Check if node is new for regular elements
-					previous_backend_node_ids = {node.backend_node_id for node in self._previous_cached_selector_map.values()}
-					if node.original_node.backend_node_id not in previous_backend_node_ids:
+					if self._previous_backend_node_ids is None:
+						self._previous_backend_node_ids = {
+							node.backend_node_id for node in self._previous_cached_selector_map.values()
+						}
+					if node.original_node.backend_node_id not in self._previous_backend_node_ids:
 						node.is_new = True
 
 		# Process children
@@ -723,17 +746,43 @@ class DOMTreeSerializer:
 
 	def _filter_tree_recursive(self, node: SimplifiedNode, active_bounds: PropagatingBounds | None = None, depth: int = 0):
 		"""
-		Recursively filter tree with bounding box propagation.
+		Filter tree with bounding box propagation.
 		Bounds propagate to ALL descendants until overridden.
-		"""
-
-		# Check if this node should be excluded by active bounds
-		if active_bounds and self._should_exclude_child(node, active_bounds):
-			node.excluded_by_parent = True
-			# Important: Still check if this node starts NEW propagation
 
-		# Check if this node starts new propagation (even if excluded!)
-		new_bounds = None
+		Candidates are grouped per propagating ancestor so containment can be checked in one batch per ancestor.
+		"""
+		candidates: dict[int, tuple[PropagatingBounds, list[SimplifiedNode]]] = {}
+
+		stack: list[tuple[SimplifiedNode, PropagatingBounds | None, int]] = [(node, active_bounds, depth)]
+		while stack:
+			current, bounds, current_depth = stack.pop()
+
+			# Nodes that could be excluded by active bounds are checked later, per ancestor
+			if bounds and self._is_exclusion_candidate(current):
+				group = candidates.get(id(bounds))
+				if group is None:
+					candidates[id(bounds)] = group = (bounds, [])
+				group[1].append(current)
+
+			# Check if this node starts new propagation (even if excluded!)
+			new_bounds = self._get_propagating_bounds(current, current_depth)
+
+			# Propagate to ALL children
+			# Use new_bounds if this node starts propagation, otherwise continue with active_bounds
+			propagate_bounds = new_bounds if new_bounds else bounds
+
+			for child in reversed(current.children):
+				stack.append((child, propagate_bounds, current_depth + 1))
+
+		for bounds, nodes in candidates.values():
+			rects = [candidate.original_node.snapshot_node.bounds for candidate in nodes]  # type: ignore[union-attr]
+			mask = self._contained_mask(rects, bounds.bounds, self.containment_threshold)  # type: ignore[arg-type]
+			for candidate, contained in zip(nodes, mask):
+				if contained:
+					candidate.excluded_by_parent = True
+
+	def _get_propagating_bounds(self, node: SimplifiedNode, depth: int) -> PropagatingBounds | None:
+		"""Return the bounds this node propagates to its descendants, if it is a propagating element."""
 		tag = node.original_node.tag_name.lower()
 		role = node.original_node.attributes.get('role') if node.original_node.attributes else None
 		attributes = {
@@ -744,24 +793,31 @@ class DOMTreeSerializer:
 		if self._is_propagating_element(attributes):
 			# This node propagates bounds to ALL its descendants
 			if node.original_node.snapshot_node and node.original_node.snapshot_node.bounds:
-				new_bounds = PropagatingBounds(
+				return PropagatingBounds(
 					tag=tag,
 					bounds=node.original_node.snapshot_node.bounds,
 					node_id=node.original_node.node_id,
 					depth=depth,
 				)
-
-		# Propagate to ALL children
-		# Use new_bounds if this node starts propagation, otherwise continue with active_bounds
-		propagate_bounds = new_bounds if new_bounds else active_bounds
-
-		for child in node.children:
-			self._filter_tree_recursive(child, propagate_bounds, depth + 1)
+		return None
 
 	def _should_exclude_child(self, node: SimplifiedNode, active_bounds: PropagatingBounds) -> bool:
 		"""
 		Determine if child should be excluded based on propagating bounds.
 		"""
+		if not self._is_exclusion_candidate(node):
+			return False
+
+		child_bounds = node.original_node.snapshot_node.bounds  # type: ignore[union-attr]
+
+		# Check containment with configured threshold
+		return self._is_contained(child_bounds, active_bounds.bounds, self.containment_threshold)  # type: ignore[arg-type]
+
+	def _is_exclusion_candidate(self, node: SimplifiedNode) -> bool:
+		"""
+		Check if a node may be excluded when contained in propagating bounds.
+		Containment itself is checked separately.
+		"""
 
 		# Never exclude text nodes - we always want to preserve text content
 		if node.original_node.node_type == NodeType.TEXT_NODE:
@@ -771,12 +827,6 @@ class DOMTreeSerializer:
 		if not node.original_node.snapshot_node or not node.original_node.snapshot_node.bounds:
 			return False  # No bounds = can't determine containment
 
-		child_bounds = node.original_node.snapshot_node.bounds
-
-		# Check containment with configured threshold
-		if not self._is_contained(child_bounds, active_bounds.bounds, self.containment_threshold):
-			return False  # Not sufficiently contained
-
 		# EXCEPTION RULES - Keep these even if contained:
 
 		child_tag = node.original_node.tag_name.lower()
@@ -812,9 +862,31 @@ class DOMTreeSerializer:
 			if role in ['button', 'link', 'checkbox', 'radio', 'tab', 'menuitem', 'option']:
 				return False
 
-		# Default: exclude this child
+		# Default: exclude this child if contained
 		return True
 
+	def _contained_mask(self, children: list[DOMRect], parent: DOMRect, threshold: float) -> list[bool]:
+		"""
+		Check containment of many children within the same parent bounds.
+		Uses NumPy for large batches; results match _is_contained exactly.
+		"""
+		if not NUMPY_AVAILABLE or len(children) < self.VECTORIZED_CONTAINMENT_MIN_BATCH:
+			return [self._is_contained(child, parent, threshold) for child in children]
+
+		boxes = np.array([(child.x, child.y, child.width, child.height) for child in children], dtype=np.float64)
+		x, y, width, height = boxes.T
+
+		# Same operations, in the same order, as _is_contained so float results are identical
+		x_overlap = np.maximum(0, np.minimum(x + width, parent.x + parent.width) - np.maximum(x, parent.x))
+		y_overlap = np.maximum(0, np.minimum(y + height, parent.y + parent.height) - np.maximum(y, parent.y))
+
+		intersection_area = x_overlap * y_overlap
+		child_area = width * height
+		has_area = child_area != 0  # Zero-area elements are never contained
+
+		containment_ratio = np.divide(intersection_area, child_area, out=np.zeros_like(child_area), where=has_area)
+		return (has_area & (containment_ratio >= threshold)).tolist()
+
 	def _is_contained(self, child: DOMRect, parent: DOMRect, threshold: float) -> bool:
 		"""
 		Check if child is contained within parent bounds.
@@ -848,31 +920,39 @@ class DOMTreeSerializer:
 		Check if an element should propagate bounds based on attributes.
 		If the element satisfies one of the patterns, it propagates bounds to all its children.
 		"""
-		keys_to_check = ['tag', 'role']
-		for pattern in self.PROPAGATING_ELEMENTS:
-			# Check if the element satisfies the pattern
-			check = [pattern.get(key) is None or pattern.get(key) == attributes.get(key) for key in keys_to_check]
-			if all(check):
-				return True
-
-		return False
+		tag = attributes.get('tag')
+		role = attributes.get('role')
+		# A pattern matches if each of its keys is either None (wildcard) or equal to the element's value
+		patterns = self._propagating_patterns
+		return (tag, role) in patterns or (tag, None) in patterns or (None, role) in patterns or (None, None) in patterns
 
 	@staticmethod
 	def serialize_tree(node: SimplifiedNode | None, include_attributes: list[str], depth: int = 0) -> str:
 		"""Serialize the optimized tree to string format."""
+		return '\n'.join(line for _, _, line in DOMTreeSerializer.serialize_tree_lines(node, include_attributes, depth))
+
+	@staticmethod
+	def serialize_tree_lines(
+		node: SimplifiedNode | None, include_attributes: list[str], depth: int = 0
+	) -> list[tuple[SimplifiedNode, int, str]]:
+		"""Serialize the optimized tree to (node, depth, line) entries in output order, one per rendered line."""
+		lines: list[tuple[SimplifiedNode, int, str]] = []
+		DOMTreeSerializer._serialize_tree_lines(node, include_attributes, depth, lines)
+		return lines
+
+	@staticmethod
+	def _serialize_tree_lines(
+		node: SimplifiedNode | None, include_attributes: list[str], depth: int, lines: list[tuple[SimplifiedNode, int, str]]
+	) -> None:
 		if not node:
-			return ''
+			return
 
 		# Skip rendering excluded nodes, but process their children
 		if hasattr(node, 'excluded_by_parent') and node.excluded_by_parent:
-			formatted_text = []
 			for child in node.children:
-				child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, depth)
-				if child_text:
-					formatted_text.append(child_text)
-			return '\n'.join(formatted_text)
+				DOMTreeSerializer._serialize_tree_lines(child, include_attributes, depth, lines)
+			return
 
-		formatted_text = []
 		depth_str = depth * '\t'
 		next_depth = depth
 
@@ -880,10 +960,8 @@ class DOMTreeSerializer:
 			# Skip displaying nodes marked as should_display=False
 			if not node.should_display:
 				for child in node.children:
-					child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, depth)
-					if child_text:
-						formatted_text.append(child_text)
-				return '\n'.join(formatted_text)
+					DOMTreeSerializer._serialize_tree_lines(child, include_attributes, depth, lines)
+				return
 
 			# Special handling for SVG elements - show the tag but collapse children
 			if node.original_node.tag_name.lower() == 'svg':
@@ -907,9 +985,9 @@ class DOMTreeSerializer:
 				if attributes_html_str:
 					line += f' {attributes_html_str}'
 				line += ' /> <!-- SVG content collapsed -->'
-				formatted_text.append(line)
+				lines.append((node, depth, line))
 				# Don't process children for SVG
-				return '\n'.join(formatted_text)
+				return
 
 			# Add element if clickable, scrollable, or iframe
 			is_any_scrollable = node.original_node.is_actually_scrollable or node.original_node.is_scrollable
@@ -1003,26 +1081,24 @@ class DOMTreeSerializer:
 					if scroll_info_text:
 						line += f' ({scroll_info_text})'
 
-				formatted_text.append(line)
+				lines.append((node, depth, line))
 
 		elif node.original_node.node_type == NodeType.DOCUMENT_FRAGMENT_NODE:
 			# Shadow DOM representation - show clearly to LLM
 			if node.original_node.shadow_root_type and node.original_node.shadow_root_type.lower() == 'closed':
-				formatted_text.append(f'{depth_str}Closed Shadow')
+				lines.append((node, depth, f'{depth_str}Closed Shadow'))
 			else:
-				formatted_text.append(f'{depth_str}Open Shadow')
+				lines.append((node, depth, f'{depth_str}Open Shadow'))
 
 			next_depth += 1
 
 			# Process shadow DOM children
 			for child in node.children:
-				child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, next_depth)
-				if child_text:
-					formatted_text.append(child_text)
+				DOMTreeSerializer._serialize_tree_lines(child, include_attributes, next_depth, lines)
 
 			# Close shadow DOM indicator
 			if node.children:  # Only show close if we had content
-				formatted_text.append(f'{depth_str}Shadow End')
+				lines.append((node, depth, f'{depth_str}Shadow End'))
 
 		elif node.original_node.node_type == NodeType.TEXT_NODE:
 			# Include visible text
@@ -1034,16 +1110,12 @@ class DOMTreeSerializer:
 				and len(node.original_node.node_value.strip()) > 1
 			):
 				clean_text = node.original_node.node_value.strip()
-				formatted_text.append(f'{depth_str}{clean_text}')
+				lines.append((node, depth, f'{depth_str}{clean_text}'))
 
 		# Process children (for non-shadow elements)
 		if node.original_node.node_type != NodeType.DOCUMENT_FRAGMENT_NODE:
 			for child in node.children:
-				child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, next_depth)
-				if child_text:
-					formatted_text.append(child_text)
-
-		return '\n'.join(formatted_text)
+				DOMTreeSerializer._serialize_tree_lines(child, include_attributes, next_depth, lines)
 
 	@staticmethod
 	def _build_attributes_string(node: EnhancedDOMTreeNode, include_attributes: list[str], text: str) -> str:
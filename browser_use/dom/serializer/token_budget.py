@@ -0,0 +1,167 @@
+# @file purpose: Fits the serialized DOM into a token budget, keeping the lines that matter most to the next action
+
+import re
+
+from browser_use.dom.serializer.serializer import DOMTreeSerializer
+from browser_use.dom.views import DOMRect, NodeType, SimplifiedNode
+
+# Rough BPE split: words of up to 8 letters and groups of up to 3 digits with their leading space, symbol pairs,
+# whitespace runs. Tokenizers merge some longer runs, so this slightly overestimates, the safe side for a budget.
+TOKEN_PATTERN = re.compile(r' ?[^\W\d_]{1,8}| ?\d{1,3}| ?[^\w\s]{1,2}|\s+')
+
+
+def estimate_tokens(text: str) -> int:
+	"""Fast local estimate of the number of LLM tokens in text, no tokenizer download needed"""
+	return len(TOKEN_PATTERN.findall(text))
+
+
+OMITTED_MARKER = '...'
+MARKER_TOKENS = estimate_tokens(f'\t{OMITTED_MARKER}') + 1  # +1 for the newline
+
+# Line scores, see TokenBudgetedSerializer._score
+INTERACTIVE_SCORE = 3.0
+TEXT_SCORE = 1.0
+STRUCTURE_SCORE = 0.5  # scroll containers, iframes and shadow roots without an index
+NEW_ELEMENT_BONUS = 2.0
+VIEWPORT_BONUS = 3.0
+FOCUS_BONUS = 2.0  # decays to 0 one viewport height away from the focused element
+TEXT_DENSITY_BONUS = 1.0  # reached by text lines of TEXT_DENSITY_CHARS characters or more
+TEXT_DENSITY_CHARS = 80
+
+
+class TokenBudgetedSerializer:
+	"""Serializes a simplified DOM tree like DOMTreeSerializer.serialize_tree, within a token budget.
+
+	When the full serialization does not fit, every rendered line is scored by what the next action most likely
+	needs: interactive elements, elements that are new since the last step, lines inside the viewport, lines near
+	the focused element and text lines with real content. Lines are kept from the highest score down, each together
+	with the enclosing lines it is nested under, until the budget is used up. Kept lines stay in page order and
+	every run of left out lines is replaced by a single '...' line.
+	"""
+
+	def __init__(self, token_budget: int, viewport: tuple[float, float] | None = None):
+		"""viewport is (scroll_y, viewport_height) in CSS pixels, None if unknown"""
+		self.token_budget = token_budget
+		self.viewport = viewport
+
+	def serialize(self, root: SimplifiedNode | None, include_attributes: list[str]) -> tuple[str, int]:
+		"""Returns the serialized tree and the number of lines left out to fit the budget"""
+		entries = DOMTreeSerializer.serialize_tree_lines(root, include_attributes)
+		costs = [estimate_tokens(line) + 1 for _, _, line in entries]
+		if sum(costs) <= self.token_budget:
+			return '\n'.join(line for _, _, line in entries), 0
+
+		parents = self._parents(entries)
+		closers = self._shadow_closers(entries)
+		positions: list[DOMRect | None] = []
+		for i, (node, _, _) in enumerate(entries):
+			position = node.original_node.absolute_position
+			if position is None and parents[i] is not None:
+				position = positions[parents[i]]  # text nodes take the position of the element they are in
+			positions.append(position)
+		focus = self._focused_position(entries, positions)
+
+		scores = [self._score(node, line, positions[i], focus) for i, (node, _, line) in enumerate(entries)]
+		selected = [False] * len(entries)
+		used = MARKER_TOKENS  # nothing selected yet: one marker for the whole page
+		for i in sorted(range(len(entries)), key=lambda i: (-scores[i], i)):
+			if selected[i]:
+				continue
+			group = []
+			j: int | None = i
+			while j is not None and not selected[j]:
+				group.append(j)
+				j = parents[j]
+			group.extend(closers[g] for g in list(group) if g in closers and not selected[closers[g]])
+			group = sorted(set(group))
+
+			cost = sum(costs[g] for g in group) + self._gap_delta(selected, group) * MARKER_TOKENS
+			if used + cost > self.token_budget:
+				continue
+			for g in group:
+				selected[g] = True
+			used += cost
+
+		lines = []
+		omitted = 0
+		for i, (_, depth, line) in enumerate(entries):
+			if selected[i]:
+				lines.append(line)
+				continue
+			if i == 0 or selected[i - 1]:
+				lines.append(depth * '\t' + OMITTED_MARKER)
+			omitted += 1
+		return '\n'.join(lines), omitted
+
+	def _score(self, node: SimplifiedNode, line: str, position: DOMRect | None, focus: DOMRect | None) -> float:
+		original = node.original_node
+		if node.is_interactive:
+			score = INTERACTIVE_SCORE
+			if node.is_new:
+				score += NEW_ELEMENT_BONUS
+		elif original.node_type == NodeType.TEXT_NODE:
+			score = TEXT_SCORE + TEXT_DENSITY_BONUS * min(1.0, len(line.strip()) / TEXT_DENSITY_CHARS)
+		else:
+			score = STRUCTURE_SCORE
+
+		if position is not None and self.viewport is not None:
+			scroll_y, viewport_height = self.viewport
+			if position.y + position.height >= scroll_y and position.y <= scroll_y + viewport_height:
+				score += VIEWPORT_BONUS
+			if focus is not None and viewport_height > 0:
+				distance = abs((position.y + position.height / 2) - (focus.y + focus.height / 2))
+				score += FOCUS_BONUS * max(0.0, 1 - distance / viewport_height)
+		return score
+
+	@staticmethod
+	def _parents(entries: list[tuple[SimplifiedNode, int, str]]) -> list[int | None]:
+		"""Index of the closest preceding line with a smaller depth, the line each line is rendered under"""
+		parents: list[int | None] = []
+		stack: list[tuple[int, int]] = []  # (depth, index)
+		for i, (_, depth, _) in enumerate(entries):
+			while stack and stack[-1][0] >= depth:
+				stack.pop()
+			parents.append(stack[-1][1] if stack else None)
+			stack.append((depth, i))
+		return parents
+
+	@staticmethod
+	def _shadow_closers(entries: list[tuple[SimplifiedNode, int, str]]) -> dict[int, int]:
+		"""Maps the index of each shadow root opening line to its 'Shadow End' line, which must be kept with it"""
+		closers: dict[int, int] = {}
+		openers: dict[int, int] = {}
+		for i, (node, _, _) in enumerate(entries):
+			if node.original_node.node_type != NodeType.DOCUMENT_FRAGMENT_NODE:
+				continue
+			if id(node) in openers:
+				closers[openers.pop(id(node))] = i
+			else:
+				openers[id(node)] = i
+		return closers
+
+	@staticmethod
+	def _focused_position(entries: list[tuple[SimplifiedNode, int, str]], positions: list[DOMRect | None]) -> DOMRect | None:
+		"""Position of the element that has focus according to the accessibility tree"""
+		for i, (node, _, _) in enumerate(entries):
+			ax_node = node.original_node.ax_node
+			if ax_node and ax_node.properties and any(p.name == 'focused' and p.value for p in ax_node.properties):
+				return positions[i]
+		return None
+
+	@staticmethod
+	def _gap_delta(selected: list[bool], group: list[int]) -> int:
+		"""Change in the number of runs of left out lines when the sorted indices in group are selected"""
+		added: set[int] = set()
+
+		def is_selected(j: int) -> bool:
+			return j < 0 or j >= len(selected) or selected[j] or j in added
+
+		delta = 0
+		for i in group:
+			left, right = is_selected(i - 1), is_selected(i + 1)
+			if left and right:
+				delta -= 1  # fills a gap of one line
+			elif not left and not right:
+				delta += 1  # splits a gap in two
+			added.add(i)
+		return delta
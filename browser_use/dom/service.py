@@ -1,7 +1,8 @@
 import asyncio
 import logging
+import sys
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 from cdp_use.cdp.accessibility.commands import GetFullAXTreeReturns
 from cdp_use.cdp.accessibility.types import AXNode
@@ -12,8 +13,11 @@ from browser_use.dom.enhanced_snapshot import (
 	REQUIRED_COMPUTED_STYLES,
 	build_snapshot_lookup,
 )
+from browser_use.dom.mutation_tracker import DOMMutationTracker
+from browser_use.dom.serializer.clickable_elements import ClickableElementDetector
 from browser_use.dom.serializer.serializer import DOMTreeSerializer
 from browser_use.dom.views import (
+	AXTreeMode,
 	DOMRect,
 	EnhancedAXNode,
 	EnhancedAXProperty,
@@ -23,6 +27,7 @@ from browser_use.dom.views import (
 	TargetAllTrees,
 )
 from browser_use.observability import observe_debug
+from browser_use.tracing.service import trace_span
 from browser_use.utils import create_task_with_error_handling
 
 if TYPE_CHECKING:
@@ -50,6 +55,8 @@ class DomService:
 		paint_order_filtering: bool = True,
 		max_iframes: int = 100,
 		max_iframe_depth: int = 5,
+		mutation_tracker: DOMMutationTracker | None = None,
+		ax_tree_mode: AXTreeMode | Literal['auto'] = 'full',
 	):
 		self.browser_session = browser_session
 		self.logger = logger or browser_session.logger
@@ -57,6 +64,11 @@ class DomService:
 		self.paint_order_filtering = paint_order_filtering
 		self.max_iframes = max_iframes
 		self.max_iframe_depth = max_iframe_depth
+		# When set, the focused target's DOM document is patched from DOM mutation events between builds
+		# instead of being refetched with DOM.getDocument every step (see dom/mutation_tracker.py)
+		self.mutation_tracker = mutation_tracker
+		# 'auto' fetches only the AX data the serializer consuming the tree needs (its AX_TREE_MODE)
+		self.ax_tree_mode: AXTreeMode | Literal['auto'] = ax_tree_mode
 
 	async def __aenter__(self):
 		return self
@@ -64,6 +76,12 @@ class DomService:
 	async def __aexit__(self, exc_type, exc_value, traceback):
 		pass  # no need to cleanup anything, browser_session auto handles cleaning up session cache
 
+	def _resolve_ax_tree_mode(self, serializer_ax_tree_mode: AXTreeMode) -> AXTreeMode:
+		"""Resolve 'auto' to the AX tree mode of the serializer that will consume the tree."""
+		if self.ax_tree_mode == 'auto':
+			return serializer_ax_tree_mode
+		return self.ax_tree_mode
+
 	def _build_enhanced_ax_node(self, ax_node: AXNode) -> EnhancedAXNode:
 		properties: list[EnhancedAXProperty] | None = None
 		if 'properties' in ax_node and ax_node['properties']:
@@ -245,7 +263,71 @@ class DomService:
 
 		return {'nodes': merged_nodes}
 
-	async def _get_all_trees(self, target_id: TargetID) -> TargetAllTrees:
+	async def _get_ax_tree_for_dirty_nodes(
+		self,
+		target_id: TargetID,
+		tracker: DOMMutationTracker,
+		dirty_backend_node_ids: set[int],
+		removed_backend_node_ids: set[int],
+	) -> GetFullAXTreeReturns:
+		"""Refresh the cached accessibility nodes only for nodes touched by DOM mutations since the last build."""
+
+		fresh_nodes = await self._get_partial_ax_nodes(target_id, list(dirty_backend_node_ids))
+		tracker.update_ax_nodes(fresh_nodes, removed_backend_node_ids)
+		return {'nodes': list(tracker.ax_nodes.values())}
+
+	async def _get_partial_ax_nodes(
+		self, target_id: TargetID, backend_node_ids: list[int], batch_size: int = 100
+	) -> list[AXNode]:
+		"""Fetch AX nodes for the given backend node ids with `Accessibility.getPartialAXTree`, `batch_size` requests at a time."""
+
+		cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
+
+		ax_nodes: list[AXNode] = []
+		for batch_start in range(0, len(backend_node_ids), batch_size):
+			ax_tree_requests = [
+				cdp_session.cdp_client.send.Accessibility.getPartialAXTree(
+					params={'backendNodeId': backend_node_id, 'fetchRelatives': False}, session_id=cdp_session.session_id
+				)
+				for backend_node_id in backend_node_ids[batch_start : batch_start + batch_size]
+			]
+			ax_trees = await asyncio.gather(*ax_tree_requests, return_exceptions=True)
+
+			for ax_tree in ax_trees:
+				# nodes can disappear between the DOM snapshot and this request, just skip them
+				if isinstance(ax_tree, BaseException):
+					continue
+				ax_nodes.extend(ax_tree['nodes'])
+
+		return ax_nodes
+
+	async def _attach_ax_nodes_to_candidates(self, target_id: TargetID, root: EnhancedDOMTreeNode) -> int:
+		"""Fetch and attach AX data only for nodes of `target_id` that may be interactive, returns the candidate count."""
+
+		candidates: dict[int, EnhancedDOMTreeNode] = {}
+		stack = [root]
+		while stack:
+			node = stack.pop()
+			if ClickableElementDetector.is_ax_candidate(node):
+				candidates[node.backend_node_id] = node
+			stack.extend(node.children_and_shadow_roots)
+			# cross-origin iframe documents are built (and get their AX data) by their own get_dom_tree call
+			if node.content_document and node.content_document.target_id == target_id:
+				stack.append(node.content_document)
+
+		if not candidates:
+			return 0
+
+		for ax_node in await self._get_partial_ax_nodes(target_id, list(candidates)):
+			node = candidates.get(ax_node.get('backendDOMNodeId', -1))
+			if node is not None and node.ax_node is None:
+				node.ax_node = self._build_enhanced_ax_node(ax_node)
+				# the AX name is part of the element hash
+				node.invalidate_hash_cache()
+
+		return len(candidates)
+
+	async def _get_all_trees(self, target_id: TargetID, fetch_ax_tree: bool = True) -> TargetAllTrees:
 		cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
 
 		# Wait for the page to be ready first
@@ -316,15 +398,51 @@ class DomService:
 				params={'depth': -1, 'pierce': True}, session_id=cdp_session.session_id
 			)
 
+		# Incremental mode: reuse the mutation-patched document of the focused target when few nodes changed
+		# (the tracker caches full AX trees, so it is only used when the full AX tree is fetched)
+		tracker = self.mutation_tracker if fetch_ax_tree and target_id == self.browser_session.agent_focus_target_id else None
+		reuse_cached_dom = tracker is not None and tracker.can_reuse(target_id, cdp_session.session_id)
+		dirty_backend_node_ids: set[int] = set()
+		removed_backend_node_ids: set[int] = set()
+		if tracker is not None and reuse_cached_dom:
+			dirty_backend_node_ids, removed_backend_node_ids = tracker.consume_dirty_nodes()
+			self.logger.debug(
+				f'🔄 Reusing cached DOM document, refreshing AX data for {len(dirty_backend_node_ids)} dirty nodes '
+				f'({len(removed_backend_node_ids)} removed)'
+			)
+		elif tracker is not None:
+			try:
+				# DOM events are only sent once the DOM domain is enabled for this session
+				await cdp_session.cdp_client.send.DOM.enable(session_id=cdp_session.session_id)
+			except Exception as e:
+				self.logger.debug(f'Failed to enable DOM domain for mutation tracking: {e}')
+			tracker.begin_full_rebuild(cdp_session.session_id)
+
+		ax_tree_ms = 0.0
+
+		async def create_ax_tree_request() -> GetFullAXTreeReturns:
+			nonlocal ax_tree_ms
+			start_ax_tree = time.time()
+			if tracker is not None and reuse_cached_dom:
+				ax_tree = await self._get_ax_tree_for_dirty_nodes(
+					target_id, tracker, dirty_backend_node_ids, removed_backend_node_ids
+				)
+			else:
+				ax_tree = await self._get_ax_tree_for_all_frames(target_id)
+			ax_tree_ms = (time.time() - start_ax_tree) * 1000
+			return ax_tree
+
 		start_cdp_calls = time.time()
 
 		# Create initial tasks
 		tasks = {
 			'snapshot': create_task_with_error_handling(create_snapshot_request(), name='get_snapshot'),
-			'dom_tree': create_task_with_error_handling(create_dom_tree_request(), name='get_dom_tree'),
-			'ax_tree': create_task_with_error_handling(self._get_ax_tree_for_all_frames(target_id), name='get_ax_tree'),
 			'device_pixel_ratio': create_task_with_error_handling(self._get_viewport_ratio(target_id), name='get_viewport_ratio'),
 		}
+		if fetch_ax_tree:
+			tasks['ax_tree'] = create_task_with_error_handling(create_ax_tree_request(), name='get_ax_tree')
+		if not reuse_cached_dom:
+			tasks['dom_tree'] = create_task_with_error_handling(create_dom_tree_request(), name='get_dom_tree')
 
 		# Wait for all tasks with timeout
 		done, pending = await asyncio.wait(tasks.values(), timeout=10.0)
@@ -334,22 +452,20 @@ class DomService:
 			for task in pending:
 				task.cancel()
 
-			# Retry mapping for pending tasks
+			# Retry factories for pending tasks
 			retry_map = {
-				tasks['snapshot']: lambda: create_task_with_error_handling(create_snapshot_request(), name='get_snapshot_retry'),
-				tasks['dom_tree']: lambda: create_task_with_error_handling(create_dom_tree_request(), name='get_dom_tree_retry'),
-				tasks['ax_tree']: lambda: create_task_with_error_handling(
-					self._get_ax_tree_for_all_frames(target_id), name='get_ax_tree_retry'
-				),
-				tasks['device_pixel_ratio']: lambda: create_task_with_error_handling(
+				'snapshot': lambda: create_task_with_error_handling(create_snapshot_request(), name='get_snapshot_retry'),
+				'dom_tree': lambda: create_task_with_error_handling(create_dom_tree_request(), name='get_dom_tree_retry'),
+				'ax_tree': lambda: create_task_with_error_handling(create_ax_tree_request(), name='get_ax_tree_retry'),
+				'device_pixel_ratio': lambda: create_task_with_error_handling(
 					self._get_viewport_ratio(target_id), name='get_viewport_ratio_retry'
 				),
 			}
 
 			# Create new tasks only for the ones that didn't complete
 			for key, task in tasks.items():
-				if task in pending and task in retry_map:
-					tasks[key] = retry_map[task]()
+				if task in pending and key in retry_map:
+					tasks[key] = retry_map[key]()
 
 			# Wait again with shorter timeout
 			done2, pending2 = await asyncio.wait([t for t in tasks.values() if not t.done()], timeout=2.0)
@@ -374,11 +490,21 @@ class DomService:
 
 		# If any required tasks failed, raise an exception
 		if failed:
+			if tracker is not None:
+				tracker.invalidate(f'CDP requests failed: {", ".join(failed)}')
 			raise TimeoutError(f'CDP requests failed or timed out: {", ".join(failed)}')
 
 		snapshot = results['snapshot']
-		dom_tree = results['dom_tree']
-		ax_tree = results['ax_tree']
+		ax_tree: GetFullAXTreeReturns = results['ax_tree'] if fetch_ax_tree else {'nodes': []}
+		if tracker is not None and reuse_cached_dom:
+			if tracker.document is None:
+				# a mutation we could not patch arrived while the CDP calls were in flight, redo a full build
+				return await self._get_all_trees(target_id, fetch_ax_tree)
+			dom_tree = tracker.document
+		else:
+			dom_tree = results['dom_tree']
+			if tracker is not None:
+				tracker.reset(target_id, cdp_session.session_id, dom_tree, ax_tree['nodes'])
 		device_pixel_ratio = results['device_pixel_ratio']
 		end_cdp_calls = time.time()
 		cdp_calls_ms = (end_cdp_calls - start_cdp_calls) * 1000
@@ -417,6 +543,8 @@ class DomService:
 				'iframe_scroll_detection_ms': iframe_scroll_ms,
 				'cdp_parallel_calls_ms': cdp_calls_ms,
 				'snapshot_processing_ms': snapshot_processing_ms,
+				'incremental_dom_reused': 1.0 if reuse_cached_dom else 0.0,
+				**({'ax_tree_full_ms': ax_tree_ms} if fetch_ax_tree else {}),
 			},
 		)
 
@@ -428,6 +556,7 @@ class DomService:
 		initial_html_frames: list[EnhancedDOMTreeNode] | None = None,
 		initial_total_frame_offset: DOMRect | None = None,
 		iframe_depth: int = 0,
+		ax_tree_mode: AXTreeMode | None = None,
 	) -> tuple[EnhancedDOMTreeNode, dict[str, float]]:
 		"""Get the DOM tree for a specific target.
 
@@ -437,6 +566,7 @@ class DomService:
 			initial_html_frames: List of HTML frame nodes encountered so far
 			initial_total_frame_offset: Accumulated coordinate offset
 			iframe_depth: Current depth of iframe nesting to prevent infinite recursion
+			ax_tree_mode: How much AX data to fetch, defaults to the service's `ax_tree_mode` ('full' for 'auto')
 
 		Returns:
 			Tuple of (enhanced_dom_tree_node, timing_info)
@@ -444,9 +574,12 @@ class DomService:
 		timing_info: dict[str, float] = {}
 		timing_start_total = time.time()
 
+		if ax_tree_mode is None:
+			ax_tree_mode = self._resolve_ax_tree_mode('full')
+
 		# Get all trees from CDP (snapshot, DOM, AX, viewport ratio)
 		start_get_trees = time.time()
-		trees = await self._get_all_trees(target_id)
+		trees = await self._get_all_trees(target_id, fetch_ax_tree=ax_tree_mode == 'full')
 		get_trees_ms = (time.time() - start_get_trees) * 1000
 		timing_info.update(trees.cdp_timing)
 		timing_info['get_all_trees_total_ms'] = get_trees_ms
@@ -510,11 +643,12 @@ class DomService:
 				enhanced_ax_node = None
 
 			# To make attributes more readable
+			# Attribute and tag names are interned: large pages repeat a few dozen names across all nodes
 			attributes: dict[str, str] | None = None
 			if 'attributes' in node and node['attributes']:
 				attributes = {}
 				for i in range(0, len(node['attributes']), 2):
-					attributes[node['attributes'][i]] = node['attributes'][i + 1]
+					attributes[sys.intern(node['attributes'][i])] = node['attributes'][i + 1]
 
 			shadow_root_type = None
 			if 'shadowRootType' in node and node['shadowRootType']:
@@ -564,7 +698,7 @@ class DomService:
 				node_id=node['nodeId'],
 				backend_node_id=node['backendNodeId'],
 				node_type=NodeType(node['nodeType']),
-				node_name=node['nodeName'],
+				node_name=sys.intern(node['nodeName']),
 				node_value=node['nodeValue'],
 				attributes=attributes or {},
 				is_scrollable=node.get('isScrollable', None),
@@ -621,6 +755,7 @@ class DomService:
 				)
 				dom_tree_node.content_document.parent_node = dom_tree_node
 				# forcefully set the parent node to the content document node (helps traverse the tree)
+				dom_tree_node.content_document.invalidate_hash_cache()
 
 			if 'shadowRoots' in node and node['shadowRoots']:
 				dom_tree_node.shadow_roots = []
@@ -630,6 +765,7 @@ class DomService:
 					)
 					# forcefully set the parent node to the shadow root node (helps traverse the tree)
 					shadow_root_node.parent_node = dom_tree_node
+					shadow_root_node.invalidate_hash_cache()
 					dom_tree_node.shadow_roots.append(shadow_root_node)
 
 			if 'children' in node and node['children']:
@@ -740,10 +876,12 @@ class DomService:
 								# initial_html_frames=updated_html_frames,
 								initial_total_frame_offset=total_frame_offset,
 								iframe_depth=iframe_depth + 1,
+								ax_tree_mode=ax_tree_mode,
 							)
 
 							dom_tree_node.content_document = content_document
 							dom_tree_node.content_document.parent_node = dom_tree_node
+							dom_tree_node.content_document.invalidate_hash_cache()
 
 			return dom_tree_node
 
@@ -756,6 +894,12 @@ class DomService:
 		)
 		timing_info['construct_enhanced_tree_ms'] = (time.time() - start_construct) * 1000
 
+		if ax_tree_mode == 'interactive':
+			start_ax_candidates = time.time()
+			candidate_count = await self._attach_ax_nodes_to_candidates(target_id, enhanced_dom_tree_node)
+			timing_info['ax_tree_interactive_ms'] = (time.time() - start_ax_candidates) * 1000
+			timing_info['ax_tree_candidate_nodes'] = float(candidate_count)
+
 		# Calculate total time for get_dom_tree
 		total_get_dom_tree_ms = (time.time() - timing_start_total) * 1000
 		timing_info['get_dom_tree_total_ms'] = total_get_dom_tree_ms
@@ -766,6 +910,7 @@ class DomService:
 			+ timing_info.get('build_ax_lookup_ms', 0)
 			+ timing_info.get('build_snapshot_lookup_ms', 0)
 			+ timing_info.get('construct_enhanced_tree_ms', 0)
+			+ timing_info.get('ax_tree_interactive_ms', 0)
 		)
 		get_dom_tree_overhead_ms = total_get_dom_tree_ms - tracked_sub_operations_ms
 		if get_dom_tree_overhead_ms > 0.1:
@@ -792,10 +937,13 @@ class DomService:
 
 		# Build DOM tree (includes CDP calls for snapshot, DOM, AX tree)
 		# Note: all_frames is fetched lazily inside get_dom_tree only if cross-origin iframes need it
-		enhanced_dom_tree, dom_tree_timing = await self.get_dom_tree(
-			target_id=self.browser_session.agent_focus_target_id,
-			all_frames=None,  # Lazy - will fetch if needed
-		)
+		tracer = self.browser_session.tracer
+		with trace_span(tracer, 'get_dom_tree', 'dom'):
+			enhanced_dom_tree, dom_tree_timing = await self.get_dom_tree(
+				target_id=self.browser_session.agent_focus_target_id,
+				all_frames=None,  # Lazy - will fetch if needed
+				ax_tree_mode=self._resolve_ax_tree_mode(DOMTreeSerializer.AX_TREE_MODE),
+			)
 
 		# Add sub-timings from DOM tree construction
 		timing_info.update(dom_tree_timing)
@@ -803,9 +951,10 @@ class DomService:
 		# Serialize DOM tree for LLM
 		start_serialize = time.time()
 
-		serialized_dom_state, serializer_timing = DOMTreeSerializer(
-			enhanced_dom_tree, previous_cached_state, paint_order_filtering=self.paint_order_filtering, session_id=session_id
-		).serialize_accessible_elements()
+		with trace_span(tracer, 'serialize', 'dom'):
+			serialized_dom_state, serializer_timing = DOMTreeSerializer(
+				enhanced_dom_tree, previous_cached_state, paint_order_filtering=self.paint_order_filtering, session_id=session_id
+			).serialize_accessible_elements()
 		total_serialization_ms = (time.time() - start_serialize) * 1000
 
 		# Add serializer sub-timings (convert to ms)
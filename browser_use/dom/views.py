@@ -1,7 +1,7 @@
 import hashlib
 from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 
 from cdp_use.cdp.accessibility.commands import GetFullAXTreeReturns
 from cdp_use.cdp.accessibility.types import AXPropertyName
@@ -286,6 +286,15 @@ class DOMRect:
 		return self.to_dict()
 
 
+AXTreeMode = Literal['full', 'interactive', 'none']
+"""How much of the accessibility tree `DomService` fetches for a DOM tree build.
+
+- `full`: `Accessibility.getFullAXTree` for every frame
+- `interactive`: `Accessibility.getPartialAXTree` only for nodes that may be interactive
+- `none`: no AX data at all (e.g. for HTML/markdown extraction)
+"""
+
+
 @dataclass(slots=True)
 class EnhancedAXProperty:
 	"""we don't need `sources` and `related_nodes` for now (not sure how to use them)
@@ -361,7 +370,7 @@ class EnhancedSnapshotNode:
 # 	element_index: int | None
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, eq=False)
 class EnhancedDOMTreeNode:
 	"""
 	Enhanced DOM tree node that contains information from AX, DOM, and Snapshot trees. It's mostly based on the types on DOM node type with enhanced data from AX and Snapshot trees.
@@ -432,10 +441,23 @@ class EnhancedDOMTreeNode:
 
 	# endregion - Snapshot Node data
 
-	# Compound control child components information
-	_compound_children: list[dict[str, Any]] = field(default_factory=list)
+	# Compound control child components information, None until the serializer adds some
+	_compound_children: list[dict[str, Any]] | None = None
+
+	_uuid: str | None = field(default=None, repr=False)
 
-	uuid: str = field(default_factory=uuid7str)
+	# Memoized hashing state, see `invalidate_hash_cache`
+	_parent_branch_path: tuple[str, ...] | None = field(default=None, repr=False)
+	_element_hash: int | None = field(default=None, repr=False)
+	_stable_hash: int | None = field(default=None, repr=False)
+	_parent_branch_hash: int | None = field(default=None, repr=False)
+
+	@property
+	def uuid(self) -> str:
+		"""Unique id of this node, generated on first access."""
+		if self._uuid is None:
+			self._uuid = uuid7str()
+		return self._uuid
 
 	@property
 	def parent(self) -> 'EnhancedDOMTreeNode | None':
@@ -805,8 +827,10 @@ class EnhancedDOMTreeNode:
 		More stable across sessions than element_hash since it excludes
 		transient CSS state classes like focus, hover, animation, etc.
 		"""
-		parent_branch_path = self._get_parent_branch_path()
-		parent_branch_path_string = '/'.join(parent_branch_path)
+		if self._stable_hash is not None:
+			return self._stable_hash
+
+		parent_branch_path_string = '/'.join(self.parent_branch_path)
 
 		# Filter dynamic classes before building attributes string
 		filtered_attrs: dict[str, str] = {}
@@ -827,7 +851,8 @@ class EnhancedDOMTreeNode:
 
 		combined_string = f'{parent_branch_path_string}|{attributes_string}{ax_name}'
 		hash_hex = hashlib.sha256(combined_string.encode()).hexdigest()
-		return int(hash_hex[:16], 16)
+		self._stable_hash = int(hash_hex[:16], 16)
+		return self._stable_hash
 
 	def __str__(self) -> str:
 		return f'[<{self.tag_name}>#{self.frame_id[-4:] if self.frame_id else "?"}:{self.backend_node_id}]'
@@ -838,10 +863,11 @@ class EnhancedDOMTreeNode:
 
 		TODO: migrate this to use only backendNodeId + current SessionId
 		"""
+		if self._element_hash is not None:
+			return self._element_hash
 
 		# Get parent branch path
-		parent_branch_path = self._get_parent_branch_path()
-		parent_branch_path_string = '/'.join(parent_branch_path)
+		parent_branch_path_string = '/'.join(self.parent_branch_path)
 
 		attributes_string = ''.join(
 			f'{k}={v}' for k, v in sorted((k, v) for k, v in self.attributes.items() if k in STATIC_ATTRIBUTES)
@@ -858,35 +884,89 @@ class EnhancedDOMTreeNode:
 		element_hash = hashlib.sha256(combined_string.encode()).hexdigest()
 
 		# Convert to int for __hash__ return type - use first 16 chars and convert from hex to int
-		return int(element_hash[:16], 16)
+		self._element_hash = int(element_hash[:16], 16)
+		return self._element_hash
 
 	def parent_branch_hash(self) -> int:
 		"""
 		Hash the element based on its parent branch path and attributes.
 		"""
-		parent_branch_path = self._get_parent_branch_path()
-		parent_branch_path_string = '/'.join(parent_branch_path)
+		if self._parent_branch_hash is not None:
+			return self._parent_branch_hash
+
+		parent_branch_path_string = '/'.join(self.parent_branch_path)
 		element_hash = hashlib.sha256(parent_branch_path_string.encode()).hexdigest()
 
-		return int(element_hash[:16], 16)
+		self._parent_branch_hash = int(element_hash[:16], 16)
+		return self._parent_branch_hash
+
+	@property
+	def parent_branch_path(self) -> tuple[str, ...]:
+		"""Tag names of the element ancestors (including self) from root to current element.
+
+		Memoized per node and built from the parent's memoized path, so a whole tree is resolved top-down in one pass.
+		"""
+		if self._parent_branch_path is not None:
+			return self._parent_branch_path
+
+		# Collect the chain of ancestors that have not been resolved yet, then fill it in top-down
+		unresolved: list['EnhancedDOMTreeNode'] = []
+		current_element: 'EnhancedDOMTreeNode | None' = self
+		while current_element is not None and current_element._parent_branch_path is None:
+			unresolved.append(current_element)
+			current_element = current_element.parent_node
+
+		path = (current_element._parent_branch_path if current_element is not None else None) or ()
+		for node in reversed(unresolved):
+			if node.node_type == NodeType.ELEMENT_NODE:
+				path = path + (node.tag_name,)
+			node._parent_branch_path = path
+
+		return path
 
 	def _get_parent_branch_path(self) -> list[str]:
 		"""Get the parent branch path as a list of tag names from root to current element."""
-		parents: list['EnhancedDOMTreeNode'] = []
-		current_element: 'EnhancedDOMTreeNode | None' = self
+		return list(self.parent_branch_path)
 
-		while current_element is not None:
-			if current_element.node_type == NodeType.ELEMENT_NODE:
-				parents.append(current_element)
-			current_element = current_element.parent_node
+	def invalidate_hash_cache(self) -> None:
+		"""Drop memoized hashes of this node and its descendants.
 
-		parents.reverse()
-		return [parent.tag_name for parent in parents]
+		Call this after patching a node in place (re-parenting it, changing its attributes or AX name).
+		Descendants are only visited while they hold a memoized path, since a path is always resolved
+		through its parent, so this is cheap while the tree is still being constructed.
+		"""
+		stack: list['EnhancedDOMTreeNode'] = [self]
+		while stack:
+			node = stack.pop()
+			has_cached_path = node._parent_branch_path is not None
+			node._parent_branch_path = None
+			node._element_hash = None
+			node._stable_hash = None
+			node._parent_branch_hash = None
+			if node is self or has_cached_path:
+				stack.extend(node.children_and_shadow_roots)
+				if node.content_document:
+					stack.append(node.content_document)
 
 
 DOMSelectorMap = dict[int, EnhancedDOMTreeNode]
 
 
+def hash_selector_map(
+	selector_map: DOMSelectorMap,
+	kind: Literal['element', 'stable', 'parent_branch'] = 'element',
+) -> dict[int, int]:
+	"""Hash every element of a selector map in one pass, returns `{index: hash}` in selector map order.
+
+	Parent branch paths are shared between elements through the per-node memo, so each ancestor is resolved once.
+	"""
+	if kind == 'stable':
+		return {index: node.compute_stable_hash() for index, node in selector_map.items()}
+	if kind == 'parent_branch':
+		return {index: node.parent_branch_hash() for index, node in selector_map.items()}
+	return {index: hash(node) for index, node in selector_map.items()}
+
+
 @dataclass
 class SerializedDOMState:
 	_root: SimplifiedNode | None
@@ -909,6 +989,34 @@ class SerializedDOMState:
 
 		return DOMTreeSerializer.serialize_tree(self._root, include_attributes)
 
+	def llm_representation_lines(self, include_attributes: list[str] | None = None) -> list[tuple[SimplifiedNode, int, str]]:
+		"""The lines of `llm_representation` as (node, depth, line) entries"""
+		from browser_use.dom.serializer.serializer import DOMTreeSerializer
+
+		return DOMTreeSerializer.serialize_tree_lines(self._root, include_attributes or DEFAULT_INCLUDE_ATTRIBUTES)
+
+	@observe_debug(ignore_input=True, ignore_output=True, name='budgeted_llm_representation')
+	def budgeted_llm_representation(
+		self,
+		token_budget: int,
+		include_attributes: list[str] | None = None,
+		viewport: tuple[float, float] | None = None,
+	) -> tuple[str, int]:
+		"""
+		Like `llm_representation`, but at most token_budget estimated tokens long.
+
+		Lines that matter least to the next action are left out first. Returns the representation and the number
+		of left out lines. viewport is (scroll_y, viewport_height), used to prefer what is on screen.
+		"""
+		from browser_use.dom.serializer.token_budget import TokenBudgetedSerializer
+
+		if not self._root:
+			return 'Empty DOM tree (you might have to wait for the page to load)', 0
+
+		include_attributes = include_attributes or DEFAULT_INCLUDE_ATTRIBUTES
+
+		return TokenBudgetedSerializer(token_budget, viewport=viewport).serialize(self._root, include_attributes)
+
 	@observe_debug(ignore_input=True, ignore_output=True, name='eval_representation')
 	def eval_representation(
 		self,
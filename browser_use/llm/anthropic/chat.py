@@ -1,5 +1,5 @@
 import json
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from typing import Any, TypeVar, overload
 
@@ -22,6 +22,7 @@ from pydantic import BaseModel
 from browser_use.llm.anthropic.serializer import AnthropicMessageSerializer
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
+from browser_use.llm.http_pool import get_shared_http_client
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.schema import SchemaOptimizer
 from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
@@ -68,7 +69,7 @@ class ChatAnthropic(BaseChatModel):
 			'max_retries': self.max_retries,
 			'default_headers': self.default_headers,
 			'default_query': self.default_query,
-			'http_client': self.http_client,
+			'http_client': self.http_client or get_shared_http_client(),
 		}
 
 		# Create client_params dict with non-None values and non-NotGiven values
@@ -138,6 +139,8 @@ class ChatAnthropic(BaseChatModel):
 		self, messages: list[BaseMessage], output_format: type[T] | None = None, **kwargs: Any
 	) -> ChatInvokeCompletion[T] | ChatInvokeCompletion[str]:
 		anthropic_messages, system_prompt = AnthropicMessageSerializer.serialize_messages(messages)
+		# Optional callback: streams a structured response and receives the tool input JSON as it arrives
+		on_text_delta: Callable[[str], None] | None = kwargs.get('on_text_delta')
 
 		try:
 			if output_format is None:
@@ -193,14 +196,28 @@ class ChatAnthropic(BaseChatModel):
 				# Force the model to use this tool
 				tool_choice = ToolChoiceToolParam(type='tool', name=tool_name)
 
-				response = await self.get_client().messages.create(
-					model=self.model,
-					messages=anthropic_messages,
-					tools=[tool],
-					system=system_prompt or omit,
-					tool_choice=tool_choice,
-					**self._get_client_params_for_invoke(),
-				)
+				if on_text_delta is not None:
+					async with self.get_client().messages.stream(
+						model=self.model,
+						messages=anthropic_messages,
+						tools=[tool],
+						system=system_prompt or omit,
+						tool_choice=tool_choice,
+						**self._get_client_params_for_invoke(),
+					) as stream:
+						async for event in stream:
+							if event.type == 'input_json' and event.partial_json:
+								on_text_delta(event.partial_json)
+						response = await stream.get_final_message()
+				else:
+					response = await self.get_client().messages.create(
+						model=self.model,
+						messages=anthropic_messages,
+						tools=[tool],
+						system=system_prompt or omit,
+						tool_choice=tool_choice,
+						**self._get_client_params_for_invoke(),
+					)
 
 				# Ensure we have a valid Message object before accessing attributes
 				if not isinstance(response, Message):
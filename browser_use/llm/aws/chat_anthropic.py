@@ -18,6 +18,7 @@ from pydantic import BaseModel
 from browser_use.llm.anthropic.serializer import AnthropicMessageSerializer
 from browser_use.llm.aws.chat_bedrock import ChatAWSBedrock
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
+from browser_use.llm.http_pool import get_shared_http_client
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
 
@@ -95,6 +96,7 @@ class ChatAnthropicBedrock(ChatAWSBedrock):
 			client_params['default_headers'] = self.default_headers
 		if self.default_query:
 			client_params['default_query'] = self.default_query
+		client_params['http_client'] = get_shared_http_client()
 
 		return client_params
 
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any, TypeVar, overload
 
 from pydantic import BaseModel
 
-from browser_use.llm.aws.serializer import AWSBedrockMessageSerializer
+from browser_use.llm.aws.serializer import CACHE_POINT, AWSBedrockMessageSerializer
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
@@ -55,6 +55,9 @@ class ChatAWSBedrock(BaseChatModel):
 	# Request parameters
 	request_params: dict[str, Any] | None = None
 
+	# Prompt caching: None enables cache points for the model families that support them
+	prompt_cache: bool | None = None
+
 	# Static
 	@property
 	def provider(self) -> str:
@@ -99,6 +102,12 @@ class ChatAWSBedrock(BaseChatModel):
 	def name(self) -> str:
 		return str(self.model)
 
+	def _use_prompt_cache(self) -> bool:
+		"""Whether to send cache points, which Bedrock rejects for models without prompt caching"""
+		if self.prompt_cache is not None:
+			return self.prompt_cache
+		return any(family in self.model for family in ('anthropic.claude', 'amazon.nova'))
+
 	def _get_inference_config(self) -> dict[str, Any]:
 		"""Get the inference configuration for the request."""
 		config = {}
@@ -147,12 +156,14 @@ class ChatAWSBedrock(BaseChatModel):
 			return None
 
 		usage_data = response['usage']
+		cache_read_tokens = usage_data.get('cacheReadInputTokens')
 		return ChatInvokeUsage(
-			prompt_tokens=usage_data.get('inputTokens', 0),
+			# inputTokens only counts tokens that were not read from the prompt cache
+			prompt_tokens=usage_data.get('inputTokens', 0) + (cache_read_tokens or 0),
 			completion_tokens=usage_data.get('outputTokens', 0),
 			total_tokens=usage_data.get('totalTokens', 0),
-			prompt_cached_tokens=None,  # Bedrock doesn't provide this
-			prompt_cache_creation_tokens=None,
+			prompt_cached_tokens=cache_read_tokens,
+			prompt_cache_creation_tokens=usage_data.get('cacheWriteInputTokens'),
 			prompt_image_tokens=None,
 		)
 
@@ -184,7 +195,8 @@ class ChatAWSBedrock(BaseChatModel):
 				'`boto3` not installed. Please install using `pip install browser-use[aws] or pip install browser-use[all]`'
 			)
 
-		bedrock_messages, system_message = AWSBedrockMessageSerializer.serialize_messages(messages)
+		use_prompt_cache = self._use_prompt_cache()
+		bedrock_messages, system_message = AWSBedrockMessageSerializer.serialize_messages(messages, cache_points=use_prompt_cache)
 
 		try:
 			# Prepare the request body
@@ -200,6 +212,8 @@ class ChatAWSBedrock(BaseChatModel):
 			# Handle structured output via tool calling
 			if output_format is not None:
 				tools = self._format_tools_for_request(output_format)
+				if use_prompt_cache:
+					tools.append(CACHE_POINT)
 				body['toolConfig'] = {'tools': tools}
 
 			# Add any additional request parameters
@@ -14,6 +14,8 @@ from browser_use.llm.messages import (
 	UserMessage,
 )
 
+CACHE_POINT: dict[str, Any] = {'cachePoint': {'type': 'default'}}
+
 
 class AWSBedrockMessageSerializer:
 	"""Serializer for converting between custom message types and AWS Bedrock message format."""
@@ -118,8 +120,9 @@ class AWSBedrockMessageSerializer:
 	@staticmethod
 	def _serialize_user_content(
 		content: str | list[ContentPartTextParam | ContentPartImageParam],
+		cache_points: bool = False,
 	) -> list[dict[str, Any]]:
-		"""Serialize content for user messages."""
+		"""Serialize content for user messages. With cache_points, a cache point follows every cache breakpoint part."""
 		if isinstance(content, str):
 			return [{'text': content}]
 
@@ -127,6 +130,8 @@ class AWSBedrockMessageSerializer:
 		for part in content:
 			if part.type == 'text':
 				content_blocks.append(AWSBedrockMessageSerializer._serialize_content_part_text(part))
+				if cache_points and part.cache:
+					content_blocks.append(CACHE_POINT)
 			elif part.type == 'image_url':
 				content_blocks.append(AWSBedrockMessageSerializer._serialize_content_part_image(part))
 
@@ -135,16 +140,19 @@ class AWSBedrockMessageSerializer:
 	@staticmethod
 	def _serialize_system_content(
 		content: str | list[ContentPartTextParam],
+		cache_point: bool = False,
 	) -> list[dict[str, Any]]:
-		"""Serialize content for system messages."""
+		"""Serialize content for system messages, optionally followed by a cache point."""
 		if isinstance(content, str):
-			return [{'text': content}]
-
-		content_blocks: list[dict[str, Any]] = []
-		for part in content:
-			if part.type == 'text':
-				content_blocks.append(AWSBedrockMessageSerializer._serialize_content_part_text(part))
+			content_blocks = [{'text': content}]
+		else:
+			content_blocks = []
+			for part in content:
+				if part.type == 'text':
+					content_blocks.append(AWSBedrockMessageSerializer._serialize_content_part_text(part))
 
+		if cache_point:
+			content_blocks.append(CACHE_POINT)
 		return content_blocks
 
 	@staticmethod
@@ -234,10 +242,16 @@ class AWSBedrockMessageSerializer:
 			raise ValueError(f'Unknown message type: {type(message)}')
 
 	@staticmethod
-	def serialize_messages(messages: list[BaseMessage]) -> tuple[list[dict[str, Any]], list[dict[str, Any]] | None]:
+	def serialize_messages(
+		messages: list[BaseMessage], cache_points: bool = False
+	) -> tuple[list[dict[str, Any]], list[dict[str, Any]] | None]:
 		"""
 		Serialize a list of messages, extracting any system message.
 
+		Args:
+			cache_points: Insert prompt cache points after a cached system message and after cache breakpoint
+				parts of user messages. Only for models that support Bedrock prompt caching.
+
 		Returns:
 			Tuple of (bedrock_messages, system_message) where system_message is extracted
 			from any SystemMessage in the list.
@@ -248,7 +262,16 @@ class AWSBedrockMessageSerializer:
 		for message in messages:
 			if isinstance(message, SystemMessage):
 				# Extract system message content
-				system_message = AWSBedrockMessageSerializer._serialize_system_content(message.content)
+				system_message = AWSBedrockMessageSerializer._serialize_system_content(
+					message.content, cache_point=cache_points and message.cache
+				)
+			elif cache_points and isinstance(message, UserMessage):
+				bedrock_messages.append(
+					{
+						'role': 'user',
+						'content': AWSBedrockMessageSerializer._serialize_user_content(message.content, cache_points=True),
+					}
+				)
 			else:
 				# Serialize and add to regular messages
 				serialized = AWSBedrockMessageSerializer.serialize(message)
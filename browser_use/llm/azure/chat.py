@@ -2,7 +2,6 @@ import os
 from dataclasses import dataclass
 from typing import Any, TypeVar, overload
 
-import httpx
 from openai import APIConnectionError, APIStatusError, RateLimitError
 from openai import AsyncAzureOpenAI as AsyncAzureOpenAIClient
 from openai.types.responses import Response
@@ -10,6 +9,7 @@ from openai.types.shared import ChatModel
 from pydantic import BaseModel
 
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
+from browser_use.llm.http_pool import get_shared_http_client
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.openai.like import ChatOpenAILike
 from browser_use.llm.openai.responses_serializer import ResponsesAPIMessageSerializer
@@ -104,18 +104,9 @@ class ChatAzureOpenAI(ChatOpenAILike):
 			return self.client
 
 		_client_params: dict[str, Any] = self._get_client_params()
+		_client_params['http_client'] = self.http_client or get_shared_http_client()
 
-		if self.http_client:
-			_client_params['http_client'] = self.http_client
-		else:
-			# Create a new async HTTP client with custom limits
-			_client_params['http_client'] = httpx.AsyncClient(
-				limits=httpx.Limits(max_connections=20, max_keepalive_connections=6)
-			)
-
-		self.client = AsyncAzureOpenAIClient(**_client_params)
-
-		return self.client
+		return AsyncAzureOpenAIClient(**_client_params)
 
 	def _should_use_responses_api(self) -> bool:
 		"""Determine if the Responses API should be used based on model and settings."""
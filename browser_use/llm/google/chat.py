@@ -3,6 +3,7 @@ import json
 import logging
 import random
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any, Literal, TypeVar, overload
 
@@ -201,11 +202,16 @@ class ChatGoogle(BaseChatModel):
 		Args:
 			messages: List of chat messages
 			output_format: Optional Pydantic model class for structured output
+			on_text_delta: Optional callback, streams a structured response and receives its text as it arrives
 
 		Returns:
 			Either a string response or an instance of output_format
 		"""
 
+		on_text_delta: Callable[[str], None] | None = kwargs.get('on_text_delta')
+		# Once text went out to the caller a retry would send it again, so those calls are not retried
+		text_streamed = False
+
 		# Serialize messages to Google format with the include_system_in_user flag
 		contents, system_instruction = GoogleMessageSerializer.serialize_messages(
 			messages, include_system_in_user=self.include_system_in_user
@@ -241,6 +247,12 @@ class ChatGoogle(BaseChatModel):
 		if self.max_output_tokens is not None:
 			config['max_output_tokens'] = self.max_output_tokens
 
+		def report_text_delta(text: str) -> None:
+			nonlocal text_streamed
+			text_streamed = True
+			assert on_text_delta is not None
+			on_text_delta(text)
+
 		async def _make_api_call():
 			start_time = time.time()
 			self.logger.debug(f'🚀 Starting API call to {self.model}')
@@ -284,11 +296,17 @@ class ChatGoogle(BaseChatModel):
 						gemini_schema = self._fix_gemini_schema(optimized_schema)
 						config['response_schema'] = gemini_schema
 
-						response = await self.get_client().aio.models.generate_content(
-							model=self.model,
-							contents=contents,
-							config=config,
-						)
+						if on_text_delta is not None:
+							response, response_text = await self._stream_content(contents, config, report_text_delta)
+							parsed = None
+						else:
+							response = await self.get_client().aio.models.generate_content(
+								model=self.model,
+								contents=contents,
+								config=config,
+							)
+							response_text = response.text
+							parsed = response.parsed
 
 						elapsed = time.time() - start_time
 						self.logger.debug(f'✅ Got structured response in {elapsed:.2f}s')
@@ -296,13 +314,13 @@ class ChatGoogle(BaseChatModel):
 						usage = self._get_usage(response)
 
 						# Handle case where response.parsed might be None
-						if response.parsed is None:
+						if parsed is None:
 							self.logger.debug('📝 Parsing JSON from text response')
 							# When using response_schema, Gemini returns JSON as text
-							if response.text:
+							if response_text:
 								try:
 									# Handle JSON wrapped in markdown code blocks (common Gemini behavior)
-									text = response.text.strip()
+									text = response_text.strip()
 									if text.startswith('```json') and text.endswith('```'):
 										text = text[7:-3].strip()
 										self.logger.debug('🔧 Stripped ```json``` wrapper from response')
@@ -319,7 +337,7 @@ class ChatGoogle(BaseChatModel):
 									)
 								except (json.JSONDecodeError, ValueError) as e:
 									self.logger.error(f'❌ Failed to parse JSON response: {str(e)}')
-									self.logger.debug(f'Raw response text: {response.text[:200]}...')
+									self.logger.debug(f'Raw response text: {response_text[:200]}...')
 									raise ModelProviderError(
 										message=f'Failed to parse or validate response {response}: {str(e)}',
 										status_code=500,
@@ -334,16 +352,16 @@ class ChatGoogle(BaseChatModel):
 								)
 
 						# Ensure we return the correct type
-						if isinstance(response.parsed, output_format):
+						if isinstance(parsed, output_format):
 							return ChatInvokeCompletion(
-								completion=response.parsed,
+								completion=parsed,
 								usage=usage,
 								stop_reason=self._get_stop_reason(response),
 							)
 						else:
 							# If it's not the expected type, try to validate it
 							return ChatInvokeCompletion(
-								completion=output_format.model_validate(response.parsed),
+								completion=output_format.model_validate(parsed),
 								usage=usage,
 								stop_reason=self._get_stop_reason(response),
 							)
@@ -427,7 +445,7 @@ class ChatGoogle(BaseChatModel):
 				return await _make_api_call()
 			except ModelProviderError as e:
 				# Retry if status code is in retryable list and we have attempts left
-				if e.status_code in self.retryable_status_codes and attempt < self.max_retries - 1:
+				if e.status_code in self.retryable_status_codes and attempt < self.max_retries - 1 and not text_streamed:
 					# Exponential backoff with jitter: base_delay * 2^attempt + random jitter
 					delay = min(self.retry_base_delay * (2**attempt), self.retry_max_delay)
 					jitter = random.uniform(0, delay * 0.1)  # 10% jitter
@@ -478,6 +496,26 @@ class ChatGoogle(BaseChatModel):
 
 		raise RuntimeError('Retry loop completed without return or exception')
 
+	async def _stream_content(
+		self, contents: Any, config: types.GenerateContentConfigDict, on_text_delta: Callable[[str], None]
+	) -> tuple[types.GenerateContentResponse, str]:
+		"""Stream a response, reporting each text delta. Returns the last chunk (usage, finish reason) and the full text."""
+		text_parts: list[str] = []
+		last_chunk: types.GenerateContentResponse | None = None
+		async for chunk in await self.get_client().aio.models.generate_content_stream(
+			model=self.model,
+			contents=contents,
+			config=config,
+		):
+			last_chunk = chunk
+			if chunk.text:
+				text_parts.append(chunk.text)
+				on_text_delta(chunk.text)
+
+		if last_chunk is None:
+			raise ModelProviderError(message='Empty response stream', status_code=500, model=self.model)
+		return last_chunk, ''.join(text_parts)
+
 	def _fix_gemini_schema(self, schema: dict[str, Any]) -> dict[str, Any]:
 		"""
 		Convert a Pydantic model to a Gemini-compatible schema.
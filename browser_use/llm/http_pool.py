@@ -0,0 +1,109 @@
+"""
+Shared HTTP connection pools for the chat model providers.
+
+Building a provider SDK client without an http_client gives it a new httpx connection pool, so a chat model that
+builds its client on every ainvoke() opens a new connection (DNS, TCP and TLS handshakes) for every agent step.
+get_shared_http_client() returns one httpx.AsyncClient per event loop that all providers hand to their SDK clients
+instead. Connections are kept alive between steps and reused by every chat model on that loop, and HTTP/2 is used
+when the optional h2 package is installed.
+
+httpx clients are bound to the event loop they first run on. So the pools are kept per loop, and a pool is dropped
+when its loop is garbage collected. Call close_shared_http_clients() before a loop ends to close its connections
+cleanly.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import weakref
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+# Agent steps are seconds apart, httpx's default of 5s would let most connections expire between two LLM calls
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+_limits = httpx.Limits(
+	max_connections=DEFAULT_MAX_CONNECTIONS,
+	max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+	keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+)
+_http2: bool | None = None  # None: use HTTP/2 if h2 is installed
+
+# event loop -> transport retries -> client
+_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[int, httpx.AsyncClient]]' = weakref.WeakKeyDictionary()
+
+
+def configure_http_pool(
+	max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+	max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+	keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+	http2: bool | None = None,
+) -> None:
+	"""Set the limits of the shared pools, used by pools created afterwards.
+
+	Args:
+		max_connections: Connections open at once per pool, None for no limit
+		max_keepalive_connections: Idle connections kept open per pool, None for no limit
+		keepalive_expiry: Seconds an idle connection is kept open
+		http2: Use HTTP/2, None to use it when the h2 package is installed
+	"""
+	global _limits, _http2
+	_limits = httpx.Limits(
+		max_connections=max_connections,
+		max_keepalive_connections=max_keepalive_connections,
+		keepalive_expiry=keepalive_expiry,
+	)
+	_http2 = http2
+
+
+def _use_http2() -> bool:
+	if _http2 is not None:
+		return _http2
+	return importlib.util.find_spec('h2') is not None
+
+
+def _new_client(retries: int) -> httpx.AsyncClient:
+	# No timeout is set on the client: SDK clients keep their own default timeout when the http_client has httpx's
+	# default, and pass it on every request
+	# No transport is passed: httpx ignores HTTP_PROXY, HTTPS_PROXY and NO_PROXY for clients given one. Retrying
+	# connections are mounted for all URLs instead, the proxy mounts httpx adds from the environment take precedence.
+	mounts = None
+	if retries > 0:
+		mounts = {'all://': httpx.AsyncHTTPTransport(limits=_limits, http2=_use_http2(), retries=retries)}
+	return httpx.AsyncClient(limits=_limits, http2=_use_http2(), follow_redirects=True, mounts=mounts)
+
+
+def get_shared_http_client(retries: int = 0) -> httpx.AsyncClient:
+	"""Get the shared HTTP client of the running event loop.
+
+	Pass it as http_client to provider SDK clients, or send requests with it directly (with a per-request timeout).
+	Don't close it, it is shared with every other chat model on the loop.
+
+	Args:
+		retries: Connection retries of the transport, clients with different retries don't share connections
+
+	Returns:
+		The loop's pooled client, or a new unshared client when no event loop is running.
+	"""
+	try:
+		loop = asyncio.get_running_loop()
+	except RuntimeError:
+		return _new_client(retries)
+
+	loop_clients = _clients.setdefault(loop, {})
+	client = loop_clients.get(retries)
+	if client is None or client.is_closed:
+		client = loop_clients[retries] = _new_client(retries)
+		logger.debug(f'Created shared LLM HTTP connection pool (http2={_use_http2()}, retries={retries})')
+	return client
+
+
+async def close_shared_http_clients() -> None:
+	"""Close the shared HTTP clients of the running event loop and their connections."""
+	loop_clients = _clients.pop(asyncio.get_running_loop(), {})
+	for client in loop_clients.values():
+		await client.aclose()
@@ -30,6 +30,11 @@ class ContentPartTextParam(BaseModel):
 	text: str
 	type: Literal['text'] = 'text'
 
+	cache: bool = False
+	"""Prompt cache breakpoint: providers with explicit prompt caching (Anthropic, Bedrock) cache the prompt up to and
+	including this part. Providers with implicit prefix caching ignore it.
+	"""
+
 	def __str__(self) -> str:
 		return f'Text: {_truncate(self.text)}'
 
@@ -128,7 +133,7 @@ class _MessageBase(BaseModel):
 	role: Literal['user', 'system', 'assistant']
 
 	cache: bool = False
-	"""Whether to cache this message. This is only applicable when using Anthropic models.
+	"""Whether to cache this message. This is only applicable when using Anthropic and Bedrock models.
 	"""
 
 
@@ -1,4 +1,4 @@
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
 from typing import Any, Literal, TypeVar, overload
 
@@ -6,6 +6,7 @@ import httpx
 from openai import APIConnectionError, APIStatusError, AsyncOpenAI, RateLimitError
 from openai.types.chat import ChatCompletionContentPartTextParam
 from openai.types.chat.chat_completion import ChatCompletion
+from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
 from openai.types.shared.chat_model import ChatModel
 from openai.types.shared_params.reasoning_effort import ReasoningEffort
 from openai.types.shared_params.response_format_json_schema import JSONSchema, ResponseFormatJSONSchema
@@ -13,6 +14,7 @@ from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
+from browser_use.llm.http_pool import get_shared_http_client
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.openai.serializer import OpenAIMessageSerializer
 from browser_use.llm.schema import SchemaOptimizer
@@ -100,9 +102,8 @@ class ChatOpenAI(BaseChatModel):
 		# Create client_params dict with non-None values
 		client_params = {k: v for k, v in base_params.items() if v is not None}
 
-		# Add http_client if provided
-		if self.http_client is not None:
-			client_params['http_client'] = self.http_client
+		# Use the given http_client, or the connection pool shared by all chat models
+		client_params['http_client'] = self.http_client or get_shared_http_client()
 
 		return client_params
 
@@ -120,7 +121,7 @@ class ChatOpenAI(BaseChatModel):
 	def name(self) -> str:
 		return str(self.model)
 
-	def _get_usage(self, response: ChatCompletion) -> ChatInvokeUsage | None:
+	def _get_usage(self, response: ChatCompletion | ChatCompletionChunk) -> ChatInvokeUsage | None:
 		if response.usage is not None:
 			completion_tokens = response.usage.completion_tokens
 			completion_token_details = response.usage.completion_tokens_details
@@ -145,6 +146,45 @@ class ChatOpenAI(BaseChatModel):
 
 		return usage
 
+	async def _stream_content(
+		self,
+		openai_messages: list,
+		model_params: dict[str, Any],
+		response_format: JSONSchema | None,
+		on_text_delta: Callable[[str], None],
+	) -> tuple[str, ChatInvokeUsage | None, str | None]:
+		"""Stream a completion, reporting each content delta, and return the full content, usage and stop reason"""
+		if response_format is not None:
+			model_params = {
+				**model_params,
+				'response_format': ResponseFormatJSONSchema(json_schema=response_format, type='json_schema'),
+			}
+
+		stream = await self.get_client().chat.completions.create(
+			model=self.model,
+			messages=openai_messages,
+			stream=True,
+			stream_options={'include_usage': True},
+			**model_params,
+		)
+
+		content_parts: list[str] = []
+		usage: ChatInvokeUsage | None = None
+		stop_reason: str | None = None
+		async for chunk in stream:
+			if chunk.usage is not None:
+				usage = self._get_usage(chunk)
+			if not chunk.choices:
+				continue
+			choice = chunk.choices[0]
+			if choice.delta.content:
+				content_parts.append(choice.delta.content)
+				on_text_delta(choice.delta.content)
+			if choice.finish_reason:
+				stop_reason = choice.finish_reason
+
+		return ''.join(content_parts), usage, stop_reason
+
 	@overload
 	async def ainvoke(
 		self, messages: list[BaseMessage], output_format: None = None, **kwargs: Any
@@ -162,12 +202,14 @@ class ChatOpenAI(BaseChatModel):
 		Args:
 			messages: List of chat messages
 			output_format: Optional Pydantic model class for structured output
+			on_text_delta: Optional callback, streams a structured response and receives its text as it arrives
 
 		Returns:
 			Either a string response or an instance of output_format
 		"""
 
 		openai_messages = OpenAIMessageSerializer.serialize_messages(messages)
+		on_text_delta: Callable[[str], None] | None = kwargs.get('on_text_delta')
 
 		try:
 			model_params: dict[str, Any] = {}
@@ -231,7 +273,14 @@ class ChatOpenAI(BaseChatModel):
 							ChatCompletionContentPartTextParam(text=schema_text, type='text')
 						]
 
-				if self.dont_force_structured_output:
+				if on_text_delta is not None:
+					content, usage, stop_reason = await self._stream_content(
+						openai_messages,
+						model_params,
+						None if self.dont_force_structured_output else response_format,
+						on_text_delta,
+					)
+				elif self.dont_force_structured_output:
 					response = await self.get_client().chat.completions.create(
 						model=self.model,
 						messages=openai_messages,
@@ -257,7 +306,11 @@ class ChatOpenAI(BaseChatModel):
 
 				# parsed = output_format.model_validate_json(response.choices[0].message.content)
 
-				content = response.choices[0].message.content
+				if on_text_delta is None:
+					content = response.choices[0].message.content
+					usage = self._get_usage(response)
+					stop_reason = response.choices[0].finish_reason if response.choices else None
+
 				if content is None or (isinstance(content, str) and not content.strip()):
 					raise ModelProviderError(
 						message='Model returned empty response (no content). Try again or check rate limits.',
@@ -265,15 +318,12 @@ class ChatOpenAI(BaseChatModel):
 						model=self.name,
 					)
 
-				usage = self._get_usage(response)
-
 				parsed = output_format.model_validate_json(content)
 
-
 				return ChatInvokeCompletion(
 					completion=parsed,
 					usage=usage,
-					stop_reason=response.choices[0].finish_reason if response.choices else None,
+					stop_reason=stop_reason,
 				)
 
 		except RateLimitError as e:
@@ -2,10 +2,15 @@
 Utilities for creating optimized Pydantic schemas for LLM usage.
 """
 
+import json
+import weakref
 from typing import Any
 
 from pydantic import BaseModel
 
+# model class -> (remove_min_items, remove_defaults) -> optimized schema serialized as JSON
+_schema_cache: 'weakref.WeakKeyDictionary[type[BaseModel], dict[tuple[bool, bool], str]]' = weakref.WeakKeyDictionary()
+
 
 class SchemaOptimizer:
 	@staticmethod
@@ -19,6 +24,9 @@ class SchemaOptimizer:
 		Create the most optimized schema by flattening all $ref/$defs while preserving
 		FULL descriptions and ALL action definitions. Also ensures OpenAI strict mode compatibility.
 
+		The schema is built once per model class and flags, every call returns a new copy
+		that the caller is free to modify.
+
 		Args:
 			model: The Pydantic model to optimize
 			remove_min_items: If True, remove minItems from the schema
@@ -27,6 +35,37 @@ class SchemaOptimizer:
 		Returns:
 			Optimized schema with all $refs resolved and strict mode compatibility
 		"""
+		return json.loads(
+			SchemaOptimizer.create_optimized_json_schema_text(
+				model, remove_min_items=remove_min_items, remove_defaults=remove_defaults
+			)
+		)
+
+	@staticmethod
+	def create_optimized_json_schema_text(
+		model: type[BaseModel],
+		*,
+		remove_min_items: bool = False,
+		remove_defaults: bool = False,
+	) -> str:
+		"""The schema of create_optimized_json_schema() serialized as JSON, cached per model class and flags"""
+		model_schemas = _schema_cache.setdefault(model, {})
+		key = (remove_min_items, remove_defaults)
+		schema_text = model_schemas.get(key)
+		if schema_text is None:
+			schema = SchemaOptimizer._build_optimized_json_schema(
+				model, remove_min_items=remove_min_items, remove_defaults=remove_defaults
+			)
+			schema_text = model_schemas[key] = json.dumps(schema)
+		return schema_text
+
+	@staticmethod
+	def _build_optimized_json_schema(
+		model: type[BaseModel],
+		*,
+		remove_min_items: bool,
+		remove_defaults: bool,
+	) -> dict[str, Any]:
 		# Generate original schema
 		original_schema = model.model_json_schema()
 
@@ -14,6 +14,7 @@ from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
+from browser_use.llm.http_pool import get_shared_http_client
 from browser_use.llm.messages import BaseMessage, ContentPartTextParam, SystemMessage
 from browser_use.llm.schema import SchemaOptimizer
 from browser_use.llm.vercel.serializer import VercelMessageSerializer
@@ -241,8 +242,7 @@ class ChatVercel(BaseChatModel):
 
 		client_params = {k: v for k, v in base_params.items() if v is not None}
 
-		if self.http_client is not None:
-			client_params['http_client'] = self.http_client
+		client_params['http_client'] = self.http_client or get_shared_http_client()
 
 		return client_params
 
@@ -253,10 +253,8 @@ class ChatVercel(BaseChatModel):
 		Returns:
 		    AsyncOpenAI: An instance of the AsyncOpenAI client with Vercel base URL.
 		"""
-		if not hasattr(self, '_client'):
-			client_params = self._get_client_params()
-			self._client = AsyncOpenAI(**client_params)
-		return self._client
+		client_params = self._get_client_params()
+		return AsyncOpenAI(**client_params)
 
 	@property
 	def name(self) -> str:
@@ -2,11 +2,31 @@
 
 Usage:
     python -m browser_use.mcp
+    python -m browser_use.mcp --http --port 8000 --max-sessions 20
 """
 
+import argparse
 import asyncio
 
 from browser_use.mcp.server import main
 
 if __name__ == '__main__':
-	asyncio.run(main())
+	parser = argparse.ArgumentParser(description='browser-use MCP server')
+	parser.add_argument('--http', action='store_true', help='Serve Streamable HTTP at /mcp instead of stdio')
+	parser.add_argument('--host', default='127.0.0.1', help='Host to bind with --http')
+	parser.add_argument('--port', type=int, default=8000, help='Port to bind with --http')
+	parser.add_argument('--max-sessions', type=int, default=10, help='Browsers open at once, one per MCP client')
+	parser.add_argument('--warm-browsers', type=int, default=1, help='Idle browsers kept launched for new clients')
+	parser.add_argument('--session-timeout-minutes', type=int, default=10, help='Release browsers of idle clients after')
+	args = parser.parse_args()
+
+	asyncio.run(
+		main(
+			session_timeout_minutes=args.session_timeout_minutes,
+			http=args.http,
+			host=args.host,
+			port=args.port,
+			max_sessions=args.max_sessions,
+			warm_browsers=args.warm_browsers,
+		)
+	)
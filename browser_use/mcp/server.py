@@ -21,6 +21,12 @@ Or as an MCP server in Claude Desktop or other MCP clients:
             }
         }
     }
+
+Or over Streamable HTTP, serving many MCP clients from one process:
+    python -m browser_use.mcp --http --port 8000
+
+Every connected client gets its own browser session, taken from a bounded pool of warm browsers, and tool calls of
+different clients run concurrently.
 """
 
 import os
@@ -36,8 +42,17 @@ import asyncio
 import json
 import logging
 import time
+import weakref
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from uuid_extensions import uuid7str
+
+if TYPE_CHECKING:
+	from starlette.applications import Starlette
 
 # Configure logging for MCP mode - redirect to stderr but preserve critical diagnostics
 logging.basicConfig(
@@ -91,7 +106,7 @@ logging.disable(logging.CRITICAL)
 
 # Import browser_use modules
 from browser_use import ActionModel, Agent
-from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser import BrowserPool, BrowserProfile, BrowserSession
 from browser_use.config import get_default_llm, get_default_profile, load_browser_use_config
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.llm.openai.chat import ChatOpenAI
@@ -184,20 +199,51 @@ def get_parent_process_cmdline() -> str | None:
 		return None
 
 
+DEFAULT_CLIENT_ID = 'default'  # tools called outside of an MCP request, e.g. directly from Python
+DEFAULT_USER_DATA_DIR = '~/.config/browseruse/profiles/default'
+
+
+@dataclass
+class ConnectedClient:
+	"""Browser state of one MCP client connection"""
+
+	client_id: str
+	browser_session: BrowserSession | None = None
+	pooled: bool = False
+	"""Whether the browser session came from the server's BrowserPool"""
+	file_system: FileSystem | None = None
+	lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+	"""Held while one of the client's browser tools runs, its calls share one browser and run one at a time"""
+	created_at: float = field(default_factory=time.time)
+	last_activity: float = field(default_factory=time.time)
+
+
+# The client whose tool call is running in the current task
+_current_client: ContextVar[ConnectedClient | None] = ContextVar('mcp_current_client', default=None)
+
+
 class BrowserUseServer:
-	"""MCP Server for browser-use capabilities."""
+	"""MCP Server for browser-use capabilities.
+
+	Browser tools run against the browser session of the calling MCP client, so clients don't see each other's tabs
+	and their calls run concurrently. Local browsers come from a BrowserPool: warm_browsers are kept launched ahead of
+	time and at most max_sessions are open at once. A new client waits for a free browser, or takes the one of the
+	least recently active idle client. Browsers of clients that are idle for session_timeout_minutes or disconnected
+	go back to the pool.
+
+	Unless the config sets a user_data_dir, one client at a time gets a browser on the persistent default profile
+	instead, so a single client (e.g. over stdio) keeps its logins between runs.
+	"""
 
-	def __init__(self, session_timeout_minutes: int = 10):
+	def __init__(self, session_timeout_minutes: int = 10, max_sessions: int = 10, warm_browsers: int = 1):
 		# Ensure all logging goes to stderr (in case new loggers were created)
 		_ensure_all_loggers_use_stderr()
 
 		self.server = Server('browser-use')
 		self.config = load_browser_use_config()
 		self.agent: Agent | None = None
-		self.browser_session: BrowserSession | None = None
 		self.tools: Tools | None = None
 		self.llm: ChatOpenAI | None = None
-		self.file_system: FileSystem | None = None
 		self._telemetry = ProductTelemetry()
 		self._start_time = time.time()
 
@@ -206,9 +252,31 @@ class BrowserUseServer:
 		self.session_timeout_minutes = session_timeout_minutes
 		self._cleanup_task: Any = None
 
+		# Per-client browser sessions
+		self.max_sessions = max_sessions
+		self.warm_browsers = warm_browsers
+		self.clients: dict[str, ConnectedClient] = {}
+		self._client_ids: weakref.WeakKeyDictionary[Any, str] = weakref.WeakKeyDictionary()  # MCP session -> client_id
+		self._open_browsers = 0
+		self._browsers_changed = asyncio.Event()  # set when a client goes idle or a browser is released
+		self._browser_pool: BrowserPool | None = None
+		self._default_profile_client: ConnectedClient | None = None  # the client using DEFAULT_USER_DATA_DIR
+
 		# Setup handlers
 		self._setup_handlers()
 
+	@property
+	def browser_session(self) -> BrowserSession | None:
+		"""Browser session of the client whose tool call is running"""
+		client = _current_client.get()
+		return client.browser_session if client else None
+
+	@property
+	def file_system(self) -> FileSystem | None:
+		"""FileSystem of the client whose tool call is running"""
+		client = _current_client.get()
+		return client.file_system if client else None
+
 	def _setup_handlers(self):
 		"""Setup MCP server handlers."""
 
@@ -466,10 +534,28 @@ class BrowserUseServer:
 
 		# Direct browser control tools (require active session)
 		elif tool_name.startswith('browser_'):
-			# Ensure browser session exists
-			if not self.browser_session:
-				await self._init_browser_session()
+			client = self._get_client()
+			try:
+				async with client.lock:
+					token = _current_client.set(client)
+					try:
+						return await self._execute_browser_tool(client, tool_name, arguments)
+					finally:
+						_current_client.reset(token)
+			finally:
+				# The client is idle again, a client waiting for a browser may take its one
+				self._browsers_changed.set()
+
+		return f'Unknown tool: {tool_name}'
 
+	async def _execute_browser_tool(self, client: ConnectedClient, tool_name: str, arguments: dict[str, Any]) -> str:
+		"""Execute a direct browser control tool with the calling client's browser session."""
+		# Ensure browser session exists
+		if not client.browser_session:
+			await self._init_browser_session()
+
+		self._touch_client(client)
+		try:
 			if tool_name == 'browser_navigate':
 				return await self._navigate(arguments['url'], arguments.get('new_tab', False))
 
@@ -503,17 +589,20 @@ class BrowserUseServer:
 			elif tool_name == 'browser_close_tab':
 				return await self._close_tab(arguments['tab_id'])
 
-		return f'Unknown tool: {tool_name}'
+			return f'Unknown tool: {tool_name}'
+		finally:
+			self._touch_client(client)
 
 	async def _init_browser_session(self, allowed_domains: list[str] | None = None, **kwargs):
-		"""Initialize browser session using config"""
-		if self.browser_session:
+		"""Initialize the calling client's browser session using config"""
+		client = _current_client.get() or self._get_client()
+		if client.browser_session:
 			return
 
 		# Ensure all logging goes to stderr before browser initialization
 		_ensure_all_loggers_use_stderr()
 
-		logger.debug('Initializing browser session...')
+		logger.debug(f'Initializing browser session for MCP client {client.client_id}...')
 
 		# Get profile config
 		profile_config = get_default_profile(self.config)
@@ -523,7 +612,6 @@ class BrowserUseServer:
 			'downloads_path': str(Path.home() / 'Downloads' / 'browser-use-mcp'),
 			'wait_between_actions': 0.5,
 			'keep_alive': True,
-			'user_data_dir': '~/.config/browseruse/profiles/default',
 			'device_scale_factor': 1.0,
 			'disable_security': False,
 			'headless': False,
@@ -538,39 +626,81 @@ class BrowserUseServer:
 		for key, value in kwargs.items():
 			profile_data[key] = value
 
-		# Create browser profile
-		profile = BrowserProfile(**profile_data)
-
-		# Create browser session
-		self.browser_session = BrowserSession(browser_profile=profile)
-		await self.browser_session.start()
+		await self._reserve_browser_slot(client)
+		uses_default_profile = False
+		try:
+			# Create browser profile
+			profile = BrowserProfile(**profile_data)
+			is_remote = bool(profile.cdp_url or profile.use_cloud or profile.cloud_browser_params)
+
+			# Only one browser can open a persistent profile, the default one goes to whichever client gets there first
+			if not is_remote and 'user_data_dir' not in profile_data and self._default_profile_client is None:
+				profile_data['user_data_dir'] = DEFAULT_USER_DATA_DIR
+				profile = BrowserProfile(**profile_data)
+				uses_default_profile = True
+				self._default_profile_client = client
+
+			# Create browser session, from the pool unless it is a remote browser or a persistent user_data_dir
+			if is_remote or profile_data.get('user_data_dir'):
+				browser_session = await self._start_browser_session(profile)
+				client.pooled = False
+			else:
+				browser_session = await self._acquire_pooled_browser_session(profile)
+				client.pooled = True
+		except BaseException:
+			if uses_default_profile:
+				self._default_profile_client = None
+			self._free_browser_slot()
+			raise
+		client.browser_session = browser_session
 
 		# Track the session for management
-		self._track_session(self.browser_session)
+		self._track_session(browser_session, client.client_id)
 
-		# Create tools for direct actions
-		self.tools = Tools()
+		# Create tools for direct actions, shared by all clients
+		if self.tools is None:
+			self.tools = Tools()
 
 		# Initialize LLM from config
-		llm_config = get_default_llm(self.config)
-		base_url = llm_config.get('base_url', None)
-		kwargs = {}
-		if base_url:
-			kwargs['base_url'] = base_url
-		if api_key := llm_config.get('api_key'):
-			self.llm = ChatOpenAI(
-				model=llm_config.get('model', 'gpt-o4-mini'),
-				api_key=api_key,
-				temperature=llm_config.get('temperature', 0.7),
-				**kwargs,
-			)
+		if self.llm is None:
+			llm_config = get_default_llm(self.config)
+			base_url = llm_config.get('base_url', None)
+			kwargs = {}
+			if base_url:
+				kwargs['base_url'] = base_url
+			if api_key := llm_config.get('api_key'):
+				self.llm = ChatOpenAI(
+					model=llm_config.get('model', 'gpt-o4-mini'),
+					api_key=api_key,
+					temperature=llm_config.get('temperature', 0.7),
+					**kwargs,
+				)
 
-		# Initialize FileSystem for extraction actions
-		file_system_path = profile_config.get('file_system_path', '~/.browser-use-mcp')
-		self.file_system = FileSystem(base_dir=Path(file_system_path).expanduser())
+		# Initialize FileSystem for extraction actions, one directory per client
+		if client.file_system is None:
+			file_system_path = profile_config.get('file_system_path', '~/.browser-use-mcp')
+			client.file_system = FileSystem(base_dir=Path(file_system_path).expanduser() / 'clients' / client.client_id)
 
 		logger.debug('Browser session initialized')
 
+	async def _start_browser_session(self, profile: BrowserProfile) -> BrowserSession:
+		"""Start a session on its own browser, for remote browsers and persistent profiles"""
+		browser_session = BrowserSession(browser_profile=profile)
+		await browser_session.start()
+		return browser_session
+
+	async def _acquire_pooled_browser_session(self, profile: BrowserProfile) -> BrowserSession:
+		"""Start a session connected to a warm browser of the pool, created with the profile of the first client"""
+		if self._browser_pool is None:
+			self._browser_pool = BrowserPool(size=self.warm_browsers, browser_profile=profile)
+		browser_session = await self._browser_pool.acquire()
+		try:
+			await browser_session.start()
+		except BaseException:
+			await self._browser_pool.release(browser_session)
+			raise
+		return browser_session
+
 	async def _retry_with_browser_use_agent(
 		self,
 		task: str,
@@ -893,14 +1023,10 @@ class BrowserUseServer:
 		return 'Navigated back'
 
 	async def _close_browser(self) -> str:
-		"""Close the browser session."""
-		if self.browser_session:
-			from browser_use.browser.events import BrowserStopEvent
-
-			event = self.browser_session.event_bus.dispatch(BrowserStopEvent())
-			await event
-			self.browser_session = None
-			self.tools = None
+		"""Close the calling client's browser session."""
+		client = _current_client.get()
+		if client and client.browser_session:
+			await self._release_browser(client)
 			return 'Browser closed'
 		return 'No browser session to close'
 
@@ -941,10 +1067,11 @@ class BrowserUseServer:
 		current_url = await self.browser_session.get_current_page_url()
 		return f'Closed tab # {tab_id}, now on {current_url}'
 
-	def _track_session(self, session: BrowserSession) -> None:
+	def _track_session(self, session: BrowserSession, client_id: str = DEFAULT_CLIENT_ID) -> None:
 		"""Track a browser session for management."""
 		self.active_sessions[session.id] = {
 			'session': session,
+			'client_id': client_id,
 			'created_at': time.time(),
 			'last_activity': time.time(),
 			'url': getattr(session, 'current_url', None),
@@ -955,6 +1082,72 @@ class BrowserUseServer:
 		if session_id in self.active_sessions:
 			self.active_sessions[session_id]['last_activity'] = time.time()
 
+	def _touch_client(self, client: ConnectedClient) -> None:
+		"""Update the last activity time of a client and its browser session."""
+		client.last_activity = time.time()
+		if client.browser_session:
+			self._update_session_activity(client.browser_session.id)
+
+	def _get_client(self) -> ConnectedClient:
+		"""Get the MCP client whose request is being handled, registering it on its first call."""
+		try:
+			mcp_session = self.server.request_context.session
+		except LookupError:
+			mcp_session = None
+
+		if mcp_session is None:
+			client_id = DEFAULT_CLIENT_ID
+		else:
+			# The MCP session object lives as long as the client's connection (stdio process or HTTP session)
+			client_id = self._client_ids.get(mcp_session)
+			if client_id is None:
+				client_id = self._client_ids[mcp_session] = uuid7str()
+
+		client = self.clients.get(client_id)
+		if client is None:
+			client = self.clients[client_id] = ConnectedClient(client_id=client_id)
+		return client
+
+	async def _reserve_browser_slot(self, client: ConnectedClient) -> None:
+		"""Wait for one of the max_sessions browser slots, taking the one of the least recently active idle client."""
+		while self._open_browsers >= self.max_sessions:
+			idle_clients = [
+				other
+				for other in self.clients.values()
+				if other is not client and other.browser_session and not other.lock.locked()
+			]
+			if idle_clients:
+				evicted = min(idle_clients, key=lambda other: other.last_activity)
+				logger.info(f'All {self.max_sessions} browsers in use, releasing the one of idle MCP client {evicted.client_id}')
+				async with evicted.lock:
+					await self._release_browser(evicted)
+			else:
+				self._browsers_changed.clear()
+				await self._browsers_changed.wait()
+		self._open_browsers += 1
+
+	def _free_browser_slot(self) -> None:
+		self._open_browsers -= 1
+		self._browsers_changed.set()
+
+	async def _release_browser(self, client: ConnectedClient) -> None:
+		"""Give a client's browser back to the pool (or close it) and free its slot, the client keeps its FileSystem."""
+		browser_session = client.browser_session
+		if browser_session is None:
+			return
+
+		client.browser_session = None
+		self.active_sessions.pop(browser_session.id, None)
+		try:
+			if client.pooled and self._browser_pool is not None:
+				await self._browser_pool.release(browser_session)
+			else:
+				await browser_session.kill()
+		finally:
+			if self._default_profile_client is client:
+				self._default_profile_client = None
+			self._free_browser_slot()
+
 	async def _list_sessions(self) -> str:
 		"""List all active browser sessions."""
 		if not self.active_sessions:
@@ -972,6 +1165,7 @@ class BrowserUseServer:
 			sessions_info.append(
 				{
 					'session_id': session_id,
+					'client_id': session_data['client_id'],
 					'created_at': created_at,
 					'last_activity': last_activity,
 					'active': is_active,
@@ -989,21 +1183,19 @@ class BrowserUseServer:
 
 		session_data = self.active_sessions[session_id]
 		session = session_data['session']
+		client = self.clients.get(session_data['client_id'])
 
 		try:
-			# Close the session
-			if hasattr(session, 'kill'):
+			if client is not None:
+				# Let a running tool call of the client finish instead of pulling its browser away mid-call
+				async with client.lock:
+					if client.browser_session is session:
+						await self._release_browser(client)
+			else:
 				await session.kill()
-			elif hasattr(session, 'close'):
-				await session.close()
 
 			# Remove from tracking
-			del self.active_sessions[session_id]
-
-			# If this was the current session, clear it
-			if self.browser_session and self.browser_session.id == session_id:
-				self.browser_session = None
-				self.tools = None
+			self.active_sessions.pop(session_id, None)
 
 			return f'Successfully closed session {session_id}'
 		except Exception as e:
@@ -1027,10 +1219,6 @@ class BrowserUseServer:
 			except Exception as e:
 				errors.append(f'{session_id}: {str(e)}')
 
-		# Clear current session references
-		self.browser_session = None
-		self.tools = None
-
 		result = f'Closed {closed_count} sessions'
 		if errors:
 			result += f'. Errors: {"; ".join(errors)}'
@@ -1038,12 +1226,15 @@ class BrowserUseServer:
 		return result
 
 	async def _cleanup_expired_sessions(self) -> None:
-		"""Background task to clean up expired sessions."""
+		"""Background task to clean up expired sessions and the browsers of disconnected clients."""
 		current_time = time.time()
 		timeout_seconds = self.session_timeout_minutes * 60
 
 		expired_sessions = []
 		for session_id, session_data in self.active_sessions.items():
+			client = self.clients.get(session_data['client_id'])
+			if client is not None and client.lock.locked():
+				continue  # a tool call is running
 			last_activity = session_data['last_activity']
 			if current_time - last_activity > timeout_seconds:
 				expired_sessions.append(session_id)
@@ -1055,6 +1246,19 @@ class BrowserUseServer:
 			except Exception as e:
 				logger.error(f'Error auto-closing session {session_id}: {e}')
 
+		# Clients drop out of _client_ids once their MCP connection is gone
+		connected_client_ids = set(self._client_ids.values())
+		for client_id, client in list(self.clients.items()):
+			if client_id == DEFAULT_CLIENT_ID or client_id in connected_client_ids or client.lock.locked():
+				continue
+			try:
+				async with client.lock:
+					await self._release_browser(client)
+				del self.clients[client_id]
+				logger.info(f'Released browser of disconnected MCP client {client_id}')
+			except Exception as e:
+				logger.error(f'Error releasing browser of disconnected MCP client {client_id}: {e}')
+
 	async def _start_cleanup_task(self) -> None:
 		"""Start the background cleanup task."""
 
@@ -1070,32 +1274,92 @@ class BrowserUseServer:
 
 		self._cleanup_task = create_task_with_error_handling(cleanup_loop(), name='mcp_cleanup_loop', suppress_exceptions=True)
 
+	async def _shutdown(self) -> None:
+		"""Stop the cleanup task, close every client's browser session and the pool's browsers."""
+		if self._cleanup_task:
+			self._cleanup_task.cancel()
+			self._cleanup_task = None
+		await self._close_all_sessions()
+		if self._browser_pool is not None:
+			await self._browser_pool.close()
+			self._browser_pool = None
+
+	def _initialization_options(self) -> InitializationOptions:
+		return InitializationOptions(
+			server_name='browser-use',
+			server_version='0.1.0',
+			capabilities=self.server.get_capabilities(
+				notification_options=NotificationOptions(),
+				experimental_capabilities={},
+			),
+		)
+
 	async def run(self):
-		"""Run the MCP server."""
+		"""Run the MCP server over stdio."""
 		# Start the cleanup task
 		await self._start_cleanup_task()
 
-		async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-			await self.server.run(
-				read_stream,
-				write_stream,
-				InitializationOptions(
-					server_name='browser-use',
-					server_version='0.1.0',
-					capabilities=self.server.get_capabilities(
-						notification_options=NotificationOptions(),
-						experimental_capabilities={},
-					),
-				),
-			)
+		try:
+			async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+				await self.server.run(read_stream, write_stream, self._initialization_options())
+		finally:
+			await self._shutdown()
+
+	def http_app(self, path: str = '/mcp') -> 'Starlette':
+		"""ASGI app serving the MCP server over Streamable HTTP at path, every MCP session is a separate client."""
+		from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+		from starlette.applications import Starlette
+		from starlette.routing import Route
+
+		session_manager = StreamableHTTPSessionManager(app=self.server)
+
+		@asynccontextmanager
+		async def lifespan(app: Starlette):
+			await self._start_cleanup_task()
+			try:
+				async with session_manager.run():
+					yield
+			finally:
+				await self._shutdown()
 
+		return Starlette(routes=[Route(path, endpoint=_StreamableHTTPEndpoint(session_manager))], lifespan=lifespan)
 
-async def main(session_timeout_minutes: int = 10):
+	async def run_http(self, host: str = '127.0.0.1', port: int = 8000, path: str = '/mcp'):
+		"""Run the MCP server over Streamable HTTP at http://host:port/path."""
+		try:
+			import uvicorn
+		except ImportError:
+			raise ImportError('Serving MCP over HTTP requires uvicorn. Install with: pip install uvicorn')
+
+		config = uvicorn.Config(self.http_app(path), host=host, port=port, log_level='warning')
+		await uvicorn.Server(config).serve()
+
+
+class _StreamableHTTPEndpoint:
+	"""ASGI endpoint handing requests to the StreamableHTTPSessionManager"""
+
+	def __init__(self, session_manager: Any):
+		self.session_manager = session_manager
+
+	async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+		await self.session_manager.handle_request(scope, receive, send)
+
+
+async def main(
+	session_timeout_minutes: int = 10,
+	http: bool = False,
+	host: str = '127.0.0.1',
+	port: int = 8000,
+	max_sessions: int = 10,
+	warm_browsers: int = 1,
+):
 	if not MCP_AVAILABLE:
 		print('MCP SDK is required. Install with: pip install mcp', file=sys.stderr)
 		sys.exit(1)
 
-	server = BrowserUseServer(session_timeout_minutes=session_timeout_minutes)
+	server = BrowserUseServer(
+		session_timeout_minutes=session_timeout_minutes, max_sessions=max_sessions, warm_browsers=warm_browsers
+	)
 	server._telemetry.capture(
 		MCPServerTelemetryEvent(
 			version=get_browser_use_version(),
@@ -1105,7 +1369,10 @@ async def main(session_timeout_minutes: int = 10):
 	)
 
 	try:
-		await server.run()
+		if http:
+			await server.run_http(host=host, port=port)
+		else:
+			await server.run()
 	finally:
 		duration = time.time() - server._start_time
 		server._telemetry.capture(
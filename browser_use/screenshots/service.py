@@ -2,39 +2,110 @@
 Screenshot storage service for browser-use agents.
 """
 
+import asyncio
 import base64
+import hashlib
+import logging
+import os
+import re
+import time
+from collections.abc import Iterable
+from io import BytesIO
 from pathlib import Path
+from typing import TYPE_CHECKING, Literal
 
 import anyio
 
+from browser_use.browser.views import Screenshot
 from browser_use.observability import observe_debug
 
+if TYPE_CHECKING:
+	from browser_use.agent.views import AgentHistoryList
+
+logger = logging.getLogger(__name__)
+
+ScreenshotStorageFormat = Literal['webp', 'avif']
+
+# Files written by older versions, one per step: screenshots/step_<n>.<ext>
+LEGACY_SCREENSHOT_PATTERN = re.compile(r'^step_\d+\.(png|jpg|jpeg|webp)$')
+# Content-addressed blobs: screenshots/<32 hex chars of blake2b(captured bytes)>.<ext>
+BLOB_PATTERN = re.compile(r'^[0-9a-f]{32}\.(png|jpg|webp|avif)$')
+
 
 class ScreenshotService:
-	"""Simple screenshot storage service that saves screenshots to disk"""
+	"""Content-addressed screenshot store in the agent directory.
 
-	def __init__(self, agent_directory: str | Path):
-		"""Initialize with agent directory path"""
+	Each screenshot is saved once under a name derived from a hash of its captured bytes, so a page seen
+	several times during a run takes the disk space of one file. Optionally re-encodes into a lossy format
+	and prunes blobs by age and total size.
+	"""
+
+	def __init__(
+		self,
+		agent_directory: str | Path,
+		storage_format: ScreenshotStorageFormat | None = None,
+		storage_quality: int = 80,
+		max_age: float | None = None,
+		max_total_bytes: int | None = None,
+	):
+		"""Initialize with agent directory path.
+
+		Args:
+			storage_format: Re-encode screenshots to 'webp' or 'avif' before writing, None keeps the captured format
+			storage_quality: Lossy quality (0-100) used when re-encoding
+			max_age: Delete blobs not stored or reused for this many seconds
+			max_total_bytes: Delete the least recently used blobs while the store is larger than this
+		"""
 		self.agent_directory = Path(agent_directory) if isinstance(agent_directory, str) else agent_directory
 
 		# Create screenshots subdirectory
 		self.screenshots_dir = self.agent_directory / 'screenshots'
 		self.screenshots_dir.mkdir(parents=True, exist_ok=True)
 
+		if storage_format == 'avif':
+			from PIL import features
+
+			if not features.check('avif'):
+				logger.warning('📸 This Pillow build cannot write AVIF, storing screenshots as WebP instead')
+				storage_format = 'webp'
+		self.storage_format: ScreenshotStorageFormat | None = storage_format
+		self.storage_quality = storage_quality
+		self.max_age = max_age
+		self.max_total_bytes = max_total_bytes
+
 	@observe_debug(ignore_input=True, ignore_output=True, name='store_screenshot')
-	async def store_screenshot(self, screenshot_b64: str, step_number: int) -> str:
-		"""Store screenshot to disk and return the full path as string"""
-		screenshot_filename = f'step_{step_number}.png'
-		screenshot_path = self.screenshots_dir / screenshot_filename
+	async def store_screenshot(self, screenshot: str | Screenshot, step_number: int) -> str:
+		"""Store screenshot to disk and return the full path as string.
+
+		Accepts a base64 PNG string or a Screenshot. Identical captures share one file, and the raw bytes are
+		written as-is unless a storage_format is configured.
+		"""
+		if not isinstance(screenshot, Screenshot):
+			screenshot = Screenshot(screenshot)
 
-		# Decode base64 and save to disk
-		screenshot_data = base64.b64decode(screenshot_b64)
+		data = screenshot.data
+		extension = self.storage_format or screenshot.file_extension
+		screenshot_path = self.screenshots_dir / f'{content_hash(data)}.{extension}'
 
-		async with await anyio.open_file(screenshot_path, 'wb') as f:
-			await f.write(screenshot_data)
+		if await asyncio.to_thread(_touch, screenshot_path):
+			logger.debug(f'📸 Step {step_number} screenshot already stored at {screenshot_path.name}')
+		else:
+			if self.storage_format and self.storage_format != screenshot.format:
+				data = await asyncio.to_thread(self._encode, data)
+			await _write_atomic(screenshot_path, data)
+
+		if self.max_age is not None or self.max_total_bytes is not None:
+			await asyncio.to_thread(self.prune, keep={screenshot_path})
 
 		return str(screenshot_path)
 
+	async def reuse_screenshot(self, screenshot_path: str) -> bool:
+		"""Mark a stored blob as used again, so retention keeps it as long as new history items point to it.
+
+		Returns False when the blob is gone (e.g. pruned by another agent sharing the directory).
+		"""
+		return await asyncio.to_thread(_touch, Path(screenshot_path))
+
 	@observe_debug(ignore_input=True, ignore_output=True, name='get_screenshot_from_disk')
 	async def get_screenshot(self, screenshot_path: str) -> str | None:
 		"""Load screenshot from disk path and return as base64"""
@@ -50,3 +121,103 @@ class ScreenshotService:
 			screenshot_data = await f.read()
 
 		return base64.b64encode(screenshot_data).decode('utf-8')
+
+	def prune(self, keep: Iterable[Path] = ()) -> int:
+		"""Apply the retention policy to the store and return how many blobs were deleted.
+
+		Blobs older than max_age go first, then the least recently used ones until the store fits in
+		max_total_bytes. Paths in keep are never deleted. History entries pointing at a deleted blob
+		load as no screenshot.
+		"""
+		keep = set(keep)
+		blobs: list[tuple[float, int, Path]] = []
+		for path in self.screenshots_dir.iterdir():
+			if not BLOB_PATTERN.match(path.name):
+				continue
+			try:
+				stat = path.stat()
+			except FileNotFoundError:
+				continue  # deleted by another agent sharing the directory
+			blobs.append((stat.st_mtime, stat.st_size, path))
+		blobs.sort()  # oldest first
+
+		removed = 0
+		total_bytes = sum(size for _, size, _ in blobs)
+		oldest_allowed = time.time() - self.max_age if self.max_age is not None else None
+		for mtime, size, path in blobs:
+			too_old = oldest_allowed is not None and mtime < oldest_allowed
+			too_big = self.max_total_bytes is not None and total_bytes > self.max_total_bytes
+			if not (too_old or too_big):
+				break
+			if path in keep:
+				continue
+			path.unlink(missing_ok=True)
+			total_bytes -= size
+			removed += 1
+
+		if removed:
+			logger.debug(f'📸 Pruned {removed} screenshots, {total_bytes} bytes left in {self.screenshots_dir}')
+		return removed
+
+	def migrate_legacy_screenshots(self, history: 'AgentHistoryList | None' = None) -> dict[str, str]:
+		"""Move step_<n>.<ext> files written by older versions into the content-addressed store.
+
+		Identical steps collapse into one blob and the storage_format is applied. When a history is given,
+		its screenshot paths are rewritten to the new files. Returns a mapping of old path to new path.
+		"""
+		migrated: dict[str, str] = {}
+		for path in sorted(self.screenshots_dir.iterdir()):
+			if not LEGACY_SCREENSHOT_PATTERN.match(path.name):
+				continue
+			captured = data = path.read_bytes()
+			extension = path.suffix[1:].replace('jpeg', 'jpg')
+			if self.storage_format and self.storage_format != extension:
+				data = self._encode(data)
+				extension = self.storage_format
+			# Hash the file as captured so later identical captures find it
+			new_path = self.screenshots_dir / f'{content_hash(captured)}.{extension}'
+			if not new_path.exists():
+				new_path.write_bytes(data)
+			path.unlink()
+			migrated[str(path)] = str(new_path)
+
+		if history is not None:
+			for item in history.history:
+				if item.state.screenshot_path in migrated:
+					item.state.screenshot_path = migrated[item.state.screenshot_path]
+
+		if migrated:
+			logger.info(f'📸 Migrated {len(migrated)} step screenshots in {self.screenshots_dir}')
+		return migrated
+
+	def _encode(self, data: bytes) -> bytes:
+		"""Re-encode image bytes into the lossy storage format"""
+		from PIL import Image
+
+		assert self.storage_format is not None
+		buffer = BytesIO()
+		with Image.open(BytesIO(data)) as image:
+			image.save(buffer, format=self.storage_format.upper(), quality=self.storage_quality)
+		return buffer.getvalue()
+
+
+def content_hash(data: bytes) -> str:
+	"""Name of the blob storing a screenshot captured as data, whatever format it is stored in"""
+	return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _touch(path: Path) -> bool:
+	"""Refresh the access time retention is based on, returns False when the blob is not stored yet"""
+	try:
+		os.utime(path)
+	except FileNotFoundError:
+		return False
+	return True
+
+
+async def _write_atomic(path: Path, data: bytes) -> None:
+	"""Write through a temporary file so concurrent writers and readers never see a partial blob"""
+	tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.{id(data)}.tmp')
+	async with await anyio.open_file(tmp_path, 'wb') as f:
+		await f.write(data)
+	await anyio.Path(tmp_path).replace(path)
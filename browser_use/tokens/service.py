@@ -24,6 +24,7 @@ from browser_use.tokens.views import (
 	ModelPricing,
 	ModelUsageStats,
 	ModelUsageTokens,
+	PromptCacheUsage,
 	TokenCostCalculated,
 	TokenUsageEntry,
 	UsageSummary,
@@ -362,6 +363,15 @@ class TokenCost:
 
 		return llm
 
+	def get_prompt_cache_usage(self, since_entry: int = 0) -> PromptCacheUsage:
+		"""Sum prompt and prompt cache tokens of the usage entries recorded after index since_entry"""
+		entries = self.usage_history[since_entry:]
+		return PromptCacheUsage(
+			prompt_tokens=sum(u.usage.prompt_tokens for u in entries),
+			prompt_cached_tokens=sum(u.usage.prompt_cached_tokens or 0 for u in entries),
+			prompt_cache_creation_tokens=sum(u.usage.prompt_cache_creation_tokens or 0 for u in entries),
+		)
+
 	def get_usage_tokens_for_model(self, model: str) -> ModelUsageTokens:
 		"""Get usage tokens for a specific model"""
 		filtered_usage = [u for u in self.usage_history if u.model == model]
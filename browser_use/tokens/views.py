@@ -90,6 +90,19 @@ class ModelUsageTokens(BaseModel):
 	total_tokens: int
 
 
+class PromptCacheUsage(BaseModel):
+	"""Prompt tokens of one or more LLM calls, and how many of them the provider served from its prompt cache"""
+
+	prompt_tokens: int = 0
+	prompt_cached_tokens: int = 0
+	prompt_cache_creation_tokens: int = 0
+
+	@property
+	def cache_hit_rate(self) -> float:
+		"""Share of prompt tokens read from the cache"""
+		return self.prompt_cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+
 class UsageSummary(BaseModel):
 	"""Summary of token usage and costs"""
 
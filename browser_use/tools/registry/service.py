@@ -37,6 +37,8 @@ class Registry(Generic[Context]):
 		self.telemetry = ProductTelemetry()
 		# Create a new list to avoid mutable default argument issues
 		self.exclude_actions = list(exclude_actions) if exclude_actions is not None else []
+		# action names -> (their RegisteredActions, the ActionModel built for them)
+		self._action_model_cache: dict[tuple[str, ...], tuple[tuple[RegisteredAction, ...], type[ActionModel]]] = {}
 
 	def exclude_action(self, action_name: str) -> None:
 		"""Exclude an action from the registry after initialization.
@@ -495,9 +497,10 @@ class Registry(Generic[Context]):
 
 		Each action model contains only the specific action being used,
 		rather than all actions with most set to None.
-		"""
-		from typing import Union
 
+		The model is reused while the same actions are available, so models derived from it
+		(AgentOutput and its cached JSON schema) only change when the action set does.
+		"""
 		# Filter actions based on page_url if provided:
 		#   if page_url is None, only include actions with no filters
 		#   if page_url is provided, only include actions that match the URL
@@ -520,6 +523,19 @@ class Registry(Generic[Context]):
 			if domain_is_allowed:
 				available_actions[name] = action
 
+		cache_key = tuple(available_actions)
+		actions = tuple(available_actions.values())
+		cached = self._action_model_cache.get(cache_key)
+		if cached is not None and all(a is b for a, b in zip(cached[0], actions)):
+			return cached[1]
+		action_model = self._build_action_model(available_actions)
+		self._action_model_cache[cache_key] = (actions, action_model)
+		return action_model
+
+	def _build_action_model(self, available_actions: dict[str, RegisteredAction]) -> type[ActionModel]:
+		"""Build the ActionModel union for the given actions"""
+		from typing import Union
+
 		# Create individual action models for each action
 		individual_action_models: list[type[BaseModel]] = []
 
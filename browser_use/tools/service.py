@@ -672,9 +672,16 @@ class Tools(Generic[Context]):
 			try:
 				from browser_use.dom.markdown_extractor import extract_clean_markdown
 
-				content, content_stats = await extract_clean_markdown(
-					browser_session=browser_session, extract_links=extract_links
-				)
+				prefetched = None
+				if browser_session.prefetcher is not None:
+					current_url = await browser_session.get_current_page_url()
+					prefetched = browser_session.prefetcher.take_markdown(current_url, extract_links)
+				if prefetched is not None:
+					content, content_stats = prefetched
+				else:
+					content, content_stats = await extract_clean_markdown(
+						browser_session=browser_session, extract_links=extract_links
+					)
 			except Exception as e:
 				raise RuntimeError(f'Could not extract clean markdown: {type(e).__name__}')
 
@@ -0,0 +1,158 @@
+"""
+Latency tracing for agent runs.
+
+A Tracer is owned by the Agent (Agent(trace_latency=...)) and attached to its BrowserSession, so CDP commands,
+browser state requests, DOM builds and event bus handlers are recorded on the same timeline as the agent's own
+step phases. Traces can be exported as Chrome trace-event JSON (chrome://tracing, https://ui.perfetto.dev) and are
+summarised per run in AgentHistoryList.trace_summary.
+
+When tracing is disabled the tracer is None and every hook is a single None check.
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from typing import Any
+
+from bubus import EventBus
+from cdp_use import CDPClient
+
+from browser_use.tracing.views import SpanStats, TraceSpan, TraceSummary
+
+_NO_SPAN = nullcontext()
+
+
+def _current_track() -> str:
+	"""Name of the asyncio task running the caller, used as the trace viewer row"""
+	try:
+		task = asyncio.current_task()
+	except RuntimeError:
+		return 'main'
+	return task.get_name() if task else 'main'
+
+
+class Tracer:
+	"""Collects timing spans for one agent run"""
+
+	def __init__(self) -> None:
+		self.spans: list[TraceSpan] = []
+		self._origin = time.perf_counter()
+		self._origin_wall = time.time()
+		self._recorded_event_ids: set[str] = set()
+
+	def now(self) -> float:
+		"""Seconds since the tracer was created"""
+		return time.perf_counter() - self._origin
+
+	@contextmanager
+	def span(self, name: str, category: str, **args: Any) -> Iterator[None]:
+		"""Record the duration of the enclosed block, even if it raises"""
+		start = self.now()
+		try:
+			yield
+		finally:
+			self.spans.append(TraceSpan(name, category, start, self.now(), _current_track(), args))
+
+	def record_event_bus(self, event_bus: EventBus) -> None:
+		"""Add a span for every completed handler in the event bus history that hasn't been recorded yet.
+
+		bubus already timestamps each handler run, so event dispatch is traced without hooking into the bus.
+		"""
+		for event in list(event_bus.event_history.values()):
+			if event.event_id in self._recorded_event_ids or event.event_status != 'completed':
+				continue
+			self._recorded_event_ids.add(event.event_id)
+
+			for result in event.event_results.values():
+				if result.started_at is None or result.completed_at is None:
+					continue
+				start = result.started_at.timestamp() - self._origin_wall
+				if start < 0:
+					continue  # Started before this run was traced
+				self.spans.append(
+					TraceSpan(
+						event.event_type,
+						'event_bus',
+						start,
+						result.completed_at.timestamp() - self._origin_wall,
+						f'{event_bus.name} handlers',
+						{'handler': result.handler_name, 'status': result.status},
+					)
+				)
+
+	def summary(self) -> TraceSummary:
+		"""Aggregate spans by category and name"""
+		groups: dict[tuple[str, str], list[float]] = {}
+		for span in self.spans:
+			groups.setdefault((span.category, span.name), []).append(span.duration_ms)
+
+		stats = [
+			SpanStats(
+				category=category,
+				name=name,
+				count=len(durations),
+				total_ms=sum(durations),
+				mean_ms=sum(durations) / len(durations),
+				max_ms=max(durations),
+			)
+			for (category, name), durations in groups.items()
+		]
+		stats.sort(key=lambda s: s.total_ms, reverse=True)
+		return TraceSummary(total_duration_ms=self.now() * 1000, spans=stats)
+
+	def to_chrome_trace(self) -> dict[str, Any]:
+		"""Convert spans to the Chrome trace-event format (complete events, one row per asyncio task)"""
+		tracks: dict[str, int] = {}
+		trace_events: list[dict[str, Any]] = []
+		for span in sorted(self.spans, key=lambda s: s.start):
+			tid = tracks.setdefault(span.track, len(tracks) + 1)
+			trace_events.append(
+				{
+					'name': span.name,
+					'cat': span.category,
+					'ph': 'X',
+					'ts': round(span.start * 1e6, 3),
+					'dur': round((span.end - span.start) * 1e6, 3),
+					'pid': 1,
+					'tid': tid,
+					'args': span.args,
+				}
+			)
+		for track, tid in tracks.items():
+			trace_events.append({'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': tid, 'args': {'name': track}})
+		return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+	def export_chrome_trace(self, path: str | Path) -> Path:
+		"""Write the trace as Chrome trace-event JSON"""
+		output_path = Path(path).expanduser()
+		output_path.parent.mkdir(parents=True, exist_ok=True)
+		output_path.write_text(json.dumps(self.to_chrome_trace(), default=str))
+		return output_path
+
+
+def trace_span(tracer: Tracer | None, name: str, category: str, **args: Any) -> AbstractContextManager[None]:
+	"""Span on `tracer`, or a shared no-op context manager when tracing is disabled"""
+	if tracer is None:
+		return _NO_SPAN
+	return tracer.span(name, category, **args)
+
+
+def trace_cdp_client(client: CDPClient, get_tracer: Callable[[], Tracer | None]) -> CDPClient:
+	"""Record a span per CDP command sent by `client` while `get_tracer` returns a tracer.
+
+	Wraps send_raw on the instance, which every `client.send.Domain.method()` call goes through.
+	"""
+	send_raw = client.send_raw
+
+	async def traced_send_raw(method: str, params: Any | None = None, session_id: str | None = None) -> dict[str, Any]:
+		tracer = get_tracer()
+		if tracer is None:
+			return await send_raw(method, params, session_id)
+		with tracer.span(method, 'cdp'):
+			return await send_raw(method, params, session_id)
+
+	client.send_raw = traced_send_raw  # type: ignore[method-assign]
+	return client
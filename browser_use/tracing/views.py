@@ -0,0 +1,51 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import BaseModel
+
+
+@dataclass(slots=True)
+class TraceSpan:
+	"""A single timed span, in seconds relative to the tracer's origin"""
+
+	name: str
+	category: str
+	start: float
+	end: float
+	track: str = 'main'  # Row in the trace viewer, usually the asyncio task that ran the span
+	args: dict[str, Any] = field(default_factory=dict)
+
+	@property
+	def duration_ms(self) -> float:
+		return (self.end - self.start) * 1000
+
+
+class SpanStats(BaseModel):
+	"""Aggregated latency of all spans with the same category and name"""
+
+	category: str
+	name: str
+	count: int
+	total_ms: float
+	mean_ms: float
+	max_ms: float
+
+
+class TraceSummary(BaseModel):
+	"""Per-run latency summary, sorted by total time spent"""
+
+	total_duration_ms: float
+	spans: list[SpanStats]
+
+	def table(self, limit: int | None = None) -> str:
+		"""Format the summary as a plain-text table"""
+		rows = self.spans[:limit] if limit else self.spans
+		header = f'{"category":<14} {"name":<40} {"count":>6} {"total ms":>10} {"mean ms":>9} {"max ms":>9}'
+		lines = [header, '-' * len(header)]
+		for stats in rows:
+			lines.append(
+				f'{stats.category:<14} {stats.name[:40]:<40} {stats.count:>6} '
+				f'{stats.total_ms:>10.1f} {stats.mean_ms:>9.1f} {stats.max_ms:>9.1f}'
+			)
+		lines.append(f'total run time: {self.total_duration_ms:.1f} ms')
+		return '\n'.join(lines)
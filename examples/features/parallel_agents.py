@@ -24,11 +24,11 @@ browser_session = BrowserSession(
 llm = ChatOpenAI(model='gpt-4.1-mini')
 
 
-# NOTE: This is experimental - you will have multiple agents running in the same browser session
+# Each agent works in its own tab of the same browser, with its own CDP connection, events and DOM state
 async def main():
 	await browser_session.start()
 	agents = [
-		Agent(task=task, llm=llm, browser_session=browser_session)
+		Agent(task=task, llm=llm, browser_session=browser_session.new_tab_session())
 		for task in [
 			'Search Google for weather in Tokyo',
 			'Check Reddit front page title',
@@ -74,3 +74,47 @@ def test_gemini_schema_retains_required_fields():
 
 	required_fields = set(schema['required'])
 	assert {'price', 'title'}.issubset(required_fields), 'Mandatory fields must stay required for Gemini.'
+
+
+def test_schema_is_built_once_per_model_and_flags(monkeypatch):
+	"""Repeated calls for the same model return fresh copies of a schema that is only built once per flag set."""
+	builds = []
+	build = SchemaOptimizer._build_optimized_json_schema
+
+	def counting_build(model, **kwargs):
+		builds.append((model, kwargs))
+		return build(model, **kwargs)
+
+	monkeypatch.setattr(SchemaOptimizer, '_build_optimized_json_schema', staticmethod(counting_build))
+
+	class Address(BaseModel):
+		street: str
+		tags: list[str] = []
+
+	first = SchemaOptimizer.create_optimized_json_schema(Address)
+	first['properties'].clear()  # callers may modify their copy
+	second = SchemaOptimizer.create_optimized_json_schema(Address)
+	assert set(second['properties']) == {'street', 'tags'}
+	assert len(builds) == 1
+
+	without_defaults = SchemaOptimizer.create_optimized_json_schema(Address, remove_defaults=True)
+	assert 'default' not in without_defaults['properties']['tags']
+	assert len(builds) == 2
+	assert SchemaOptimizer.create_gemini_optimized_schema(Address) == second
+	assert len(builds) == 2
+
+
+def test_action_model_is_reused_until_the_actions_change():
+	"""The registry hands out the same ActionModel for the same actions, so the schema cache keeps hitting."""
+	tools = Tools()
+	action_model = tools.registry.create_action_model()
+	assert tools.registry.create_action_model(page_url='https://example.com') is action_model
+
+	@tools.registry.action('Only on example.com', domains=['example.com'])
+	async def example_only():
+		pass
+
+	assert tools.registry.create_action_model(page_url='https://other.com') is action_model
+	with_example_only = tools.registry.create_action_model(page_url='https://example.com')
+	assert with_example_only is not action_model
+	assert tools.registry.create_action_model(page_url='https://example.com') is with_example_only
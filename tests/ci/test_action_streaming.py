@@ -0,0 +1,203 @@
+"""
+Tests for streaming LLM responses with early action dispatch (Agent(stream_actions=True)).
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from browser_use import Agent
+from browser_use.agent.streaming import ActionStream, IncrementalActionParser
+from browser_use.agent.views import ActionResult
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.views import BrowserStateSummary
+from browser_use.dom.views import SerializedDOMState
+from browser_use.llm import BaseChatModel
+from browser_use.llm.views import ChatInvokeCompletion
+from browser_use.tools.service import Tools
+
+ACTIONS = [
+	{'scroll': {'down': True, 'pages': 1.0}},
+	{'input': {'index': 3, 'text': 'say "hi" {not json} ['}},
+	{'scroll': {'down': False, 'pages': 0.5}},
+]
+
+RESPONSE = json.dumps(
+	{
+		'thinking': 'The "action" key appears in this string: {"action": [1]}',
+		'evaluation_previous_goal': 'ok',
+		'memory': 'nested {"action": []}',
+		'next_goal': 'scroll and type',
+		'action': ACTIONS,
+	},
+	indent=2,
+)
+
+
+def _chunks(text: str, size: int) -> list[str]:
+	return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def create_streaming_llm(response: str, events: list[str], fail_after: int | None = None) -> BaseChatModel:
+	"""Mock LLM that reports its response through on_text_delta in small chunks before returning it.
+
+	With fail_after, the call fails after streaming that many characters of the response.
+	"""
+	llm = AsyncMock(spec=BaseChatModel)
+	llm.model = 'mock-llm'
+	llm._verified_api_keys = True
+	llm.provider = 'mock'
+	llm.name = 'mock-llm'
+	llm.model_name = 'mock-llm'
+
+	async def mock_ainvoke(messages, output_format=None, **kwargs):
+		on_text_delta = kwargs.get('on_text_delta')
+		if on_text_delta is not None:
+			for chunk in _chunks(response if fail_after is None else response[:fail_after], 16):
+				on_text_delta(chunk)
+				await asyncio.sleep(0.001)
+		if fail_after is not None:
+			await asyncio.sleep(0.05)  # the streamed actions run meanwhile
+			events.append('llm failed')
+			raise ConnectionError('stream interrupted')
+		events.append('llm finished')
+		return ChatInvokeCompletion(completion=output_format.model_validate_json(response), usage=None)
+
+	llm.ainvoke.side_effect = mock_ainvoke
+	return llm
+
+
+def _browser_state() -> BrowserStateSummary:
+	return BrowserStateSummary(
+		dom_state=SerializedDOMState(_root=None, selector_map={}), url='https://example.com', title='Example', tabs=[]
+	)
+
+
+def _agent(response: str, events: list[str], fail_after: int | None = None, on_act=None, **kwargs) -> Agent:
+	agent = Agent(task='Test task', llm=create_streaming_llm(response, events, fail_after), stream_actions=True, **kwargs)
+
+	async def act(action, **act_kwargs):
+		events.append(f'act {next(iter(action.model_dump(exclude_unset=True)))}')
+		if on_act is not None:
+			on_act(agent)
+		return ActionResult(extracted_content='ok')
+
+	agent.tools.act = act  # type: ignore[method-assign]
+	agent.browser_profile.wait_between_actions = 0
+	return agent
+
+
+class TestIncrementalActionParser:
+	def test_yields_each_action_once_for_any_chunking(self):
+		for size in (1, 2, 7, 64, len(RESPONSE)):
+			parser = IncrementalActionParser()
+			parsed = [element for chunk in _chunks(RESPONSE, size) for element in parser.feed(chunk)]
+			assert parsed == ACTIONS
+
+	def test_ignores_surrounding_text(self):
+		parser = IncrementalActionParser()
+		assert parser.feed('```json\n' + RESPONSE + '\n```') == ACTIONS
+		assert parser.feed('{"action": [{"late": 1}]}') == []
+
+
+class TestActionStream:
+	async def test_final_output_replaces_queued_actions_and_adds_missing_ones(self):
+		ActionModel = Tools().registry.create_action_model()
+		stream = ActionStream(ActionModel, max_actions=5)
+		stream.start_attempt()
+		stream.feed(RESPONSE[: RESPONSE.index('"input"')])  # only the first action is complete
+
+		first = await stream.__anext__()
+		assert first.model_dump(exclude_unset=True) == ACTIONS[0]
+
+		stream.close([ActionModel.model_validate(action) for action in ACTIONS])
+		assert [action.model_dump(exclude_unset=True) async for action in stream] == ACTIONS[1:]
+
+	async def test_diverging_final_output_stops_dispatch(self):
+		ActionModel = Tools().registry.create_action_model()
+		stream = ActionStream(ActionModel, max_actions=5)
+		stream.start_attempt()
+		stream.feed(RESPONSE)
+		await stream.__anext__()
+
+		stream.close([ActionModel.model_validate(action) for action in reversed(ACTIONS)])
+		assert [action async for action in stream] == []
+		assert stream.stopped
+
+	async def test_done_is_only_taken_from_the_final_output(self):
+		ActionModel = Tools().registry.create_action_model()
+		stream = ActionStream(ActionModel, max_actions=5)
+		stream.start_attempt()
+		done = {'done': {'text': 'finished', 'success': True}}
+		stream.feed(json.dumps({'action': [done]}))
+		assert stream.streamed == []
+
+		stream.close([ActionModel.model_validate(done)])
+		assert [action.model_dump(exclude_unset=True) async for action in stream] == [done]
+
+
+class TestEarlyDispatch:
+	async def test_actions_start_before_the_llm_finishes(self):
+		events: list[str] = []
+		agent = _agent(RESPONSE, events)
+
+		await agent._get_next_action(_browser_state())
+		await agent._execute_actions()
+
+		assert events.index('act scroll') < events.index('llm finished')
+		assert events.count('act scroll') == 2 and events.count('act input') == 1
+		assert agent.state.last_result is not None and len(agent.state.last_result) == 3
+		assert agent._streamed_results is None
+
+	async def test_page_change_skips_remaining_streamed_actions(self):
+		events: list[str] = []
+		agent = _agent(RESPONSE, events)
+		urls = iter(['https://example.com', 'https://example.com/next'])
+		with patch.object(BrowserSession, 'get_current_page_url', AsyncMock(side_effect=lambda: next(urls))):
+			await agent._get_next_action(_browser_state())
+			await agent._execute_actions()
+
+		assert [event for event in events if event.startswith('act')] == ['act scroll']
+		assert agent.state.last_result is not None and len(agent.state.last_result) == 1
+
+	async def test_failed_stream_keeps_the_results_of_dispatched_actions(self):
+		events: list[str] = []
+		agent = _agent(RESPONSE, events, fail_after=RESPONSE.index('"input"'))  # only the first action is complete
+
+		with pytest.raises(ConnectionError) as error:
+			await agent._get_next_action(_browser_state())
+		assert events == ['act scroll', 'llm failed']
+		assert agent.state.last_result == [ActionResult(extracted_content='ok')]
+
+		await agent._handle_step_error(error.value)
+		assert agent.state.last_result is not None and len(agent.state.last_result) == 2
+		assert agent.state.last_result[0].extracted_content == 'ok'
+		assert agent.state.last_result[1].error is not None and 'stream interrupted' in agent.state.last_result[1].error
+
+	async def test_pause_stops_the_remaining_streamed_actions(self):
+		events: list[str] = []
+
+		def pause(agent: Agent) -> None:
+			agent.state.paused = True
+
+		agent = _agent(RESPONSE, events, on_act=pause)
+		with pytest.raises(InterruptedError):
+			await agent._get_next_action(_browser_state())
+
+		assert [event for event in events if event.startswith('act')] == ['act scroll']
+		assert agent.state.last_result is not None and len(agent.state.last_result) == 1
+
+	async def test_step_callback_sees_the_output_before_actions_run(self):
+		events: list[str] = []
+
+		def on_step(browser_state, model_output, step) -> None:
+			events.append('callback')
+
+		agent = _agent(RESPONSE, events, register_new_step_callback=on_step)
+		await agent._get_next_action(_browser_state())
+		await agent._execute_actions()
+
+		assert events[:2] == ['llm finished', 'callback']
+		assert events.count('act scroll') == 2 and events.count('act input') == 1
@@ -0,0 +1,106 @@
+"""Tests for demand-driven accessibility tree fetching in DomService."""
+
+import logging
+from types import SimpleNamespace
+from typing import Literal
+from unittest.mock import AsyncMock, MagicMock
+
+from browser_use.dom.serializer.clickable_elements import ClickableElementDetector
+from browser_use.dom.serializer.html_serializer import HTMLSerializer
+from browser_use.dom.serializer.serializer import DOMTreeSerializer
+from browser_use.dom.service import DomService
+from browser_use.dom.views import EnhancedDOMTreeNode, NodeType
+
+
+def _node(
+	backend_node_id: int,
+	name: str,
+	parent: EnhancedDOMTreeNode | None = None,
+	attributes: dict[str, str] | None = None,
+) -> EnhancedDOMTreeNode:
+	node = EnhancedDOMTreeNode(
+		node_id=backend_node_id,
+		backend_node_id=backend_node_id,
+		node_type=NodeType.ELEMENT_NODE,
+		node_name=name,
+		node_value='',
+		attributes=attributes or {},
+		is_scrollable=None,
+		is_visible=True,
+		absolute_position=None,
+		target_id='target-1',
+		frame_id=None,
+		session_id=None,
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=None,
+		parent_node=parent,
+		children_nodes=None,
+		ax_node=None,
+		snapshot_node=None,
+	)
+	if parent is not None:
+		parent.children_nodes = [*(parent.children_nodes or []), node]
+	return node
+
+
+def _make_dom_service(ax_tree_mode: Literal['full', 'auto'] = 'auto') -> tuple[DomService, AsyncMock]:
+	async def get_partial_ax_tree(params, session_id=None):
+		backend_node_id = params['backendNodeId']
+		return {
+			'nodes': [
+				{
+					'nodeId': f'ax-{backend_node_id}',
+					'ignored': False,
+					'backendDOMNodeId': backend_node_id,
+					'role': {'type': 'role', 'value': 'button'},
+					'name': {'type': 'computedString', 'value': f'name {backend_node_id}'},
+				}
+			]
+		}
+
+	get_partial = AsyncMock(side_effect=get_partial_ax_tree)
+	cdp_session = SimpleNamespace(
+		session_id='session-1',
+		cdp_client=SimpleNamespace(send=SimpleNamespace(Accessibility=SimpleNamespace(getPartialAXTree=get_partial))),
+	)
+	browser_session = MagicMock()
+	browser_session.get_or_create_cdp_session = AsyncMock(return_value=cdp_session)
+	return DomService(browser_session, logger=logging.getLogger('test'), ax_tree_mode=ax_tree_mode), get_partial
+
+
+class TestAXTreeMode:
+	def test_serializers_declare_ax_needs(self):
+		assert DOMTreeSerializer.AX_TREE_MODE == 'interactive'
+		assert HTMLSerializer.AX_TREE_MODE == 'none'
+
+		service, _ = _make_dom_service('auto')
+		assert service._resolve_ax_tree_mode(HTMLSerializer.AX_TREE_MODE) == 'none'
+		service, _ = _make_dom_service('full')
+		assert service._resolve_ax_tree_mode(HTMLSerializer.AX_TREE_MODE) == 'full'
+
+	def test_ax_candidates(self):
+		body = _node(1, 'BODY')
+		assert not ClickableElementDetector.is_ax_candidate(body)
+		assert not ClickableElementDetector.is_ax_candidate(_node(2, 'DIV', body, {'class': 'content'}))
+		assert ClickableElementDetector.is_ax_candidate(_node(3, 'BUTTON', body))
+		assert ClickableElementDetector.is_ax_candidate(_node(4, 'DIV', body, {'aria-expanded': 'false'}))
+		assert ClickableElementDetector.is_ax_candidate(_node(5, 'SPAN', body, {'class': 'search-icon'}))
+
+	async def test_attaches_ax_nodes_only_to_candidates(self):
+		service, get_partial = _make_dom_service()
+		body = _node(1, 'BODY')
+		plain = _node(2, 'DIV', body)
+		button = _node(3, 'BUTTON', plain)
+		link = _node(4, 'A', body, {'href': '/'})
+		hash_without_ax = hash(button)
+
+		candidate_count = await service._attach_ax_nodes_to_candidates('target-1', body)
+
+		assert candidate_count == 2
+		assert get_partial.await_count == 2
+		assert plain.ax_node is None and body.ax_node is None
+		assert button.ax_node is not None and button.ax_node.name == 'name 3'
+		assert link.ax_node is not None and link.ax_node.role == 'button'
+		# the element hash includes the AX name, so the memoized hash must be refreshed
+		assert hash(button) != hash_without_ax
@@ -0,0 +1,146 @@
+"""Tests for batched bounding-box containment filtering in DOMTreeSerializer."""
+
+import random
+
+import pytest
+
+import browser_use.dom.serializer.serializer as serializer_module
+from browser_use.dom.serializer.serializer import DOMTreeSerializer
+from browser_use.dom.views import DOMRect, EnhancedDOMTreeNode, EnhancedSnapshotNode, NodeType, SimplifiedNode
+
+TAGS = ['div', 'div', 'span', 'span', 'a', 'button', 'img', 'input', 'label', 'svg', 'p']
+ROLES = [None, None, None, 'button', 'combobox', 'link']
+
+
+def _simplified(
+	name: str,
+	bounds: DOMRect | None,
+	attributes: dict[str, str] | None = None,
+	node_type: NodeType = NodeType.ELEMENT_NODE,
+) -> SimplifiedNode:
+	snapshot = EnhancedSnapshotNode(
+		is_clickable=None,
+		cursor_style=None,
+		bounds=bounds,
+		clientRects=None,
+		scrollRects=None,
+		computed_styles=None,
+		paint_order=None,
+		stacking_contexts=None,
+	)
+	node = EnhancedDOMTreeNode(
+		node_id=0,
+		backend_node_id=0,
+		node_type=node_type,
+		node_name=name,
+		node_value='',
+		attributes=attributes or {},
+		is_scrollable=None,
+		is_visible=True,
+		absolute_position=None,
+		target_id='target-1',
+		frame_id=None,
+		session_id=None,
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=None,
+		parent_node=None,
+		children_nodes=None,
+		ax_node=None,
+		snapshot_node=snapshot,
+	)
+	return SimplifiedNode(original_node=node, children=[])
+
+
+def _random_tree(rng: random.Random, node_count: int) -> SimplifiedNode:
+	root = _simplified('body', DOMRect(0, 0, 1280, 4000))
+	nodes = [root]
+	for _ in range(node_count):
+		parent = rng.choice(nodes)
+		parent_bounds = parent.original_node.snapshot_node.bounds or DOMRect(0, 0, 1280, 4000)  # type: ignore[union-attr]
+		# mostly inside the parent, sometimes poking out, sometimes degenerate
+		x = parent_bounds.x + rng.uniform(-2, parent_bounds.width * 0.8)
+		y = parent_bounds.y + rng.uniform(-2, parent_bounds.height * 0.8)
+		width = rng.choice([0.0, rng.uniform(0, parent_bounds.x + parent_bounds.width - x), rng.uniform(0, 60)])
+		height = rng.choice([rng.uniform(0, parent_bounds.y + parent_bounds.height - y), rng.uniform(0, 30)])
+		bounds = None if rng.random() < 0.05 else DOMRect(x, y, width, height)
+
+		attributes = {}
+		role = rng.choice(ROLES)
+		if role:
+			attributes['role'] = role
+		if rng.random() < 0.05:
+			attributes['aria-label'] = rng.choice(['', '  ', 'Close'])
+		if rng.random() < 0.03:
+			attributes['onclick'] = 'go()'
+
+		node_type = NodeType.TEXT_NODE if rng.random() < 0.1 else NodeType.ELEMENT_NODE
+		child = _simplified(rng.choice(TAGS), bounds, attributes, node_type)
+		parent.children.append(child)
+		nodes.append(child)
+	return root
+
+
+def _reference_filter(serializer: DOMTreeSerializer, node: SimplifiedNode, active_bounds=None, depth: int = 0) -> None:
+	"""Per-node filtering, one containment check at a time."""
+	if active_bounds and serializer._should_exclude_child(node, active_bounds):
+		node.excluded_by_parent = True
+	propagate_bounds = serializer._get_propagating_bounds(node, depth) or active_bounds
+	for child in node.children:
+		_reference_filter(serializer, child, propagate_bounds, depth + 1)
+
+
+def _flags(node: SimplifiedNode) -> list[bool]:
+	flags = [node.excluded_by_parent]
+	for child in node.children:
+		flags.extend(_flags(child))
+	return flags
+
+
+def _reset(node: SimplifiedNode) -> None:
+	node.excluded_by_parent = False
+	for child in node.children:
+		_reset(child)
+
+
+class TestBoundingBoxFiltering:
+	def _assert_matches_reference(self, seed: int) -> None:
+		tree = _random_tree(random.Random(seed), 600)
+		serializer = DOMTreeSerializer(tree.original_node)
+
+		_reference_filter(serializer, tree)
+		expected = _flags(tree)
+		assert any(expected)
+
+		_reset(tree)
+		serializer._apply_bounding_box_filtering(tree)
+		assert _flags(tree) == expected
+
+	@pytest.mark.parametrize('seed', range(5))
+	def test_pure_python_matches_reference(self, seed: int, monkeypatch: pytest.MonkeyPatch):
+		monkeypatch.setattr(serializer_module, 'NUMPY_AVAILABLE', False)
+		self._assert_matches_reference(seed)
+
+	@pytest.mark.parametrize('seed', range(5))
+	def test_vectorized_matches_reference(self, seed: int, monkeypatch: pytest.MonkeyPatch):
+		if not serializer_module.NUMPY_AVAILABLE:
+			pytest.skip('numpy is not installed')
+		monkeypatch.setattr(DOMTreeSerializer, 'VECTORIZED_CONTAINMENT_MIN_BATCH', 1)
+		self._assert_matches_reference(seed)
+
+	def test_contained_mask_edge_cases(self, monkeypatch: pytest.MonkeyPatch):
+		serializer = DOMTreeSerializer(_simplified('body', None).original_node)
+		parent = DOMRect(10, 10, 100, 100)
+		children = [
+			DOMRect(10, 10, 100, 100),  # identical
+			DOMRect(20, 20, 0, 50),  # zero area
+			DOMRect(109, 50, 2, 2),  # half outside
+			DOMRect(200, 200, 5, 5),  # disjoint
+			DOMRect(10.5, 10.5, 99.5, 99.5),  # touching the far edges
+		]
+		expected = [serializer._is_contained(child, parent, 0.99) for child in children]
+		assert expected == [True, False, False, False, True]
+		assert serializer._contained_mask(children, parent, 0.99) == expected
+		if serializer_module.NUMPY_AVAILABLE:
+			monkeypatch.setattr(DOMTreeSerializer, 'VECTORIZED_CONTAINMENT_MIN_BATCH', 1)
+			assert serializer._contained_mask(children, parent, 0.99) == expected
@@ -0,0 +1,118 @@
+"""Tests for BrowserPool, warm local browsers handed out to new sessions."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from browser_use.browser import BrowserPool, BrowserProfile
+from browser_use.browser.pool import PooledBrowser
+
+
+class FakeBrowserPool(BrowserPool):
+	"""Pool whose browsers are fake processes, launched after launch_delay seconds"""
+
+	def __init__(self, *args, launch_delay: float = 0, memory_mb: float = 100, **kwargs):
+		super().__init__(*args, **kwargs)
+		self.launch_delay = launch_delay
+		self.memory_mb = memory_mb
+		self.launched: list[PooledBrowser] = []
+		self.reset_calls: list[PooledBrowser] = []
+		self.shut_down: list[PooledBrowser] = []
+		self.fail_launches = False
+
+	async def _launch(self) -> PooledBrowser:
+		await asyncio.sleep(self.launch_delay)
+		if self.fail_launches:
+			raise RuntimeError('Chrome crashed on startup')
+		port = 9300 + len(self.launched)
+		browser = PooledBrowser(process=MagicMock(), cdp_url=f'http://127.0.0.1:{port}/', user_data_dir=Path(f'/tmp/pool-{port}'))
+		self.launched.append(browser)
+		return browser
+
+	async def _reset(self, browser: PooledBrowser) -> None:
+		self.reset_calls.append(browser)
+
+	async def _shutdown(self, browser: PooledBrowser) -> None:
+		self.shut_down.append(browser)
+
+	def _memory_mb(self, browser: PooledBrowser) -> float:
+		return self.memory_mb
+
+
+async def _settle():
+	for _ in range(5):
+		await asyncio.sleep(0)
+
+
+class TestBrowserPool:
+	async def test_warm_browsers_are_handed_out_and_replaced(self):
+		pool = FakeBrowserPool(size=2)
+		await pool.start()
+		assert len(pool.launched) == 2
+
+		session = await pool.acquire()
+		assert session.cdp_url in {browser.cdp_url for browser in pool.launched[:2]}
+		assert session.is_local and session.browser_profile.keep_alive is False
+		assert pool.stats.hits == 1 and pool.stats.misses == 0
+
+		await _settle()
+		assert len(pool.launched) == 3  # the taken browser is replaced in the background
+		await pool.close()
+
+	async def test_empty_pool_launches_on_demand(self):
+		pool = FakeBrowserPool(size=0)
+		session = await pool.acquire()
+		assert session.cdp_url == pool.launched[0].cdp_url
+		assert pool.stats.misses == 1 and pool.stats.launches == 1
+		assert pool.stats.average_launch_seconds >= 0
+		await pool.close()
+
+	async def test_released_browser_is_reset_and_reused(self):
+		pool = FakeBrowserPool(size=1)
+		await pool.start()
+		async with pool.session() as session:
+			first_url = session.cdp_url
+		await _settle()
+
+		assert pool.reset_calls and pool.reset_calls[0].cdp_url == first_url
+		assert pool.stats.recycled == 0
+		assert pool._idle.qsize() == 2  # the released browser and the replacement launched while it was leased
+
+	async def test_browser_is_recycled_after_max_uses_or_memory(self):
+		pool = FakeBrowserPool(size=1, max_uses=1)
+		await pool.start()
+		session = await pool.acquire()
+		await pool.release(session)
+		await _settle()
+		assert pool.stats.recycled == 1 and not pool.reset_calls
+		assert pool.shut_down[0].cdp_url == session.cdp_url
+
+		heavy_pool = FakeBrowserPool(size=1, max_memory_mb=500, memory_mb=800)
+		await heavy_pool.start()
+		await heavy_pool.release(await heavy_pool.acquire())
+		assert heavy_pool.stats.recycled == 1
+
+	async def test_failed_launch_fails_the_waiting_session(self):
+		pool = FakeBrowserPool(size=0)
+		pool.fail_launches = True
+		with pytest.raises(RuntimeError, match='Chrome crashed'):
+			await pool.acquire()
+		assert pool.stats.failed_launches == 1
+
+	async def test_close_shuts_down_idle_and_released_browsers(self):
+		pool = FakeBrowserPool(size=2)
+		await pool.start()
+		session = await pool.acquire()
+		await pool.close()
+		assert len(pool.shut_down) == len(pool.launched) - 1
+
+		await pool.release(session)
+		assert len(pool.shut_down) == len(pool.launched)
+		with pytest.raises(RuntimeError, match='closed'):
+			await pool.acquire()
+
+	def test_only_local_browsers_can_be_pooled(self):
+		with pytest.raises(ValueError, match='local browsers'):
+			BrowserPool(browser_profile=BrowserProfile(cdp_url='http://localhost:9222'))
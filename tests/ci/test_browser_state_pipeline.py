@@ -0,0 +1,133 @@
+"""Tests for the concurrent browser state request pipeline in DOMWatchdog."""
+
+import asyncio
+import logging
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from browser_use.browser.events import BrowserStateRequestEvent
+from browser_use.browser.views import PageInfo, Screenshot, TabInfo
+from browser_use.browser.watchdogs.dom_watchdog import DOMWatchdog
+from browser_use.dom.views import SerializedDOMState
+
+STEP_DELAY = 0.1
+
+
+async def _slow(value, delay: float = STEP_DELAY):
+	await asyncio.sleep(delay)
+	return value
+
+
+def _make_watchdog(monkeypatch: pytest.MonkeyPatch, network_idle: asyncio.Event) -> DOMWatchdog:
+	cdp_session = SimpleNamespace(_network_idle=network_idle)
+
+	async def get_or_create_cdp_session(*args, **kwargs):
+		return cdp_session
+
+	browser_session = SimpleNamespace(
+		logger=logging.getLogger('test'),
+		agent_focus_target_id='target-1',
+		browser_profile=SimpleNamespace(viewport=None, dom_highlight_elements=False),
+		_cached_browser_state_summary=None,
+		_closed_popup_messages=[],
+		_original_viewport_size=None,
+		tracer=None,
+		get_current_page_url=lambda: _slow('https://example.com', 0),
+		get_current_page_title=lambda: _slow('Example'),
+		get_tabs=lambda: _slow([TabInfo(url='https://example.com', title='Example', target_id='target-1')]),
+		get_or_create_cdp_session=get_or_create_cdp_session,
+	)
+	page_info = PageInfo(
+		viewport_width=800,
+		viewport_height=600,
+		page_width=800,
+		page_height=2000,
+		scroll_x=0,
+		scroll_y=0,
+		pixels_above=0,
+		pixels_below=1400,
+		pixels_left=0,
+		pixels_right=0,
+	)
+	monkeypatch.setattr(DOMWatchdog, '_get_pending_network_requests', lambda self: _slow([]))
+	monkeypatch.setattr(DOMWatchdog, '_get_page_info', lambda self: _slow(page_info))
+	monkeypatch.setattr(
+		DOMWatchdog,
+		'_build_dom_tree_without_highlights',
+		lambda self, previous_state=None: _slow(SerializedDOMState(_root=None, selector_map={}), 2 * STEP_DELAY),
+	)
+	monkeypatch.setattr(
+		DOMWatchdog, '_capture_clean_screenshot', lambda self: _slow(Screenshot('c2NyZWVuc2hvdA=='), 2 * STEP_DELAY)
+	)
+	return DOMWatchdog.model_construct(event_bus=None, browser_session=browser_session)
+
+
+class TestBrowserStatePipeline:
+	async def test_phases_run_concurrently(self, monkeypatch: pytest.MonkeyPatch):
+		network_idle = asyncio.Event()
+		watchdog = _make_watchdog(monkeypatch, network_idle)
+		asyncio.get_running_loop().call_later(0.05, network_idle.set)
+
+		start = time.perf_counter()
+		state = await watchdog.on_BrowserStateRequestEvent(BrowserStateRequestEvent())
+		elapsed = time.perf_counter() - start
+
+		assert state.title == 'Example'
+		assert state.screenshot == 'c2NyZWVuc2hvdA=='
+		assert state.page_info is not None and state.page_info.page_height == 2000
+		assert len(state.tabs) == 1
+		# serially this would take 0.05 + 0.8s; concurrently the idle wait plus the slowest phase
+		assert elapsed < 0.5
+
+		timing = state.timing_info
+		for key in ('tabs_ms', 'pending_requests_ms', 'network_idle_wait_ms', 'dom_build_ms', 'screenshot_ms', 'title_ms'):
+			assert key in timing
+		assert 30 < timing['network_idle_wait_ms'] < DOMWatchdog.NETWORK_IDLE_TIMEOUT * 1000
+		assert timing['total_ms'] >= timing['dom_build_ms']
+
+	async def test_idle_page_does_not_wait(self, monkeypatch: pytest.MonkeyPatch):
+		network_idle = asyncio.Event()
+		network_idle.set()
+		watchdog = _make_watchdog(monkeypatch, network_idle)
+
+		state = await watchdog.on_BrowserStateRequestEvent(BrowserStateRequestEvent())
+
+		assert state.timing_info['network_idle_wait_ms'] < 20
+
+	async def test_network_idle_wait_is_bounded(self, monkeypatch: pytest.MonkeyPatch):
+		monkeypatch.setattr(DOMWatchdog, 'NETWORK_IDLE_TIMEOUT', 0.05)
+		watchdog = _make_watchdog(monkeypatch, asyncio.Event())  # never becomes idle
+
+		assert await watchdog._wait_for_network_idle(timeout=DOMWatchdog.NETWORK_IDLE_TIMEOUT) is False
+
+		state = await watchdog.on_BrowserStateRequestEvent(BrowserStateRequestEvent())
+		assert state.title == 'Example'
+		assert 40 < state.timing_info['network_idle_wait_ms'] < 200
+
+	async def test_failed_request_cancels_the_phases_still_running(self, monkeypatch: pytest.MonkeyPatch):
+		network_idle = asyncio.Event()
+		network_idle.set()
+		watchdog = _make_watchdog(monkeypatch, network_idle)
+		cancelled: list[str] = []
+
+		async def failing_tabs():
+			raise RuntimeError('target closed')
+
+		async def slow_title(self):
+			try:
+				await asyncio.sleep(5)
+			except asyncio.CancelledError:
+				cancelled.append('title')
+				raise
+			return 'Example'
+
+		watchdog.browser_session.get_tabs = failing_tabs
+		monkeypatch.setattr(DOMWatchdog, '_get_page_title', slow_title)
+
+		state = await watchdog.on_BrowserStateRequestEvent(BrowserStateRequestEvent())
+		await asyncio.sleep(0)
+
+		assert state.title == 'Error'
+		assert cancelled == ['title']
@@ -0,0 +1,98 @@
+"""Tests for running many CodeAgents concurrently on one event loop, each capturing only its own cell output."""
+
+import asyncio
+import sys
+import urllib.request
+
+from pytest_httpserver import HTTPServer
+
+from browser_use.browser import BrowserSession
+from browser_use.code_use import CodeAgent
+from browser_use.code_use.capture import capture_output, install_output_capture
+from browser_use.code_use.utils import compile_code_cell
+from browser_use.filesystem.file_system import FileSystem
+from tests.ci.conftest import create_mock_llm
+
+AGENTS = 20
+
+CELL = """
+html = await asyncio.to_thread(fetch, page_url)
+for line in range(5):
+    print(f'{agent_name} line {line}: {html}')
+    await asyncio.sleep(0.001 * (line % 3))
+sys.stdout.write(f'{agent_name} done\\n')
+"""
+
+
+def _fetch(url: str) -> str:
+	with urllib.request.urlopen(url) as response:
+		return response.read().decode()
+
+
+def _make_agent(index: int, page_url: str, tmp_path) -> CodeAgent:
+	agent = CodeAgent(
+		task=f'Read page {index}',
+		llm=create_mock_llm(),
+		browser=BrowserSession(headless=True),
+		file_system=FileSystem(tmp_path / f'agent-{index}'),
+	)
+	agent.namespace.update({'agent_name': f'agent-{index}', 'page_url': page_url, 'fetch': _fetch, 'sys': sys})
+	return agent
+
+
+class TestConcurrentCodeAgents:
+	async def test_concurrent_cells_capture_only_their_own_output(self, httpserver: HTTPServer, tmp_path):
+		for index in range(AGENTS):
+			httpserver.expect_request(f'/page/{index}').respond_with_data(f'page-{index}', content_type='text/html')
+		agents = [_make_agent(index, httpserver.url_for(f'/page/{index}'), tmp_path) for index in range(AGENTS)]
+		stdout_before = sys.stdout
+
+		results = await asyncio.gather(*(agent._execute_code(CELL) for agent in agents))
+
+		for index, (output, error, _) in enumerate(results):
+			assert error is None
+			expected = [f'agent-{index} line {line}: page-{index}' for line in range(5)] + [f'agent-{index} done']
+			assert output is not None and output.splitlines() == expected
+			assert agents[index].namespace['html'] == f'page-{index}'
+		assert sys.stdout is stdout_before
+
+	async def test_output_of_modules_the_cell_calls_is_captured(self, tmp_path):
+		agent = _make_agent(0, 'http://localhost/', tmp_path)
+		stdout_before, stderr_before = sys.stdout, sys.stderr
+
+		output, error, _ = await agent._execute_code(
+			'import pprint\nimport traceback\n'
+			"pprint.pprint({'a': 1})\n"
+			'try:\n    1 / 0\nexcept ZeroDivisionError:\n    traceback.print_exc()\n'
+		)
+
+		assert error is None and output is not None
+		assert output.startswith("{'a': 1}\nTraceback (most recent call last):")
+		assert output.endswith('ZeroDivisionError: division by zero\n')
+		assert sys.stdout is stdout_before and sys.stderr is stderr_before
+
+	async def test_output_outside_a_cell_is_not_captured(self, capsys):
+		ready = asyncio.Event()
+		release = asyncio.Event()
+		namespace: dict = {}
+		install_output_capture(namespace)
+
+		async def cell() -> str:
+			with capture_output() as captured:
+				exec("print('inside the cell')", namespace)
+				ready.set()
+				await release.wait()
+				exec("import sys\nsys.stdout.write('still inside the cell\\n')", namespace)
+			return captured.getvalue()
+
+		task = asyncio.create_task(cell())
+		await ready.wait()
+		print('host program output')
+		release.set()
+
+		assert await task == 'inside the cell\nstill inside the cell\n'
+		assert capsys.readouterr().out == 'host program output\n'
+
+	def test_cells_are_compiled_once_per_source(self):
+		source = 'x = 1 + 1'
+		assert compile_code_cell(source) is compile_code_cell(source)
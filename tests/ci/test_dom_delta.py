@@ -0,0 +1,210 @@
+"""Tests for the delta DOM state format (Agent(dom_state_format='delta'))."""
+
+from browser_use.agent.message_manager.service import MessageManager
+from browser_use.agent.views import MessageManagerState
+from browser_use.browser.views import BrowserStateSummary, PageInfo
+from browser_use.dom.serializer.delta import DOMDeltaTracker
+from browser_use.dom.views import (
+	DOMRect,
+	EnhancedDOMTreeNode,
+	EnhancedSnapshotNode,
+	NodeType,
+	SerializedDOMState,
+	SimplifiedNode,
+)
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm.messages import ContentPartTextParam, SystemMessage, UserMessage
+
+
+def _node(backend_node_id: int, name: str, node_type: NodeType = NodeType.ELEMENT_NODE, value: str = '', **attributes):
+	bounds = DOMRect(0, 0, 100, 20)
+	return EnhancedDOMTreeNode(
+		node_id=backend_node_id,
+		backend_node_id=backend_node_id,
+		node_type=node_type,
+		node_name=name,
+		node_value=value,
+		attributes=attributes,
+		is_scrollable=None,
+		is_visible=True,
+		absolute_position=bounds,
+		target_id='target-1',
+		frame_id=None,
+		session_id=None,
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=None,
+		parent_node=None,
+		children_nodes=None,
+		ax_node=None,
+		snapshot_node=EnhancedSnapshotNode(
+			is_clickable=None,
+			cursor_style=None,
+			bounds=bounds,
+			clientRects=None,
+			scrollRects=None,
+			computed_styles=None,
+			paint_order=None,
+			stacking_contexts=None,
+		),
+	)
+
+
+def _text(backend_node_id: int, value: str) -> SimplifiedNode:
+	return SimplifiedNode(original_node=_node(backend_node_id, '#text', NodeType.TEXT_NODE, value), children=[])
+
+
+def _button(backend_node_id: int, label: str, is_new: bool = False) -> SimplifiedNode:
+	node = _node(backend_node_id, 'button', **{'aria-label': label})
+	return SimplifiedNode(original_node=node, children=[_text(backend_node_id + 100, label)], is_interactive=True, is_new=is_new)
+
+
+def _dom(*children: SimplifiedNode) -> SerializedDOMState:
+	return SerializedDOMState(_root=SimplifiedNode(original_node=_node(1, 'body'), children=list(children)), selector_map={})
+
+
+def _update(tracker: DOMDeltaTracker, dom: SerializedDOMState, url: str = 'https://example.com'):
+	return tracker.update(url, dom.llm_representation_lines(), dom.llm_representation())
+
+
+class TestDOMDeltaTracker:
+	def test_lists_added_changed_and_removed_elements(self):
+		tracker = DOMDeltaTracker(max_change_ratio=10)  # tiny page, most of it changes
+		first = _update(tracker, _dom(_text(2, 'Welcome home'), _button(10, 'Save'), _button(11, 'Cancel')))
+		assert first.changes is None
+
+		second = _update(tracker, _dom(_text(2, 'Saved successfully'), _button(10, 'Saved'), _button(12, 'Undo', is_new=True)))
+		assert second.keyframe is first.keyframe
+		assert second.changes == '\n'.join(
+			[
+				'~ [10]<button aria-label=Saved />',
+				'\tSaved',
+				'+ [12]<button aria-label=Undo />',
+				'\tUndo',
+				'- [11]<button aria-label=Cancel />',
+				'+ Saved successfully',
+				'- Welcome home',
+			]
+		)
+
+	def test_unchanged_page_and_new_marker_give_no_changes(self):
+		tracker = DOMDeltaTracker()
+		_update(tracker, _dom(_button(10, 'Save', is_new=True)))
+		assert _update(tracker, _dom(_button(10, 'Save'))).changes == ''
+
+	def test_new_keyframe_after_navigation_interval_or_large_changes(self):
+		tracker = DOMDeltaTracker(keyframe_interval=3)
+		page = _dom(_button(10, 'Save'), _text(2, 'Some text on the page that stays the same between steps'))
+		_update(tracker, page)
+		assert _update(tracker, page).changes == ''
+		assert _update(tracker, page, url='https://example.com/other').changes is None
+
+		assert _update(tracker, page, url='https://example.com/other').changes == ''
+		assert _update(tracker, page, url='https://example.com/other').changes == ''
+		assert _update(tracker, page, url='https://example.com/other').changes is None  # third step since the keyframe
+
+		other_page = _dom(*(_button(20 + i, f'Result {i}') for i in range(5)))
+		assert _update(tracker, other_page, url='https://example.com/other').changes is None
+
+	def test_keyframe_holds_only_what_the_budgeted_or_truncated_text_shows(self):
+		page = _dom(*(_button(10 + i, f'Result {i}') for i in range(20)))
+		budgeted_text, omitted_lines = page.budgeted_llm_representation(80)
+		assert omitted_lines
+
+		tracker = DOMDeltaTracker(max_change_ratio=10)
+		keyframe = tracker.update('https://example.com', page.llm_representation_lines(), budgeted_text).keyframe
+		assert keyframe.elements and len(keyframe.elements) < 20
+		for block in keyframe.elements.values():
+			assert block.split('\n', 1)[0] in budgeted_text
+		# Elements that never made it into the snapshot are not reported as changed or removed
+		assert tracker.update('https://example.com', page.llm_representation_lines(), budgeted_text).changes == ''
+
+		truncated_text = page.llm_representation()[:100]
+		keyframe = DOMDeltaTracker().update('https://example.com', page.llm_representation_lines(), truncated_text).keyframe
+		assert 0 < len(keyframe.elements) < 20
+		assert list(keyframe.elements) == list(range(10, 10 + len(keyframe.elements)))
+		for block in keyframe.elements.values():
+			assert block.split('\n', 1)[0] in truncated_text
+
+
+class TestDeltaStateMessages:
+	def test_snapshot_leads_the_state_message_and_stays_byte_identical(self, tmp_path):
+		manager = MessageManager(
+			task='task',
+			system_message=SystemMessage(content='system', cache=True),
+			file_system=FileSystem(tmp_path),
+			state=MessageManagerState(),
+			use_thinking=False,
+			dom_state_format='delta',
+		)
+		assert manager.dom_delta_tracker is not None
+		manager.dom_delta_tracker.max_change_ratio = 10  # tiny page, most of it changes
+
+		def state_message(dom: SerializedDOMState) -> UserMessage:
+			browser_state = BrowserStateSummary(dom_state=dom, url='https://example.com', title='Example', tabs=[])
+			manager.create_state_messages(browser_state_summary=browser_state, use_vision=False)
+			message = manager.state.history.state_message
+			assert isinstance(message, UserMessage) and isinstance(message.content, list)
+			return message
+
+		first = state_message(_dom(_button(10, 'Save'), _button(11, 'Cancel')))
+		second = state_message(_dom(_button(10, 'Save'), _button(12, 'Undo')))
+
+		snapshot = first.content[0]
+		assert isinstance(snapshot, ContentPartTextParam) and snapshot.text.startswith('<page_snapshot>\n')
+		assert '[11]<button' in snapshot.text
+		assert second.content[0] == snapshot
+		assert 'The <page_snapshot> above shows the current page.' in first.text
+		assert '+ [12]<button aria-label=Undo />' in second.text
+		assert '- [11]<button aria-label=Cancel />' in second.text
+		assert [part.cache for part in second.content if isinstance(part, ContentPartTextParam)][:2] == [False, True]
+
+	def test_delta_state_keeps_scroll_hints(self, tmp_path):
+		manager = MessageManager(
+			task='task',
+			system_message=SystemMessage(content='system'),
+			file_system=FileSystem(tmp_path),
+			state=MessageManagerState(),
+			use_thinking=False,
+			dom_state_format='delta',
+		)
+		page_info = PageInfo(
+			viewport_width=1280,
+			viewport_height=800,
+			page_width=1280,
+			page_height=4000,
+			scroll_x=0,
+			scroll_y=1600,
+			pixels_above=1600,
+			pixels_below=1600,
+			pixels_left=0,
+			pixels_right=0,
+		)
+		browser_state = BrowserStateSummary(
+			dom_state=_dom(_button(10, 'Save')), url='https://example.com', title='Example', tabs=[], page_info=page_info
+		)
+		for _ in range(2):  # keyframe, then changes
+			manager.create_state_messages(browser_state_summary=browser_state, use_vision=False)
+			message = manager.state.history.state_message
+			assert message is not None
+			assert '... 2.0 pages above ...' in message.text
+
+	def test_tab_switch_on_the_same_url_takes_a_new_keyframe(self):
+		from browser_use import Agent
+		from tests.ci.conftest import create_mock_llm
+
+		agent = Agent(task='task', llm=create_mock_llm(), dom_state_format='delta')
+		tracker = agent._message_manager.dom_delta_tracker
+		assert tracker is not None
+		page = _dom(_button(10, 'Save'))
+
+		agent.browser_session.agent_focus_target_id = 'tab-1'
+		agent._reset_dom_delta_on_tab_switch()
+		assert _update(tracker, page).changes is None
+		agent._reset_dom_delta_on_tab_switch()
+		assert _update(tracker, page).changes == ''
+
+		# Same URL, but another tab: its elements must not be described against the first tab's keyframe
+		agent.browser_session.agent_focus_target_id = 'tab-2'
+		agent._reset_dom_delta_on_tab_switch()
+		assert _update(tracker, page).changes is None
@@ -0,0 +1,143 @@
+"""Tests for incremental DOM snapshots driven by CDP DOM mutation events."""
+
+from typing import Any
+
+from browser_use.dom.mutation_tracker import DOMMutationTracker
+
+SESSION_ID = 'session-1'
+TARGET_ID = 'target-1'
+
+
+def _element(node_id: int, name: str, children: list | None = None, attributes: list[str] | None = None) -> dict:
+	node = {
+		'nodeId': node_id,
+		'backendNodeId': node_id + 1000,
+		'nodeType': 1,
+		'nodeName': name,
+		'localName': name.lower(),
+		'nodeValue': '',
+		'childNodeCount': len(children or []),
+		'children': children or [],
+		'attributes': attributes or [],
+	}
+	for child in node['children']:
+		child['parentId'] = node_id
+	return node
+
+
+def _text(node_id: int, value: str) -> dict:
+	return {
+		'nodeId': node_id,
+		'backendNodeId': node_id + 1000,
+		'nodeType': 3,
+		'nodeName': '#text',
+		'localName': '',
+		'nodeValue': value,
+	}
+
+
+def _make_tracker(max_dirty_nodes: int = 500) -> tuple[DOMMutationTracker, dict]:
+	button = _element(4, 'BUTTON', [_text(5, 'Open')], ['id', 'menu-button'])
+	body = _element(3, 'BODY', [button])
+	html = _element(2, 'HTML', [body])
+	root = {**_element(1, '#document', [html]), 'nodeType': 9}
+	document: Any = {'root': root}
+
+	tracker = DOMMutationTracker(max_dirty_nodes=max_dirty_nodes)
+	tracker.reset(TARGET_ID, SESSION_ID, document, [{'nodeId': 'ax-4', 'ignored': False, 'backendDOMNodeId': 1004}])
+	return tracker, document
+
+
+class TestDOMMutationTracker:
+	def test_fresh_document_is_reusable(self):
+		tracker, _ = _make_tracker()
+		assert tracker.can_reuse(TARGET_ID, SESSION_ID)
+		assert not tracker.can_reuse('other-target', SESSION_ID)
+		assert not tracker.can_reuse(TARGET_ID, 'other-session')
+
+	def test_child_node_inserted_patches_document(self):
+		tracker, document = _make_tracker()
+		body = document['root']['children'][0]['children'][0]
+		old_children = body['children']
+
+		menu = _element(10, 'UL', [_element(11, 'LI', [_text(12, 'Item')])])
+		tracker.on_child_node_inserted({'parentNodeId': 3, 'previousNodeId': 4, 'node': menu}, SESSION_ID)
+
+		assert [child['nodeName'] for child in body['children']] == ['BUTTON', 'UL']
+		assert body['children'][1]['parentId'] == 3
+		# lists are replaced rather than mutated so in-flight builds keep a consistent view
+		assert len(old_children) == 1
+		dirty, removed = tracker.consume_dirty_nodes()
+		assert {1010, 1011, 1012, 1003} <= dirty
+		assert not removed
+		assert tracker.can_reuse(TARGET_ID, SESSION_ID)
+
+	def test_child_node_removed_tracks_removed_backend_ids(self):
+		tracker, document = _make_tracker()
+		tracker.on_child_node_removed({'parentNodeId': 3, 'nodeId': 4}, SESSION_ID)
+
+		body = document['root']['children'][0]['children'][0]
+		assert body['children'] == []
+		dirty, removed = tracker.consume_dirty_nodes()
+		assert removed == {1004, 1005}
+		assert 1003 in dirty
+
+		tracker.update_ax_nodes([], removed)
+		assert 1004 not in tracker.ax_nodes
+
+	def test_attribute_and_text_changes(self):
+		tracker, document = _make_tracker()
+		button = document['root']['children'][0]['children'][0]['children'][0]
+
+		tracker.on_attribute_modified({'nodeId': 4, 'name': 'aria-expanded', 'value': 'true'}, SESSION_ID)
+		tracker.on_attribute_modified({'nodeId': 4, 'name': 'id', 'value': 'menu'}, SESSION_ID)
+		assert button['attributes'] == ['id', 'menu', 'aria-expanded', 'true']
+
+		tracker.on_attribute_removed({'nodeId': 4, 'name': 'id'}, SESSION_ID)
+		assert button['attributes'] == ['aria-expanded', 'true']
+
+		tracker.on_character_data_modified({'nodeId': 5, 'characterData': 'Close'}, SESSION_ID)
+		assert button['children'][0]['nodeValue'] == 'Close'
+
+		dirty, _ = tracker.consume_dirty_nodes()
+		assert dirty == {1004, 1005}
+
+	def test_events_from_other_sessions_are_ignored(self):
+		tracker, document = _make_tracker()
+		tracker.on_attribute_modified({'nodeId': 4, 'name': 'id', 'value': 'changed'}, 'other-session')
+		assert tracker.dirty_count == 0
+
+	def test_unpatchable_mutations_invalidate_cache(self):
+		tracker, _ = _make_tracker()
+		tracker.on_child_node_inserted({'parentNodeId': 999, 'previousNodeId': 0, 'node': _text(20, 'x')}, SESSION_ID)
+		assert not tracker.can_reuse(TARGET_ID, SESSION_ID)
+
+		tracker, _ = _make_tracker()
+		shallow = _element(30, 'DIV')
+		shallow['childNodeCount'] = 3  # children were not pushed with the event
+		tracker.on_child_node_inserted({'parentNodeId': 3, 'previousNodeId': 0, 'node': shallow}, SESSION_ID)
+		assert not tracker.can_reuse(TARGET_ID, SESSION_ID)
+
+		tracker, _ = _make_tracker()
+		tracker.on_document_updated({}, SESSION_ID)
+		assert tracker.document is None
+		assert not tracker.can_reuse(TARGET_ID, SESSION_ID)
+
+	def test_dirty_threshold_forces_full_rebuild(self):
+		tracker, _ = _make_tracker(max_dirty_nodes=2)
+		tracker.on_attribute_modified({'nodeId': 4, 'name': 'a', 'value': '1'}, SESSION_ID)
+		tracker.on_attribute_modified({'nodeId': 3, 'name': 'a', 'value': '1'}, SESSION_ID)
+		assert tracker.can_reuse(TARGET_ID, SESSION_ID)
+		tracker.on_attribute_modified({'nodeId': 2, 'name': 'a', 'value': '1'}, SESSION_ID)
+		assert not tracker.can_reuse(TARGET_ID, SESSION_ID)
+
+	def test_mutations_during_full_rebuild_are_not_trusted(self):
+		tracker, document = _make_tracker()
+		tracker.invalidate('navigation')
+
+		tracker.begin_full_rebuild(SESSION_ID)
+		tracker.on_attribute_modified({'nodeId': 4, 'name': 'id', 'value': 'changed'}, SESSION_ID)
+		tracker.reset(TARGET_ID, SESSION_ID, document, [])
+
+		assert tracker.document is document
+		assert not tracker.can_reuse(TARGET_ID, SESSION_ID)
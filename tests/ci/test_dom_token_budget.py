@@ -0,0 +1,167 @@
+"""Tests for token-budgeted DOM serialization (Agent(dom_token_budget=...))."""
+
+from browser_use.agent.prompts import AgentMessagePrompt
+from browser_use.browser.views import BrowserStateSummary
+from browser_use.dom.serializer.serializer import DOMTreeSerializer
+from browser_use.dom.serializer.token_budget import TokenBudgetedSerializer, estimate_tokens
+from browser_use.dom.views import (
+	DEFAULT_INCLUDE_ATTRIBUTES,
+	DOMRect,
+	EnhancedAXNode,
+	EnhancedAXProperty,
+	EnhancedDOMTreeNode,
+	EnhancedSnapshotNode,
+	NodeType,
+	SerializedDOMState,
+	SimplifiedNode,
+)
+from browser_use.filesystem.file_system import FileSystem
+
+VIEWPORT = (0.0, 800.0)
+
+
+def _node(
+	backend_node_id: int,
+	name: str,
+	y: float,
+	node_type: NodeType = NodeType.ELEMENT_NODE,
+	value: str = '',
+	attributes: dict[str, str] | None = None,
+	focused: bool = False,
+) -> EnhancedDOMTreeNode:
+	bounds = DOMRect(0, y, 200, 30)
+	ax_node = None
+	if focused:
+		ax_node = EnhancedAXNode(
+			ax_node_id=str(backend_node_id),
+			ignored=False,
+			role='textbox',
+			name=None,
+			description=None,
+			properties=[EnhancedAXProperty(name='focused', value=True)],
+			child_ids=None,
+		)
+	return EnhancedDOMTreeNode(
+		node_id=backend_node_id,
+		backend_node_id=backend_node_id,
+		node_type=node_type,
+		node_name=name,
+		node_value=value,
+		attributes=attributes or {},
+		is_scrollable=None,
+		is_visible=True,
+		absolute_position=bounds,
+		target_id='target-1',
+		frame_id=None,
+		session_id=None,
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=None,
+		parent_node=None,
+		children_nodes=None,
+		ax_node=ax_node,
+		snapshot_node=EnhancedSnapshotNode(
+			is_clickable=None,
+			cursor_style=None,
+			bounds=bounds,
+			clientRects=None,
+			scrollRects=None,
+			computed_styles=None,
+			paint_order=None,
+			stacking_contexts=None,
+		),
+	)
+
+
+def _button(backend_node_id: int, y: float, label: str, is_new: bool = False, focused: bool = False) -> SimplifiedNode:
+	text = SimplifiedNode(original_node=_node(backend_node_id + 10000, '#text', y, NodeType.TEXT_NODE, label), children=[])
+	node = _node(backend_node_id, 'button', y, attributes={'aria-label': label}, focused=focused)
+	return SimplifiedNode(original_node=node, children=[text], is_interactive=True, is_new=is_new)
+
+
+def _text(backend_node_id: int, y: float, value: str) -> SimplifiedNode:
+	return SimplifiedNode(original_node=_node(backend_node_id, '#text', y, NodeType.TEXT_NODE, value), children=[])
+
+
+def _page(**button_kwargs) -> SimplifiedNode:
+	"""Long page: a paragraph and a button per screen, 10 screens"""
+	children = []
+	for i in range(10):
+		y = i * 800 + 100
+		children.append(_text(1000 + i, y, f'Paragraph {i} ' + 'lorem ipsum dolor sit amet ' * 8))
+		children.append(_button(i + 1, y + 50, f'Action {i}', **button_kwargs.get(str(i), {})))
+	return SimplifiedNode(original_node=_node(999, 'body', 0), children=children)
+
+
+def _serialize(root: SimplifiedNode, budget: int, viewport=VIEWPORT) -> tuple[str, int]:
+	return TokenBudgetedSerializer(budget, viewport=viewport).serialize(root, DEFAULT_INCLUDE_ATTRIBUTES)
+
+
+class TestEstimateTokens:
+	def test_estimate_grows_with_text_and_counts_symbols(self):
+		assert estimate_tokens('') == 0
+		assert estimate_tokens('hello world') == 2
+		assert estimate_tokens('[123]<button />') == 5
+		assert estimate_tokens('word ' * 100) > estimate_tokens('word ' * 10)
+
+
+class TestTokenBudgetedSerializer:
+	def test_fitting_tree_is_serialized_unchanged(self):
+		root = _page()
+		full = DOMTreeSerializer.serialize_tree(root, DEFAULT_INCLUDE_ATTRIBUTES)
+		assert _serialize(root, 100_000) == (full, 0)
+
+	def test_output_stays_within_budget_and_keeps_page_order(self):
+		root = _page()
+		full = DOMTreeSerializer.serialize_tree(root, DEFAULT_INCLUDE_ATTRIBUTES)
+		budget = estimate_tokens(full) // 3
+
+		text, omitted = _serialize(root, budget)
+		assert omitted > 0
+		assert sum(estimate_tokens(line) + 1 for line in text.split('\n')) <= budget
+		kept = [line for line in text.split('\n') if line.strip() != '...']
+		full_lines = full.split('\n')
+		assert [full_lines.index(line) for line in kept] == sorted(full_lines.index(line) for line in kept)
+		assert '\n...\n' in f'\n{text}\n'
+
+	def test_interactive_elements_and_viewport_win_over_offscreen_text(self):
+		root = _page()
+		full = DOMTreeSerializer.serialize_tree(root, DEFAULT_INCLUDE_ATTRIBUTES)
+		text, _ = _serialize(root, estimate_tokens(full) // 2)
+
+		# Every button is kept, the paragraph on screen is kept, paragraphs further down go first
+		for i in range(10):
+			assert f'[{i + 1}]<button' in text
+		assert 'Paragraph 0' in text
+		assert 'Paragraph 9' not in text
+
+	def test_new_and_focused_elements_are_preferred(self):
+		root = _page(**{'7': {'is_new': True}, '4': {'focused': True}})
+		# Scrolled past the end, nothing is in the viewport: with room for two buttons, the new one and the focused one win
+		text, _ = _serialize(root, 40, viewport=(100_000.0, 800.0))
+		assert '*[8]<button' in text
+		assert '[5]<button' in text
+		assert '[1]<button' not in text
+
+	def test_children_are_kept_with_their_enclosing_element(self):
+		root = _page()
+		text, _ = _serialize(root, 80)
+		lines = text.split('\n')
+		for i, line in enumerate(lines):
+			if line.startswith('\tAction'):
+				assert lines[i - 1].startswith('[')
+
+	def test_dom_state_budgeted_representation(self):
+		state = SerializedDOMState(_root=_page(), selector_map={})
+		text, omitted = state.budgeted_llm_representation(200, viewport=VIEWPORT)
+		assert omitted > 0 and '[1]<button' in text
+		assert SerializedDOMState(_root=None, selector_map={}).budgeted_llm_representation(10)[1] == 0
+
+	def test_prompt_notes_left_out_lines(self, tmp_path):
+		browser_state = BrowserStateSummary(
+			dom_state=SerializedDOMState(_root=_page(), selector_map={}), url='https://example.com', title='Example', tabs=[]
+		)
+		prompt = AgentMessagePrompt(browser_state_summary=browser_state, file_system=FileSystem(tmp_path), dom_token_budget=200)
+		text = prompt.get_user_message(use_vision=False).text
+		assert 'less relevant lines left out' in text
+		assert 'Paragraph 9' not in text
@@ -0,0 +1,81 @@
+"""Tests for memoized element hashing on EnhancedDOMTreeNode."""
+
+import hashlib
+
+from browser_use.dom.views import EnhancedDOMTreeNode, NodeType, hash_selector_map
+
+
+def _node(
+	name: str,
+	parent: EnhancedDOMTreeNode | None = None,
+	attributes: dict[str, str] | None = None,
+	node_type: NodeType = NodeType.ELEMENT_NODE,
+) -> EnhancedDOMTreeNode:
+	node = EnhancedDOMTreeNode(
+		node_id=0,
+		backend_node_id=0,
+		node_type=node_type,
+		node_name=name,
+		node_value='',
+		attributes=attributes or {},
+		is_scrollable=None,
+		is_visible=True,
+		absolute_position=None,
+		target_id='target-1',
+		frame_id=None,
+		session_id=None,
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=None,
+		parent_node=parent,
+		children_nodes=None,
+		ax_node=None,
+		snapshot_node=None,
+	)
+	if parent is not None:
+		parent.children_nodes = [*(parent.children_nodes or []), node]
+	return node
+
+
+def _reference_hash(path: str, attributes: str = '') -> int:
+	return int(hashlib.sha256(f'{path}|{attributes}'.encode()).hexdigest()[:16], 16)
+
+
+class TestElementHashing:
+	def test_hashes_match_uncached_formula(self):
+		document = _node('#document', node_type=NodeType.DOCUMENT_NODE)
+		html = _node('HTML', document)
+		body = _node('BODY', html)
+		button = _node('BUTTON', body, {'id': 'submit', 'class': 'btn focus'})
+
+		assert button.parent_branch_path == ('html', 'body', 'button')
+		assert button._get_parent_branch_path() == ['html', 'body', 'button']
+		assert hash(button) == _reference_hash('html/body/button', 'class=btn focusid=submit')
+		assert button.compute_stable_hash() == _reference_hash('html/body/button', 'class=btnid=submit')
+		assert button.parent_branch_hash() == int(hashlib.sha256(b'html/body/button').hexdigest()[:16], 16)
+		# ancestors were resolved along the way
+		assert body._parent_branch_path == ('html', 'body')
+
+	def test_invalidation_after_reparenting(self):
+		html = _node('HTML')
+		body = _node('BODY', html)
+		link = _node('A', body)
+		before = hash(link)
+
+		# e.g. a shadow root or iframe document attached to its host after construction
+		host = _node('DIV')
+		html.parent_node = host
+		assert hash(link) == before  # memoized until invalidated
+
+		html.invalidate_hash_cache()
+		assert link.parent_branch_path == ('div', 'html', 'body', 'a')
+		assert hash(link) != before
+
+	def test_hash_selector_map(self):
+		html = _node('HTML')
+		body = _node('BODY', html)
+		selector_map = {1: _node('A', body, {'href': '/a'}), 2: _node('INPUT', body, {'name': 'q'})}
+
+		assert hash_selector_map(selector_map) == {1: hash(selector_map[1]), 2: hash(selector_map[2])}
+		assert hash_selector_map(selector_map, 'stable') == {i: n.compute_stable_hash() for i, n in selector_map.items()}
+		assert list(hash_selector_map(selector_map, 'parent_branch')) == [1, 2]
@@ -0,0 +1,94 @@
+"""Tests for the columnar snapshot lookup built from DOMSnapshot.captureSnapshot results."""
+
+from typing import Any
+
+from browser_use.dom.enhanced_snapshot import REQUIRED_COMPUTED_STYLES, build_snapshot_lookup
+from browser_use.dom.views import DOMRect
+
+
+def _styles(strings: list[str], **values: str) -> list[int]:
+	indices = []
+	for name in REQUIRED_COMPUTED_STYLES:
+		value = values.get(name, 'auto')
+		if value not in strings:
+			strings.append(value)
+		indices.append(strings.index(value))
+	return indices
+
+
+def _make_snapshot() -> Any:
+	strings = ['https://example.com/', 'https://example.com/frame']
+	pointer = _styles(strings, cursor='pointer', display='block')
+	default = _styles(strings, display='inline')
+	return {
+		'strings': strings,
+		'documents': [
+			{
+				'documentURL': 0,
+				'nodes': {'backendNodeId': [10, 11, 12, 13], 'isClickable': {'index': [1]}},
+				'layout': {
+					'nodeIndex': [1, 2, 1],  # duplicate entry for node 1, the first one wins
+					'bounds': [[20, 40, 200, 100], [0, 0, 2, 2], [999, 999, 999, 999]],
+					'styles': [pointer, default, default],
+					'paintOrders': [3, 4, 5],
+					'clientRects': [[1, 2, 3, 4], [], []],
+					'scrollRects': [[5, 6, 7, 8], [], []],
+					'text': [],
+					'stackingContexts': {'index': [7]},
+				},
+				'textBoxes': {},
+			},
+			{
+				'documentURL': 1,
+				'nodes': {'backendNodeId': [13, 20]},
+				'layout': {'nodeIndex': [1], 'bounds': [[2, 2, 4, 4]], 'styles': [default], 'text': []},
+				'textBoxes': {},
+			},
+		],
+	}
+
+
+class TestSnapshotLookup:
+	def test_builds_nodes_from_columns(self):
+		lookup = build_snapshot_lookup(_make_snapshot(), device_pixel_ratio=2.0)
+
+		assert len(lookup) == 5
+		assert set(lookup) == {10, 11, 12, 13, 20}
+
+		node = lookup[11]
+		assert node.is_clickable is True
+		assert node.cursor_style == 'pointer'
+		assert node.bounds == DOMRect(x=10, y=20, width=100, height=50)  # scaled to CSS pixels
+		assert node.clientRects == DOMRect(x=1, y=2, width=3, height=4)
+		assert node.scrollRects == DOMRect(x=5, y=6, width=7, height=8)
+		assert node.paint_order == 3
+		assert node.stacking_contexts == 7
+		assert node.computed_styles is not None and node.computed_styles['display'] == 'block'
+
+		unpainted = lookup[10]
+		assert unpainted.is_clickable is False
+		assert unpainted.bounds is None
+		assert unpainted.computed_styles is None
+		assert unpainted.paint_order is None
+
+	def test_rare_data_missing_and_duplicate_backend_ids(self):
+		lookup = build_snapshot_lookup(_make_snapshot())
+
+		# node 13 appears in both documents, the later document wins
+		assert lookup[13].is_clickable is None
+		assert lookup[20].bounds == DOMRect(x=2, y=2, width=4, height=4)
+		assert lookup.get(999) is None
+		assert 999 not in lookup
+
+	def test_views_are_lazy_memoized_and_share_styles(self):
+		lookup = build_snapshot_lookup(_make_snapshot())
+
+		assert lookup[12] is lookup[12]
+		# nodes with identical computed styles share one interned dict
+		assert lookup[12].computed_styles is lookup[20].computed_styles
+		assert lookup.count_with_bounds() == 3
+
+	def test_empty_snapshot(self):
+		lookup = build_snapshot_lookup({'strings': [], 'documents': []})
+		assert len(lookup) == 0
+		assert lookup.get(1) is None
@@ -0,0 +1,80 @@
+"""Tests for the HTTP connection pool shared by the chat model providers."""
+
+import asyncio
+
+import httpcore
+import httpx
+
+from browser_use.llm.anthropic.chat import ChatAnthropic
+from browser_use.llm.deepseek.chat import ChatDeepSeek
+from browser_use.llm.groq.chat import ChatGroq
+from browser_use.llm.http_pool import close_shared_http_clients, configure_http_pool, get_shared_http_client
+from browser_use.llm.openai.chat import ChatOpenAI
+
+
+class TestSharedHttpClient:
+	async def test_providers_share_one_client_per_loop(self):
+		shared = get_shared_http_client()
+		assert get_shared_http_client() is shared
+
+		assert ChatOpenAI(model='gpt-4.1-mini', api_key='test').get_client()._client is shared
+		assert ChatAnthropic(model='claude-sonnet-4-0', api_key='test').get_client()._client is shared
+		assert ChatGroq(model='openai/gpt-oss-20b', api_key='test').get_client()._client is shared
+		assert ChatDeepSeek(api_key='test')._client()._client is shared
+		await close_shared_http_clients()
+
+	async def test_given_http_client_is_used_instead(self):
+		own = httpx.AsyncClient()
+		assert ChatOpenAI(model='gpt-4.1-mini', api_key='test', http_client=own).get_client()._client is own
+		assert ChatDeepSeek(api_key='test', client_params={'http_client': own})._client()._client is own
+		await own.aclose()
+
+	async def test_sdk_timeout_is_kept(self):
+		client = ChatOpenAI(model='gpt-4.1-mini', api_key='test', timeout=12.0).get_client()
+		assert client.timeout == 12.0
+		await close_shared_http_clients()
+
+	async def test_closed_client_is_replaced(self):
+		shared = get_shared_http_client()
+		await close_shared_http_clients()
+		assert shared.is_closed
+		replacement = get_shared_http_client()
+		assert replacement is not shared and not replacement.is_closed
+		assert get_shared_http_client(retries=3) is not replacement
+		await close_shared_http_clients()
+
+	def test_each_event_loop_gets_its_own_client(self):
+		async def get_and_close() -> httpx.AsyncClient:
+			client = get_shared_http_client()
+			assert get_shared_http_client() is client
+			await close_shared_http_clients()
+			return client
+
+		assert asyncio.run(get_and_close()) is not asyncio.run(get_and_close())
+
+	async def test_configured_limits_apply_to_new_pools(self):
+		configure_http_pool(max_connections=5, max_keepalive_connections=2, keepalive_expiry=10, http2=False)
+		try:
+			await close_shared_http_clients()
+			pool = get_shared_http_client()._transport._pool  # type: ignore[attr-defined]
+			assert pool._max_connections == 5 and pool._max_keepalive_connections == 2
+			assert pool._keepalive_expiry == 10 and not pool._http2
+		finally:
+			configure_http_pool()
+			await close_shared_http_clients()
+
+	async def test_environment_proxies_are_honoured(self, monkeypatch):
+		monkeypatch.setenv('HTTPS_PROXY', 'http://proxy.internal:3128')
+		monkeypatch.setenv('NO_PROXY', 'localhost')
+		await close_shared_http_clients()
+		try:
+			for retries in (0, 3):
+				client = get_shared_http_client(retries=retries)
+				proxied = client._transport_for_url(httpx.URL('https://api.openai.com/v1'))  # type: ignore[attr-defined]
+				assert isinstance(proxied._pool, httpcore.AsyncHTTPProxy)  # type: ignore[attr-defined]
+				direct = client._transport_for_url(httpx.URL('https://localhost:8000/'))  # type: ignore[attr-defined]
+				assert not isinstance(direct._pool, httpcore.AsyncHTTPProxy)  # type: ignore[attr-defined]
+			retrying = get_shared_http_client(retries=3)._transport_for_url(httpx.URL('http://example.com'))  # type: ignore[attr-defined]
+			assert retrying._pool._retries == 3  # type: ignore[attr-defined]
+		finally:
+			await close_shared_http_clients()
@@ -0,0 +1,251 @@
+"""Tests for the MCP server serving each client its own browser session from a bounded pool, over stdio and HTTP."""
+
+import asyncio
+import gc
+import importlib
+import logging
+import os
+import socket
+from collections import Counter
+from contextlib import asynccontextmanager
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import anyio
+import pytest
+import uvicorn
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.shared.memory import create_client_server_memory_streams
+
+from browser_use.browser import BrowserPool, BrowserSession
+from browser_use.browser.pool import PooledBrowser
+
+CLIENTS = 30
+CALLS_PER_CLIENT = 3
+
+
+@pytest.fixture(scope='module')
+def server_module():
+	"""Import the MCP server, and undo the stderr-only, CRITICAL level logging it sets up for stdio mode afterwards"""
+	environ = dict(os.environ)
+	root_handlers, root_level = logging.root.handlers[:], logging.root.level
+	loggers = {
+		name: (logger.handlers[:], logger.level, logger.propagate)
+		for name, logger in logging.root.manager.loggerDict.items()
+		if isinstance(logger, logging.Logger)
+	}
+
+	yield importlib.import_module('browser_use.mcp.server')
+
+	logging.disable(logging.NOTSET)
+	logging.root.handlers, logging.root.level = root_handlers, root_level
+	for name, (handlers, level, propagate) in loggers.items():
+		logger = logging.getLogger(name)
+		logger.handlers, logger.level, logger.propagate = handlers, level, propagate
+	os.environ.clear()
+	os.environ.update(environ)
+
+
+class FakeBrowserPool(BrowserPool):
+	"""Pool of fake browser processes"""
+
+	def __init__(self, *args, **kwargs):
+		super().__init__(*args, **kwargs)
+		self.launched: list[PooledBrowser] = []
+
+	async def _launch(self) -> PooledBrowser:
+		port = 9300 + len(self.launched)
+		browser = PooledBrowser(process=MagicMock(), cdp_url=f'http://127.0.0.1:{port}/', user_data_dir=Path(f'/tmp/pool-{port}'))
+		self.launched.append(browser)
+		return browser
+
+	async def _reset(self, browser: PooledBrowser) -> None:
+		pass
+
+	async def _shutdown(self, browser: PooledBrowser) -> None:
+		pass
+
+
+@pytest.fixture
+def make_server(server_module, tmp_path):
+	class FakeBrowserUseServer(server_module.BrowserUseServer):
+		"""Server whose browsers come from a FakeBrowserPool and whose browser_navigate takes nav_delay seconds"""
+
+		def __init__(self, *args, nav_delay: float = 0.05, **kwargs):
+			super().__init__(*args, **kwargs)
+			# No persistent profile configured, so every client gets a pooled browser
+			self.config = {'browser_profile': {'file_system_path': str(tmp_path), 'user_data_dir': None}, 'llm': {}}
+			self._browser_pool = FakeBrowserPool(size=self.warm_browsers)
+			self.nav_delay = nav_delay
+			self.in_flight: Counter[str] = Counter()
+			self.max_in_flight = 0
+			self.max_in_flight_per_session = 0
+
+		async def _acquire_pooled_browser_session(self, profile):
+			assert self._browser_pool is not None
+			return await self._browser_pool.acquire()  # fake browsers have no CDP endpoint to start a session on
+
+		async def _start_browser_session(self, profile):
+			return BrowserSession(browser_profile=profile)  # not started, there is no browser to launch
+
+		async def _navigate(self, url: str, new_tab: bool = False) -> str:
+			browser_session = self.browser_session
+			assert browser_session is not None
+			self.in_flight[browser_session.id] += 1
+			self.max_in_flight = max(self.max_in_flight, sum(self.in_flight.values()))
+			self.max_in_flight_per_session = max(self.max_in_flight_per_session, self.in_flight[browser_session.id])
+			try:
+				await asyncio.sleep(self.nav_delay)
+			finally:
+				self.in_flight[browser_session.id] -= 1
+			return f'{browser_session.id} {url}'
+
+	return FakeBrowserUseServer
+
+
+@asynccontextmanager
+async def stdio_client(server):
+	"""Client session talking to the server like over stdio, with in-memory streams in place of the pipes"""
+	async with create_client_server_memory_streams() as (client_streams, server_streams):
+		async with anyio.create_task_group() as tg:
+			tg.start_soon(server.server.run, *server_streams, server._initialization_options())
+			async with ClientSession(*client_streams) as session:
+				await session.initialize()
+				yield session
+			tg.cancel_scope.cancel()
+
+
+async def navigate(session: ClientSession, url: str) -> tuple[str, str]:
+	"""Call browser_navigate, returning the browser session id that served it and the url"""
+	result = await session.call_tool('browser_navigate', {'url': url})
+	browser_session_id, served_url = result.content[0].text.split(' ')  # type: ignore[union-attr]
+	return browser_session_id, served_url
+
+
+class TestMCPServerSessions:
+	async def test_stdio_clients_get_their_own_browser_and_run_concurrently(self, make_server):
+		server = make_server(max_sessions=CLIENTS)
+
+		async def client(index: int) -> list[tuple[str, str]]:
+			async with stdio_client(server) as session:
+				# A client's own calls are sent at once but share its browser, so they run one at a time
+				urls = [f'https://example.com/{index}/{call}' for call in range(CALLS_PER_CLIENT)]
+				return await asyncio.gather(*(navigate(session, url) for url in urls))
+
+		results = await asyncio.gather(*(client(index) for index in range(CLIENTS)))
+
+		browser_session_ids = []
+		for index, calls in enumerate(results):
+			assert [url for _, url in calls] == [f'https://example.com/{index}/{call}' for call in range(CALLS_PER_CLIENT)]
+			assert len({browser_session_id for browser_session_id, _ in calls}) == 1
+			browser_session_ids.append(calls[0][0])
+		assert len(set(browser_session_ids)) == CLIENTS
+		assert len(server.clients) == CLIENTS and len(server.active_sessions) == CLIENTS
+
+		assert server.max_in_flight_per_session == 1
+		assert server.max_in_flight > CLIENTS // 2  # different clients' calls overlapped
+
+		await server._shutdown()
+		assert not server.active_sessions and server._open_browsers == 0
+
+	async def test_full_pool_takes_the_browser_of_the_least_recently_active_client(self, make_server):
+		server = make_server(max_sessions=2)
+		async with stdio_client(server) as first, stdio_client(server) as second, stdio_client(server) as third:
+			first_browser, _ = await navigate(first, 'https://example.com/1')
+			second_browser, _ = await navigate(second, 'https://example.com/2')
+			third_browser, _ = await navigate(third, 'https://example.com/3')
+
+			assert first_browser not in server.active_sessions
+			assert set(server.active_sessions) == {second_browser, third_browser}
+			assert server._browser_pool is not None and server._browser_pool.stats.hits >= 1  # the released browser is reused
+
+			# The first client gets a browser again, now taken from the second
+			first_browser_again, _ = await navigate(first, 'https://example.com/1')
+			assert set(server.active_sessions) == {third_browser, first_browser_again}
+			assert server._open_browsers == 2
+		await server._shutdown()
+
+	async def test_client_waits_for_a_busy_pool(self, make_server):
+		server = make_server(max_sessions=1, nav_delay=0.3)
+		async with stdio_client(server) as first, stdio_client(server) as second:
+			first_call = asyncio.create_task(navigate(first, 'https://example.com/1'))
+			await asyncio.sleep(0.1)  # the first client's call holds the only browser
+			second_browser, _ = await navigate(second, 'https://example.com/2')
+
+			assert first_call.done()
+			assert second_browser != (await first_call)[0]
+			assert list(server.active_sessions) == [second_browser]
+		await server._shutdown()
+
+	async def test_cleanup_releases_idle_and_disconnected_clients(self, make_server):
+		server = make_server()
+		async with stdio_client(server) as session:
+			await navigate(session, 'https://example.com/')
+		async with stdio_client(server) as session:
+			await navigate(session, 'https://example.com/')
+			gc.collect()  # drop the first client's closed MCP session
+
+			await server._cleanup_expired_sessions()
+			assert len(server.clients) == 1 and len(server.active_sessions) == 1
+
+			server.session_timeout_minutes = 0
+			await server._cleanup_expired_sessions()
+			assert not server.active_sessions and server._open_browsers == 0
+			assert len(server.clients) == 1  # still connected, gets a browser again on its next call
+
+			await navigate(session, 'https://example.com/')
+			assert len(server.active_sessions) == 1
+		await server._shutdown()
+
+	async def test_one_client_at_a_time_gets_the_persistent_default_profile(self, make_server, server_module):
+		server = make_server(max_sessions=3)
+		del server.config['browser_profile']['user_data_dir']
+		async with stdio_client(server) as first, stdio_client(server) as second:
+			first_browser, _ = await navigate(first, 'https://example.com/1')
+			second_browser, _ = await navigate(second, 'https://example.com/2')
+
+			def user_data_dir(browser_session_id: str) -> str:
+				return str(server.active_sessions[browser_session_id]['session'].browser_profile.user_data_dir)
+
+			default_profile = str(await anyio.Path(server_module.DEFAULT_USER_DATA_DIR).expanduser())
+			assert user_data_dir(first_browser) == default_profile
+			assert user_data_dir(second_browser) != default_profile  # pooled, on a profile of its own
+
+			# Once the first client's browser is closed, the next client to start a browser gets the default profile
+			await first.call_tool('browser_close', {})
+			server.session_timeout_minutes = 0
+			await server._cleanup_expired_sessions()
+			third_browser, _ = await navigate(second, 'https://example.com/3')
+			assert user_data_dir(third_browser) == default_profile
+		await server._shutdown()
+
+	async def test_http_clients_get_their_own_browser_and_run_concurrently(self, make_server):
+		server = make_server(max_sessions=CLIENTS)
+		# Listening before the server task starts, so clients can connect right away
+		listener = socket.create_server(('127.0.0.1', 0))
+		port = listener.getsockname()[1]
+		http_server = uvicorn.Server(uvicorn.Config(server.http_app(), log_level='warning'))
+		serving = asyncio.create_task(http_server.serve(sockets=[listener]))
+
+		connected = asyncio.Barrier(CLIENTS)
+
+		async def client(index: int) -> list[tuple[str, str]]:
+			async with streamablehttp_client(f'http://127.0.0.1:{port}/mcp') as (read_stream, write_stream, _):
+				async with ClientSession(read_stream, write_stream) as session:
+					await session.initialize()
+					await connected.wait()
+					return [await navigate(session, f'https://example.com/{index}/{call}') for call in range(CALLS_PER_CLIENT)]
+
+		try:
+			results = await asyncio.gather(*(client(index) for index in range(CLIENTS)))
+		finally:
+			http_server.should_exit = True
+			await serving
+			listener.close()
+
+		for calls in results:
+			assert len({browser_session_id for browser_session_id, _ in calls}) == 1
+		assert len({calls[0][0] for calls in results}) == CLIENTS
+		assert server.max_in_flight > CLIENTS // 2
+		assert not server.active_sessions  # shutting the app down closed every client's browser
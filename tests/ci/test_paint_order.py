@@ -0,0 +1,52 @@
+"""Tests for the rectangle unions used by the paint order filter."""
+
+import random
+
+from browser_use.dom.serializer.paint_order import Rect, RectUnionGrid, RectUnionPure
+
+
+def _random_rects(count: int, seed: int, max_coord: float = 3000) -> list[Rect]:
+	rng = random.Random(seed)
+	rects = []
+	for _ in range(count):
+		x, y = rng.uniform(0, max_coord), rng.uniform(0, max_coord)
+		rects.append(Rect(x, y, x + rng.choice([0, rng.uniform(1, 600)]), y + rng.uniform(1, 400)))
+	return rects
+
+
+class TestRectUnionGrid:
+	def test_matches_pure_union(self):
+		for seed in range(5):
+			pure, grid = RectUnionPure(), RectUnionGrid(cell_size=128)
+			for rect in _random_rects(300, seed):
+				assert grid.contains(rect) == pure.contains(rect)
+				assert grid.add(rect) == pure.add(rect)
+
+			# same covered region, possibly split into different disjoint rectangles
+			assert abs(sum(r.area() for r in grid._rects) - sum(r.area() for r in pure._rects)) < 1e-3
+			for probe in _random_rects(300, seed + 100):
+				assert grid.contains(probe) == pure.contains(probe)
+
+	def test_stored_rects_are_disjoint(self):
+		grid = RectUnionGrid(cell_size=64)
+		for rect in _random_rects(200, seed=7):
+			grid.add(rect)
+		rects = [r for r in grid._rects if r.area() > 0]  # lines and points are stored as-is
+		for i, a in enumerate(rects):
+			for b in rects[i + 1 :]:
+				assert not a.intersects(b)
+
+	def test_large_and_unbounded_rects(self):
+		grid = RectUnionGrid(cell_size=10)
+		assert not grid.contains(Rect(0, 0, 5, 5))
+		assert grid.add(Rect(-1e9, -1e9, 1e9, 1e9))  # too large for the grid
+		assert grid.contains(Rect(0, 0, 5, 5))
+		assert grid.contains(Rect(100, 100, 100, 100))
+		assert not grid.add(Rect(3, 3, 4, 4))
+
+	def test_covered_by_several_rects(self):
+		grid = RectUnionGrid(cell_size=50)
+		grid.add(Rect(0, 0, 100, 100))
+		grid.add(Rect(100, 0, 200, 100))
+		assert grid.contains(Rect(50, 10, 150, 90))
+		assert not grid.contains(Rect(150, 50, 250, 90))
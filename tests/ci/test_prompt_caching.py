@@ -0,0 +1,142 @@
+"""Tests for the stable prompt prefix, per-provider cache breakpoints and per-step prompt cache reporting."""
+
+from browser_use.agent.message_manager.service import MessageManager
+from browser_use.agent.message_manager.views import HistoryItem
+from browser_use.agent.views import MessageManagerState
+from browser_use.browser.views import BrowserStateSummary
+from browser_use.dom.views import SerializedDOMState
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm.anthropic.serializer import AnthropicMessageSerializer
+from browser_use.llm.aws.chat_bedrock import ChatAWSBedrock
+from browser_use.llm.aws.serializer import CACHE_POINT, AWSBedrockMessageSerializer
+from browser_use.llm.messages import ContentPartTextParam, SystemMessage, UserMessage
+from browser_use.llm.views import ChatInvokeUsage
+from browser_use.tokens.service import TokenCost
+
+
+def _manager(tmp_path, max_history_items: int | None = None, steps: int = 3) -> MessageManager:
+	manager = MessageManager(
+		task='task',
+		system_message=SystemMessage(content='system', cache=True),
+		file_system=FileSystem(tmp_path),
+		state=MessageManagerState(),
+		use_thinking=False,
+		max_history_items=max_history_items,
+	)
+	for step in range(1, steps + 1):
+		manager.state.agent_history_items.append(HistoryItem(step_number=step, memory=f'memory {step}', next_goal='go'))
+	return manager
+
+
+def _state_message(manager: MessageManager) -> UserMessage:
+	browser_state = BrowserStateSummary(
+		dom_state=SerializedDOMState(_root=None, selector_map={}), url='https://example.com', title='Example', tabs=[]
+	)
+	manager.create_state_messages(browser_state_summary=browser_state, use_vision=False)
+	message = manager.state.history.state_message
+	assert isinstance(message, UserMessage)
+	return message
+
+
+class TestStablePrefix:
+	def test_history_is_split_into_parts_with_a_breakpoint_after_the_last_item(self, tmp_path):
+		manager = _manager(tmp_path)
+		message = _state_message(manager)
+
+		assert isinstance(message.content, list) and not message.cache
+		parts = [part for part in message.content if isinstance(part, ContentPartTextParam)]
+		# The initial task item plus three steps, each in its own part, then the rest of the state
+		assert len(parts) == 5
+		assert [part.cache for part in parts] == [False, False, False, True, False]
+		# Parts carry their own newlines, providers see exactly the unsplit state message
+		assert ''.join(part.text for part in parts) == manager.last_state_message_text
+		assert parts[0].text.startswith('<agent_history>\n')
+
+	def test_previous_prompt_history_is_a_prefix_of_the_next_one(self, tmp_path):
+		manager = _manager(tmp_path)
+		previous = _state_message(manager).content
+		manager.state.agent_history_items.append(HistoryItem(step_number=4, memory='memory 4', next_goal='go'))
+		current = _state_message(manager).content
+
+		assert isinstance(previous, list) and isinstance(current, list)
+		cached_parts = next(i for i, part in enumerate(previous) if isinstance(part, ContentPartTextParam) and part.cache)
+		assert [part.text for part in current[: cached_parts + 1]] == [part.text for part in previous[: cached_parts + 1]]
+
+	def test_history_omission_moves_in_blocks(self, tmp_path):
+		histories = []
+		for steps in range(12, 24):
+			manager = _manager(tmp_path, max_history_items=10, steps=steps)
+			histories.append(manager.agent_history_description)
+			assert manager.agent_history_description.count('<step>') <= 9
+
+		# Omitting whole blocks keeps the start of the history unchanged between consecutive steps
+		stable = sum(current.startswith(previous) for previous, current in zip(histories, histories[1:]))
+		assert stable >= len(histories) // 2
+
+
+class TestProviderBreakpoints:
+	def test_anthropic_marks_breakpoint_parts(self):
+		message = UserMessage(content=[ContentPartTextParam(text='history', cache=True), ContentPartTextParam(text='state')])
+		serialized, _ = AnthropicMessageSerializer.serialize_messages([message])
+
+		content = serialized[0]['content']
+		assert isinstance(content, list)
+		assert [block.get('cache_control') for block in content] == [{'type': 'ephemeral'}, None]  # type: ignore[union-attr]
+
+	def test_bedrock_adds_cache_points_only_when_enabled(self):
+		messages = [
+			SystemMessage(content='system', cache=True),
+			UserMessage(content=[ContentPartTextParam(text='history', cache=True), ContentPartTextParam(text='state')]),
+		]
+		bedrock_messages, system = AWSBedrockMessageSerializer.serialize_messages(messages, cache_points=True)
+		assert system == [{'text': 'system'}, CACHE_POINT]
+		assert bedrock_messages[0]['content'] == [{'text': 'history'}, CACHE_POINT, {'text': 'state'}]
+
+		bedrock_messages, system = AWSBedrockMessageSerializer.serialize_messages(messages)
+		assert CACHE_POINT not in (system or [])
+		assert CACHE_POINT not in bedrock_messages[0]['content']
+
+	def test_bedrock_usage_includes_cache_reads(self):
+		llm = ChatAWSBedrock(model='anthropic.claude-3-5-sonnet-20240620-v1:0')
+		assert llm._use_prompt_cache()
+		assert not ChatAWSBedrock(model='meta.llama3-70b-instruct-v1:0')._use_prompt_cache()
+
+		usage = llm._get_usage(
+			{
+				'usage': {
+					'inputTokens': 100,
+					'outputTokens': 20,
+					'totalTokens': 1120,
+					'cacheReadInputTokens': 1000,
+					'cacheWriteInputTokens': 50,
+				}
+			}
+		)
+		assert usage is not None
+		assert (usage.prompt_tokens, usage.prompt_cached_tokens, usage.prompt_cache_creation_tokens) == (1100, 1000, 50)
+
+
+class TestCacheUsageReporting:
+	def test_prompt_cache_usage_since_entry(self):
+		token_cost = TokenCost()
+
+		def add(prompt: int, cached: int | None) -> None:
+			usage = ChatInvokeUsage(
+				prompt_tokens=prompt,
+				prompt_cached_tokens=cached,
+				prompt_cache_creation_tokens=None,
+				prompt_image_tokens=None,
+				completion_tokens=10,
+				total_tokens=prompt + 10,
+			)
+			token_cost.add_usage('model', usage)
+
+		add(1000, None)
+		step_start = len(token_cost.usage_history)
+		add(1200, 900)
+		add(300, 100)
+
+		usage = token_cost.get_prompt_cache_usage(since_entry=step_start)
+		assert (usage.prompt_tokens, usage.prompt_cached_tokens, usage.prompt_cache_creation_tokens) == (1500, 1000, 0)
+		assert usage.cache_hit_rate == 1000 / 1500
+		assert token_cost.get_prompt_cache_usage().prompt_tokens == 2500
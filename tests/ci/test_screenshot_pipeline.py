@@ -0,0 +1,232 @@
+"""Tests for the shared Screenshot object and the capture-once screenshot pipeline."""
+
+import base64
+import logging
+from io import BytesIO
+from pathlib import Path
+from types import SimpleNamespace
+
+import anyio
+from PIL import Image
+
+from browser_use.agent.prompts import AgentMessagePrompt
+from browser_use.browser.events import ScreenshotEvent
+from browser_use.browser.views import BrowserStateSummary, Screenshot
+from browser_use.browser.watchdogs.screenshot_watchdog import ScreenshotWatchdog
+from browser_use.dom.views import SerializedDOMState
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.screenshots.service import ScreenshotService
+
+
+def _image_bytes(size: tuple[int, int], format: str = 'PNG') -> bytes:
+	buffer = BytesIO()
+	Image.new('RGB', size, (200, 30, 30)).save(buffer, format=format)
+	return buffer.getvalue()
+
+
+def _state(screenshot: Screenshot) -> BrowserStateSummary:
+	return BrowserStateSummary(
+		dom_state=SerializedDOMState(_root=None, selector_map={}),
+		url='https://example.com',
+		title='Example',
+		tabs=[],
+		screenshot_image=screenshot,
+	)
+
+
+class FakeCDPSession:
+	def __init__(self, metrics: dict, sent: list[dict]):
+		self.session_id = 'session-1'
+
+		async def get_layout_metrics(session_id=None):
+			return metrics
+
+		async def capture_screenshot(params, session_id=None):
+			sent.append(params)
+			return {'data': base64.b64encode(_image_bytes((4, 4), 'JPEG')).decode()}
+
+		self.cdp_client = SimpleNamespace(
+			send=SimpleNamespace(Page=SimpleNamespace(getLayoutMetrics=get_layout_metrics, captureScreenshot=capture_screenshot))
+		)
+
+
+def _make_watchdog(metrics: dict, sent: list[dict]) -> ScreenshotWatchdog:
+	cdp_session = FakeCDPSession(metrics, sent)
+
+	async def get_or_create_cdp_session(*args, **kwargs):
+		return cdp_session
+
+	async def remove_highlights():
+		pass
+
+	browser_session = SimpleNamespace(
+		logger=logging.getLogger('test'),
+		get_focused_target=lambda: SimpleNamespace(target_type='page', target_id='target-1'),
+		get_or_create_cdp_session=get_or_create_cdp_session,
+		remove_highlights=remove_highlights,
+	)
+	return ScreenshotWatchdog.model_construct(event_bus=None, browser_session=browser_session)
+
+
+# 1280x800 CSS viewport rendered at device pixel ratio 2
+HIDPI_METRICS = {
+	'cssVisualViewport': {'pageX': 0, 'pageY': 300, 'clientWidth': 1280, 'clientHeight': 800},
+	'visualViewport': {'clientWidth': 2560, 'clientHeight': 1600},
+}
+
+
+class TestScreenshot:
+	def test_decodes_lazily_and_reads_size_from_header(self):
+		data = _image_bytes((40, 30))
+		screenshot = Screenshot(base64.b64encode(data).decode())
+		assert screenshot._data is None
+
+		assert screenshot.size == (40, 30)
+		assert screenshot.data == data
+		assert screenshot.data is screenshot.data  # decoded once
+		assert screenshot.data_url.startswith('data:image/png;base64,iVBOR')
+
+	def test_from_bytes_encodes_lazily(self):
+		screenshot = Screenshot(data=b'\xff\xd8jpeg', format='jpeg', size=(1, 1))
+		assert screenshot._base64 is None
+		assert screenshot.mime_type == 'image/jpeg'
+		assert screenshot.file_extension == 'jpg'
+		assert base64.b64decode(screenshot.base64) == b'\xff\xd8jpeg'
+
+	def test_state_summary_keeps_legacy_base64_field_in_sync(self):
+		screenshot = Screenshot('c2NyZWVuc2hvdA==', format='webp')
+		assert _state(screenshot).screenshot == 'c2NyZWVuc2hvdA=='
+
+		legacy = BrowserStateSummary(
+			dom_state=SerializedDOMState(_root=None, selector_map={}), url='', title='', tabs=[], screenshot='aGk='
+		)
+		assert legacy.screenshot_image is not None
+		assert legacy.screenshot_image.base64 == 'aGk='
+		assert legacy.screenshot_image.format == 'png'
+
+
+class TestScreenshotPipeline:
+	async def test_storage_writes_captured_bytes_in_their_format(self, tmp_path):
+		service = ScreenshotService(tmp_path)
+		jpeg = _image_bytes((8, 8), 'JPEG')
+
+		path = await service.store_screenshot(Screenshot(base64.b64encode(jpeg).decode(), format='jpeg'), 3)
+		assert path.endswith('.jpg')
+		assert Path(path).parent == tmp_path / 'screenshots'
+		assert await anyio.Path(path).read_bytes() == jpeg
+
+		legacy_path = await service.store_screenshot(base64.b64encode(jpeg).decode(), 4)
+		assert legacy_path.endswith('.png')
+
+	def test_prompt_skips_resize_when_already_at_llm_size(self, tmp_path):
+		screenshot = Screenshot(base64.b64encode(_image_bytes((140, 85), 'JPEG')).decode(), format='jpeg')
+		prompt = AgentMessagePrompt(
+			browser_state_summary=_state(screenshot),
+			file_system=FileSystem(tmp_path),
+			screenshots=[screenshot],
+			llm_screenshot_size=(140, 85),
+		)
+		assert prompt._resize_screenshot(screenshot) is screenshot
+
+		message = prompt.get_user_message(use_vision=True)
+		assert isinstance(message.content, list)
+		image_part = message.content[-1]
+		assert image_part.type == 'image_url'
+		assert image_part.image_url.media_type == 'image/jpeg'
+		assert image_part.image_url.url == screenshot.data_url
+
+	def test_prompt_resizes_in_captured_format(self, tmp_path):
+		screenshot = Screenshot(data=_image_bytes((280, 200), 'WEBP'), format='webp')
+		prompt = AgentMessagePrompt(
+			browser_state_summary=_state(screenshot), file_system=FileSystem(tmp_path), llm_screenshot_size=(140, 85)
+		)
+
+		resized = prompt._resize_screenshot(screenshot)
+		assert resized.size == (140, 85)
+		assert resized.format == 'webp'
+		assert Image.open(BytesIO(resized.data)).format == 'WEBP'
+
+	async def test_capture_uses_requested_format_and_browser_downscaling(self):
+		sent: list[dict] = []
+		watchdog = _make_watchdog(HIDPI_METRICS, sent)
+
+		screenshot_b64 = await watchdog.on_ScreenshotEvent(ScreenshotEvent(format='jpeg', quality=70, target_size=(1280, 800)))
+
+		assert Image.open(BytesIO(base64.b64decode(screenshot_b64))).format == 'JPEG'
+		params = sent[0]
+		assert params['format'] == 'jpeg'
+		assert params['quality'] == 70
+		assert params['clip'] == {'x': 0, 'y': 300, 'width': 1280, 'height': 800, 'scale': 0.5}
+
+	async def test_downscaled_clip_never_upscales_or_undershoots(self):
+		watchdog = _make_watchdog(HIDPI_METRICS, [])
+		cdp_session = FakeCDPSession(HIDPI_METRICS, [])
+
+		# must still cover 1400x850 after scaling, so the width decides
+		clip = await watchdog._get_downscaled_viewport_clip(cdp_session, (1400, 850))  # type: ignore[arg-type]
+		assert clip is not None
+		assert 2560 * clip['scale'] >= 1400 and 1600 * clip['scale'] >= 850
+
+		assert await watchdog._get_downscaled_viewport_clip(cdp_session, (3000, 1000)) is None  # type: ignore[arg-type]
+
+		sent: list[dict] = []
+		await _make_watchdog(HIDPI_METRICS, sent).on_ScreenshotEvent(ScreenshotEvent())
+		assert sent[0] == {'format': 'png', 'captureBeyondViewport': False}
+
+
+def _page_png(changed: bool = False, glyph: bool = False, compress_level: int = 6) -> Screenshot:
+	image = Image.new('RGB', (1280, 800), (255, 255, 255))
+	for y in range(100, 700, 40):
+		image.paste((20, 20, 20), (100, y, 900, y + 12))  # text lines
+	if changed:
+		image.paste((0, 120, 255), (1000, 300, 1200, 360))  # a new button
+	if glyph:
+		image.paste((255, 255, 255), (850, 100, 852, 104))  # e.g. 'hello' -> 'hellp', a few pixels of one character
+	buffer = BytesIO()
+	image.save(buffer, format='PNG', compress_level=compress_level)
+	return Screenshot(data=buffer.getvalue())
+
+
+class TestScreenshotDeduplication:
+	def test_detects_visually_identical_pages(self):
+		page = _page_png()
+		assert page.is_visually_identical(Screenshot(page.base64))
+		reencoded = _page_png(compress_level=1)
+		assert reencoded.base64 != page.base64 and page.is_visually_identical(reencoded)
+		assert not page.is_visually_identical(_page_png(glyph=True))
+		assert not page.is_visually_identical(_page_png(changed=True))
+		assert not page.is_visually_identical(Screenshot(data=_image_bytes((640, 400))))
+
+	def test_prompt_omits_unchanged_screenshot_only_when_enabled(self, tmp_path):
+		from browser_use.agent.message_manager.service import MessageManager
+		from browser_use.agent.views import ActionResult, MessageManagerState
+		from browser_use.llm.messages import SystemMessage
+
+		def image_parts(omit: bool, requested: bool = False) -> tuple[list, str]:
+			manager = MessageManager(
+				task='task',
+				system_message=SystemMessage(content='system'),
+				file_system=FileSystem(tmp_path),
+				state=MessageManagerState(),
+				use_thinking=False,
+				omit_unchanged_screenshots=omit,
+			)
+			state = _state(_page_png())
+			state.screenshot_unchanged = True
+			result = [ActionResult(metadata={'include_screenshot': True})] if requested else None
+			manager.create_state_messages(browser_state_summary=state, result=result, use_vision=True)
+			message = manager.state.history.state_message
+			assert message is not None
+			content = message.content if isinstance(message.content, list) else []
+			text = message.text
+			return [part for part in content if part.type == 'image_url'], text
+
+		images, _ = image_parts(omit=False)
+		assert len(images) == 1
+
+		images, text = image_parts(omit=True)
+		assert images == []
+		assert 'Screenshot omitted' in text
+
+		images, _ = image_parts(omit=True, requested=True)
+		assert len(images) == 1
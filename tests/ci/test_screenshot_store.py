@@ -0,0 +1,145 @@
+"""Tests for the content-addressed screenshot store: dedupe, lossy storage tier, retention and legacy migration."""
+
+import os
+import time
+from io import BytesIO
+from pathlib import Path
+
+import anyio
+from PIL import Image
+
+from browser_use.agent.views import AgentHistory, AgentHistoryList
+from browser_use.browser.views import BrowserStateHistory, Screenshot
+from browser_use.screenshots.service import ScreenshotService
+
+
+def _png(color: tuple[int, int, int], size: tuple[int, int] = (64, 48)) -> bytes:
+	buffer = BytesIO()
+	Image.new('RGB', size, color).save(buffer, format='PNG')
+	return buffer.getvalue()
+
+
+def _history(paths: list[str | None]) -> AgentHistoryList:
+	return AgentHistoryList(
+		history=[
+			AgentHistory(
+				model_output=None,
+				result=[],
+				state=BrowserStateHistory(
+					url='https://example.com', title='', tabs=[], interacted_element=[], screenshot_path=path
+				),
+			)
+			for path in paths
+		]
+	)
+
+
+class TestScreenshotStore:
+	async def test_identical_screenshots_share_one_blob(self, tmp_path):
+		service = ScreenshotService(tmp_path)
+		red, blue = _png((255, 0, 0)), _png((0, 0, 255))
+
+		first = await service.store_screenshot(Screenshot(data=red), 1)
+		second = await service.store_screenshot(Screenshot(data=blue), 2)
+		third = await service.store_screenshot(Screenshot(data=red), 3)
+
+		assert first == third != second
+		assert sorted(p.name for p in service.screenshots_dir.iterdir()) == sorted([Path(first).name, Path(second).name])
+
+	async def test_lossy_storage_tier(self, tmp_path):
+		service = ScreenshotService(tmp_path, storage_format='webp', storage_quality=50)
+		path = await service.store_screenshot(Screenshot(data=_png((0, 128, 0))), 1)
+
+		assert path.endswith('.webp')
+		assert Image.open(path).format == 'WEBP'
+		# the name still comes from the captured bytes, so the next identical capture is not re-encoded
+		assert await service.store_screenshot(Screenshot(data=_png((0, 128, 0))), 2) == path
+
+	async def test_retention_by_size_and_age(self, tmp_path):
+		service = ScreenshotService(tmp_path)
+		paths = [Path(await service.store_screenshot(Screenshot(data=_png((i, 0, 0))), i)) for i in range(4)]
+		for age, path in enumerate(reversed(paths)):
+			os.utime(path, (time.time() - 100 * age, time.time() - 100 * age))
+
+		service.max_total_bytes = sum(path.stat().st_size for path in paths[1:])
+		assert service.prune() == 1
+		assert not paths[0].exists()
+
+		service.max_total_bytes = None
+		service.max_age = 150
+		assert service.prune(keep=[paths[1]]) == 0  # only paths[1] is older than 150s, and it is kept
+		assert service.prune() == 1
+		assert [path.exists() for path in paths] == [False, False, True, True]
+
+		history = _history([str(paths[0]), str(paths[3])])
+		assert list(history.iter_screenshot_bytes()) == [None, paths[3].read_bytes()]
+
+	async def test_reused_screenshot_survives_retention(self, tmp_path):
+		from browser_use import Agent
+		from browser_use.browser.views import BrowserStateSummary
+		from browser_use.dom.views import SerializedDOMState
+		from tests.ci.conftest import create_mock_llm
+
+		agent = Agent(task='task', llm=create_mock_llm())
+		agent.screenshot_service = ScreenshotService(tmp_path, max_age=150)
+
+		def state(unchanged: bool) -> BrowserStateSummary:
+			summary = BrowserStateSummary(
+				dom_state=SerializedDOMState(_root=None, selector_map={}),
+				url='https://example.com',
+				title='',
+				tabs=[],
+				screenshot=Screenshot(data=_png((255, 0, 0))).base64,
+			)
+			summary.screenshot_unchanged = unchanged
+			return summary
+
+		await agent._make_history_item(None, state(unchanged=False), [])
+		stored = Path(agent.history.history[-1].state.screenshot_path or '')
+		os.utime(stored, (time.time() - 200, time.time() - 200))  # stored long ago
+
+		# The page stayed the same, the step reuses the blob, which counts as using it now
+		await agent._make_history_item(None, state(unchanged=True), [])
+		assert agent.history.history[-1].state.screenshot_path == str(stored)
+		assert agent.screenshot_service.prune() == 0
+		assert agent.history.history[-1].state.get_screenshot_bytes() == _png((255, 0, 0))
+
+		# A blob deleted meanwhile is stored again instead of being pointed at
+		await anyio.Path(stored).unlink()
+		await agent._make_history_item(None, state(unchanged=True), [])
+		assert await anyio.Path(stored).exists()
+
+	async def test_gif_skips_reencoded_placeholder(self, tmp_path):
+		import base64
+
+		from browser_use.agent.gif import create_history_gif
+		from browser_use.browser.views import PLACEHOLDER_4PX_SCREENSHOT
+
+		service = ScreenshotService(tmp_path, storage_format='webp')
+		placeholder = await service.store_screenshot(Screenshot(PLACEHOLDER_4PX_SCREENSHOT), 1)
+		page = await service.store_screenshot(Screenshot(data=_png((0, 0, 255))), 2)
+		assert (await anyio.Path(placeholder).read_bytes()) != base64.b64decode(PLACEHOLDER_4PX_SCREENSHOT)
+
+		output_path = str(tmp_path / 'history.gif')
+		create_history_gif('task', _history([placeholder, page]), output_path=output_path, show_task=False)
+
+		with Image.open(output_path) as gif:
+			assert gif.n_frames == 1
+			assert gif.size == (64, 48)
+
+	def test_migrates_legacy_step_files(self, tmp_path):
+		screenshots_dir = tmp_path / 'screenshots'
+		screenshots_dir.mkdir()
+		for step, color in enumerate([(1, 2, 3), (1, 2, 3), (4, 5, 6)], 1):
+			(screenshots_dir / f'step_{step}.png').write_bytes(_png(color))
+		history = _history([str(screenshots_dir / f'step_{step}.png') for step in (1, 2, 3)] + [None])
+
+		service = ScreenshotService(tmp_path)
+		migrated = service.migrate_legacy_screenshots(history)
+
+		assert len(migrated) == 3
+		assert len(list(screenshots_dir.iterdir())) == 2
+		assert history.screenshot_paths() == [migrated[str(screenshots_dir / f'step_{step}.png')] for step in (1, 2, 3)] + [None]
+		screenshots = history.screenshots()
+		assert screenshots[0] == screenshots[1] != screenshots[2]
+		assert screenshots[3] is None
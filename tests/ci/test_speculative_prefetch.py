@@ -0,0 +1,186 @@
+"""Tests for speculative CDP prefetching during LLM latency (Agent(speculative_prefetch=True))."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from browser_use import Agent
+from browser_use.browser.prefetch import SpeculativePrefetcher
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.views import BrowserStateSummary, PageInfo
+from browser_use.dom.views import DOMRect, SerializedDOMState
+from browser_use.llm import BaseChatModel
+from browser_use.llm.views import ChatInvokeCompletion
+
+VIEWPORT = {'layoutViewport': {'clientWidth': 800, 'clientHeight': 600}}
+
+
+def _quad(x: float, y: float, width: float = 100, height: float = 20) -> list[float]:
+	return [x, y, x + width, y, x + width, y + height, x, y + height]
+
+
+def _node(backend_node_id: int, y: float, visible: bool = True) -> SimpleNamespace:
+	return SimpleNamespace(backend_node_id=backend_node_id, is_visible=visible, absolute_position=DOMRect(10, y, 100, 20))
+
+
+def _fake_session(nodes: list[SimpleNamespace], delay: float = 0) -> SimpleNamespace:
+	"""Browser session whose CDP commands answer from the node positions, after delay seconds"""
+	positions = {node.backend_node_id: node.absolute_position for node in nodes}
+	calls: list[str] = []
+
+	async def send(method: str, result):
+		calls.append(method)
+		await asyncio.sleep(delay)
+		return result
+
+	def get_content_quads(params, session_id):
+		position = positions[params['backendNodeId']]
+		return send('DOM.getContentQuads', {'quads': [_quad(position.x, position.y)]})
+
+	def resolve_node(params, session_id):
+		assert params['objectGroup'].startswith('browser_use_prefetch_')
+		return send('DOM.resolveNode', {'object': {'objectId': f'object-{params["backendNodeId"]}'}})
+
+	def release_object_group(params, session_id):
+		return send(f'Runtime.releaseObjectGroup {params["objectGroup"]}', {})
+
+	cdp_session = SimpleNamespace(
+		session_id='session-1',
+		cdp_client=SimpleNamespace(
+			send=SimpleNamespace(
+				Page=SimpleNamespace(getLayoutMetrics=lambda session_id: send('Page.getLayoutMetrics', VIEWPORT)),
+				DOM=SimpleNamespace(getContentQuads=get_content_quads, resolveNode=resolve_node),
+				Runtime=SimpleNamespace(releaseObjectGroup=release_object_group),
+			)
+		),
+	)
+
+	async def get_cdp_session(*args, **kwargs):
+		return cdp_session
+
+	page_info = PageInfo(
+		viewport_width=800,
+		viewport_height=600,
+		page_width=800,
+		page_height=3000,
+		scroll_x=0,
+		scroll_y=0,
+		pixels_above=0,
+		pixels_below=2400,
+		pixels_left=0,
+		pixels_right=0,
+	)
+	return SimpleNamespace(
+		calls=calls,
+		cdp_session=cdp_session,
+		_cached_selector_map={node.backend_node_id: node for node in nodes},
+		_cached_browser_state_summary=SimpleNamespace(page_info=page_info),
+		get_page_targets=lambda: [SimpleNamespace(target_id='target-1')],
+		get_or_create_cdp_session=get_cdp_session,
+		cdp_client_for_node=get_cdp_session,
+		get_current_page_url=AsyncMock(return_value='https://example.com'),
+	)
+
+
+class TestSpeculativePrefetcher:
+	async def test_prefetches_visible_elements_and_counts_hits_and_waste(self):
+		session = _fake_session([_node(1, 50), _node(2, 200), _node(3, 2000), _node(4, 100, visible=False)])
+		prefetcher = SpeculativePrefetcher(session, prefetch_markdown=False)  # type: ignore[arg-type]
+
+		await prefetcher.run()
+
+		# Only elements on screen are worth resolving, each costs a quads and an object id lookup
+		assert session.calls.count('DOM.getContentQuads') == 2
+		assert prefetcher.take_layout_metrics('session-1') == VIEWPORT
+		assert prefetcher.take_quads('session-1', 1) == [_quad(10, 50)]
+		assert prefetcher.take_object_id('session-1', 2) == 'object-2'
+		assert prefetcher.take_quads('session-1', 3) is None
+
+		prefetcher.invalidate()
+		stats = prefetcher.stats
+		assert (stats.rounds, stats.cdp_calls, stats.hits, stats.wasted_cdp_calls) == (1, 5, 3, 2)
+		assert stats.hit_rate == 3 / 5
+		assert prefetcher.take_object_id('session-1', 1) is None
+
+	async def test_invalidate_releases_resolved_objects(self):
+		session = _fake_session([_node(1, 50), _node(2, 200)])
+		prefetcher = SpeculativePrefetcher(session, prefetch_markdown=False)  # type: ignore[arg-type]
+
+		await prefetcher.run()
+		assert prefetcher.take_object_id('session-1', 1) == 'object-1'
+		prefetcher.invalidate()
+		await asyncio.sleep(0)
+
+		# Taken or not, the objects of the round are released together, once
+		assert session.calls.count('Runtime.releaseObjectGroup browser_use_prefetch_0') == 1
+
+		# An object resolved after the page changed is released as soon as it arrives
+		session.calls.clear()
+		prefetcher.invalidate()
+		await prefetcher._prefetch_element(_node(1, 50), generation=0)  # type: ignore[arg-type]
+		await asyncio.sleep(0)
+		assert session.calls == ['DOM.getContentQuads', 'DOM.resolveNode', 'Runtime.releaseObjectGroup browser_use_prefetch_0']
+
+	async def test_calls_cancelled_or_outdated_are_wasted(self):
+		session = _fake_session([_node(1, 50)], delay=0.05)
+		prefetcher = SpeculativePrefetcher(session, prefetch_markdown=False)  # type: ignore[arg-type]
+
+		task = asyncio.create_task(prefetcher.run())
+		await asyncio.sleep(0.01)
+		prefetcher.invalidate()  # the page changed while Page.getLayoutMetrics was in flight
+		await asyncio.sleep(0.05)
+		task.cancel()  # the LLM responded while the element lookups were in flight
+		await asyncio.gather(task, return_exceptions=True)
+
+		assert prefetcher.take_layout_metrics('session-1') is None
+		assert prefetcher.stats.cdp_calls == 3
+		assert prefetcher.stats.wasted_cdp_calls == 3
+		assert prefetcher.stats.hits == 0
+
+	async def test_element_coordinates_use_prefetched_quads(self):
+		session = _fake_session([_node(1, 50)])
+		prefetcher = SpeculativePrefetcher(session, prefetch_markdown=False)  # type: ignore[arg-type]
+		await prefetcher.run()
+		session.calls.clear()
+
+		browser_session = BrowserSession()
+		browser_session.set_prefetcher(prefetcher)
+		rect = await browser_session.get_element_coordinates(1, session.cdp_session)  # type: ignore[arg-type]
+
+		assert rect is not None and (rect.x, rect.y, rect.width, rect.height) == (10, 50, 100, 20)
+		assert session.calls == []
+		assert prefetcher.stats.hits == 1
+
+
+class TestAgentPrefetch:
+	async def test_prefetch_runs_while_the_llm_is_thinking(self):
+		llm = AsyncMock(spec=BaseChatModel)
+		llm.model = llm.name = llm.model_name = 'mock-llm'
+		llm.provider = 'mock'
+		llm._verified_api_keys = True
+		events: list[str] = []
+
+		async def mock_ainvoke(messages, output_format=None, **kwargs):
+			await asyncio.sleep(0.1)
+			events.append('llm finished')
+			return ChatInvokeCompletion(
+				completion=output_format.model_validate({'action': [{'scroll': {'down': True}}]}), usage=None
+			)
+
+		llm.ainvoke.side_effect = mock_ainvoke
+		agent = Agent(task='Test task', llm=llm, speculative_prefetch=True)
+		assert agent.prefetcher is not None
+
+		session = _fake_session([_node(1, 50), _node(2, 100)], delay=0.06)
+		agent.prefetcher = SpeculativePrefetcher(session, prefetch_markdown=False)  # type: ignore[arg-type]
+		browser_state = BrowserStateSummary(
+			dom_state=SerializedDOMState(_root=None, selector_map={}), url='https://example.com', title='Example', tabs=[]
+		)
+		await agent._get_next_action(browser_state)
+
+		stats = agent.prefetcher.stats
+		assert stats.rounds == 1
+		# Layout metrics arrived in time, the element lookups still in flight were cancelled with the round
+		assert agent.prefetcher.take_layout_metrics('session-1') == VIEWPORT
+		assert stats.cdp_calls == 5 and stats.wasted_cdp_calls == 4
+		assert events == ['llm finished']
@@ -0,0 +1,140 @@
+"""Tests for tab sessions, parallel agents in their own tabs of one browser (BrowserSession.new_tab_session())."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from cdp_use import CDPClient
+
+from browser_use.browser.events import TabClosedEvent
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.session_manager import SessionManager
+
+
+def _fake_cdp_client() -> MagicMock:
+	client = MagicMock(spec=CDPClient)
+	client.send = AsyncMock()
+	client.register = MagicMock()
+	client.stop = AsyncMock()
+	return client
+
+
+def _attached(target_id: str, session_id: str, target_type: str = 'page', opener_id: str | None = None) -> dict:
+	target_info = {'targetId': target_id, 'type': target_type, 'url': 'about:blank', 'title': ''}
+	if opener_id:
+		target_info['openerId'] = opener_id
+	return {'sessionId': session_id, 'targetInfo': target_info, 'waitingForDebugger': False}
+
+
+def _monitored_session_ids(client) -> list[str]:
+	return [call.kwargs['session_id'] for call in client.send.Page.enable.await_args_list]
+
+
+@pytest.fixture
+async def browser_sessions():
+	"""Sessions created by a test, killed afterwards so none of them outlives it on the shared event loop"""
+	sessions: list[BrowserSession] = []
+	yield sessions
+	for browser_session in sessions:
+		await browser_session.kill()
+		await browser_session.event_bus.stop(clear=True, timeout=5)
+
+
+@pytest.fixture
+def browser_session(browser_sessions) -> BrowserSession:
+	"""Session on a fake CDP client with its session manager set up, as after connecting to a shared browser"""
+	browser_session = BrowserSession(cdp_url='ws://127.0.0.1:9222/devtools/browser/shared')
+	browser_session._cdp_client_root = _fake_cdp_client()
+	browser_session.session_manager = SessionManager(browser_session)
+	browser_sessions.append(browser_session)
+	return browser_session
+
+
+class TestNewTabSession:
+	def test_requires_a_started_browser(self, browser_sessions):
+		browser_session = BrowserSession(headless=True)
+		browser_sessions.append(browser_session)
+		with pytest.raises(RuntimeError, match='Start the browser session'):
+			browser_session.new_tab_session()
+
+	def test_connects_to_the_same_browser_without_owning_it(self, browser_sessions, tmp_path):
+		storage_state = tmp_path / 'storage_state.json'
+		browser_session = BrowserSession(headless=True, keep_alive=True, storage_state=storage_state, user_data_dir=None)
+		browser_session.browser_profile.cdp_url = 'ws://127.0.0.1:9222/devtools/browser/shared'
+
+		tab_session = browser_session.new_tab_session()
+		browser_sessions.extend([browser_session, tab_session])
+		assert tab_session.id != browser_session.id
+		assert tab_session.cdp_url == browser_session.cdp_url
+		assert tab_session.is_local == browser_session.is_local
+		assert tab_session.event_bus is not browser_session.event_bus
+		assert tab_session._tab_scope == set()
+		assert browser_session._tab_scope is None
+
+		profile = tab_session.browser_profile
+		assert profile.keep_alive is False
+		assert profile.storage_state is None
+		assert not profile.use_cloud
+		assert profile.headless is True
+		assert browser_session.browser_profile.keep_alive is True
+
+
+class TestTabScope:
+	async def test_tab_session_only_sees_and_monitors_its_own_tabs(self, browser_session):
+		browser_session._tab_scope = {'own-tab'}
+		manager, client = browser_session.session_manager, browser_session._cdp_client_root
+		assert manager is not None
+
+		await manager._handle_target_attached(_attached('own-tab', 'session-own'))
+		await manager._handle_target_attached(_attached('other-tab', 'session-other'))
+		await manager._handle_target_attached(_attached('popup', 'session-popup', opener_id='own-tab'))
+
+		assert [target.target_id for target in manager.get_all_page_targets()] == ['own-tab', 'popup']
+		assert [page['targetId'] for page in await browser_session._cdp_get_all_pages()] == ['own-tab', 'popup']
+		assert browser_session._tab_scope == {'own-tab', 'popup'}
+
+		# The other session's tab stays tracked, but nothing is enabled on it
+		assert manager.get_target('other-tab') is not None
+		assert _monitored_session_ids(client) == ['session-own', 'session-popup']
+		auto_attached = [call.kwargs['session_id'] for call in client.send.Target.setAutoAttach.await_args_list]
+		assert 'session-other' not in auto_attached
+
+	async def test_adopting_an_attached_tab_starts_monitoring_it(self, browser_session):
+		browser_session._tab_scope = set()
+		manager, client = browser_session.session_manager, browser_session._cdp_client_root
+		assert manager is not None
+		await manager._handle_target_attached(_attached('new-tab', 'session-new'))
+		assert manager.get_all_page_targets() == []
+
+		await manager.adopt_target('new-tab')
+		assert [target.target_id for target in manager.get_all_page_targets()] == ['new-tab']
+		assert _monitored_session_ids(client) == ['session-new']
+
+		await manager.adopt_target('new-tab')  # already adopted, nothing enabled twice
+		assert _monitored_session_ids(client) == ['session-new']
+
+	async def test_tab_closed_only_for_own_tabs(self, browser_session):
+		browser_session._tab_scope = {'own-tab'}
+		manager = browser_session.session_manager
+		assert manager is not None
+		await manager._handle_target_attached(_attached('own-tab', 'session-own'))
+		await manager._handle_target_attached(_attached('other-tab', 'session-other'))
+
+		await manager._handle_target_detached({'sessionId': 'session-other', 'targetId': 'other-tab'})
+		await manager._handle_target_detached({'sessionId': 'session-own', 'targetId': 'own-tab'})
+		await asyncio.sleep(0)
+
+		closed = [
+			event.target_id for event in browser_session.event_bus.event_history.values() if isinstance(event, TabClosedEvent)
+		]
+		assert closed == ['own-tab']
+		assert browser_session._tab_scope == set()
+
+	async def test_regular_session_sees_every_tab(self, browser_session):
+		manager, client = browser_session.session_manager, browser_session._cdp_client_root
+		assert manager is not None
+		await manager._handle_target_attached(_attached('tab-1', 'session-1'))
+		await manager._handle_target_attached(_attached('tab-2', 'session-2'))
+
+		assert [target.target_id for target in manager.get_all_page_targets()] == ['tab-1', 'tab-2']
+		assert _monitored_session_ids(client) == ['session-1', 'session-2']
@@ -0,0 +1,103 @@
+"""Tests for latency tracing and Chrome trace export."""
+
+import asyncio
+import json
+
+import pytest
+from bubus import BaseEvent, EventBus
+from cdp_use import CDPClient
+
+from browser_use.agent.views import AgentHistoryList
+from browser_use.tracing.service import Tracer, trace_cdp_client, trace_span
+
+
+class SlowEvent(BaseEvent[str]):
+	delay: float = 0.02
+
+
+class TestTracer:
+	async def test_spans_summary_and_chrome_trace(self, tmp_path):
+		tracer = Tracer()
+
+		async def action(name: str):
+			with tracer.span(name, 'action', index=1):
+				await asyncio.sleep(0.02)
+
+		with tracer.span('step', 'agent', step=1):
+			await asyncio.gather(
+				asyncio.create_task(action('click'), name='task-a'),
+				asyncio.create_task(action('click'), name='task-b'),
+			)
+
+		summary = tracer.summary()
+		assert [(s.category, s.name, s.count) for s in summary.spans] == [('action', 'click', 2), ('agent', 'step', 1)]
+		assert summary.spans[1].total_ms >= summary.spans[0].max_ms
+		assert 'click' in summary.table()
+
+		path = tracer.export_chrome_trace(tmp_path / 'trace.json')
+		trace = json.loads(path.read_text())
+		complete = [e for e in trace['traceEvents'] if e['ph'] == 'X']
+		assert len(complete) == 3
+		assert all(e['dur'] > 0 for e in complete)
+		# concurrent actions land on separate rows, named after their asyncio task
+		threads = {e['args']['name']: e['tid'] for e in trace['traceEvents'] if e['ph'] == 'M'}
+		assert {'task-a', 'task-b'} <= set(threads)
+		assert threads['task-a'] != threads['task-b']
+
+	def test_disabled_tracing_is_a_shared_no_op(self):
+		assert trace_span(None, 'a', 'agent') is trace_span(None, 'b', 'cdp')
+		with trace_span(None, 'a', 'agent'):
+			pass
+
+	async def test_span_is_recorded_when_block_raises(self):
+		tracer = Tracer()
+		with pytest.raises(ValueError):
+			with tracer.span('invoke', 'llm'):
+				raise ValueError('boom')
+		assert [span.name for span in tracer.spans] == ['invoke']
+
+	async def test_event_bus_handlers_are_recorded_once(self):
+		tracer = Tracer()
+		bus = EventBus(name='TraceTestBus')
+
+		async def on_slow(event: SlowEvent) -> str:
+			await asyncio.sleep(event.delay)
+			return 'done'
+
+		bus.on(SlowEvent, on_slow)
+		try:
+			await bus.dispatch(SlowEvent())
+			tracer.record_event_bus(bus)
+			tracer.record_event_bus(bus)
+		finally:
+			await bus.stop()
+
+		spans = [span for span in tracer.spans if span.category == 'event_bus']
+		assert len(spans) == 1
+		assert spans[0].name == 'SlowEvent'
+		assert 'on_slow' in spans[0].args['handler']
+		assert spans[0].duration_ms >= 15
+
+	async def test_cdp_commands_are_traced_only_when_enabled(self, monkeypatch: pytest.MonkeyPatch):
+		async def fake_send_raw(self, method, params=None, session_id=None):
+			return {'method': method}
+
+		monkeypatch.setattr(CDPClient, 'send_raw', fake_send_raw)
+		tracer: Tracer | None = None
+		client = trace_cdp_client(CDPClient('ws://localhost:9222'), get_tracer=lambda: tracer)
+
+		assert await client.send_raw('Page.enable') == {'method': 'Page.enable'}
+
+		tracer = Tracer()
+		await client.send_raw('DOM.getDocument', session_id='session-1')
+		assert [(span.category, span.name) for span in tracer.spans] == [('cdp', 'DOM.getDocument')]
+
+	def test_history_round_trips_trace_summary(self):
+		tracer = Tracer()
+		with tracer.span('step', 'agent'):
+			pass
+		history = AgentHistoryList(history=[], trace_summary=tracer.summary())
+
+		restored = AgentHistoryList.model_validate_json(history.model_dump_json())
+		assert restored.trace_summary is not None
+		assert restored.trace_summary.spans[0].name == 'step'
@@ -0,0 +1,122 @@
+"""Tests for VideoRecorderService, screencast frames streamed into one encoder process."""
+
+import base64
+import io
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from browser_use.browser import video_recorder
+from browser_use.browser.profile import ViewportSize
+from browser_use.browser.video_recorder import VideoRecorderService
+
+
+class FakeEncoderStdin(io.BytesIO):
+	"""Encoder input that blocks every write until the test lets it through"""
+
+	def __init__(self):
+		super().__init__()
+		self.frames: list[bytes] = []
+		self.unblocked = threading.Event()
+
+	def write(self, data) -> int:
+		self.unblocked.wait()
+		self.frames.append(bytes(data))
+		return len(data)
+
+
+class FakeEncoder:
+	def __init__(self):
+		self.stdin = FakeEncoderStdin()
+		self.stderr = io.BytesIO()
+		self.returncode = 0
+
+	def wait(self) -> int:
+		return self.returncode
+
+
+class FakeVideoRecorder(VideoRecorderService):
+	def __init__(self, *args, **kwargs):
+		super().__init__(*args, **kwargs)
+		self.encoders_opened = 0
+
+	def _open_encoder(self):
+		self.encoders_opened += 1
+		return FakeEncoder()
+
+
+@pytest.fixture
+def recorder(monkeypatch, tmp_path: Path) -> FakeVideoRecorder:
+	monkeypatch.setattr(video_recorder, 'IMAGEIO_AVAILABLE', True)
+	return FakeVideoRecorder(tmp_path / 'video.mp4', ViewportSize(width=100, height=50), framerate=30, max_queued_frames=2)
+
+
+def _frame(n: int) -> str:
+	return base64.b64encode(f'frame-{n}'.encode()).decode()
+
+
+def _wait_until(condition, timeout: float = 2.0) -> None:
+	deadline = time.monotonic() + timeout
+	while not condition() and time.monotonic() < deadline:
+		time.sleep(0.01)
+
+
+class TestVideoRecorderService:
+	def test_frames_stream_into_one_encoder(self, recorder: FakeVideoRecorder):
+		recorder.start()
+		encoder = recorder._encoder
+		assert isinstance(encoder, FakeEncoder)
+		encoder.stdin.unblocked.set()
+
+		for n in range(5):
+			recorder.add_frame(_frame(n))
+			_wait_until(lambda: recorder._queue.empty())
+		recorder.stop_and_save()
+
+		assert recorder.encoders_opened == 1
+		assert encoder.stdin.frames == [f'frame-{n}'.encode() for n in range(5)]
+		assert recorder.frames_written == 5 and recorder.frames_dropped == 0
+		assert not recorder._is_active
+
+	def test_add_frame_does_not_block_and_drops_oldest_frames(self, recorder: FakeVideoRecorder):
+		recorder.start()
+		encoder = recorder._encoder
+		assert isinstance(encoder, FakeEncoder)
+
+		recorder.add_frame(_frame(0))
+		_wait_until(lambda: recorder._queue.empty())  # the worker is now stuck writing frame 0
+		started = time.monotonic()
+		for n in range(1, 6):
+			recorder.add_frame(_frame(n))
+		assert time.monotonic() - started < 0.5
+		assert recorder.frames_dropped == 3
+
+		encoder.stdin.unblocked.set()
+		recorder.stop_and_save()
+		assert encoder.stdin.frames == [b'frame-0', b'frame-4', b'frame-5']
+
+	def test_failed_encoder_stops_accepting_frames(self, recorder: FakeVideoRecorder):
+		recorder.start()
+		encoder = recorder._encoder
+		assert isinstance(encoder, FakeEncoder)
+
+		def broken_pipe(data):
+			raise BrokenPipeError('ffmpeg exited')
+
+		encoder.stdin.write = broken_pipe
+		recorder.add_frame(_frame(0))
+		_wait_until(lambda: not recorder._is_active)
+		assert not recorder._is_active
+		recorder.add_frame(_frame(1))  # ignored
+		recorder.stop_and_save()
+		assert recorder.frames_written == 0
+
+	def test_missing_dependencies_leave_recorder_inactive(self, monkeypatch, tmp_path: Path):
+		monkeypatch.setattr(video_recorder, 'IMAGEIO_AVAILABLE', False)
+		recorder = FakeVideoRecorder(tmp_path / 'video.mp4', ViewportSize(width=100, height=50), framerate=30)
+		recorder.start()
+		assert not recorder._is_active and recorder.encoders_opened == 0
+		recorder.add_frame(_frame(0))
+		recorder.stop_and_save()
@@ -0,0 +1,95 @@
+"""Tests for precomputed watchdog handler registration and the handler wrapper fast path."""
+
+import logging
+from typing import Any
+
+import pytest
+from bubus import EventBus
+
+from browser_use.browser.events import BrowserStateRequestEvent, ScreenshotEvent
+from browser_use.browser.watchdog_base import BaseWatchdog, get_event_classes, get_event_handler_methods
+from browser_use.browser.watchdogs.dom_watchdog import DOMWatchdog
+from browser_use.browser.watchdogs.screenshot_watchdog import ScreenshotWatchdog
+
+
+class FakeSession:
+	"""Counts how often the (expensive, rebuilt on every access) session logger is resolved"""
+
+	def __init__(self, event_bus: EventBus):
+		self.event_bus = event_bus
+		self.agent_focus_target_id = None
+		self.logger_lookups = 0
+
+	@property
+	def logger(self) -> logging.Logger:
+		self.logger_lookups += 1
+		return logging.getLogger('browser_use.FakeSession')
+
+
+class IdleWatchdog(BaseWatchdog):
+	pass
+
+
+class TestWatchdogHandlers:
+	def test_handler_methods_match_on_methods(self):
+		handlers = get_event_handler_methods(DOMWatchdog)
+		assert (BrowserStateRequestEvent, 'on_BrowserStateRequestEvent') in handlers
+		event_classes = get_event_classes()
+		expected = {name for name in dir(DOMWatchdog) if name.startswith('on_') and name[3:] in event_classes}
+		assert {method_name for _, method_name in handlers} == expected
+		assert get_event_handler_methods(DOMWatchdog) is handlers  # computed once per class
+		assert get_event_handler_methods(IdleWatchdog) == ()
+
+	async def test_attach_registers_each_handler_once(self):
+		bus = EventBus(name='WatchdogHandlersTestBus')
+		session = FakeSession(bus)
+		try:
+			ScreenshotWatchdog.model_construct(event_bus=bus, browser_session=session).attach_to_session()
+			IdleWatchdog.model_construct(event_bus=bus, browser_session=session).attach_to_session()
+
+			assert [getattr(h, '__name__') for h in bus.handlers['ScreenshotEvent']] == ['ScreenshotWatchdog.on_ScreenshotEvent']
+			assert sum(len(handlers) for handlers in bus.handlers.values()) == len(get_event_handler_methods(ScreenshotWatchdog))
+			with pytest.raises(RuntimeError, match='Duplicate handler'):
+				ScreenshotWatchdog.model_construct(event_bus=bus, browser_session=session).attach_to_session()
+		finally:
+			await bus.stop(clear=True)
+
+	async def test_wrapper_skips_debug_logging_work_when_disabled(self):
+		bus = EventBus(name='WatchdogWrapperTestBus')
+		session = FakeSession(bus)
+		calls: list[ScreenshotEvent] = []
+
+		class RecordingWatchdog:
+			async def on_ScreenshotEvent(self, event: ScreenshotEvent) -> str:
+				calls.append(event)
+				return 'ok'
+
+		class FailingWatchdog:
+			async def on_ScreenshotEvent(self, event: ScreenshotEvent) -> str:
+				raise ValueError('boom')
+
+		BaseWatchdog.attach_handler_to_session(session, ScreenshotEvent, RecordingWatchdog().on_ScreenshotEvent)  # type: ignore[arg-type]
+		BaseWatchdog.attach_handler_to_session(session, ScreenshotEvent, FailingWatchdog().on_ScreenshotEvent)  # type: ignore[arg-type]
+		handlers: list[Any] = bus.handlers['ScreenshotEvent']
+		wrapped, failing = handlers
+		event = ScreenshotEvent()
+		package_logger = logging.getLogger('browser_use')
+		original_level = package_logger.level
+		try:
+			package_logger.setLevel(logging.INFO)
+			assert await wrapped(event) == 'ok'
+			assert session.logger_lookups == 0
+
+			package_logger.setLevel(logging.DEBUG)
+			assert await wrapped(event) == 'ok'
+			assert session.logger_lookups == 1
+			assert calls == [event, event]
+
+			# errors are always logged, and still re-raised
+			package_logger.setLevel(logging.INFO)
+			with pytest.raises(ValueError, match='boom'):
+				await failing(event)
+			assert session.logger_lookups == 2
+		finally:
+			package_logger.setLevel(original_level)
+			await bus.stop(clear=True)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Measure memory per EnhancedDOMTreeNode for a large synthetic page.
+
+Usage:
+	python tests/scripts/benchmark_dom_node_memory.py [--nodes 100000]
+
+Nodes are built from JSON-decoded CDP payloads (like DomService does), once with the compact layout
+(interned tag/attribute names, lazy uuid, no per-node empty containers) and once emulating the previous
+layout (fresh strings per node, eager uuid7str, one empty list per node).
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import tracemalloc
+
+from uuid_extensions import uuid7str
+
+from browser_use.dom.views import EnhancedDOMTreeNode, NodeType
+
+TAGS = ['DIV', 'SPAN', 'A', 'LI', 'UL', 'P', 'IMG', 'BUTTON', 'INPUT', 'svg', 'path']
+ATTRIBUTE_NAMES = ['class', 'id', 'href', 'role', 'aria-label', 'style', 'data-testid', 'type']
+
+
+def make_cdp_nodes(count: int, seed: int = 0) -> list[dict]:
+	rng = random.Random(seed)
+	nodes = []
+	for i in range(count):
+		if rng.random() < 0.4:
+			nodes.append({'nodeId': i, 'backendNodeId': i, 'nodeType': 3, 'nodeName': '#text', 'nodeValue': f'text {i}'})
+			continue
+		attributes = []
+		for name in rng.sample(ATTRIBUTE_NAMES, rng.randint(0, 3)):
+			attributes += [name, f'value-{rng.randint(0, 50)}']
+		nodes.append(
+			{
+				'nodeId': i,
+				'backendNodeId': i,
+				'nodeType': 1,
+				'nodeName': rng.choice(TAGS),
+				'nodeValue': '',
+				'attributes': attributes,
+			}
+		)
+	# round-trip through JSON so strings are fresh objects, like a CDP response
+	return json.loads(json.dumps(nodes))
+
+
+def build_nodes(cdp_nodes: list[dict], legacy: bool) -> list[EnhancedDOMTreeNode]:
+	intern = (lambda value: value) if legacy else sys.intern
+	result = []
+	for node in cdp_nodes:
+		attributes = {}
+		raw = node.get('attributes') or []
+		for i in range(0, len(raw), 2):
+			attributes[intern(raw[i])] = raw[i + 1]
+		dom_node = EnhancedDOMTreeNode(
+			node_id=node['nodeId'],
+			backend_node_id=node['backendNodeId'],
+			node_type=NodeType(node['nodeType']),
+			node_name=intern(node['nodeName']),
+			node_value=node['nodeValue'],
+			attributes=attributes,
+			is_scrollable=None,
+			is_visible=None,
+			absolute_position=None,
+			target_id='target',
+			frame_id=None,
+			session_id=None,
+			content_document=None,
+			shadow_root_type=None,
+			shadow_roots=None,
+			parent_node=None,
+			children_nodes=None,
+			ax_node=None,
+			snapshot_node=None,
+		)
+		if legacy:
+			dom_node._uuid = uuid7str()
+			dom_node._compound_children = []
+		result.append(dom_node)
+	return result
+
+
+def measure(node_count: int, legacy: bool) -> float:
+	cdp_nodes = make_cdp_nodes(node_count)
+	gc.collect()
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+	nodes = build_nodes(cdp_nodes, legacy)
+	# the CDP payload is dropped once the tree is built, only names it shares with nodes stay alive
+	del cdp_nodes
+	gc.collect()
+	after = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	assert len(nodes) == node_count
+	return (after - before) / node_count
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--nodes', type=int, default=100_000)
+	args = parser.parse_args()
+
+	legacy = measure(args.nodes, legacy=True)
+	compact = measure(args.nodes, legacy=False)
+	print(f'{args.nodes} nodes: previous layout {legacy:.0f} B/node, compact layout {compact:.0f} B/node')
+	print(f'reduction: {(1 - compact / legacy) * 100:.1f}%')
+
+
+if __name__ == '__main__':
+	main()
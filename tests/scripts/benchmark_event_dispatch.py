@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Benchmark event bus dispatch overhead for every event type in browser_use/browser/events.py.
+
+Usage:
+	python tests/scripts/benchmark_event_dispatch.py [--iterations 500] [--events ClickElementEvent ...] [--bubus-log-level INFO]
+
+Each event is dispatched to no-op handlers with the same fan-out as a real session (BrowserSession plus every
+watchdog that defines an on_EventName handler for it), once registered directly on the bus and once wrapped by
+BaseWatchdog.attach_handler_to_session. The wrapper cost is also measured on its own by awaiting the wrapped handlers
+directly, since full dispatches are dominated by bubus bookkeeping that this repo doesn't control.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from bubus import BaseEvent, EventBus
+
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.watchdog_base import BaseWatchdog, get_event_classes, get_event_handler_methods
+from browser_use.browser.watchdogs.aboutblank_watchdog import AboutBlankWatchdog
+from browser_use.browser.watchdogs.default_action_watchdog import DefaultActionWatchdog
+from browser_use.browser.watchdogs.dom_watchdog import DOMWatchdog
+from browser_use.browser.watchdogs.downloads_watchdog import DownloadsWatchdog
+from browser_use.browser.watchdogs.local_browser_watchdog import LocalBrowserWatchdog
+from browser_use.browser.watchdogs.permissions_watchdog import PermissionsWatchdog
+from browser_use.browser.watchdogs.popups_watchdog import PopupsWatchdog
+from browser_use.browser.watchdogs.recording_watchdog import RecordingWatchdog
+from browser_use.browser.watchdogs.screenshot_watchdog import ScreenshotWatchdog
+from browser_use.browser.watchdogs.security_watchdog import SecurityWatchdog
+from browser_use.browser.watchdogs.storage_state_watchdog import StorageStateWatchdog
+
+HANDLER_OWNERS: list[type] = [
+	BrowserSession,
+	AboutBlankWatchdog,
+	DefaultActionWatchdog,
+	DOMWatchdog,
+	DownloadsWatchdog,
+	LocalBrowserWatchdog,
+	PermissionsWatchdog,
+	PopupsWatchdog,
+	RecordingWatchdog,
+	ScreenshotWatchdog,
+	SecurityWatchdog,
+	StorageStateWatchdog,
+]
+
+
+def handler_owners_by_event() -> dict[str, list[str]]:
+	"""Names of the classes that handle each event type in a real session"""
+	owners: dict[str, list[str]] = {name: [] for name in get_event_classes()}
+	for owner in HANDLER_OWNERS:
+		for event_class, _ in get_event_handler_methods(owner):
+			owners[event_class.__name__].append(owner.__name__)
+	return owners
+
+
+def make_event(event_class: type[BaseEvent[Any]]) -> BaseEvent[Any]:
+	# only the bus routing fields matter here, the no-op handlers never read the payload
+	event = event_class.model_construct()
+	event.event_type = event_class.__name__
+	return event
+
+
+def attach_noop_handlers(bus: EventBus, event_class: type[BaseEvent[Any]], owners: list[str], wrapped: bool) -> list[Any]:
+	"""Register one no-op handler per owner, returns the bare handlers"""
+	session = SimpleNamespace(
+		event_bus=bus, logger=logging.getLogger('browser_use.BrowserSession🅑 bench'), agent_focus_target_id=None
+	)
+	method_name = f'on_{event_class.__name__}'
+	handlers = []
+	for owner in owners:
+
+		async def noop(self, event):
+			return None
+
+		noop.__name__ = method_name
+		stub = type(owner, (), {method_name: noop})()
+		if wrapped:
+			BaseWatchdog.attach_handler_to_session(session, event_class, getattr(stub, method_name))  # type: ignore[arg-type]
+		else:
+			bus.on(event_class, getattr(stub, method_name))
+		handlers.append(getattr(stub, method_name))
+	return handlers
+
+
+async def measure(event_class: type[BaseEvent[Any]], owners: list[str], wrapped: bool, iterations: int) -> float:
+	"""Mean microseconds from dispatch until every handler has completed"""
+	bus = EventBus(name='DispatchBenchmark')
+	attach_noop_handlers(bus, event_class, owners, wrapped)
+	try:
+		for _ in range(min(iterations, 50)):  # warm up and fill the bounded event history
+			await bus.dispatch(make_event(event_class))
+		start = time.perf_counter()
+		for _ in range(iterations):
+			await bus.dispatch(make_event(event_class))
+		return (time.perf_counter() - start) / iterations * 1e6
+	finally:
+		await bus.stop(clear=True)
+
+
+async def measure_wrapper(event_class: type[BaseEvent[Any]], owners: list[str], iterations: int) -> float:
+	"""Mean microseconds added per handler call by the attach_handler_to_session wrapper"""
+	bus = EventBus(name='WrapperBenchmark')
+	bare_handlers = attach_noop_handlers(bus, event_class, owners, wrapped=True)
+	wrapped_handlers = bus.handlers[event_class.__name__]
+	event = make_event(event_class)
+	calls = iterations * 20
+
+	async def time_calls(handlers: list[Any]) -> float:
+		start = time.perf_counter()
+		for _ in range(calls):
+			for handler in handlers:
+				await handler(event)
+		return time.perf_counter() - start
+
+	try:
+		overhead = await time_calls(wrapped_handlers) - await time_calls(bare_handlers)
+		return overhead / (calls * len(owners)) * 1e6
+	finally:
+		await bus.stop(clear=True)
+
+
+async def run(event_names: list[str] | None, iterations: int) -> None:
+	event_classes = get_event_classes()
+	owners_by_event = handler_owners_by_event()
+	names = event_names or sorted(event_classes, key=lambda name: (-len(owners_by_event[name]), name))
+
+	print(f'{"event":<36} {"handlers":>8} {"bare µs":>9} {"wrapped µs":>11} {"wrapper µs/call":>16}')
+	for name in names:
+		owners = owners_by_event[name]
+		if not owners:
+			continue
+		bare = await measure(event_classes[name], owners, wrapped=False, iterations=iterations)
+		wrapped = await measure(event_classes[name], owners, wrapped=True, iterations=iterations)
+		wrapper = await measure_wrapper(event_classes[name], owners, iterations=iterations)
+		print(f'{name:<36} {len(owners):>8} {bare:>9.1f} {wrapped:>11.1f} {wrapper:>16.2f}')
+
+	# parametrized generics like ElementSelectedEvent[NoneType] also show up in the events module
+	unhandled = [name for name in names if not owners_by_event[name] and name.isidentifier()]
+	if unhandled:
+		print(f'\nno handlers (skipped): {", ".join(unhandled)}')
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--iterations', type=int, default=500)
+	parser.add_argument('--events', nargs='+', help='event class names to benchmark (default: all handled events)')
+	parser.add_argument(
+		'--bubus-log-level',
+		default='WARNING',
+		help='bubus logs every dispatch at INFO, keep it above that to measure dispatch rather than console output',
+	)
+	parser.add_argument('--session-log-level', default='INFO', help='set to DEBUG to include the handler debug logs')
+	args = parser.parse_args()
+
+	logging.basicConfig(level=logging.WARNING)
+	logging.getLogger('bubus').setLevel(args.bubus_log_level)
+	logging.getLogger('browser_use').setLevel(args.session_log_level)
+	asyncio.run(run(args.events, args.iterations))
+
+
+if __name__ == '__main__':
+	main()
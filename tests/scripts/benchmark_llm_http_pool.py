@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Benchmark per-call latency of ChatOpenAI with and without the shared LLM HTTP connection pool.
+
+Usage:
+	python tests/scripts/benchmark_llm_http_pool.py [--calls 50] [--handshake-delay-ms 0] [--no-tls]
+
+A local stub of the OpenAI /chat/completions endpoint is served over HTTPS with a throwaway self-signed certificate.
+Each mode makes the same sequential ainvoke() calls:
+
+- new client per call: a fresh httpx.AsyncClient for every call, like the providers that built an SDK client (and
+  with it a new connection pool) on every ainvoke()
+- shared pool: the default, every call goes through get_shared_http_client()
+
+--handshake-delay-ms delays every new connection on the server side, to model the network round trips of the
+TCP and TLS handshakes to a remote provider that a loopback connection doesn't have.
+"""
+
+import argparse
+import asyncio
+import datetime
+import ipaddress
+import json
+import os
+import ssl
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from browser_use.llm.http_pool import close_shared_http_clients
+from browser_use.llm.messages import UserMessage
+from browser_use.llm.openai.chat import ChatOpenAI
+
+COMPLETION = json.dumps(
+	{
+		'id': 'chatcmpl-benchmark',
+		'object': 'chat.completion',
+		'created': 0,
+		'model': 'gpt-4.1-mini',
+		'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': 'ok'}, 'finish_reason': 'stop'}],
+		'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2},
+	}
+).encode()
+
+
+def write_self_signed_cert(directory: Path) -> tuple[Path, Path]:
+	"""Write a certificate for 127.0.0.1 and its key, the certificate doubles as the CA bundle"""
+	from cryptography import x509
+	from cryptography.hazmat.primitives import hashes, serialization
+	from cryptography.hazmat.primitives.asymmetric import ec
+	from cryptography.x509.oid import NameOID
+
+	key = ec.generate_private_key(ec.SECP256R1())
+	name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, '127.0.0.1')])
+	now = datetime.datetime.now(datetime.UTC)
+	cert = (
+		x509.CertificateBuilder()
+		.subject_name(name)
+		.issuer_name(name)
+		.public_key(key.public_key())
+		.serial_number(x509.random_serial_number())
+		.not_valid_before(now - datetime.timedelta(minutes=1))
+		.not_valid_after(now + datetime.timedelta(hours=1))
+		.add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address('127.0.0.1'))]), critical=False)
+		.add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+		.sign(key, hashes.SHA256())
+	)
+	cert_path, key_path = directory / 'cert.pem', directory / 'key.pem'
+	cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+	key_path.write_bytes(
+		key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+	)
+	return cert_path, key_path
+
+
+class StubServer:
+	"""Answers every request with the same chat completion, keeping connections alive"""
+
+	def __init__(self, ssl_context: ssl.SSLContext | None, handshake_delay: float):
+		self.ssl_context = ssl_context
+		self.handshake_delay = handshake_delay
+		self.connections = 0
+		self.requests = 0
+
+	async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+		self.connections += 1
+		await asyncio.sleep(self.handshake_delay)
+		try:
+			while True:
+				head = await reader.readuntil(b'\r\n\r\n')
+				length = 0
+				for line in head.decode('latin-1').split('\r\n'):
+					if line.lower().startswith('content-length:'):
+						length = int(line.split(':', 1)[1])
+				await reader.readexactly(length)
+				self.requests += 1
+				writer.write(
+					b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nConnection: keep-alive\r\n'
+					+ f'Content-Length: {len(COMPLETION)}\r\n\r\n'.encode()
+					+ COMPLETION
+				)
+				await writer.drain()
+		except (asyncio.IncompleteReadError, ConnectionError):
+			pass
+		finally:
+			writer.close()
+
+	async def start(self) -> str:
+		server = await asyncio.start_server(self.handle, '127.0.0.1', 0, ssl=self.ssl_context)
+		port = server.sockets[0].getsockname()[1]
+		return f'{"https" if self.ssl_context else "http"}://127.0.0.1:{port}/v1'
+
+
+async def measure(base_url: str, calls: int, shared: bool) -> list[float]:
+	messages = [UserMessage(content='hi')]
+	timings: list[float] = []
+	shared_llm = ChatOpenAI(model='gpt-4.1-mini', api_key='benchmark', base_url=base_url, max_retries=0)
+	for _ in range(calls):
+		started = time.perf_counter()
+		if shared:
+			await shared_llm.ainvoke(messages)
+		else:
+			async with httpx.AsyncClient() as http_client:
+				llm = ChatOpenAI(
+					model='gpt-4.1-mini', api_key='benchmark', base_url=base_url, max_retries=0, http_client=http_client
+				)
+				await llm.ainvoke(messages)
+		timings.append((time.perf_counter() - started) * 1000)
+	await close_shared_http_clients()
+	return timings
+
+
+async def run(calls: int, handshake_delay_ms: float, tls: bool) -> None:
+	ssl_context = None
+	if tls:
+		cert_path, key_path = write_self_signed_cert(Path(tempfile.mkdtemp()))
+		ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+		ssl_context.load_cert_chain(cert_path, key_path)
+		os.environ['SSL_CERT_FILE'] = str(cert_path)  # trusted by httpx clients created from here on
+
+	print(f'{calls} sequential ainvoke() calls, {"TLS" if tls else "plain HTTP"}, handshake delay {handshake_delay_ms}ms\n')
+	print(f'{"mode":<24} {"connections":>11} {"mean ms":>9} {"median ms":>10} {"p95 ms":>8}')
+	for label, shared in (('new client per call', False), ('shared pool', True)):
+		server = StubServer(ssl_context, handshake_delay_ms / 1000)
+		base_url = await server.start()
+		await measure(base_url, 3, shared)  # warm up imports and SDK setup
+		server.connections = 0
+		timings = await measure(base_url, calls, shared)
+		p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+		print(
+			f'{label:<24} {server.connections:>11} {statistics.mean(timings):>9.2f} {statistics.median(timings):>10.2f} {p95:>8.2f}'
+		)
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--calls', type=int, default=50)
+	parser.add_argument('--handshake-delay-ms', type=float, default=0.0)
+	parser.add_argument('--no-tls', action='store_true', help='serve plain HTTP instead of HTTPS')
+	args = parser.parse_args()
+	asyncio.run(run(args.calls, args.handshake_delay_ms, tls=not args.no_tls))
+
+
+if __name__ == '__main__':
+	main()
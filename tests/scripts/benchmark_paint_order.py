@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Benchmark the paint order rectangle unions on synthetic grid-heavy layouts.
+
+Usage:
+	python tests/scripts/benchmark_paint_order.py [--sizes 1000 5000 10000 50000] [--pure-limit 10000]
+
+Each layout is a product-listing style grid of cards (card background, image, title, button) painted in
+order, fed to `contains`/`add` exactly like PaintOrderRemover does.
+"""
+
+import argparse
+import time
+
+from browser_use.dom.serializer.paint_order import Rect, RectUnionGrid, RectUnionPure
+
+
+def make_layout(rect_count: int) -> list[Rect]:
+	rects: list[Rect] = [Rect(0, 0, 1280, 100_000)]  # page background
+	columns, card_w, card_h, gap = 5, 240, 360, 16
+	card = 0
+	while len(rects) < rect_count:
+		x = (card % columns) * (card_w + gap)
+		y = 120 + (card // columns) * (card_h + gap)
+		rects.append(Rect(x, y, x + card_w, y + card_h))
+		rects.append(Rect(x + 8, y + 8, x + card_w - 8, y + 240))
+		rects.append(Rect(x + 8, y + 248, x + card_w - 8, y + 290))
+		rects.append(Rect(x + 8, y + 300, x + 120, y + 340))
+		card += 1
+	# topmost elements are painted last, the union is filled from the top down
+	return list(reversed(rects[:rect_count]))
+
+
+def run(union: RectUnionPure, rects: list[Rect]) -> tuple[float, int]:
+	start = time.perf_counter()
+	covered = 0
+	for rect in rects:
+		if union.contains(rect):
+			covered += 1
+		union.add(rect)
+	return time.perf_counter() - start, covered
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 5_000, 10_000, 50_000])
+	parser.add_argument('--pure-limit', type=int, default=10_000, help='skip RectUnionPure above this size')
+	args = parser.parse_args()
+
+	for size in args.sizes:
+		rects = make_layout(size)
+		grid_s, grid_covered = run(RectUnionGrid(), rects)
+		line = f'{size:>6} rects | grid {grid_s * 1000:9.1f} ms'
+		if size <= args.pure_limit:
+			pure_s, pure_covered = run(RectUnionPure(), rects)
+			assert pure_covered == grid_covered
+			line += f' | pure {pure_s * 1000:9.1f} ms | speedup {pure_s / grid_s:6.1f}x'
+		print(line)
+
+
+if __name__ == '__main__':
+	main()
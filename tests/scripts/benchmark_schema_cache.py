@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Benchmark the per-step cost of building the AgentOutput model and its LLM JSON schema.
+
+Usage:
+	python tests/scripts/benchmark_schema_cache.py [--extra-actions 20] [--steps 200]
+
+Registers --extra-actions custom actions on top of the default tools, then runs what every agent step does before
+calling the LLM: Agent._update_action_models_for_page() followed by the schema generation of ChatOpenAI.ainvoke().
+
+- uncached: a new ActionModel and AgentOutput every step, and the schema rebuilt from model_json_schema()
+- cached: the registry reuses the ActionModel for the same actions, so the agent keeps its AgentOutput and the
+  schema is a lookup of the cached JSON plus json.loads() of a copy the provider may modify
+"""
+
+import argparse
+import statistics
+import time
+
+from pydantic import BaseModel, Field
+
+from browser_use.agent.views import AgentOutput
+from browser_use.llm.schema import SchemaOptimizer
+from browser_use.tools.service import Tools
+
+
+def build_tools(extra_actions: int) -> Tools:
+	tools = Tools()
+	for i in range(extra_actions):
+
+		class Params(BaseModel):
+			query: str = Field(description=f'What to look up in system {i}')
+			limit: int = Field(default=10, ge=1, le=100)
+			tags: list[str] = Field(default_factory=list, description='Optional filters')
+
+		async def custom_action(params: Params):
+			pass
+
+		custom_action.__name__ = f'lookup_system_{i}'
+		tools.registry.action(f'Look something up in internal system {i}', param_model=Params)(custom_action)
+	return tools
+
+
+def uncached_step(tools: Tools, page_url: str) -> None:
+	action_model = tools.registry._build_action_model(
+		{name: action for name, action in tools.registry.registry.actions.items() if action.domains is None}
+	)
+	agent_output = AgentOutput.type_with_custom_actions(action_model)
+	SchemaOptimizer._build_optimized_json_schema(agent_output, remove_min_items=False, remove_defaults=False)
+
+
+def make_cached_step(tools: Tools):
+	state: dict = {'action_model': None, 'agent_output': None}
+
+	def cached_step(page_url: str) -> None:
+		action_model = tools.registry.create_action_model(page_url=page_url)
+		if action_model is not state['action_model']:
+			state['action_model'] = action_model
+			state['agent_output'] = AgentOutput.type_with_custom_actions(action_model)
+		SchemaOptimizer.create_optimized_json_schema(state['agent_output'])
+
+	return cached_step
+
+
+def timed(fn, steps: int) -> list[float]:
+	timings = []
+	for step in range(steps):
+		started = time.perf_counter()
+		fn(f'https://example.com/page/{step}')
+		timings.append((time.perf_counter() - started) * 1000)
+	return timings
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--extra-actions', type=int, default=20)
+	parser.add_argument('--steps', type=int, default=200)
+	args = parser.parse_args()
+
+	tools = build_tools(args.extra_actions)
+	action_count = len(tools.registry.registry.actions)
+	schema_size = len(
+		SchemaOptimizer.create_optimized_json_schema_text(
+			AgentOutput.type_with_custom_actions(tools.registry.create_action_model())
+		)
+	)
+	print(f'{action_count} registered actions, optimized schema {schema_size / 1024:.1f} KiB, {args.steps} steps\n')
+	print(f'{"mode":<10} {"mean ms":>9} {"median ms":>10} {"first ms":>9}')
+	for label, fn in (('uncached', lambda url: uncached_step(tools, url)), ('cached', make_cached_step(tools))):
+		timings = timed(fn, args.steps)
+		print(f'{label:<10} {statistics.mean(timings):>9.3f} {statistics.median(timings):>10.3f} {timings[0]:>9.3f}')
+
+
+if __name__ == '__main__':
+	main()
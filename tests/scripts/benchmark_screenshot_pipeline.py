@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Benchmark per-step CPU time and bytes of the screenshot pipeline (prompt, disk, cloud event, GIF).
+
+Usage:
+	python tests/scripts/benchmark_screenshot_pipeline.py [--steps 20] [--viewport 1280 800] [--dpr 2] [--llm-size 1400 850]
+
+"legacy" replays what every step used to do with the base64 PNG returned by CDP: decode, resize and re-encode it
+for the prompt, decode it again for disk, then re-encode and decode it again when building the GIF. The other rows
+share one Screenshot captured in the final format (and, with --llm-size, already downscaled by the browser), so
+only the Python-side work is timed; the browser's own encode is not part of the numbers.
+"""
+
+import argparse
+import asyncio
+import base64
+import random
+import tempfile
+import time
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFilter
+
+from browser_use.agent.prompts import AgentMessagePrompt
+from browser_use.browser.views import BrowserStateSummary, Screenshot, ScreenshotFormat
+from browser_use.dom.views import SerializedDOMState
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.screenshots.service import ScreenshotService
+
+
+def render_page(size: tuple[int, int], seed: int) -> Image.Image:
+	"""Page-like image: white background, colored boxes, a few photos and rows of small text-sized strokes"""
+	rng = random.Random(seed)
+	image = Image.new('RGB', size, (255, 255, 255))
+	draw = ImageDraw.Draw(image)
+	width, height = size
+	for _ in range(40):
+		x, y = rng.randrange(width), rng.randrange(height)
+		color = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+		draw.rectangle((x, y, x + rng.randrange(20, width // 3), y + rng.randrange(10, height // 6)), fill=color)
+	for _ in range(4):
+		photo = Image.effect_noise((rng.randrange(width // 6, width // 3), rng.randrange(height // 8, height // 4)), 60)
+		image.paste(photo.convert('RGB').filter(ImageFilter.SMOOTH), (rng.randrange(width), rng.randrange(height)))
+	for line_y in range(0, height, max(height // 60, 8)):
+		x = rng.randrange(20)
+		while x < width:
+			word = rng.randrange(10, 60)
+			draw.line((x, line_y, x + word, line_y), fill=(30, 30, 30), width=max(height // 400, 1))
+			x += word + rng.randrange(5, 15)
+	return image
+
+
+def encode(image: Image.Image, format: ScreenshotFormat, quality: int | None) -> bytes:
+	buffer = BytesIO()
+	image.save(buffer, format=format.upper(), **({'quality': quality} if quality and format != 'png' else {}))
+	return buffer.getvalue()
+
+
+def legacy_resize(screenshot_b64: str, llm_size: tuple[int, int] | None) -> str:
+	"""The prompt's previous resize path: decode, resize, re-encode as PNG, base64"""
+	if not llm_size:
+		return screenshot_b64
+	img = Image.open(BytesIO(base64.b64decode(screenshot_b64)))
+	if img.size == llm_size:
+		return screenshot_b64
+	buffer = BytesIO()
+	img.resize(llm_size, Image.Resampling.LANCZOS).save(buffer, format='PNG')
+	return base64.b64encode(buffer.getvalue()).decode('utf-8')
+
+
+def capture_size(device_size: tuple[int, int], llm_size: tuple[int, int] | None) -> tuple[int, int]:
+	"""Size the browser renders at when asked to cover llm_size (see ScreenshotWatchdog._get_downscaled_viewport_clip)"""
+	if not llm_size:
+		return device_size
+	scale = min(1.0, max(llm_size[0] / device_size[0], llm_size[1] / device_size[1]))
+	return round(device_size[0] * scale), round(device_size[1] * scale)
+
+
+def run_legacy(pages: list[str], llm_size: tuple[int, int] | None, directory: Path) -> tuple[float, int, int]:
+	start = time.process_time()
+	prompt_bytes = disk_bytes = 0
+	paths = []
+	for step, screenshot_b64 in enumerate(pages):
+		prompt_image = legacy_resize(screenshot_b64, llm_size)
+		prompt_bytes += len(f'data:image/png;base64,{prompt_image}')
+		_cloud_url = f'data:image/png;base64,{screenshot_b64}'
+
+		path = directory / f'step_{step}.png'
+		path.write_bytes(base64.b64decode(screenshot_b64))
+		disk_bytes += path.stat().st_size
+		paths.append(path)
+
+	for path in paths:  # GIF: history.screenshots() re-encodes each file, then the GIF decodes it again
+		Image.open(BytesIO(base64.b64decode(base64.b64encode(path.read_bytes()).decode()))).load()
+	return (time.process_time() - start) / len(pages) * 1000, prompt_bytes // len(pages), disk_bytes // len(pages)
+
+
+async def run_shared(
+	pages: list[Screenshot], llm_size: tuple[int, int] | None, directory: Path, file_system: FileSystem
+) -> tuple[float, int, int]:
+	service = ScreenshotService(directory)
+	start = time.process_time()
+	prompt_bytes = disk_bytes = 0
+	paths = []
+	for step, screenshot in enumerate(pages):
+		state = BrowserStateSummary(
+			dom_state=SerializedDOMState(_root=None, selector_map={}), url='', title='', tabs=[], screenshot_image=screenshot
+		)
+		prompt = AgentMessagePrompt(browser_state_summary=state, file_system=file_system, llm_screenshot_size=llm_size)
+		prompt_bytes += len(prompt._resize_screenshot(screenshot).data_url)
+		_cloud_url = screenshot.data_url
+
+		paths.append(Path(await service.store_screenshot(screenshot, step)))
+		disk_bytes += len(screenshot.data)
+
+	for path in paths:  # GIF: raw bytes straight from disk
+		Image.open(BytesIO(path.read_bytes())).load()
+	return (time.process_time() - start) / len(pages) * 1000, prompt_bytes // len(pages), disk_bytes // len(pages)
+
+
+async def main_async(args: argparse.Namespace) -> None:
+	device_size = (args.viewport[0] * args.dpr, args.viewport[1] * args.dpr)
+	llm_size = tuple(args.llm_size) if args.llm_size else None
+	print(f'viewport {args.viewport[0]}x{args.viewport[1]} @ {args.dpr}x, llm_screenshot_size={llm_size}, {args.steps} steps')
+	print(f'{"pipeline":<22} {"capture size":>13} {"CPU ms/step":>12} {"prompt KB":>10} {"disk KB":>9}')
+
+	renders = [render_page(device_size, seed) for seed in range(args.steps)]
+	with tempfile.TemporaryDirectory() as tmp:
+		legacy_pages = [base64.b64encode(encode(image, 'png', None)).decode() for image in renders]
+		cpu_ms, prompt_bytes, disk_bytes = run_legacy(legacy_pages, llm_size, Path(tmp))
+		size = f'{device_size[0]}x{device_size[1]}'
+		print(f'{"legacy png":<22} {size:>13} {cpu_ms:>12.1f} {prompt_bytes / 1024:>10.0f} {disk_bytes / 1024:>9.0f}')
+
+		file_system = FileSystem(Path(tmp) / 'fs')
+		scaled = capture_size(device_size, llm_size)
+		scaled_renders = [image.resize(scaled, Image.Resampling.BILINEAR) for image in renders]
+		for format, quality in (('png', None), ('jpeg', args.quality), ('webp', args.quality)):
+			pages = [
+				Screenshot(base64.b64encode(encode(image, format, quality)).decode(), format=format) for image in scaled_renders
+			]
+			cpu_ms, prompt_bytes, disk_bytes = await run_shared(pages, llm_size, Path(tmp) / format, file_system)
+			label = f'shared {format}' + (f' q{quality}' if format != 'png' else '')
+			size = f'{scaled[0]}x{scaled[1]}'
+			print(f'{label:<22} {size:>13} {cpu_ms:>12.1f} {prompt_bytes / 1024:>10.0f} {disk_bytes / 1024:>9.0f}')
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--steps', type=int, default=20)
+	parser.add_argument('--viewport', type=int, nargs=2, default=[1280, 800], metavar=('WIDTH', 'HEIGHT'))
+	parser.add_argument('--dpr', type=int, default=1, help='device pixel ratio')
+	parser.add_argument('--llm-size', type=int, nargs=2, default=None, metavar=('WIDTH', 'HEIGHT'))
+	parser.add_argument('--quality', type=int, default=80)
+	asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark build_snapshot_lookup on synthetic DOMSnapshot.captureSnapshot payloads.
+
+Usage:
+	python tests/scripts/benchmark_snapshot_lookup.py [--sizes 1000 10000 100000] [--repeat 5]
+	python tests/scripts/benchmark_snapshot_lookup.py --fixture recorded_snapshot.json
+
+The synthetic payloads mimic real pages: ~60% of nodes have a layout box, ~5% are clickable and
+computed styles are drawn from a small pool of distinct style tuples.
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+from typing import Any
+
+from browser_use.dom.enhanced_snapshot import REQUIRED_COMPUTED_STYLES, build_snapshot_lookup
+
+
+def make_snapshot(node_count: int, seed: int = 0) -> Any:
+	rng = random.Random(seed)
+	strings = ['https://example.com/', 'auto', 'pointer', 'block', 'inline', 'none', 'visible', 'hidden', '1', '0.5']
+	style_pool = [[rng.randrange(1, len(strings)) for _ in REQUIRED_COMPUTED_STYLES] for _ in range(40)]
+
+	layout_node_index: list[int] = []
+	bounds: list[list[float]] = []
+	styles: list[list[int]] = []
+	paint_orders: list[int] = []
+	client_rects: list[list[float]] = []
+	scroll_rects: list[list[float]] = []
+	for i in range(node_count):
+		if rng.random() < 0.6:
+			layout_node_index.append(i)
+			bounds.append([rng.uniform(0, 1200), rng.uniform(0, 5000), rng.uniform(1, 400), rng.uniform(1, 200)])
+			styles.append(rng.choice(style_pool))
+			paint_orders.append(len(paint_orders))
+			client_rects.append([0, 0, 10, 10])
+			scroll_rects.append([0, 0, 10, 10])
+
+	return {
+		'strings': strings,
+		'documents': [
+			{
+				'documentURL': 0,
+				'nodes': {
+					'backendNodeId': list(range(1, node_count + 1)),
+					'isClickable': {'index': [i for i in range(node_count) if rng.random() < 0.05]},
+				},
+				'layout': {
+					'nodeIndex': layout_node_index,
+					'bounds': bounds,
+					'styles': styles,
+					'paintOrders': paint_orders,
+					'clientRects': client_rects,
+					'scrollRects': scroll_rects,
+					'text': [],
+					'stackingContexts': {'index': [0]},
+				},
+				'textBoxes': {},
+			}
+		],
+	}
+
+
+def bench(snapshot: Any, repeat: int) -> None:
+	node_count = sum(len(doc['nodes'].get('backendNodeId', [])) for doc in snapshot['documents'])
+	build_times = []
+	access_times = []
+	for _ in range(repeat):
+		start = time.perf_counter()
+		lookup = build_snapshot_lookup(snapshot, device_pixel_ratio=2.0)
+		build_times.append(time.perf_counter() - start)
+
+		start = time.perf_counter()
+		for backend_node_id in lookup:
+			lookup.get(backend_node_id)
+		access_times.append(time.perf_counter() - start)
+
+	print(
+		f'{node_count:>8} nodes | build {statistics.median(build_times) * 1000:8.2f} ms'
+		f' | build + access all {statistics.median(build_times) * 1000 + statistics.median(access_times) * 1000:8.2f} ms'
+	)
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+	parser.add_argument('--repeat', type=int, default=5)
+	parser.add_argument('--fixture', action='append', default=[], help='JSON dump of a recorded CaptureSnapshotReturns')
+	args = parser.parse_args()
+
+	for path in args.fixture:
+		with open(path) as f:
+			bench(json.load(f), args.repeat)
+	for size in args.sizes:
+		bench(make_snapshot(size), args.repeat)
+
+
+if __name__ == '__main__':
+	main()